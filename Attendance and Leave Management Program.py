@@ -11,566 +11,150 @@ APP_TITLE = f"{APP_NAME_EN} | Made by AQMAN | {APP_VERSION}"
 # PySide6 import 확인 및 오류 처리
 try:
     from PySide6.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, 
-                                    QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, 
+                                    QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QTableView,
+                                    QTableWidgetSelectionRange,
                                     QHeaderView, QLabel, QLineEdit, QMessageBox, QDialog, 
                                     QComboBox, QDateEdit, QSpinBox, QDialogButtonBox, QTextEdit,
-                                    QAbstractItemView, QFileDialog, QFrame, QStatusBar, QStyledItemDelegate, QCheckBox)
-    from PySide6.QtCore import Qt, QDate, QTime, Signal, QModelIndex, QRect, QTimer
+                                    QAbstractItemView, QFileDialog, QFrame, QStatusBar, QStyledItemDelegate, QCheckBox,
+                                    QProgressDialog)
+    from PySide6.QtCore import (Qt, QDate, QTime, Signal, QModelIndex, QRect, QTimer, QObject,
+                                QRunnable, QThreadPool, QAbstractTableModel, QItemSelection,
+                                QItemSelectionModel)
     from PySide6.QtGui import QColor, QBrush, QFont, QClipboard, QKeyEvent, QIcon, QPainter, QPen
     PYSIDE6_AVAILABLE = True
 except ImportError as e:
     PYSIDE6_AVAILABLE = False
     PYSIDE6_ERROR = str(e)
 
-import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import pandas as pd
 from pathlib import Path
 import openpyxl
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.utils import get_column_letter
+import logging
 import sys
+import threading
 import traceback
 
+# 데이터 계층 (Qt/pandas 비의존 패키지)
+from attendance_core import (DatabaseManager, LeaveCalculator, AttendanceCalculator, LeaveLedger,
+                             ExpirationScheduler, ChangeBus, AttendanceImporter, AttendanceWorkbookWriter)
+from attendance_core.leave_balance import usage_between
+from attendance_core.annual_close import AnnualClose, is_year_closed
+from attendance_core.attendance_edits import commit_pending_changes
+from attendance_core.leave_calendar import entitlement_calendar
+from attendance_core.leave_export import write_leave_sheet
+from attendance_core.change_bus import EMPLOYEE_CHANGED, ATTENDANCE_CHANGED, LEAVE_CHANGED
+from attendance_core.leave_ledger import MONTH_COLUMNS
+from attendance_core.month_loader import month_date_range
+from attendance_core.time_input import format_minutes, input_time, normalize_time_input, time_input_minutes
+from attendance_core.month_grid import (MonthGrid, STYLE_EMPTY, STYLE_PLAIN, STYLE_LEAVE,
+                                        STYLE_EARLY, STYLE_LATE, STYLE_NIGHT)
 
-class DatabaseManager:
-    """데이터베이스 관리 클래스"""
-    
-    def __init__(self, db_path="leave_attendance.db"):
-        # exe 파일로 실행 중인지 확인
-        import sys
-        import os
-        import shutil
-        
-        if getattr(sys, 'frozen', False):
-            # exe로 실행 중인 경우
-            # 먼저 사용자 AppData 폴더에 저장 시도 (권한 문제 방지)
-            try:
-                appdata_dir = os.path.join(os.getenv('APPDATA', ''), '근태관리프로그램')
-                os.makedirs(appdata_dir, exist_ok=True)
-                appdata_db_path = os.path.join(appdata_dir, db_path)
-                
-                # AppData 폴더에 쓰기 권한이 있는지 테스트
-                test_file = os.path.join(appdata_dir, '.test_write')
-                try:
-                    with open(test_file, 'w') as f:
-                        f.write('test')
-                    os.remove(test_file)
-                    # 쓰기 가능하면 AppData 폴더 사용
-                    self.db_path = appdata_db_path
-                except (IOError, OSError):
-                    # AppData 폴더에 쓰기 불가능하면 EXE 파일 디렉토리 사용
-                    exe_dir = os.path.dirname(sys.executable)
-                    self.db_path = os.path.join(exe_dir, db_path)
-            except Exception:
-                # 모든 시도 실패 시 EXE 파일 디렉토리 사용
-                exe_dir = os.path.dirname(sys.executable)
-                self.db_path = os.path.join(exe_dir, db_path)
-            
-            # 포함된 데이터베이스 파일이 있으면 복사
-            try:
-                # PyInstaller의 임시 디렉토리에서 데이터베이스 파일 찾기
-                if hasattr(sys, '_MEIPASS'):
-                    bundled_db = os.path.join(sys._MEIPASS, db_path)
-                    if os.path.exists(bundled_db):
-                        # 실행 디렉토리에 데이터베이스가 없거나, 포함된 데이터베이스가 더 최신이면 복사
-                        if not os.path.exists(self.db_path):
-                            # 데이터베이스 파일이 없으면 포함된 파일 복사
-                            try:
-                                shutil.copy2(bundled_db, self.db_path)
-                            except (IOError, OSError, PermissionError):
-                                # 복사 실패 시 AppData 폴더에 복사 시도
-                                try:
-                                    appdata_dir = os.path.join(os.getenv('APPDATA', ''), '근태관리프로그램')
-                                    os.makedirs(appdata_dir, exist_ok=True)
-                                    appdata_db_path = os.path.join(appdata_dir, db_path)
-                                    shutil.copy2(bundled_db, appdata_db_path)
-                                    self.db_path = appdata_db_path
-                                except Exception:
-                                    pass
-                        # 실행 디렉토리에 데이터베이스가 있으면 그대로 사용 (사용자가 수정한 데이터 유지)
-            except Exception as e:
-                # 오류 발생 시에도 계속 진행 (기존 데이터베이스 사용)
-                pass
+logger = logging.getLogger(__name__)
+
+
+class ChangeListenerMixin:
+    """ChangeBus를 구독하는 탭의 공통 처리
+    
+    관련 변경 알림이 오면 바로 다시 그리지 않고 모아 두었다가, 탭이 보이는 상태면
+    이벤트 루프에서 한 번에 반영하고 숨겨진 탭은 표시될 때(showEvent) 반영합니다.
+    직원 ID가 있으면 _patch_rows(해당 직원), 없으면 _full_refresh()를 호출합니다.
+    """
+    
+    def _init_change_listener(self, change_bus):
+        self.change_bus = change_bus if change_bus is not None else ChangeBus()
+        self._needs_full_refresh = False
+        self._dirty_employees = set()
+        self._pending_scheduled = False
+        self.change_bus.subscribe(self.on_data_changed)
+    
+    def on_data_changed(self, event):
+        """변경 알림 처리 (탭별로 관련 이벤트만 골라 _mark_dirty 호출, 기본: 무시)"""
+    
+    def _mark_dirty(self, employee_ids=None):
+        """employee_ids: 갱신할 직원 ID 집합 (None이면 전체 새로고침)"""
+        if employee_ids is None:
+            self._needs_full_refresh = True
         else:
-            # Python 스크립트로 실행 중인 경우
-            self.db_path = db_path
-        
-        self.init_database()
+            self._dirty_employees.update(employee_ids)
+        if self.isVisible() and not self._pending_scheduled:
+            self._pending_scheduled = True
+            QTimer.singleShot(0, self._apply_pending_changes)
     
-    def get_connection(self):
-        """데이터베이스 연결 반환"""
-        conn = sqlite3.connect(self.db_path, timeout=30.0)  # 타임아웃 30초 설정
-        return conn
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._needs_full_refresh or self._dirty_employees:
+            self._apply_pending_changes()
     
-    def init_database(self):
-        """데이터베이스 초기화 및 테이블 생성"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # 직원 정보 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS employees (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                department TEXT NOT NULL,
-                position TEXT NOT NULL,
-                name TEXT NOT NULL,
-                hire_date DATE NOT NULL,
-                display_order INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(department, position, name, hire_date)
-            )
-        """)
-        
-        # display_order 컬럼이 없으면 추가 (기존 데이터베이스 호환성)
-        cursor.execute("PRAGMA table_info(employees)")
-        columns = [col[1] for col in cursor.fetchall()]
-        if 'display_order' not in columns:
-            cursor.execute("ALTER TABLE employees ADD COLUMN display_order INTEGER DEFAULT 0")
-        
-        # is_active 컬럼이 없으면 추가 (중도 퇴사자 숨김 기능)
-        if 'is_active' not in columns:
-            cursor.execute("ALTER TABLE employees ADD COLUMN is_active INTEGER DEFAULT 1")
-        
-        # resignation_date 컬럼이 없으면 추가 (퇴사일 저장)
-        if 'resignation_date' not in columns:
-            cursor.execute("ALTER TABLE employees ADD COLUMN resignation_date DATE")
-        
-        # phone 컬럼이 없으면 추가 (연락처 저장)
-        if 'phone' not in columns:
-            cursor.execute("ALTER TABLE employees ADD COLUMN phone TEXT")
-        
-        # email 컬럼이 없으면 추가 (이메일 저장)
-        if 'email' not in columns:
-            cursor.execute("ALTER TABLE employees ADD COLUMN email TEXT")
-        
-        # 연월차 관리 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS leave_records (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                employee_id INTEGER NOT NULL,
-                leave_type TEXT NOT NULL,
-                leave_date DATE NOT NULL,
-                leave_amount REAL NOT NULL,
-                year INTEGER NOT NULL,
-                month INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (employee_id) REFERENCES employees(id),
-                UNIQUE(employee_id, leave_date, leave_type)
-            )
-        """)
+    def _apply_pending_changes(self):
+        self._pending_scheduled = False
+        if self._needs_full_refresh:
+            self._needs_full_refresh = False
+            self._dirty_employees = set()
+            self._full_refresh()
+        elif self._dirty_employees:
+            employee_ids, self._dirty_employees = self._dirty_employees, set()
+            self._patch_rows(employee_ids)
+    
+    def _full_refresh(self):
+        self.refresh_data()
+    
+    def _patch_rows(self, employee_ids):
+        """해당 직원 행만 갱신 (기본: 전체 새로고침)"""
+        self._full_refresh()
 
-        # leave_records 테이블 컬럼 호환성 검사 (기존 데이터베이스 업그레이드)
-        cursor.execute("PRAGMA table_info(leave_records)")
-        lr_columns = [col[1] for col in cursor.fetchall()]
-        if 'year' not in lr_columns:
-            cursor.execute("ALTER TABLE leave_records ADD COLUMN year INTEGER")
-        if 'month' not in lr_columns:
-            cursor.execute("ALTER TABLE leave_records ADD COLUMN month INTEGER")
-        
-        # 연월차 소멸 내역 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS leave_expirations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                employee_id INTEGER NOT NULL,
-                leave_type TEXT NOT NULL,
-                expired_amount REAL NOT NULL,
-                expiration_date DATE NOT NULL,
-                year INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (employee_id) REFERENCES employees(id)
-            )
-        """)
-        
-        # 출퇴근 기록 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS attendance_records (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                employee_id INTEGER NOT NULL,
-                work_date DATE NOT NULL,
-                arrival_time TIME,
-                departure_time TIME,
-                early_arrival INTEGER DEFAULT 0,
-                late_arrival INTEGER DEFAULT 0,
-                late_departure INTEGER DEFAULT 0,
-                leave_type TEXT,
-                remarks TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (employee_id) REFERENCES employees(id),
-                UNIQUE(employee_id, work_date)
-            )
-        """)
 
-        # attendance_records 테이블 컬럼 호환성 검사 (기존 데이터베이스 업그레이드)
-        cursor.execute("PRAGMA table_info(attendance_records)")
-        ar_columns = [col[1] for col in cursor.fetchall()]
-        if 'early_arrival' not in ar_columns:
-            cursor.execute("ALTER TABLE attendance_records ADD COLUMN early_arrival INTEGER DEFAULT 0")
-        if 'late_arrival' not in ar_columns:
-            cursor.execute("ALTER TABLE attendance_records ADD COLUMN late_arrival INTEGER DEFAULT 0")
-        if 'late_departure' not in ar_columns:
-            cursor.execute("ALTER TABLE attendance_records ADD COLUMN late_departure INTEGER DEFAULT 0")
-        if 'leave_type' not in ar_columns:
-            cursor.execute("ALTER TABLE attendance_records ADD COLUMN leave_type TEXT")
-        if 'remarks' not in ar_columns:
-            cursor.execute("ALTER TABLE attendance_records ADD COLUMN remarks TEXT")
-        
-        # 연월차 관리대장 수동 입력 값 저장 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS leave_manual_values (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                employee_id INTEGER NOT NULL,
-                year INTEGER NOT NULL,
-                column_index INTEGER NOT NULL,
-                manual_value TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (employee_id) REFERENCES employees(id),
-                UNIQUE(employee_id, year, column_index)
-            )
-        """)
-        
-        # 연도별 잔여수 저장 테이블 (1년 이상 재직인원의 이전 년도 잔여수 저장)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS leave_remaining_by_year (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                employee_id INTEGER NOT NULL,
-                year INTEGER NOT NULL,
-                remaining_amount REAL NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (employee_id) REFERENCES employees(id),
-                UNIQUE(employee_id, year)
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+class _InvalidCellValue(ValueError):
+    """형식이 잘못된 셀 입력 (restore_text: 셀에 되돌릴 값)"""
+    
+    def __init__(self, message, restore_text):
+        super().__init__(message)
+        self.restore_text = restore_text
 
 
-class LeaveCalculator:
-    """연월차 계산 클래스"""
-    
-    # 1년 이상 재직인원 리스트 (TODAY 기준)
-    ONE_YEAR_OR_MORE_EMPLOYEES = [
-        '전금희', '박진성', '김미라', '김아름벌', '맹기열', 
-        '강지승', '신동인', '두보라', '오세원', '황혜선', '김현경'
-    ]
+class CellEditJournalMixin:
+    """붙여넣기/삭제처럼 여러 셀을 한 번에 바꾸는 작업을 하나의 편집으로 처리
     
-    def __init__(self, db_manager):
-        self.db = db_manager
+    cell_edit_batch() 블록 안에서 발생한 셀 변경(itemChanged)은 바로 처리하지 않고
+    셀별 마지막 변경만 모아 두었다가, 가장 바깥 블록이 끝날 때 _flush_cell_edits(items)로
+    한 번에 넘깁니다. 블록 밖의 단일 편집은 on_cell_changed에서 바로 처리합니다.
+    """
     
-    def is_one_year_or_more(self, name, hire_date, target_date=None):
-        """TODAY 기준으로 1년 이상 재직인원인지 확인"""
-        if target_date is None:
-            target_date = datetime.now().date()
-        
-        if isinstance(hire_date, str):
-            hire_date = datetime.strptime(hire_date, "%Y-%m-%d").date()
-        if isinstance(target_date, str):
-            target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
-        
-        # 명시적으로 1년 이상 재직인원 리스트에 있으면 1년 이상자로 처리
-        if name in self.ONE_YEAR_OR_MORE_EMPLOYEES:
-            return True
-        
-        # TODAY 기준으로 입사일로부터 경과 일수 계산
-        days_passed = (target_date - hire_date).days
-        return days_passed >= 365
+    def _init_cell_edit_journal(self):
+        self._cell_edit_depth = 0
+        self._cell_edits = {}
     
-    def calculate_monthly_leave(self, hire_date, target_date):
-        """입사 1년 미만 직원의 월차 계산
-        입사일을 기준으로 1개월 만근 시 연차 1개 발생 (최대 11개)
-        """
-        if isinstance(hire_date, str):
-            hire_date = datetime.strptime(hire_date, "%Y-%m-%d").date()
-        if isinstance(target_date, str):
-            target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
-        
-        if (target_date - hire_date).days >= 365:
-            return 0
-        
-        # 입사일 기준으로 경과한 개월 수 계산
-        months_passed = (target_date.year - hire_date.year) * 12 + (target_date.month - hire_date.month)
-        if target_date.day < hire_date.day:
-            months_passed -= 1
-        
-        return min(months_passed, 11)
-    
-    def calculate_annual_leave(self, hire_date, target_date):
-        """연차 계산
-        - 입사 1년 경과 시: 입사일 기준으로 연차 15개 부여
-        - 근속연수 증가 시 연차 추가:
-          * 만3년차: 16일 (예: 2023년 5월 30일 입사 → 2026년 5월 30일에 16일 발생)
-          * 만5년차: 17일
-          * 만7년차: 18일
-          * 만25년차: 25일 (최대)
-        """
-        if isinstance(hire_date, str):
-            hire_date = datetime.strptime(hire_date, "%Y-%m-%d").date()
-        if isinstance(target_date, str):
-            target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
-        
-        # 만 근무 연수 계산 (입사일 기준)
-        years_passed = (target_date.year - hire_date.year)
-        if target_date.month < hire_date.month or (target_date.month == hire_date.month and target_date.day < hire_date.day):
-            years_passed -= 1
-        
-        if years_passed < 1:
-            return 0
-        
-        # 입사 1년 경과 시 연차 15개 부여
-        annual_leave = 15
-        
-        # 근속연수 증가 시 연차 추가
-        # 만3년차부터 시작: 만3년(16일), 만5년(17일), 만7년(18일)...
-        if years_passed >= 3:  # 만3년 이상
-            # 만3년부터 2년마다 1개씩 추가
-            # 만3년: +1 (16일), 만5년: +2 (17일), 만7년: +3 (18일)...
-            additional_leaves = (years_passed - 3) // 2 + 1
-            annual_leave += additional_leaves
-        
-        # 최대 25일 제한
-        return min(annual_leave, 25)
-    
-    def check_monthly_leave_expiration(self, employee_id, hire_date, target_date):
-        """월차 소멸 확인 및 처리 - 1년 미만자만 처리
-        입사기념일 기준으로 1년 되는 날 소멸 (1년 이상자는 월차 없음)
-        """
-        if isinstance(hire_date, str):
-            hire_date = datetime.strptime(hire_date, "%Y-%m-%d").date()
-        if isinstance(target_date, str):
-            target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
-        
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        # 직원 정보 조회
-        cursor.execute("SELECT name FROM employees WHERE id = ?", (employee_id,))
-        result = cursor.fetchone()
-        if not result:
-            conn.close()
-            return 0
-        
-        name = result[0]
-        
-        # 1년 이상자는 월차 소멸 없음
-        if self.is_one_year_or_more(name, hire_date, target_date):
-            conn.close()
-            return 0
-        
-        # 1년 미만자: 입사기념일 기준으로 1년 되는 날 소멸
+    @contextmanager
+    def cell_edit_batch(self):
+        self._cell_edit_depth += 1
         try:
-            one_year_date = datetime(hire_date.year + 1, hire_date.month, hire_date.day).date()
-        except ValueError:
-            # 2월 29일 같은 경우 처리
-            one_year_date = datetime(hire_date.year + 1, hire_date.month, hire_date.day - 1).date()
-        
-        # 정확히 1년 되는 날에 소멸 처리
-        if target_date >= one_year_date:
-            # 기존 소멸 기록이 있는지 확인 (중복 방지)
-            cursor.execute("""
-                SELECT id FROM leave_expirations
-                WHERE employee_id = ? AND leave_type = '월차' AND expiration_date = ?
-            """, (employee_id, one_year_date))
-            existing = cursor.fetchone()
-            
-            if not existing:
-                cursor.execute("""
-                    SELECT SUM(leave_amount) as total_used
-                    FROM leave_records
-                    WHERE employee_id = ? AND leave_type = '월차'
-                    AND leave_date < ?
-                """, (employee_id, one_year_date))
-                result = cursor.fetchone()
-                total_used = result[0] if result[0] else 0
-                
-                # 입사기념일 기준으로 1년 전까지 생성된 월차 수 (최대 11개)
-                max_monthly_leave = min(11, self.calculate_monthly_leave(hire_date, one_year_date - timedelta(days=1)))
-                expired_amount = max_monthly_leave - total_used
-                
-                if expired_amount > 0:
-                    cursor.execute("""
-                        INSERT INTO leave_expirations 
-                        (employee_id, leave_type, expired_amount, expiration_date, year)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (employee_id, '월차', expired_amount, one_year_date, target_date.year))
-                    conn.commit()
-                    conn.close()
-                    return expired_amount
-            
-            conn.close()
-        return 0
+            yield
+        finally:
+            self._cell_edit_depth -= 1
+            if self._cell_edit_depth == 0 and self._cell_edits:
+                items, self._cell_edits = list(self._cell_edits.values()), {}
+                self._flush_cell_edits(items)
     
-    def check_annual_leave_expiration(self, employee_id, target_date):
-        """연차 소멸 확인 및 처리
-        1년 이상자: 입사기념일 기준으로 연차 생성, 다음년도 입사기념일까지 사용 안하면 소멸
-        1년 미만자: 소멸 없음 (1년 경과 후 1년 이상자 로직으로 전환)
-        """
-        if isinstance(target_date, str):
-            target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
-        
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        # 직원 정보 조회
-        cursor.execute("SELECT name, hire_date FROM employees WHERE id = ?", (employee_id,))
-        result = cursor.fetchone()
-        if not result:
-            conn.close()
-            return 0
-        
-        name, hire_date_str = result
-        hire_date = datetime.strptime(hire_date_str, "%Y-%m-%d").date()
-        
-        # 1년 이상자 여부 확인
-        if not self.is_one_year_or_more(name, hire_date, target_date):
-            # 1년 미만자는 소멸 없음
-            conn.close()
-            return 0
-        
-        # 1년 이상자: 입사기념일 기준으로 연차 생성, 다음년도 입사기념일까지 사용 안하면 소멸
-        hire_month = hire_date.month
-        hire_day = hire_date.day
-        
-        expired_total = 0
-        
-        # 입사일 이후의 모든 입사기념일 확인
-        for year_offset in range(1, 50):  # 최대 50년까지 확인
-            # 입사기념일 계산
-            try:
-                anniversary_date = datetime(hire_date.year + year_offset, hire_month, hire_day).date()
-            except ValueError:
-                anniversary_date = datetime(hire_date.year + year_offset, hire_month, hire_day - 1).date()
-            
-            # 다음년도 입사기념일 (소멸일)
-            try:
-                next_anniversary_date = datetime(anniversary_date.year + 1, hire_month, hire_day).date()
-            except ValueError:
-                next_anniversary_date = datetime(anniversary_date.year + 1, hire_month, hire_day - 1).date()
-            
-            # 소멸일이 지났는지 확인
-            if target_date >= next_anniversary_date:
-                # 기존 소멸 기록 확인
-                cursor.execute("""
-                    SELECT id FROM leave_expirations
-                    WHERE employee_id = ? AND leave_type = '연차' AND expiration_date = ?
-                    """, (employee_id, next_anniversary_date))
-                existing = cursor.fetchone()
-                
-                if not existing:
-                    # 입사기념일 기준으로 생성된 연차 계산
-                    annual_leave_generated = self.calculate_annual_leave(hire_date, anniversary_date)
-                    
-                    # 입사기념일부터 다음년도 입사기념일 직전까지 사용한 연차 계산
-                    cursor.execute("""
-                        SELECT SUM(leave_amount) as total_used
-                        FROM leave_records
-                        WHERE employee_id = ? AND leave_type = '연차'
-                        AND leave_date >= ? AND leave_date < ?
-                        """, (employee_id, anniversary_date, next_anniversary_date))
-                    result = cursor.fetchone()
-                    total_used = result[0] if result[0] else 0
-                    
-                    expired_amount = annual_leave_generated - total_used
-                    
-                    if expired_amount > 0:
-                        cursor.execute("""
-                            INSERT INTO leave_expirations 
-                            (employee_id, leave_type, expired_amount, expiration_date, year)
-                            VALUES (?, ?, ?, ?, ?)
-                            """, (employee_id, '연차', expired_amount, next_anniversary_date, target_date.year))
-                        expired_total += expired_amount
-            else:
-                # 아직 소멸일이 지나지 않았으면 중단
-                break
-        
-        conn.commit()
-        conn.close()
-        return expired_total
-
-
-class AttendanceCalculator:
-    """출퇴근 계산 클래스"""
+    def record_cell_edits(self, items):
+        """이미 기록된 여러 셀 변경을 하나의 편집으로 처리 (일괄 편집 중이면 모아 둠)"""
+        if self._cell_edit_depth:
+            for item in items:
+                self._cell_edits[(item.row(), item.column())] = item
+        else:
+            self._flush_cell_edits(items)
     
-    def __init__(self, db_manager):
-        self.db = db_manager
+    def _journal_cell_edit(self, item, row, col):
+        """일괄 편집 중이면 변경을 모아 두고 True (같은 셀은 마지막 변경만 유지)"""
+        if not self._cell_edit_depth:
+            return False
+        self._cell_edits[(row, col)] = item
+        return True
     
-    def process_attendance_record(self, employee_id, work_date, arrival_time, departure_time, leave_type=None, remarks=None, conn=None):
-        """출퇴근 기록 처리 및 계산
-        
-        Args:
-            employee_id: 직원 ID
-            work_date: 근무일
-            arrival_time: 출근 시간
-            departure_time: 퇴근 시간
-            leave_type: 휴가 유형
-            remarks: 비고
-            conn: 데이터베이스 연결 (None이면 새로 생성)
-        """
-        try:
-            if isinstance(work_date, str):
-                work_date = datetime.strptime(work_date, "%Y-%m-%d").date()
-            if isinstance(arrival_time, str):
-                # HH:MM:SS 또는 HH:MM 형식 처리
-                try:
-                    if len(arrival_time) >= 8:
-                        arrival_time = datetime.strptime(arrival_time, "%H:%M:%S").time()
-                    else:
-                        arrival_time = datetime.strptime(arrival_time, "%H:%M").time()
-                except:
-                    arrival_time = None
-            if isinstance(departure_time, str):
-                # HH:MM:SS 또는 HH:MM 형식 처리
-                try:
-                    if len(departure_time) >= 8:
-                        departure_time = datetime.strptime(departure_time, "%H:%M:%S").time()
-                    else:
-                        departure_time = datetime.strptime(departure_time, "%H:%M").time()
-                except:
-                    departure_time = None
-            
-            early_arrival = 0
-            late_arrival = 0
-            late_departure = 0
-            
-            if arrival_time is not None:
-                early_arrival = 1 if arrival_time < datetime.strptime("08:00", "%H:%M").time() else 0
-                late_arrival = 1 if arrival_time > datetime.strptime("09:00", "%H:%M").time() else 0
-            
-            if departure_time is not None:
-                late_departure = 1 if departure_time >= datetime.strptime("20:00", "%H:%M").time() else 0
-            
-            # connection이 제공되지 않으면 새로 생성
-            should_close = False
-            if conn is None:
-                conn = self.db.get_connection()
-                should_close = True
-            
-            cursor = conn.cursor()
-            
-            try:
-                arrival_time_str = arrival_time.strftime("%H:%M:%S") if arrival_time else None
-                departure_time_str = departure_time.strftime("%H:%M:%S") if departure_time else None
-                
-                cursor.execute("""
-                    INSERT OR REPLACE INTO attendance_records
-                    (employee_id, work_date, arrival_time, departure_time, 
-                     early_arrival, late_arrival, late_departure, leave_type, remarks)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (employee_id, work_date, arrival_time_str, departure_time_str, 
-                      early_arrival, late_arrival, late_departure, leave_type, remarks))
-                
-                conn.commit()
-            except Exception as e:
-                conn.rollback()
-                raise Exception(f"데이터베이스 저장 중 오류: {str(e)}")
-            finally:
-                if should_close:
-                    conn.close()
-        except Exception as e:
-            # 예외를 다시 발생시켜 호출자가 처리할 수 있도록 함
-            raise
+    def _flush_cell_edits(self, items):
+        """모아 둔 셀 변경을 한 번에 처리 (기본: 처리 없음)"""
 
 
 # GUI 클래스들 - PySide6 + QTableWidget 사용
@@ -625,14 +209,20 @@ if not PYSIDE6_AVAILABLE:
         pass
 
 if PYSIDE6_AVAILABLE:
-    class LeaveManagementGUI(QWidget):
+    class LeaveManagementGUI(ChangeListenerMixin, CellEditJournalMixin, QWidget):
         """연월차 관리 GUI"""
         
-        def __init__(self, parent, db_manager, leave_calculator, employee_gui=None):
+        def __init__(self, parent, db_manager, leave_calculator, employee_gui=None, change_bus=None):
             super().__init__(parent)
             self.db = db_manager
             self.calculator = leave_calculator
             self.employee_gui = employee_gui  # 재직인원 탭 참조
+            # 탭 간 변경 알림 (다른 탭에서 저장하면 관련 직원 행만 갱신)
+            self._init_change_listener(change_bus)
+            # 붙여넣기/삭제로 바뀐 셀은 모아서 한 트랜잭션에 저장
+            self._init_cell_edit_journal()
+            self._leave_rows = {}
+            self._leave_rows_year = None
             
             layout = QVBoxLayout(self)
             
@@ -643,6 +233,7 @@ if PYSIDE6_AVAILABLE:
             button_layout.addWidget(QPushButton("엑셀 다운로드", clicked=self.download_combined_excel))
             button_layout.addWidget(QPushButton("연차 사용 등록", clicked=self.register_leave))
             button_layout.addWidget(QPushButton("소멸 내역 조회", clicked=self.view_expirations))
+            button_layout.addWidget(QPushButton("연말 마감", clicked=self.close_year))
             button_layout.addWidget(QPushButton("새로고침", clicked=self.refresh_data))
             button_layout.addStretch()
             # 재직인원 수 표시 레이블
@@ -656,6 +247,10 @@ if PYSIDE6_AVAILABLE:
             button_layout.addWidget(self.today_label)
             layout.addLayout(button_layout)
             
+            # 년도/퇴사자 표시 변경 시 원장 계산은 작업 스레드에서 실행 (연속 변경은 마지막 선택만 계산)
+            self._year_loader = BackgroundLoader(self.db, self._load_year_in_background, self._apply_loaded_year,
+                                                 self._on_year_load_error, parent=self)
+            
             # 조회 기간 선택
             year_layout = QHBoxLayout()
             year_layout.addWidget(QLabel("조회 기간:"))
@@ -668,7 +263,7 @@ if PYSIDE6_AVAILABLE:
                 self.year_combo.addItem(str(year), year)
             self.year_combo.setCurrentText(str(current_year))
             self.year_combo.setMaxVisibleItems(20)  # 드롭다운 열었을 때 모든 년도가 보이도록 설정
-            self.year_combo.currentIndexChanged.connect(self.refresh_data)  # 년도 변경 시 자동 새로고침
+            self.year_combo.currentIndexChanged.connect(self.request_refresh)  # 년도 변경 시 자동 새로고침 (백그라운드)
             
             year_layout.addWidget(self.year_combo)
             year_layout.addWidget(QLabel("년"))
@@ -683,12 +278,11 @@ if PYSIDE6_AVAILABLE:
                 self.show_inactive_checkbox.setChecked(self.employee_gui.show_inactive_checkbox.isChecked())
                 # 재직인원 탭의 체크박스 상태 변경 시 이 탭의 체크박스도 업데이트 (비동기로 처리)
                 def sync_from_employee():
-                    from PySide6.QtCore import QTimer
                     self.show_inactive_checkbox.blockSignals(True)
                     self.show_inactive_checkbox.setChecked(self.employee_gui.show_inactive_checkbox.isChecked())
                     self.show_inactive_checkbox.blockSignals(False)
-                    # 비동기로 새로고침하여 데이터베이스 충돌 방지
-                    QTimer.singleShot(50, lambda: self.refresh_data())
+                    # 백그라운드로 새로고침 (다른 탭에서 연달아 요청해도 마지막 한 번만 계산)
+                    self.request_refresh()
                 self.employee_gui.show_inactive_checkbox.stateChanged.connect(sync_from_employee)
                 # 이 탭의 체크박스 상태 변경 시 재직인원 탭의 체크박스도 업데이트
                 def sync_to_employee():
@@ -704,19 +298,19 @@ if PYSIDE6_AVAILABLE:
                         self.employee_gui.leave_gui.show_inactive_checkbox.blockSignals(True)
                         self.employee_gui.leave_gui.show_inactive_checkbox.setChecked(self.show_inactive_checkbox.isChecked())
                         self.employee_gui.leave_gui.show_inactive_checkbox.blockSignals(False)
-                        QTimer.singleShot(100, lambda: self.employee_gui.leave_gui.refresh_data() if self.employee_gui and self.employee_gui.leave_gui else None)
+                        self.employee_gui.leave_gui.request_refresh()
                     if self.employee_gui.attendance_gui:
                         self.employee_gui.attendance_gui.show_inactive_checkbox.blockSignals(True)
                         self.employee_gui.attendance_gui.show_inactive_checkbox.setChecked(self.show_inactive_checkbox.isChecked())
                         self.employee_gui.attendance_gui.show_inactive_checkbox.blockSignals(False)
-                        QTimer.singleShot(150, lambda: self.employee_gui.attendance_gui.refresh_data() if self.employee_gui and self.employee_gui.attendance_gui else None)
-                    # 이 탭도 비동기로 새로고침
-                    QTimer.singleShot(0, lambda: self.refresh_data())
+                        self.employee_gui.attendance_gui.request_refresh()
+                    # 이 탭도 백그라운드로 새로고침
+                    self.request_refresh()
                 self.show_inactive_checkbox.stateChanged.connect(sync_to_employee)
             else:
                 # 재직인원 탭이 없으면 독립적으로 동작
                 self.show_inactive_checkbox.setChecked(False)
-                self.show_inactive_checkbox.stateChanged.connect(self.refresh_data)
+                self.show_inactive_checkbox.stateChanged.connect(self.request_refresh)
             option_layout.addWidget(self.show_inactive_checkbox)
             option_layout.addStretch()
             layout.addLayout(option_layout)
@@ -764,22 +358,78 @@ if PYSIDE6_AVAILABLE:
         
         def refresh_data(self):
             """데이터 새로고침"""
-            self._is_refreshing = True  # 새로고침 시작
-            self.table.setRowCount(0)
-            
-            # 선택된 년도 가져오기
+            # 진행 중인 백그라운드 조회는 취소하고 최신 데이터로 바로 다시 그림 (저장 직후 등)
+            self._year_loader.cancel()
+            self._show_year(self._selected_year())
+        
+        def request_refresh(self):
+            """년도/퇴사자 표시 변경 시 백그라운드에서 조회 (연속 변경은 마지막 선택만 계산)"""
+            # 조회가 끝날 때까지 이전 년도 셀을 편집하지 않도록 잠금 (적용 시 해제)
+            self.table.setEnabled(False)
+            self._year_loader.request((self._selected_year(), self.show_inactive_checkbox.isChecked()))
+        
+        def cancel_background_refresh(self):
+            self._year_loader.cancel()
+        
+        def _selected_year(self):
             selected_year = self.year_combo.currentData()
             if selected_year is None:
                 selected_year = datetime.now().year
-            
-            # 조회 기간에 맞춰 헤더 업데이트
-            prev_year = selected_year - 1
-            prev_year_text = f"{prev_year}년 남은연차"
-            current_year_text = f"{selected_year}년 사용연차"
-            self.table.setHorizontalHeaderItem(4, QTableWidgetItem(prev_year_text))
-            self.table.setHorizontalHeaderItem(17, QTableWidgetItem(current_year_text))
-            
-            conn = self.db.get_connection()
+            return selected_year
+        
+        def _load_year_in_background(self, conn, key):
+            """작업 스레드: 원장 계산"""
+            selected_year, show_inactive = key
+            return self._load_year_data(conn, selected_year, show_inactive)
+        
+        def _apply_loaded_year(self, key, loaded):
+            if key != (self._selected_year(), self.show_inactive_checkbox.isChecked()):
+                return  # 그 사이 선택이 바뀜 (새 요청이 이어서 처리)
+            self._show_year(key[0], loaded)
+        
+        def _on_year_load_error(self, key, error):
+            logger.error("연월차 조회 오류: %s", error)
+            self.refresh_data()
+        
+        def on_data_changed(self, event):
+            """다른 탭의 변경 알림 - 원장 계산 기간(전전년도~다음 년도)과 겹치는 변경만 반영"""
+            if event.source is self:
+                return
+            if event.kind == EMPLOYEE_CHANGED:
+                self._mark_dirty(None)
+            elif event.kind in (ATTENDANCE_CHANGED, LEAVE_CHANGED):
+                selected_year = self._selected_year()
+                if event.overlaps_years(selected_year - 2, selected_year + 1):
+                    self._mark_dirty(event.employee_ids)
+        
+        def _full_refresh(self):
+            self.request_refresh()
+        
+        def _patch_rows(self, employee_ids):
+            """표시 중인 년도에서 해당 직원 행만 다시 계산/표시"""
+            selected_year = self._selected_year()
+            if self._leave_rows_year != selected_year or self._year_loader.is_busy():
+                self.request_refresh()
+                return
+            targets = [self._leave_rows[emp_id] for emp_id in employee_ids if emp_id in self._leave_rows]
+            if not targets:
+                return  # 표시 중인 직원이 아님 (퇴사자 숨김 등)
+            self._is_refreshing = True
+            try:
+                with self.db.connection() as conn:
+                    ledger = LeaveLedger(self.calculator).build(
+                        conn, [(emp[0], emp[3], emp[4]) for row, emp in targets], selected_year)
+                    self._store_ledger(conn.cursor(), ledger, selected_year)
+                    conn.commit()
+                for row, emp in targets:
+                    self._fill_leave_row(row, emp, ledger.loc[emp[0]], selected_year)
+            except Exception as e:
+                logger.exception("연월차 행 갱신 오류")
+            finally:
+                self._is_refreshing = False
+        
+        def _load_year_data(self, conn, selected_year, show_inactive):
+            """해당 년도 표시용 (직원 목록, 원장) 조회 - 위젯에 접근하지 않으므로 작업 스레드에서도 호출 가능"""
             cursor = conn.cursor()
             
             # 퇴사일을 고려한 조회: 퇴사일이 있으면 해당 년도/월까지 표시
@@ -810,34 +460,55 @@ if PYSIDE6_AVAILABLE:
             """)
             all_employees = cursor.fetchall()
             
-            # 퇴사자 표시 옵션 확인
-            show_inactive = self.show_inactive_checkbox.isChecked()
-            
             # 퇴사일을 고려한 필터링: 활성 직원 또는 퇴사일이 선택한 년도 이하인 경우만 표시
             employees = []
             for emp in all_employees:
                 emp_id, dept, pos, name, hire_date, display_order, is_active, resignation_date = emp
                 
-                # resignation_date가 문자열인 경우 date 객체로 변환
-                if resignation_date and isinstance(resignation_date, str):
-                    try:
-                        resignation_date = datetime.strptime(resignation_date, "%Y-%m-%d").date()
-                    except:
-                        resignation_date = None
-                
                 if is_active == 1:
                     # 활성 직원은 항상 표시
                     employees.append((emp_id, dept, pos, name, hire_date, display_order))
                 elif show_inactive:
                     # 퇴사자 표시 체크박스가 체크되어 있으면 모든 퇴사자 표시
                     employees.append((emp_id, dept, pos, name, hire_date, display_order))
-                # 체크박스가 OFF이면 퇴사자는 표시하지 않음 (기존 로직 제거)
             
-            current_date = datetime(selected_year, 11, 1).date()
+            # 전체 직원 원장 계산 (테이블별 1회 조회 + 벡터화 집계)
+            # 소멸 기록은 ExpirationScheduler가 시작 시/날짜 변경 시 처리하므로 여기서는 읽기만 합니다.
+            return employees, LeaveLedger(self.calculator).build(
+                conn, [(emp_id, name, hire_date) for emp_id, dept, pos, name, hire_date, display_order in employees],
+                selected_year
+            )
+        
+        def _show_year(self, selected_year, loaded=None):
+            """해당 년도를 화면에 표시 (loaded: 백그라운드에서 미리 조회한 결과)"""
+            self._is_refreshing = True  # 새로고침 시작
+            self.table.setRowCount(0)
+            
+            # 조회 기간에 맞춰 헤더 업데이트
+            prev_year = selected_year - 1
+            prev_year_text = f"{prev_year}년 남은연차"
+            current_year_text = f"{selected_year}년 사용연차"
+            self.table.setHorizontalHeaderItem(4, QTableWidgetItem(prev_year_text))
+            self.table.setHorizontalHeaderItem(17, QTableWidgetItem(current_year_text))
+            
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
+            
+            # 1단계: 전체 직원 원장 계산 (테이블별 1회 조회 + 벡터화 집계)
+            if loaded is None:
+                loaded = self._load_year_data(conn, selected_year, self.show_inactive_checkbox.isChecked())
+            employees, ledger = loaded
+            
+            # 2단계: 계산 결과 저장
+            self._store_ledger(cursor, ledger, selected_year)
             
+            # 3단계: 화면 표시
+            self._leave_rows = {}  # 직원 ID -> (행 번호, 직원 정보) - 일부 행 갱신용
+            self._leave_rows_year = selected_year
             current_department = None
             employee_row_number = 1  # 실제 직원 행 번호 카운터
-            for emp_id, dept, pos, name, hire_date, display_order in employees:
+            for emp in employees:
+                emp_id, dept = emp[0], emp[1]
                 # 부서가 변경되면 구분자 추가
                 if current_department != dept:
                     # 구분자 행 추가
@@ -857,1115 +528,137 @@ if PYSIDE6_AVAILABLE:
                     self.table.setSpan(separator_row, 0, 1, self.table.columnCount())
                     
                     current_department = dept
-                hire_date_obj = datetime.strptime(hire_date, "%Y-%m-%d").date()
-                
-                self.calculator.check_monthly_leave_expiration(emp_id, hire_date_obj, current_date)
-                self.calculator.check_annual_leave_expiration(emp_id, current_date)
-                
-                # 입사일 기준 연차 생성일 계산
-                # 예: 2022-08-01 입사 → 2023-08-01에 첫 연차 생성, 2025-08-01에 만 3년 연차 생성
-                hire_year = hire_date_obj.year
-                hire_month = hire_date_obj.month
-                hire_day = hire_date_obj.day
                 
-                # 선택된 년도의 입사기념일 계산
-                try:
-                    anniversary_date = datetime(selected_year, hire_month, hire_day).date()
-                except ValueError:
-                    # 2월 29일 같은 경우 처리
-                    anniversary_date = datetime(selected_year, hire_month, hire_day - 1).date()
+                # 행 추가
+                row = self.table.rowCount()
+                self.table.insertRow(row)
                 
-                # 이전 입사기념일 계산 (선택된 년도 이전의 마지막 입사기념일)
-                prev_anniversary_year = selected_year - 1
-                try:
-                    prev_anniversary_date = datetime(prev_anniversary_year, hire_month, hire_day).date()
-                except ValueError:
-                    prev_anniversary_date = datetime(prev_anniversary_year, hire_month, hire_day - 1).date()
+                # 실제 직원 행의 행 번호 설정
+                self.table.setVerticalHeaderItem(row, QTableWidgetItem(str(employee_row_number)))
+                employee_row_number += 1
                 
-                # 입사일부터 입사기념일까지의 일수 계산
-                # 입사일과 입사기념일이 같은 경우(같은 년도 입사) 0일이 되므로, 다음 년도 입사기념일까지의 일수로 계산
-                if anniversary_date <= hire_date_obj:
-                    # 입사기념일이 입사일보다 이전이거나 같으면 다음 년도 입사기념일 사용
-                    next_anniversary_date = datetime(selected_year + 1, hire_month, hire_day).date()
-                    try:
-                        next_anniversary_date = datetime(selected_year + 1, hire_month, hire_day).date()
-                    except ValueError:
-                        next_anniversary_date = datetime(selected_year + 1, hire_month, hire_day - 1).date()
-                    days_from_hire_to_anniversary = (next_anniversary_date - hire_date_obj).days
+                self._fill_leave_row(row, emp, ledger.loc[emp_id], selected_year)
+                self._leave_rows[emp_id] = (row, emp)
+            
+            # 모든 작업 완료 후 한 번만 commit
+            try:
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.exception("데이터베이스 커밋 오류")
+            finally:
+                conn.close()
+            
+            # 재직인원 수 계산 (구분자 행 제외)
+            employee_count = len(employees)
+            if hasattr(self, 'employee_count_label'):
+                self.employee_count_label.setText(f"재직인원: {employee_count}명")
+            
+            self._is_refreshing = False  # 새로고침 완료
+            self.table.setEnabled(True)
+        
+        @staticmethod
+        def _format_ledger_value(val, col_idx=None):
+            """0.0 값은 빈 문자열로 변환 (col_idx: 잔여수 컬럼 19인 경우 0도 표시)"""
+            # None 체크
+            if val is None:
+                return ""
+            if isinstance(val, (int, float)):
+                val_float = float(val)
+                # 잔여수 컬럼(19)인 경우 0도 표시, 음수도 표시
+                if col_idx == 19:
+                    if val_float.is_integer():
+                        return str(int(val_float))
+                    return f"{val_float:.1f}"
+                # 사용연차 컬럼(17)인 경우 소수점 표시 (반차 반영), 음수도 표시
+                if col_idx == 17:
+                    if val_float == 0.0:
+                        return ""
+                    if val_float.is_integer():
+                        return str(int(val_float))
+                    return f"{val_float:.1f}"
+                # 다른 컬럼은 0이면 빈 문자열
+                if val == 0 or val == 0.0:
+                    return ""
+                # 소수점이 0이면 정수로, 아니면 소수점 첫째 자리까지 표시 (예: 14.5)
+                if val_float.is_integer():
+                    return str(int(val_float))
+                return f"{val_float:.1f}"
+            return str(val) if val else ""
+        
+        def _store_ledger(self, cursor, ledger, selected_year):
+            """원장 계산 결과 저장"""
+            # 1년 이상 재직인원의 경우 해당 년도 잔여수를 저장 (다음 년도 조회 시 사용)
+            # 연말 마감한 년도는 마감 시 확정한 잔여수를 유지
+            try:
+                if not is_year_closed(cursor, selected_year):
+                    cursor.executemany("""
+                        INSERT OR REPLACE INTO leave_remaining_by_year
+                        (employee_id, year, remaining_amount, updated_at)
+                        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                    """, [(emp_id, selected_year, float(remaining))
+                          for emp_id, remaining in ledger.loc[ledger['is_one_year_or_more'].astype(bool), 'remaining'].items()])
+            except Exception as e:
+                logger.exception("잔여수 저장 오류")
+            
+            # 사용연차(17번), 연차발생수(18번), 잔여수(19번)는 항상 자동 계산 값만 사용하므로 수동 입력 값 삭제
+            cursor.executemany("""
+                DELETE FROM leave_manual_values
+                WHERE employee_id = ? AND year = ? AND column_index IN (17, 18, 19)
+            """, [(emp_id, selected_year) for emp_id in ledger.index])
+        
+        def _fill_leave_row(self, row, emp, entry, selected_year):
+            """직원 한 명의 원장 행 표시 (entry: LeaveLedger 결과의 해당 직원 행)"""
+            emp_id, dept, pos, name, hire_date, display_order = emp
+            used_current_year = float(entry['used'])
+            remaining = float(entry['remaining'])
+            manual_values_dict = entry['manual_values']
+            
+            base_values = [dept, pos, name, hire_date, self._format_ledger_value(float(entry['remaining_prev_year']))] + \
+                         [self._format_ledger_value(float(entry[month])) for month in MONTH_COLUMNS] + \
+                         [self._format_ledger_value(used_current_year, col_idx=17), self._format_ledger_value(float(entry['generated'])),
+                          self._format_ledger_value(remaining, col_idx=19), entry['expiration_text']]
+            
+            # 수동 입력 값이 있으면 우선 사용, 없으면 계산된 값 사용
+            # 단, 연차발생수(18번 컬럼), 잔여수(19번 컬럼), 사용연차(17번 컬럼)는 항상 자동 계산 값 사용
+            values = []
+            for col_idx, base_val in enumerate(base_values):
+                manual_val = manual_values_dict.get(col_idx)
+                values.append(manual_val if manual_val is not None else base_val)
+            
+            for col, val in enumerate(values):
+                item = QTableWidgetItem(val)
+                # 연차발생수(18번)와 잔여수(19번)는 편집 불가
+                if col == 18 or col == 19:
+                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                # 사용연차(17번)와 잔여수(19번) 음수 표시 (연차, 반차 모두)
+                if (col == 17 and used_current_year < 0) or (col == 19 and remaining < 0):
+                    item.setForeground(QColor("#FF0000"))  # 빨간색으로 표시
+                # 직원 ID와 컬럼 정보 저장 (월별 컬럼만 편집 가능)
+                if col >= 5 and col <= 16:  # 1월~12월 컬럼 (5번째부터 16번째까지)
+                    item.setData(Qt.UserRole, {'emp_id': emp_id, 'col': col, 'month': col - 4, 'year': selected_year})
                 else:
-                    days_from_hire_to_anniversary = (anniversary_date - hire_date_obj).days
-                
-                # 이전 년도 남은 연차 계산 (예: 2025년 선택 시 2024년 남은 연차)
-                # 입사일이 선택된 년도인 근로자는 해당 사항 없으니 0으로 표기
-                # 그 이전 근로자는 입사일에 맞춰서 계산
-                if hire_year >= selected_year:
-                    # 선택된 년도 입사자는 이전 년도 남은연차가 없음
-                    remaining_prev_year = 0.0
-                else:
-                    # 이전 년도 이전 입사자는 입사일에 맞춰서 계산
-                    # 이전 입사기념일부터 이번 입사기념일 직전까지 사용한 연차 계산
-                    cursor.execute("""
-                        SELECT work_date, leave_type, remarks
-                        FROM attendance_records
-                        WHERE employee_id = ? AND work_date >= ? AND work_date < ?
-                        AND leave_type IN ('연차', '반차', '휴가')
-                    """, (emp_id, prev_anniversary_date, anniversary_date))
-                    prev_records = cursor.fetchall()
-                    
-                    used_before_anniversary = 0.0
-                    반차_날짜_set_prev = set()
-                    
-                    for work_date, leave_type, remarks in prev_records:
-                        if leave_type == '연차' or leave_type == '휴가':
-                            used_before_anniversary += 1.0
-                        elif leave_type == '반차':
-                            if work_date not in 반차_날짜_set_prev:
-                                used_before_anniversary += 0.5
-                                반차_날짜_set_prev.add(work_date)
-                    
-                    # 이전 년도(prev_year) 연말 시점의 잔여수 계산
-                    # 이전 년도 연말 시점의 잔여수 = (이전 년도 연차 발생 수 - 이전 년도 사용연차) + (이전 년도 이전의 최종 남은 연차)
-                    prev_year = selected_year - 1
-                    prev_year_end = datetime(prev_year, 12, 31).date()
-                    
-                    # 이전 년도 연말 시점까지의 연차 발생 수 계산 (2025년 조회 시와 동일한 로직)
-                    # 입사기념일 계산
-                    prev_year_anniversary = datetime(prev_year, hire_month, hire_day).date()
-                    try:
-                        prev_year_anniversary = datetime(prev_year, hire_month, hire_day).date()
-                    except ValueError:
-                        prev_year_anniversary = datetime(prev_year, hire_month, hire_day - 1).date()
-                    
-                    if prev_year_anniversary <= hire_date_obj:
-                        try:
-                            prev_year_anniversary = datetime(prev_year + 1, hire_month, hire_day).date()
-                        except ValueError:
-                            prev_year_anniversary = datetime(prev_year + 1, hire_month, hire_day - 1).date()
-                    
-                    days_from_hire_to_prev_year_end = (prev_year_end - hire_date_obj).days
-                    
-                    if days_from_hire_to_prev_year_end < 0:
-                        annual_prev_anniversary = 0
-                    elif days_from_hire_to_prev_year_end < 365:
-                        # 1년 미만: 입사일부터 이전 년도 연말까지 월차 계산
-                        months_passed_prev = (prev_year_end.year - hire_date_obj.year) * 12 + (prev_year_end.month - hire_date_obj.month)
-                        if prev_year_end.day < hire_date_obj.day:
-                            months_passed_prev -= 1
-                        annual_prev_anniversary = min(max(months_passed_prev, 0), 11)
-                    elif prev_year_anniversary <= prev_year_end:
-                        # 입사 1년 경과 시: 입사기념일 기준으로 연차 계산
-                        annual_prev_anniversary = self.calculator.calculate_annual_leave(hire_date_obj, prev_year_anniversary)
-                    else:
-                        # 입사기념일이 이전 년도 이후: 연도 말일 기준으로 계산
-                        annual_prev_anniversary = self.calculator.calculate_annual_leave(hire_date_obj, prev_year_end)
-                    
-                    # 이전 년도에 사용한 연차 계산 (이전 년도 전체, 입사기념일 기준)
-                    # 입사기념일이 이전 년도 내에 있으면 입사기념일 이후만, 아니면 연도 전체
-                    if prev_year_anniversary <= prev_year_end:
-                        # 입사기념일이 이전 년도 내에 있음
-                        if hire_date_obj.year == prev_year:
-                            usage_start_date_prev = hire_date_obj
-                        else:
-                            usage_start_date_prev = prev_year_anniversary
-                    else:
-                        # 입사기념일이 이전 년도 이후에 있음
-                        if hire_date_obj.year == prev_year:
-                            usage_start_date_prev = hire_date_obj
-                        else:
-                            usage_start_date_prev = datetime(prev_year, 1, 1).date()
-                    
-                    cursor.execute("""
-                        SELECT work_date, leave_type, remarks
-                        FROM attendance_records
-                        WHERE employee_id = ? AND work_date >= ? AND work_date < ?
-                        AND (leave_type IN ('연차', '반차', '휴가') 
-                             OR remarks IN ('반차_출근', '반차_퇴근'))
-                    """, (emp_id, 
-                          usage_start_date_prev,
-                          datetime(prev_year + 1, 1, 1).date()))
-                    prev_year_records = cursor.fetchall()
-                    
-                    used_prev_year = 0.0
-                    반차_날짜_set_prev_year = set()
-                    
-                    for work_date, leave_type, remarks in prev_year_records:
-                        is_half_day = (leave_type == '반차' or remarks == '반차_출근' or remarks == '반차_퇴근')
-                        if leave_type == '연차' or leave_type == '휴가':
-                            used_prev_year += 1.0
-                        elif is_half_day:
-                            if work_date not in 반차_날짜_set_prev_year:
-                                used_prev_year += 0.5
-                                반차_날짜_set_prev_year.add(work_date)
-                    
-                    # 이전 년도 이전의 최종 남은 연차 계산 (소멸 차감 포함)
-                    # 이전 년도 이전의 남은 연차 계산
-                    prev_prev_year = prev_year - 1
-                    if prev_prev_year >= hire_date_obj.year:
-                        # 이전 년도 이전의 연말 시점까지의 연차 발생 수 계산
-                        prev_prev_year_end = datetime(prev_prev_year, 12, 31).date()
-                        days_from_hire_to_prev_prev_year_end = (prev_prev_year_end - hire_date_obj).days
-                        
-                        if days_from_hire_to_prev_prev_year_end < 0:
-                            annual_prev_prev_anniversary = 0
-                        elif days_from_hire_to_prev_prev_year_end < 365:
-                            months_passed_prev_prev = (prev_prev_year_end.year - hire_date_obj.year) * 12 + (prev_prev_year_end.month - hire_date_obj.month)
-                            if prev_prev_year_end.day < hire_date_obj.day:
-                                months_passed_prev_prev -= 1
-                            annual_prev_prev_anniversary = min(max(months_passed_prev_prev, 0), 11)
-                        else:
-                            annual_prev_prev_anniversary = self.calculator.calculate_annual_leave(hire_date_obj, prev_prev_year_end)
-                        
-                        # 이전 년도 이전에 사용한 연차 계산
-                        cursor.execute("""
-                            SELECT work_date, leave_type, remarks
-                            FROM attendance_records
-                            WHERE employee_id = ? AND work_date >= ? AND work_date < ?
-                            AND leave_type IN ('연차', '반차', '휴가')
-                        """, (emp_id, 
-                              datetime(prev_prev_year, 1, 1).date(),
-                              datetime(prev_prev_year + 1, 1, 1).date()))
-                        prev_prev_year_records = cursor.fetchall()
-                        
-                        used_prev_prev_year = 0.0
-                        반차_날짜_set_prev_prev_year = set()
-                        
-                        for work_date, leave_type, remarks in prev_prev_year_records:
-                            if leave_type == '연차' or leave_type == '휴가':
-                                used_prev_prev_year += 1.0
-                            elif leave_type == '반차':
-                                if work_date not in 반차_날짜_set_prev_prev_year:
-                                    used_prev_prev_year += 0.5
-                                    반차_날짜_set_prev_prev_year.add(work_date)
-                        
-                        remaining_prev_prev_year = annual_prev_prev_anniversary - used_prev_prev_year
-                    else:
-                        remaining_prev_prev_year = 0.0
-                    
-                    # 이전 년도 연말 시점 이전에 소멸된 연차 조회
-                    cursor.execute("""
-                        SELECT SUM(expired_amount) as total_expired
-                        FROM leave_expirations
-                        WHERE employee_id = ? AND leave_type = '연차' AND expiration_date <= ?
-                    """, (emp_id, prev_year_end))
-                    expired_result = cursor.fetchone()
-                    total_expired_prev = expired_result[0] if expired_result[0] else 0
-                    
-                    # 이전 년도 이전의 최종 남은 연차 (소멸 차감 적용)
-                    remaining_prev_prev_year_float = float(remaining_prev_prev_year) if remaining_prev_prev_year is not None else 0.0
-                    total_expired_prev_float = float(total_expired_prev) if total_expired_prev is not None else 0.0
-                    remaining_prev_prev_year_final = max(0.0, remaining_prev_prev_year_float - total_expired_prev_float)
-                    
-                    # 이전 년도 연말 시점의 잔여수 계산
-                    # 1년 이상 재직인원이고 2026년 조회 시: 저장된 2025년 잔여수 사용
-                    if selected_year >= 2026 and self.calculator.is_one_year_or_more(name, hire_date_obj):
-                        # 저장된 이전 년도 잔여수 조회
-                        cursor.execute("""
-                            SELECT remaining_amount FROM leave_remaining_by_year
-                            WHERE employee_id = ? AND year = ?
-                        """, (emp_id, prev_year))
-                        stored_remaining = cursor.fetchone()
-                        if stored_remaining:
-                            # 저장된 값이 있으면 그대로 사용
-                            remaining_prev_year = float(stored_remaining[0])
-                        else:
-                            # 저장된 값이 없으면 계산
-                            remaining_prev_year = (annual_prev_anniversary - used_prev_year) + remaining_prev_prev_year_final
-                    else:
-                        # 그 외의 경우: 계산된 값 사용
-                        remaining_prev_year = (annual_prev_anniversary - used_prev_year) + remaining_prev_prev_year_final
-                
-                # 월별 사용량 (연차, 반차, 휴가 포함) - 선택된 년도
-                # 출퇴근 관리대장의 attendance_records에서 직접 계산하여 반영
-                monthly_usage = []
-                for month in range(1, 13):
-                    month_start = datetime(selected_year, month, 1).date()
-                    month_end = datetime(selected_year, month + 1, 1).date() if month < 12 else datetime(selected_year + 1, 1, 1).date()
-                    
-                    # 입사기념일 필터링 로직:
-                    # - 입사기념일이 해당 월보다 이전이면 해당 월 전체 계산
-                    # - 입사기념일이 해당 월 내에 있으면 입사기념일 이후만 계산
-                    # - 입사기념일이 해당 월보다 이후이면 해당 월 전체 계산 (이전 년도에 생성된 연차 사용 가능)
-                    if anniversary_date < month_start:
-                        # 입사기념일이 해당 월보다 이전이면 해당 월 전체 계산
-                        query_start = month_start
-                    elif anniversary_date < month_end:
-                        # 입사기념일이 해당 월 내에 있으면 입사기념일 이후만 계산
-                        query_start = anniversary_date
-                    else:
-                        # 입사기념일이 해당 월보다 이후이면 해당 월 전체 계산
-                        query_start = month_start
-                    
-                    # attendance_records에서 work_date를 가져와서 정확히 계산
-                    cursor.execute("""
-                        SELECT work_date, leave_type, remarks
-                        FROM attendance_records
-                        WHERE employee_id = ? AND work_date >= ? AND work_date < ?
-                        AND (leave_type IN ('연차', '반차', '휴가') 
-                             OR remarks IN ('반차_출근', '반차_퇴근'))
-                    """, (emp_id, query_start, month_end))
-                    month_records = cursor.fetchall()
-                    
-                    month_leave_amount = 0.0
-                    반차_날짜_set = set()  # 반차 중복 방지
-                    
-                    for work_date, leave_type, remarks in month_records:
-                        # remarks가 반차_출근 또는 반차_퇴근인 경우도 반차로 처리
-                        is_half_day = (leave_type == '반차' or remarks == '반차_출근' or remarks == '반차_퇴근')
-                        
-                        if leave_type == '연차' or leave_type == '휴가':
-                            month_leave_amount += 1.0
-                        elif is_half_day:
-                            # 반차는 하루에 0.5만 (같은 날짜에 여러 번 있어도 한 번만)
-                            if work_date not in 반차_날짜_set:
-                                month_leave_amount += 0.5
-                                반차_날짜_set.add(work_date)
-                    
-                    monthly_usage.append(month_leave_amount)
-                
-                # 선택된 년도 입사기념일 이후 사용량 (연차, 반차, 휴가 포함)
-                # 출퇴근 관리대장의 attendance_records에서 직접 계산
-                # 입사기념일이 선택된 년도 내에 있으면 입사기념일 이후만, 아니면 연도 전체
-                # 단, 입사일이 선택된 년도 내에 있고 입사기념일이 선택된 년도 내에 있으면
-                # 입사일부터 계산 (입사일 이후 발생한 연차 사용 가능)
-                if anniversary_date <= datetime(selected_year, 12, 31).date():
-                    # 입사기념일이 선택된 년도 내에 있음
-                    # 입사일이 선택된 년도 내에 있으면 입사일부터, 아니면 입사기념일부터
-                    if hire_date_obj.year == selected_year:
-                        # 입사일이 선택된 년도 내에 있으면 입사일부터 계산
-                        usage_start_date = hire_date_obj
-                    else:
-                        # 입사일이 선택된 년도 이전이면 입사기념일부터 계산
-                        # 입사기념일 당일부터 포함하여 계산 (>= 대신 > 사용 시 당일 제외됨)
-                        usage_start_date = anniversary_date
-                else:
-                    # 입사기념일이 선택된 년도 이후에 있음 (아직 생성 안 됨)
-                    # 입사일이 선택된 년도 내에 있으면 입사일부터, 아니면 연도 시작부터
-                    if hire_date_obj.year == selected_year:
-                        usage_start_date = hire_date_obj
-                    else:
-                        usage_start_date = datetime(selected_year, 1, 1).date()
-                
-                cursor.execute("""
-                    SELECT work_date, leave_type, remarks
-                    FROM attendance_records
-                    WHERE employee_id = ? AND work_date >= ? AND work_date < ?
-                    AND (leave_type IN ('연차', '반차', '휴가') 
-                         OR remarks IN ('반차_출근', '반차_퇴근'))
-                """, (emp_id,
-                      usage_start_date,
-                      datetime(selected_year + 1, 1, 1).date()))
-                year_records = cursor.fetchall()
-                
-                used_current_year = 0.0
-                반차_날짜_set = set()  # 반차 중복 방지
-                
-                for work_date, leave_type, remarks in year_records:
-                    # remarks가 반차_출근 또는 반차_퇴근인 경우도 반차로 처리
-                    is_half_day = (leave_type == '반차' or remarks == '반차_출근' or remarks == '반차_퇴근')
-                    
-                    if leave_type == '연차' or leave_type == '휴가':
-                        used_current_year += 1.0
-                    elif is_half_day:
-                        # 반차는 하루에 0.5만 (같은 날짜에 여러 번 있어도 한 번만)
-                        if work_date not in 반차_날짜_set:
-                            used_current_year += 0.5
-                            반차_날짜_set.add(work_date)
-                            # 디버깅: 반차 추가 확인
-                            if name == "김미라":
-                                print(f"DEBUG {name} (refresh_data): 반차 추가 - work_date={work_date}, used_current_year={used_current_year}")
-                
-                # 수동 입력된 월별 연차 사용량도 사용연차에 포함
-                # 월별 컬럼은 5번(1월)부터 16번(12월)까지
-                # 입사기념일 이후의 월만 포함해야 함
-                cursor.execute("""
-                    SELECT column_index, manual_value
-                    FROM leave_manual_values
-                    WHERE employee_id = ? AND year = ? AND column_index >= 5 AND column_index <= 16
-                """, (emp_id, selected_year))
-                manual_monthly_values = cursor.fetchall()
-                
-                manual_used_current_year = 0.0
-                for col_idx, manual_val in manual_monthly_values:
-                    if manual_val:
-                        try:
-                            month_value = float(manual_val)
-                            # 컬럼 인덱스 5=1월, 6=2월, ..., 16=12월
-                            month = col_idx - 4
-                            month_start = datetime(selected_year, month, 1).date()
-                            # 월의 마지막 날짜 계산
-                            if month == 12:
-                                month_end = datetime(selected_year + 1, 1, 1).date()
-                            else:
-                                month_end = datetime(selected_year, month + 1, 1).date()
-                            
-                            # 입사기념일 이후의 월만 포함
-                            # 입사기념일이 속한 월은 제외하고, 그 다음 월부터 포함
-                            if anniversary_date <= datetime(selected_year, 12, 31).date():
-                                # 입사기념일이 선택된 년도 내에 있으면 입사기념일이 속한 월을 제외하고 그 다음 월부터 포함
-                                # 입사기념일이 해당 월 내에 있으면 해당 월 수동 입력은 사용연차 계산에서 제외 (경고 로그 출력)
-                                if anniversary_date >= month_start and anniversary_date < month_end:
-                                    try:
-                                        print(f"WARNING {name}: 입사기념일이 속한 {month}월의 수동 입력 값({month_value})은 2025년 사용연차 계산에서 제외됩니다. 출퇴근 관리대장 기록만 반영됩니다.")
-                                    except Exception:
-                                        pass
-                                    continue
-                                elif month_start > anniversary_date:
-                                    # 입사기념일 이후의 월만 포함
-                                    manual_used_current_year += month_value
-                            else:
-                                # 입사기념일이 선택된 년도 이후에 있으면 모든 월 포함
-                                manual_used_current_year += month_value
-                        except (ValueError, TypeError):
-                            pass
-                
-                # attendance_records에서 계산한 값과 수동 입력 월별 값을 합산
-                used_current_year += manual_used_current_year
-                
-                # 디버깅: 사용연차 계산 결과 확인 (refresh_data)
-                if name == "김미라" or name == "전금희" or name == "강지승":
-                    print(f"DEBUG {name} (refresh_data): 입사일={hire_date_obj}, 입사기념일={anniversary_date}, usage_start_date={usage_start_date}, year_records 개수={len(year_records)}, 반차_날짜_set={반차_날짜_set}")
-                    print(f"DEBUG {name} (refresh_data): attendance_records에서 계산={used_current_year - manual_used_current_year}, 수동 입력 월별={manual_used_current_year}, 합계={used_current_year}")
-                    print(f"DEBUG {name} (refresh_data): 조회 기간 = {usage_start_date} ~ {datetime(selected_year + 1, 1, 1).date()}")
-                    if manual_monthly_values:
-                        print(f"DEBUG {name} (refresh_data): 수동 입력 월별 값 개수={len(manual_monthly_values)}")
-                        for col_idx, manual_val in manual_monthly_values:
-                            if manual_val:
-                                try:
-                                    month_value = float(manual_val)
-                                    month = col_idx - 4
-                                    month_start = datetime(selected_year, month, 1).date()
-                                    print(f"DEBUG {name} (refresh_data): 수동 입력 - {month}월: {month_value}, month_start={month_start}, anniversary_date={anniversary_date}")
-                                except (ValueError, TypeError):
-                                    pass
-                    for work_date, leave_type, remarks in year_records:
-                        is_half_day_check = (leave_type == '반차' or remarks == '반차_출근' or remarks == '반차_퇴근')
-                        print(f"DEBUG {name} (refresh_data): work_date={work_date}, leave_type={leave_type}, remarks={remarks}, is_half_day={is_half_day_check}")
-                
-                # 연차 발생 수 계산 (입사기념일 기준)
-                # - 입사 1년 미만: 입사일 기준으로 1개월 만근 시 연차 1개 발생 (최대 11개)
-                # - 입사 1년 경과 시: 입사일 기준으로 연차 15개 부여
-                # - 근속연수 증가 시: 만3년차 16일, 만5년차 17일, 만7년차 18일, 만25년차 25일 (최대)
-                # 입사일부터 입사기념일까지의 일수 계산
-                # 입사일과 입사기념일이 같은 경우(같은 년도 입사) 다음 년도 입사기념일까지의 일수로 계산
-                if anniversary_date <= hire_date_obj:
-                    # 입사기념일이 입사일보다 이전이거나 같으면 다음 년도 입사기념일 사용
-                    try:
-                        next_anniversary_date = datetime(selected_year + 1, hire_month, hire_day).date()
-                    except ValueError:
-                        next_anniversary_date = datetime(selected_year + 1, hire_month, hire_day - 1).date()
-                    days_from_hire_to_anniversary = (next_anniversary_date - hire_date_obj).days
-                else:
-                    days_from_hire_to_anniversary = (anniversary_date - hire_date_obj).days
-                days_from_hire_to_year_end = (datetime(selected_year, 12, 31).date() - hire_date_obj).days
-                
-                # 현재 날짜 기준으로 계산 (실제 근속 개월 수 반영)
-                current_date_for_calc = datetime.now().date()
-                # 선택된 년도가 현재 년도보다 이후이면 선택된 년도의 말일을 사용
-                if selected_year > current_date_for_calc.year:
-                    current_date_for_calc = datetime(selected_year, 12, 31).date()
-                # 선택된 년도가 현재 년도이면 현재 날짜를 사용
-                elif selected_year == current_date_for_calc.year:
-                    # 선택된 년도 내에서만 계산
-                    pass
-                else:
-                    # 선택된 년도가 과거이면 해당 년도 말일 사용
-                    current_date_for_calc = datetime(selected_year, 12, 31).date()
-                
-                # 입사일부터 계산 기준일까지의 일수 계산
-                # 오늘 날짜를 기준으로 입사일에 맞춰서 계산
-                today = datetime.now().date()
-                # 선택된 년도가 현재 년도보다 이후이면 선택된 년도의 말일을 사용
-                if selected_year > today.year:
-                    calc_date = datetime(selected_year, 12, 31).date()
-                # 선택된 년도가 현재 년도이면 오늘 날짜를 사용
-                elif selected_year == today.year:
-                    calc_date = today
-                else:
-                    # 선택된 년도가 과거이면 해당 년도 말일 사용
-                    calc_date = datetime(selected_year, 12, 31).date()
-                
-                # 입사일부터 계산일까지의 일수
-                days_from_hire_to_current = (calc_date - hire_date_obj).days
-                
-                # TODAY 기준으로 1년 이상/미만 구분
-                is_one_year_or_more = self.calculator.is_one_year_or_more(name, hire_date_obj, calc_date)
-                
-                # 입사 1년 미만 여부 확인
-                if not is_one_year_or_more:
-                    # 입사 1년 미만: 입사기념일 기준으로 1개월 만근 시 연차 1개 발생
-                    # 입사기념일부터 계산 기준일까지의 개월 수 계산
-                    # 입사기념일이 지나면 해당 월의 연차가 생성됨
-                    # 예: 2025년 10월 13일 입사 → 2025년 11월 13일이 되면(또는 지나면) 연차 1개 생성
-                    if calc_date < hire_date_obj:
-                        # 입사일이 아직 미래인 경우
-                        leave_generated = 0
-                    else:
-                        # 입사기념일 기준으로 개월 수 계산
-                        # 입사일의 월/일을 기준으로 매월 같은 날짜가 지나면 연차 1개 발생
-                        months_passed = (calc_date.year - hire_date_obj.year) * 12 + (calc_date.month - hire_date_obj.month)
-                        # 입사일의 날짜가 아직 지나지 않았으면 한 달을 뺌
-                        if calc_date.day < hire_date_obj.day:
-                            months_passed -= 1
-                        # 입사일과 같은 날짜이거나 지났으면 해당 월 연차 생성됨
-                        # 최대 11개 (1년 전까지)
-                        leave_generated = min(max(months_passed, 0), 11)
-                elif is_one_year_or_more:
-                    # 입사 1년 이상: 입사기념일 기준으로 연차 계산
-                    # 입사기념일 기준으로 근속연수 책정하여 연차 생성
-                    # 입사기념일이 선택된 년도 내에 있으면 입사기념일 기준으로 계산
-                    if anniversary_date <= datetime(selected_year, 12, 31).date():
-                        # 입사기념일이 선택된 년도 내에 있음
-                        # 2025년 조회 시: 입사기념일 기준으로 연차 생성 (TODAY 확인 없음)
-                        # 2026년 이상 조회 시: TODAY 기준으로 입사기념일이 지났을 때만 연차 생성
-                        if selected_year <= 2025:
-                            # 2025년 이하 조회 시: 입사기념일 기준으로 연차 생성
-                            leave_generated = self.calculator.calculate_annual_leave(hire_date_obj, anniversary_date)
-                        else:
-                            # 2026년 이상 조회 시: TODAY 기준으로 입사기념일이 지났을 때만 연차 생성
-                            today = datetime.now().date()
-                            if anniversary_date <= today:
-                                # 입사기념일이 TODAY 이전이거나 같으면 연차 생성
-                                leave_generated = self.calculator.calculate_annual_leave(hire_date_obj, anniversary_date)
-                            else:
-                                # 입사기념일이 TODAY 이후이면 연차 생성 안 함
-                                leave_generated = 0
-                    else:
-                        # 입사기념일이 선택된 년도 이후에 있음
-                        # 이전 입사기념일 기준으로 계산
-                        prev_anniversary_year = selected_year - 1
-                        if prev_anniversary_year >= hire_date_obj.year:
-                            try:
-                                prev_anniversary = datetime(prev_anniversary_year, hire_month, hire_day).date()
-                            except ValueError:
-                                prev_anniversary = datetime(prev_anniversary_year, hire_month, hire_day - 1).date()
-                            
-                            if prev_anniversary > hire_date_obj:
-                                # 이전 입사기념일이 입사일 이후이면 해당 입사기념일 기준으로 계산
-                                today = datetime.now().date()
-                                if prev_anniversary <= today:
-                                    leave_generated = self.calculator.calculate_annual_leave(hire_date_obj, prev_anniversary)
-                                else:
-                                    leave_generated = 0
-                            else:
-                                leave_generated = 0
-                        else:
-                            leave_generated = 0
-                else:
-                    # 입사기념일이 선택된 년도 이후에 있음
-                    # 1년 미만자이거나 1년 이상자이지만 입사기념일이 아직 안 지난 경우
-                    if not is_one_year_or_more:
-                        # 입사 1년 미만: 입사기념일 기준으로 1개월 만근 시 연차 1개 발생
-                        if calc_date < hire_date_obj:
-                            leave_generated = 0
-                        else:
-                            months_passed = (calc_date.year - hire_date_obj.year) * 12 + (calc_date.month - hire_date_obj.month)
-                            if calc_date.day < hire_date_obj.day:
-                                months_passed -= 1
-                            leave_generated = min(max(months_passed, 0), 11)
-                    else:
-                        # 1년 이상이지만 입사기념일이 선택된 년도 이후: 연도 말일 기준으로 계산
-                        # 2026년 이상 조회 시: TODAY 기준으로 입사기념일이 지났는지 확인
-                        if selected_year >= 2026:
-                            today = datetime.now().date()
-                            # 선택된 년도 내의 실제 입사기념일 찾기
-                            # 입사일 이후의 첫 번째 입사기념일부터 선택된 년도 말일까지의 입사기념일 중
-                            # TODAY 이전이거나 같은 가장 최근 입사기념일 찾기
-                            actual_anniversary = None
-                            # 입사일 이후의 모든 입사기념일 확인
-                            for year_offset in range(1, 50):  # 최대 50년까지 확인
-                                check_year = hire_date_obj.year + year_offset
-                                if check_year > selected_year:
-                                    break
-                                try:
-                                    check_anniversary = datetime(check_year, hire_month, hire_day).date()
-                                except ValueError:
-                                    check_anniversary = datetime(check_year, hire_month, hire_day - 1).date()
-                                
-                                if check_anniversary > hire_date_obj:
-                                    if check_anniversary <= today:
-                                        # TODAY 이전이거나 같은 입사기념일 중 가장 최근 것
-                                        actual_anniversary = check_anniversary
-                                    elif check_anniversary > today:
-                                        # TODAY 이후의 입사기념일이면 중단
-                                        break
-                            
-                            if actual_anniversary:
-                                # 입사기념일이 TODAY 이전이거나 같으면 연차 생성
-                                leave_generated = self.calculator.calculate_annual_leave(hire_date_obj, actual_anniversary)
-                            else:
-                                # 입사기념일을 찾을 수 없거나 아직 지나지 않았으면 연차 생성 안 함
-                                leave_generated = 0
-                        else:
-                            # 2025년 이하 조회 시: 기존 로직 유지
-                            leave_generated = self.calculator.calculate_annual_leave(hire_date_obj, datetime(selected_year, 12, 31).date())
-                
-                # 입사일 기준 매년 입사기념일마다 잔여 연차 소멸 처리
-                # 입사일 기준으로 1년 동안 주어진 연차를 사용하지 않을 시 소멸
-                # 소멸내역 컬럼에 기재
-                current_date = datetime.now().date()
-                anniversary_date = hire_date_obj
-                max_years = 50  # 최대 50년까지 확인 (무한 루프 방지)
-                
-                # 입사일 이후의 모든 입사기념일 확인 (매년)
-                for year_offset in range(1, max_years + 1):
-                    # 다음 입사기념일 계산
-                    try:
-                        next_anniversary = datetime(hire_date_obj.year + year_offset, hire_date_obj.month, hire_date_obj.day).date()
-                    except ValueError:
-                        # 2월 29일 같은 경우 처리
-                        next_anniversary = datetime(hire_date_obj.year + year_offset, hire_date_obj.month, hire_date_obj.day - 1).date()
-                    
-                    # 입사기념일이 현재 날짜보다 이후면 중단
-                    if next_anniversary > current_date:
-                        break
-                    
-                    # 입사기념일이 지난 경우 소멸 처리
-                    # 입사일 기준으로 1년 동안 주어진 연차 - 사용 연차 = 소멸될 연차
-                    if current_date >= next_anniversary:
-                        # 기존 소멸 기록 확인 (중복 방지)
-                        cursor.execute("""
-                            SELECT id FROM leave_expirations
-                            WHERE employee_id = ? AND leave_type = '연차' AND expiration_date = ?
-                        """, (emp_id, next_anniversary))
-                        existing_expiration = cursor.fetchone()
-                        
-                        if not existing_expiration:
-                            # 이전 입사기념일 계산 (현재 입사기념일의 1년 전)
-                            if year_offset == 1:
-                                # 첫 해인 경우 입사일부터 계산
-                                period_start = hire_date_obj
-                            else:
-                                prev_anniversary = datetime(hire_date_obj.year + year_offset - 1, hire_date_obj.month, hire_date_obj.day).date()
-                                period_start = prev_anniversary
-                            
-                            # 입사일(또는 이전 입사기념일)부터 현재 입사기념일 직전까지 발생한 연차 계산
-                            leave_generated_period = self.calculator.calculate_annual_leave(hire_date_obj, next_anniversary - timedelta(days=1))
-                            
-                            # 이전 입사기념일 시점의 연차를 빼야 함 (첫 해가 아닌 경우)
-                            if year_offset > 1:
-                                leave_generated_prev = self.calculator.calculate_annual_leave(hire_date_obj, period_start - timedelta(days=1))
-                                leave_generated_period = leave_generated_period - leave_generated_prev
-                            
-                            # 해당 기간 동안 사용한 연차 계산 (입사일 또는 이전 입사기념일부터 현재 입사기념일 직전까지)
-                            cursor.execute("""
-                                SELECT SUM(leave_amount) as total_used
-                                FROM leave_records
-                                WHERE employee_id = ? AND leave_type = '연차'
-                                AND leave_date >= ? AND leave_date < ?
-                            """, (emp_id, period_start, next_anniversary))
-                            used_result = cursor.fetchone()
-                            total_used_period = used_result[0] if used_result[0] else 0
-                            
-                            # 소멸될 연차 = 입사일 기준으로 1년 동안 주어진 연차 - 사용 연차
-                            expired_amount = max(0, leave_generated_period - total_used_period)
-                            
-                            if expired_amount > 0:
-                                cursor.execute("""
-                                    INSERT INTO leave_expirations 
-                                    (employee_id, leave_type, expired_amount, expiration_date, year)
-                                    VALUES (?, ?, ?, ?, ?)
-                                """, (emp_id, '연차', expired_amount, next_anniversary, current_date.year))
-                                conn.commit()
-                                # 소멸 내역에 기록됨
-                
-                # 잔여 연차 계산 순서
-                # 1단계: 이전 년도 남은 연차 - 입사일 기준 1년 소멸 차감 = 이전 년도 최종 남은 연차
-                # 2단계: 잔여수 = 연차 발생 수 - 선택된 년도 사용연차 + 이전 년도 최종 남은 연차
-                
-                # 2026년 이상 조회 시: remaining_prev_year는 이미 2025년 연말 시점의 최종 잔여수이므로
-                # 추가 소멸 차감이 필요 없습니다. (이미 2025년 연말 이전의 소멸이 차감된 상태)
-                # 2025년 이하 조회 시: 현재 날짜 이전의 소멸 차감 필요
-                prev_year = selected_year - 1
-                prev_year_end = datetime(prev_year, 12, 31).date()
-                
-                if selected_year >= 2026:
-                    # 2026년 이상 조회 시: 입사기념일 기준 소멸 확인
-                    # 1년 이상자는 다음년도 입사기념일까지 사용하지 않으면 소멸
-                    remaining_prev_year_float = float(remaining_prev_year) if remaining_prev_year is not None else 0.0
-                    
-                    # 2026년 입사기념일 계산
-                    try:
-                        anniversary_2026 = datetime(selected_year, hire_month, hire_day).date()
-                    except ValueError:
-                        anniversary_2026 = datetime(selected_year, hire_month, hire_day - 1).date()
-                    
-                    # 2026년 입사기념일이 지났는지 확인
-                    current_date = datetime.now().date()
-                    if current_date >= anniversary_2026:
-                        # 2026년 입사기념일이 지났다면, 2025년 잔여 연차 중 사용하지 않은 부분 소멸
-                        # 1년 이상자는 다음년도 입사기념일까지 사용하지 않으면 소멸
-                        try:
-                            anniversary_2025 = datetime(prev_year, hire_month, hire_day).date()
-                        except ValueError:
-                            anniversary_2025 = datetime(prev_year, hire_month, hire_day - 1).date()
-                        
-                        # 2025년 입사기념일부터 2026년 입사기념일 직전까지 사용한 연차
-                        cursor.execute("""
-                            SELECT SUM(leave_amount) as total_used
-                            FROM leave_records
-                            WHERE employee_id = ? AND leave_type = '연차'
-                            AND leave_date >= ? AND leave_date < ?
-                        """, (emp_id, anniversary_2025, anniversary_2026))
-                        used_result = cursor.fetchone()
-                        total_used_between_anniversaries = float(used_result[0]) if used_result[0] else 0.0
-                        
-                        # 2025년 잔여 연차 중 2026년 입사기념일까지 사용하지 않은 부분 소멸
-                        # 2025년 잔여 연차가 2026년 입사기념일까지 사용되지 않으면 소멸
-                        expired_2025_remaining = max(0.0, remaining_prev_year_float - total_used_between_anniversaries)
-                        
-                        if expired_2025_remaining > 0:
-                            # 소멸 기록 확인 (중복 방지)
-                            cursor.execute("""
-                                SELECT id FROM leave_expirations
-                                WHERE employee_id = ? AND leave_type = '연차' AND expiration_date = ?
-                            """, (emp_id, anniversary_2026))
-                            existing_expiration = cursor.fetchone()
-                            
-                            if not existing_expiration:
-                                cursor.execute("""
-                                    INSERT INTO leave_expirations 
-                                    (employee_id, leave_type, expired_amount, expiration_date, year)
-                                    VALUES (?, ?, ?, ?, ?)
-                                """, (emp_id, '연차', expired_2025_remaining, anniversary_2026, selected_year))
-                                conn.commit()
-                        
-                        remaining_prev_year_final = max(0.0, remaining_prev_year_float - expired_2025_remaining)
-                        total_expired_float = expired_2025_remaining
-                    else:
-                        # 2026년 입사기념일이 아직 안 지났으면 소멸 없음
-                        remaining_prev_year_final = remaining_prev_year_float
-                        total_expired_float = 0.0
-                else:
-                    # 2025년 이하 조회 시: 현재 날짜 이전의 소멸 차감
-                    current_date = datetime.now().date()
-                    cursor.execute("""
-                        SELECT SUM(expired_amount) as total_expired
-                        FROM leave_expirations
-                        WHERE employee_id = ? AND leave_type = '연차' AND expiration_date <= ?
-                    """, (emp_id, current_date))
-                    
-                    expired_result = cursor.fetchone()
-                    total_expired = expired_result[0] if expired_result[0] else 0
-                    
-                    # 1단계: 이전 년도 남은 연차 - 입사일 기준 1년 소멸 차감
-                    # float로 명시적 변환하여 소수점 계산 지원
-                    remaining_prev_year_float = float(remaining_prev_year) if remaining_prev_year is not None else 0.0
-                    total_expired_float = float(total_expired) if total_expired is not None else 0.0
-                    remaining_prev_year_final = max(0.0, remaining_prev_year_float - total_expired_float)
-                
-                # 2단계: 잔여수 = 연차 발생 수 - 2025년 사용연차 + 2024년 최종 남은 연차
-                # 연차발생수와 사용연차를 명시적으로 float로 변환하여 계산
-                leave_generated_float = float(leave_generated) if leave_generated is not None else 0.0
-                used_current_year_float = float(used_current_year) if used_current_year is not None else 0.0
-                remaining_prev_year_final_float = float(remaining_prev_year_final) if remaining_prev_year_final is not None else 0.0
-                
-                remaining = (leave_generated_float - used_current_year_float) + remaining_prev_year_final_float
-                
-                # 잔여수 값이 None이거나 계산되지 않은 경우를 방지
-                if remaining is None:
-                    remaining = 0.0
-                # float 타입으로 명시적 변환
-                remaining = float(remaining) if remaining is not None else 0.0
-                
-                # 1년 이상 재직인원의 경우 해당 년도 잔여수를 저장 (다음 년도 조회 시 사용)
-                if is_one_year_or_more:
-                    try:
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO leave_remaining_by_year
-                            (employee_id, year, remaining_amount, updated_at)
-                            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                        """, (emp_id, selected_year, remaining))
-                    except Exception as e:
-                        print(f"잔여수 저장 오류 ({name}): {str(e)}")
-                
-                # 디버깅: 잔여수 계산 확인
-                if name == "장지웅" or name == "전금희" or name == "김미라" or name == "김아름" or "김아름" in name:
-                    print(f"DEBUG {name} ({selected_year}년) 잔여수: remaining_prev_year={remaining_prev_year}, remaining_prev_year_float={remaining_prev_year_float}")
-                    if selected_year >= 2026:
-                        print(f"DEBUG {name} ({selected_year}년) 소멸처리: total_expired_float={total_expired_float}, remaining_prev_year_final={remaining_prev_year_final}")
-                    else:
-                        print(f"DEBUG {name} ({selected_year}년) 소멸처리: total_expired={total_expired}, total_expired_float={total_expired_float}, remaining_prev_year_final={remaining_prev_year_final}")
-                    print(f"DEBUG {name} ({selected_year}년) 잔여수: leave_generated={leave_generated_float}, used_current_year={used_current_year_float}, remaining_prev_year_final={remaining_prev_year_final_float}, remaining={remaining}")
-                    print(f"DEBUG {name} ({selected_year}년) 계산식: ({leave_generated_float} - {used_current_year_float}) + {remaining_prev_year_final_float} = {remaining}")
-                
-                # 소멸 내역 조회 및 계산
-                # 2025년 이상 조회 시: TODAY 기준으로 입사기념일이 지났을 때 소멸 내역 표기
-                today = datetime.now().date()
-                expiration_text = ""
-                
-                if selected_year >= 2025:
-                    # 2025년 이상 조회 시: TODAY 기준으로 입사기념일이 지났는지 확인
-                    expiration_list = []
-                    
-                    # 입사일 이후의 모든 입사기념일 확인
-                    for year_offset in range(1, 50):  # 최대 50년까지 확인
-                        try:
-                            check_anniversary = datetime(hire_date_obj.year + year_offset, hire_month, hire_day).date()
-                        except ValueError:
-                            check_anniversary = datetime(hire_date_obj.year + year_offset, hire_month, hire_day - 1).date()
-                        
-                        # 입사기념일이 TODAY 이전이거나 같고, 선택된 년도 이내이면 소멸 내역 표기
-                        # TODAY 기준으로 입사기념일이 지났을 때만 표기
-                        if check_anniversary <= today and check_anniversary.year <= selected_year:
-                            # 해당 입사기념일 직전 시점의 잔여수 계산
-                            # 입사일부터 해당 입사기념일 직전까지의 연차 발생 수
-                            if check_anniversary <= hire_date_obj:
-                                # 입사기념일이 입사일보다 이전이면 다음 해 입사기념일 사용
-                                continue
-                            
-                            # 입사일부터 입사기념일 직전까지 발생한 연차 계산
-                            if year_offset == 1:
-                                # 첫 해: 입사일부터 입사기념일 직전까지
-                                period_start = hire_date_obj
-                                leave_generated_period = self.calculator.calculate_annual_leave(hire_date_obj, check_anniversary - timedelta(days=1))
-                            else:
-                                # 이후 해: 이전 입사기념일부터 현재 입사기념일 직전까지
-                                prev_anniversary = datetime(hire_date_obj.year + year_offset - 1, hire_month, hire_day).date()
-                                try:
-                                    prev_anniversary = datetime(hire_date_obj.year + year_offset - 1, hire_month, hire_day).date()
-                                except ValueError:
-                                    prev_anniversary = datetime(hire_date_obj.year + year_offset - 1, hire_month, hire_day - 1).date()
-                                
-                                period_start = prev_anniversary
-                                leave_generated_period = self.calculator.calculate_annual_leave(hire_date_obj, check_anniversary - timedelta(days=1))
-                                leave_generated_prev = self.calculator.calculate_annual_leave(hire_date_obj, prev_anniversary - timedelta(days=1))
-                                leave_generated_period = leave_generated_period - leave_generated_prev
-                            
-                            # 해당 기간 동안 사용한 연차 계산
-                            cursor.execute("""
-                                SELECT work_date, leave_type, remarks
-                                FROM attendance_records
-                                WHERE employee_id = ? AND work_date >= ? AND work_date < ?
-                                AND (leave_type IN ('연차', '반차', '휴가') 
-                                     OR remarks IN ('반차_출근', '반차_퇴근'))
-                            """, (emp_id, period_start, check_anniversary))
-                            period_records = cursor.fetchall()
-                            
-                            used_period = 0.0
-                            반차_날짜_set_period = set()
-                            
-                            for work_date, leave_type, remarks in period_records:
-                                is_half_day = (leave_type == '반차' or remarks == '반차_출근' or remarks == '반차_퇴근')
-                                if leave_type == '연차' or leave_type == '휴가':
-                                    used_period += 1.0
-                                elif is_half_day:
-                                    if work_date not in 반차_날짜_set_period:
-                                        used_period += 0.5
-                                        반차_날짜_set_period.add(work_date)
-                            
-                            # 이전 입사기념일 시점의 잔여수 계산 (첫 해가 아닌 경우)
-                            remaining_before_period = 0.0
-                            if year_offset > 1:
-                                # 이전 입사기념일 직전 시점의 잔여수 계산
-                                prev_anniversary = datetime(hire_date_obj.year + year_offset - 1, hire_month, hire_day).date()
-                                try:
-                                    prev_anniversary = datetime(hire_date_obj.year + year_offset - 1, hire_month, hire_day).date()
-                                except ValueError:
-                                    prev_anniversary = datetime(hire_date_obj.year + year_offset - 1, hire_month, hire_day - 1).date()
-                                
-                                if prev_anniversary > hire_date_obj:
-                                    # 이전 입사기념일 직전까지의 연차 발생 수
-                                    if year_offset == 2:
-                                        prev_period_start = hire_date_obj
-                                        prev_leave_generated = self.calculator.calculate_annual_leave(hire_date_obj, prev_anniversary - timedelta(days=1))
-                                    else:
-                                        prev_prev_anniversary = datetime(hire_date_obj.year + year_offset - 2, hire_month, hire_day).date()
-                                        try:
-                                            prev_prev_anniversary = datetime(hire_date_obj.year + year_offset - 2, hire_month, hire_day).date()
-                                        except ValueError:
-                                            prev_prev_anniversary = datetime(hire_date_obj.year + year_offset - 2, hire_month, hire_day - 1).date()
-                                        prev_period_start = prev_prev_anniversary
-                                        prev_leave_generated = self.calculator.calculate_annual_leave(hire_date_obj, prev_anniversary - timedelta(days=1))
-                                        prev_prev_leave_generated = self.calculator.calculate_annual_leave(hire_date_obj, prev_prev_anniversary - timedelta(days=1))
-                                        prev_leave_generated = prev_leave_generated - prev_prev_leave_generated
-                                    
-                                    # 이전 기간 동안 사용한 연차 계산
-                                    cursor.execute("""
-                                        SELECT work_date, leave_type, remarks
-                                        FROM attendance_records
-                                        WHERE employee_id = ? AND work_date >= ? AND work_date < ?
-                                        AND (leave_type IN ('연차', '반차', '휴가') 
-                                             OR remarks IN ('반차_출근', '반차_퇴근'))
-                                    """, (emp_id, prev_period_start, prev_anniversary))
-                                    prev_period_records = cursor.fetchall()
-                                    
-                                    prev_used = 0.0
-                                    prev_반차_날짜_set = set()
-                                    
-                                    for work_date, leave_type, remarks in prev_period_records:
-                                        is_half_day = (leave_type == '반차' or remarks == '반차_출근' or remarks == '반차_퇴근')
-                                        if leave_type == '연차' or leave_type == '휴가':
-                                            prev_used += 1.0
-                                        elif is_half_day:
-                                            if work_date not in prev_반차_날짜_set:
-                                                prev_used += 0.5
-                                                prev_반차_날짜_set.add(work_date)
-                                    
-                                    remaining_before_period = prev_leave_generated - prev_used
-                            
-                            # 해당 입사기념일 직전 시점의 잔여수 = (발생한 연차 - 사용한 연차) + 이전 잔여수
-                            remaining_at_anniversary = (leave_generated_period - used_period) + remaining_before_period
-                            
-                            # 소멸될 연차 = 해당 입사기념일 직전 시점의 잔여수
-                            expired_amount = max(0, remaining_at_anniversary)
-                            
-                            if expired_amount > 0:
-                                if expired_amount.is_integer():
-                                    expired_amount_str = str(int(expired_amount))
-                                else:
-                                    expired_amount_str = f"{expired_amount:.1f}"
-                                expiration_list.append(f"연차 {expired_amount_str}개 ({check_anniversary})")
-                        
-                        # 입사기념일이 TODAY 이후이면 중단
-                        if check_anniversary > today:
-                            break
-                    
-                    # 소멸 내역이 있을 때만 표기, 없으면 공란 유지
-                    if expiration_list:
-                        expiration_text = ", ".join(expiration_list)
-                    else:
-                        expiration_text = ""  # 소멸 내역이 없으면 공란
-                else:
-                    # 2025년 이외 조회 시: 기존 로직 유지
-                    cursor.execute("""
-                        SELECT leave_type, expired_amount, expiration_date
-                        FROM leave_expirations
-                        WHERE employee_id = ?
-                        ORDER BY expiration_date DESC
-                    """, (emp_id,))
-                    expirations = cursor.fetchall()
-                    
-                    # 소멸 내역이 있을 때만 표기, 없으면 공란 유지
-                    if expirations:
-                        expiration_list = []
-                        for leave_type, amount, exp_date in expirations:
-                            # 소멸된 연차가 0보다 클 때만 표기
-                            if amount and float(amount) > 0:
-                                expiration_list.append(f"{leave_type} {amount}개 ({exp_date})")
-                        if expiration_list:
-                            expiration_text = ", ".join(expiration_list)
-                        else:
-                            expiration_text = ""  # 소멸 내역이 없으면 공란
-                    else:
-                        expiration_text = ""  # 소멸 내역이 없으면 공란
-                
-                # 행 추가
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-                
-                # 실제 직원 행의 행 번호 설정
-                self.table.setVerticalHeaderItem(row, QTableWidgetItem(str(employee_row_number)))
-                employee_row_number += 1
-                
-                # 0.0 값은 빈 문자열로 변환하는 헬퍼 함수
-                # col_idx: 컬럼 번호 (잔여수 컬럼 19인 경우 0도 표시)
-                def format_value(val, col_idx=None):
-                    # None 체크
-                    if val is None:
-                        return ""
-                    if isinstance(val, (int, float)):
-                        val_float = float(val)
-                        # 잔여수 컬럼(19)인 경우 0도 표시, 음수도 표시
-                        if col_idx == 19:
-                            if val_float.is_integer():
-                                return str(int(val_float))
-                            return f"{val_float:.1f}"
-                        # 사용연차 컬럼(17)인 경우 소수점 표시 (반차 반영), 음수도 표시
-                        if col_idx == 17:
-                            if val_float == 0.0:
-                                return ""
-                            if val_float.is_integer():
-                                return str(int(val_float))
-                            return f"{val_float:.1f}"
-                        # 다른 컬럼은 0이면 빈 문자열
-                        if val == 0 or val == 0.0:
-                            return ""
-                        # float로 변환하여 소수점 처리
-                        # 소수점이 0이면 정수로, 아니면 소수점 표시 (예: 14.5)
-                        if val_float.is_integer():
-                            return str(int(val_float))
-                        # 소수점이 있으면 소수점 첫째 자리까지 표시 (예: 14.5, 1.5)
-                        return f"{val_float:.1f}"
-                    return str(val) if val else ""
-                
-                # 잔여수 값 확인 및 디버깅
-                # print(f"DEBUG 잔여수: {name}, remaining={remaining}, type={type(remaining)}")
-                
-                # 연차발생수(18번)와 잔여수(19번)의 수동 입력 값이 있으면 먼저 삭제
-                # 이렇게 하면 항상 자동 계산 값만 사용됨
-                
-                # 디버깅: 삭제 전에 수동 입력 값이 있었는지 확인
-                if name == "장지웅" or name == "전금희" or name == "김미라" or name == "김아름":
-                    cursor.execute("""
-                        SELECT column_index, manual_value
-                        FROM leave_manual_values
-                        WHERE employee_id = ? AND year = ? AND column_index IN (18, 19)
-                    """, (emp_id, selected_year))
-                    deleted_manual = cursor.fetchall()
-                    if deleted_manual:
-                        print(f"DEBUG {name}: 삭제 전 수동 입력 값 발견 - {deleted_manual}")
-                
-                cursor.execute("""
-                    DELETE FROM leave_manual_values
-                    WHERE employee_id = ? AND year = ? AND column_index IN (18, 19)
-                """, (emp_id, selected_year))
-                # 중간 commit 제거 - 마지막에 한 번만 commit하여 데이터베이스 잠금 방지
-                
-                # 저장된 수동 입력 값 조회 (18번, 19번 제외)
-                cursor.execute("""
-                    SELECT column_index, manual_value
-                    FROM leave_manual_values
-                    WHERE employee_id = ? AND year = ? AND column_index NOT IN (18, 19)
-                """, (emp_id, selected_year))
-                manual_values_result = cursor.fetchall()
-                manual_values_dict = {col_idx: val for col_idx, val in manual_values_result}
-                
-                # 디버깅: 19번 컬럼 수동 입력 값이 여전히 있는지 확인 (있으면 안 됨)
-                if name == "장지웅" or name == "전금희" or name == "김미라" or name == "김아름" or "김아름" in name:
-                    cursor.execute("""
-                        SELECT column_index, manual_value
-                        FROM leave_manual_values
-                        WHERE employee_id = ? AND year = ? AND column_index = 19
-                    """, (emp_id, selected_year))
-                    remaining_manual = cursor.fetchone()
-                    if remaining_manual:
-                        print(f"WARNING {name}: 잔여수(19번) 수동 입력 값이 여전히 존재합니다! - {remaining_manual}")
-                        # 강제 삭제
-                        cursor.execute("""
-                            DELETE FROM leave_manual_values
-                            WHERE employee_id = ? AND year = ? AND column_index = 19
-                        """, (emp_id, selected_year))
-                        # 중간 commit 제거 - 마지막에 한 번만 commit하여 데이터베이스 잠금 방지
-                        print(f"DEBUG {name}: 잔여수(19번) 수동 입력 값 강제 삭제 완료")
-                
-                # 기본 계산된 값들
-                # 연차발생수와 사용연차를 float로 명시적 변환하여 소수점 표시 지원
-                leave_generated_float = float(leave_generated) if leave_generated is not None else 0.0
-                used_current_year_float = float(used_current_year) if used_current_year is not None else 0.0
-                
-                # 디버깅: 사용연차 계산 결과 확인
-                if name == "장지웅" or name == "전금희" or name == "김미라" or name == "김아름" or "김아름" in name:
-                    print(f"DEBUG {name}: used_current_year 원본={used_current_year}, type={type(used_current_year)}, used_current_year_float={used_current_year_float}, type={type(used_current_year_float)}, is_integer={used_current_year_float.is_integer() if isinstance(used_current_year_float, float) else 'N/A'}")
-                
-                # 17번 컬럼(2025년 사용연차)은 항상 attendance_records에서 계산한 값을 사용
-                # 출퇴근 관리대장에서 입력한 연차가 반영되도록 함
-                # 수동 입력 값이 있더라도 무시하고 계산된 값 사용
-                if 17 in manual_values_dict:
-                    # 수동 입력 값이 있으면 삭제 (출퇴근 관리대장에서 입력한 값이 우선)
-                    cursor.execute("""
-                        DELETE FROM leave_manual_values
-                        WHERE employee_id = ? AND year = ? AND column_index = 17
-                    """, (emp_id, selected_year))
-                    if name == "장지웅" or name == "전금희" or name == "김미라" or name == "김아름" or "김아름" in name:
-                        print(f"DEBUG {name}: 17번 컬럼 수동 입력 값 삭제 - 계산된 값({used_current_year_float}) 사용")
-                
-                # 잔여수 계산: 연차 발생 수 - 사용연차 + 2024년 최종 남은 연차
-                remaining = (leave_generated_float - used_current_year_float) + remaining_prev_year_final_float
-                # float 타입으로 명시적 변환
-                remaining = float(remaining) if remaining is not None else 0.0
-                
-                base_values = [dept, pos, name, hire_date, format_value(remaining_prev_year)] + \
-                             [format_value(monthly_usage[i]) for i in range(12)] + \
-                             [format_value(used_current_year_float, col_idx=17), format_value(leave_generated_float), format_value(remaining, col_idx=19), expiration_text]
-                
-                # 디버깅: 연차발생수 및 잔여수 계산 결과 확인
-                if name == "장지웅" or name == "전금희" or name == "김미라" or name == "김아름" or "김아름" in name:
-                    print(f"DEBUG {name}: leave_generated 원본={leave_generated}, type={type(leave_generated)}, leave_generated_float={leave_generated_float}, format_value={format_value(leave_generated_float)}")
-                    print(f"DEBUG {name}: used_current_year 원본={used_current_year}, used_current_year_float={used_current_year_float}, format_value(17번)={format_value(used_current_year_float, col_idx=17)}")
-                    print(f"DEBUG {name}: remaining_prev_year_final={remaining_prev_year_final}, type={type(remaining_prev_year_final)}")
-                    print(f"DEBUG {name}: remaining 계산 전 - leave_generated_float={leave_generated_float}, used_current_year_float={used_current_year_float}, remaining_prev_year_final_float={remaining_prev_year_final_float}")
-                    print(f"DEBUG {name}: remaining={remaining}, type={type(remaining)}, is_integer={remaining.is_integer() if isinstance(remaining, float) else 'N/A'}, format_value(19번)={format_value(remaining, col_idx=19)}")
-                    print(f"DEBUG {name}: manual_values_dict={manual_values_dict}, 18번 컬럼 수동 입력={manual_values_dict.get(18, '없음')}, 19번 컬럼 수동 입력={manual_values_dict.get(19, '없음')}")
-                    print(f"DEBUG {name}: base_values[17]={base_values[17] if len(base_values) > 17 else 'N/A'}, base_values[18]={base_values[18] if len(base_values) > 18 else 'N/A'}, base_values[19]={base_values[19] if len(base_values) > 19 else 'N/A'}")
-                
-                # 수동 입력 값이 있으면 우선 사용, 없으면 계산된 값 사용
-                # 단, 연차발생수(18번 컬럼), 잔여수(19번 컬럼), 사용연차(17번 컬럼)는 항상 자동 계산 값 사용
-                values = []
-                for col_idx, base_val in enumerate(base_values):
-                    # 연차발생수(18번 컬럼), 잔여수(19번 컬럼), 사용연차(17번 컬럼)는 항상 자동 계산 값 사용
-                    if col_idx == 17 or col_idx == 18 or col_idx == 19:
-                        values.append(base_val)
-                    elif col_idx in manual_values_dict:
-                        # 저장된 수동 입력 값 사용 (월별 컬럼만)
-                        manual_val = manual_values_dict[col_idx]
-                        if manual_val is not None:
-                            values.append(manual_val)
-                            # 디버깅: 수동 입력 값 사용 확인
-                            if name == "장지웅" and col_idx == 18:
-                                print(f"DEBUG 장지웅: 수동 입력 값 사용 - {manual_val}")
-                        else:
-                            values.append(base_val)
-                    else:
-                        # 계산된 값 사용
-                        values.append(base_val)
-                
-                for col, val in enumerate(values):
-                    item = QTableWidgetItem(val)
-                    # 연차발생수(18번)와 잔여수(19번)는 편집 불가
-                    if col == 18 or col == 19:
-                        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                        # 디버깅: 표시 값 확인
-                        if name == "장지웅" or name == "전금희" or name == "김미라" or name == "김아름" or "김아름" in name:
-                            if col == 17:  # 사용연차
-                                print(f"DEBUG {name}: 사용연차 표시 값 - val='{val}', used_current_year_float={used_current_year_float}, format_value(17번)='{format_value(used_current_year_float, col_idx=17)}'")
-                            if col == 19:  # 잔여수
-                                print(f"DEBUG {name}: 잔여수 표시 값 - val='{val}', remaining={remaining}, format_value(19번)='{format_value(remaining, col_idx=19)}'")
-                    # 사용연차(17번)와 잔여수(19번) 음수 표시 (연차, 반차 모두)
-                    if col == 17:  # 사용연차
-                        try:
-                            val_float = float(used_current_year_float) if used_current_year_float is not None else 0.0
-                            if val_float < 0:
-                                item.setForeground(QColor("#FF0000"))  # 빨간색으로 표시
-                        except:
-                            pass
-                    elif col == 19:  # 잔여수
-                        try:
-                            val_float = float(remaining) if remaining is not None else 0.0
-                            if val_float < 0:
-                                item.setForeground(QColor("#FF0000"))  # 빨간색으로 표시
-                        except:
-                            pass
-                    # 직원 ID와 컬럼 정보 저장 (월별 컬럼만 편집 가능)
-                    if col >= 5 and col <= 16:  # 1월~12월 컬럼 (5번째부터 16번째까지)
-                        item.setData(Qt.UserRole, {'emp_id': emp_id, 'col': col, 'month': col - 4, 'year': selected_year})
-                    else:
-                        item.setData(Qt.UserRole, emp_id)  # 직원 ID만 저장
-                    self.table.setItem(row, col, item)
-            
-            # 모든 작업 완료 후 한 번만 commit
-            try:
-                conn.commit()
-            except Exception as e:
-                conn.rollback()
-                print(f"데이터베이스 커밋 오류: {str(e)}")
-            finally:
-                conn.close()
-            
-            # 재직인원 수 계산 (구분자 행 제외)
-            employee_count = len(employees)
-            if hasattr(self, 'employee_count_label'):
-                self.employee_count_label.setText(f"재직인원: {employee_count}명")
-            
-            self._is_refreshing = False  # 새로고침 완료
-        
-        def upload_excel(self):
-            """엑셀 파일 업로드"""
-            file_path, _ = QFileDialog.getOpenFileName(self, "엑셀 파일 선택", "", "Excel files (*.xlsx *.xls);;All files (*.*)")
-            if not file_path:
-                return
-            
-            try:
-                file_ext = Path(file_path).suffix.lower()
-                if file_ext == '.xls':
-                    try:
-                        df = pd.read_excel(file_path, header=0, engine='xlrd')
-                    except:
-                        df = pd.read_excel(file_path, header=None, engine='xlrd')
-                        if len(df) > 0:
-                            first_row = df.iloc[0].astype(str).tolist()
-                            if any('부서' in str(cell) or '직급' in str(cell) or '이름' in str(cell) for cell in first_row):
-                                df.columns = df.iloc[0]
-                                df = df[1:].reset_index(drop=True)
+                    item.setData(Qt.UserRole, emp_id)  # 직원 ID만 저장
+                self.table.setItem(row, col, item)
+        
+        def upload_excel(self):
+            """엑셀 파일 업로드"""
+            file_path, _ = QFileDialog.getOpenFileName(self, "엑셀 파일 선택", "", "Excel files (*.xlsx *.xls);;All files (*.*)")
+            if not file_path:
+                return
+            
+            try:
+                file_ext = Path(file_path).suffix.lower()
+                if file_ext == '.xls':
+                    try:
+                        df = pd.read_excel(file_path, header=0, engine='xlrd')
+                    except:
+                        df = pd.read_excel(file_path, header=None, engine='xlrd')
+                        if len(df) > 0:
+                            first_row = df.iloc[0].astype(str).tolist()
+                            if any('부서' in str(cell) or '직급' in str(cell) or '이름' in str(cell) for cell in first_row):
+                                df.columns = df.iloc[0]
+                                df = df[1:].reset_index(drop=True)
                 else:
                     try:
                         df = pd.read_excel(file_path, header=0, engine='openpyxl')
@@ -2045,9 +738,8 @@ if PYSIDE6_AVAILABLE:
                                     leave_amount = row[month_col]
                                     if pd.notna(leave_amount) and float(leave_amount) > 0:
                                         leave_date = datetime(2025, month, 1).date()
-                                        hire_date_obj = datetime.strptime(str(hire_date), "%Y-%m-%d").date()
                                         current_date = datetime(2025, 11, 1).date()
-                                        leave_type = "월차" if (current_date - hire_date_obj).days < 365 else "연차"
+                                        leave_type = "월차" if current_date < entitlement_calendar(hire_date).one_year_date else "연차"
                                         
                                         cursor.execute("""
                                             INSERT OR IGNORE INTO leave_records
@@ -2056,7 +748,7 @@ if PYSIDE6_AVAILABLE:
                                         """, (employee_id, leave_type, leave_date, float(leave_amount), 2025, month))
                                         leave_records_added += 1
                     except Exception as e:
-                        print(f"행 {idx+1} 처리 중 오류: {str(e)}")
+                        logger.exception("행 %d 처리 중 오류", idx + 1)
                         continue
                 
                 conn.commit()
@@ -2065,9 +757,46 @@ if PYSIDE6_AVAILABLE:
                 QMessageBox.information(self, "성공",
                     f"엑셀 파일이 업로드되었습니다.\n직원: {employees_added}명 추가\n연차 기록: {leave_records_added}건 추가")
                 self.refresh_data()
+                self.change_bus.employees_changed(source=self)
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"엑셀 파일 업로드 중 오류 발생: {str(e)}")
         
+        def _leave_export_rows(self):
+            """엑셀로 내보낼 표 데이터 (부서 구분자 행 제외)
+            
+            Returns:
+                [[부서, 직급, 이름, 입사일, 전년도 남은연차, 1월 ... 12월, 선택년도 사용연차,
+                  연차발생수, 잔여수, 소멸내역], ...] - 숫자 열은 float (빈 칸은 0.0)
+            """
+            def number(row_idx, col):
+                item = self.table.item(row_idx, col)
+                text = item.text().strip() if item else ""
+                try:
+                    return float(text) if text else 0.0
+                except ValueError:
+                    return 0.0
+            
+            def text(row_idx, col):
+                item = self.table.item(row_idx, col)
+                return item.text() if item else ""
+            
+            rows = []
+            for row_idx in range(self.table.rowCount()):
+                # 부서(팀) 구분자 행은 엑셀 다운로드에서 제외
+                # (테이블에서 "━━━ 부서명 ━━━" 형태로 전체 컬럼 병합된 행)
+                first_item = self.table.item(row_idx, 0)
+                if first_item:
+                    txt = (first_item.text() or "").strip()
+                    if txt.startswith("━━━") and txt.endswith("━━━"):
+                        continue
+                
+                # 부서/직급/이름/입사일 (0~3), 이전 년도 남은연차 (4), 1월~12월 (5~16),
+                # 선택 년도 사용연차 (17), 연차발생수 (18), 잔여수 (19), 소멸내역 (20)
+                rows.append([text(row_idx, col) for col in range(4)]
+                            + [number(row_idx, col) for col in range(4, 20)]
+                            + [text(row_idx, 20)])
+            return rows
+        
         def download_excel(self, file_path_override=None, silent=False, open_after=True):
             """엑셀 파일 다운로드 - 테이블에 표시된 데이터를 그대로 다운로드
             (file_path_override가 주어지면 파일 다이얼로그 없이 해당 경로로 저장)
@@ -2099,249 +828,15 @@ if PYSIDE6_AVAILABLE:
                 if selected_year is None:
                     selected_year = datetime.now().year
                 
-                prev_year = selected_year - 1
-                
-                # 테이블에서 직접 데이터 읽기
-                data = []
-                row_count = self.table.rowCount()
-                
-                for row_idx in range(row_count):
-                    # 부서(팀) 구분자 행은 엑셀 다운로드에서 제외
-                    # (테이블에서 "━━━ 부서명 ━━━" 형태로 전체 컬럼 병합된 행)
-                    first_item = self.table.item(row_idx, 0)
-                    if first_item:
-                        txt = (first_item.text() or "").strip()
-                        if txt.startswith("━━━") and txt.endswith("━━━"):
-                            continue
-
-                    row_data = {}
-                    
-                    # 부서 (컬럼 0)
-                    dept_item = self.table.item(row_idx, 0)
-                    row_data["부서"] = dept_item.text() if dept_item else ""
-                    
-                    # 직급 (컬럼 1)
-                    pos_item = self.table.item(row_idx, 1)
-                    row_data["직급"] = pos_item.text() if pos_item else ""
-                    
-                    # 이름 (컬럼 2)
-                    name_item = self.table.item(row_idx, 2)
-                    row_data["이름"] = name_item.text() if name_item else ""
-                    
-                    # 입사일 (컬럼 3)
-                    hire_date_item = self.table.item(row_idx, 3)
-                    row_data["입사일"] = hire_date_item.text() if hire_date_item else ""
-                    
-                    # 이전 년도 남은연차 (컬럼 4)
-                    prev_year_item = self.table.item(row_idx, 4)
-                    prev_year_text = prev_year_item.text().strip() if prev_year_item else ""
-                    try:
-                        row_data[f"{prev_year}년"] = float(prev_year_text) if prev_year_text else 0.0
-                    except ValueError:
-                        row_data[f"{prev_year}년"] = 0.0
-                    
-                    # 월별 사용량 (컬럼 5-16: 1월~12월)
-                    for month in range(1, 13):
-                        month_col = 4 + month  # 5번째부터 16번째까지
-                        month_item = self.table.item(row_idx, month_col)
-                        month_text = month_item.text().strip() if month_item else ""
-                        try:
-                            row_data[f"{month}월"] = float(month_text) if month_text else 0.0
-                        except ValueError:
-                            row_data[f"{month}월"] = 0.0
-                    
-                    # 선택된 년도 사용연차 (컬럼 17)
-                    used_year_item = self.table.item(row_idx, 17)
-                    used_year_text = used_year_item.text().strip() if used_year_item else ""
-                    try:
-                        row_data[f"{selected_year}년"] = float(used_year_text) if used_year_text else 0.0
-                    except ValueError:
-                        row_data[f"{selected_year}년"] = 0.0
-                    
-                    # 연차발생수 (컬럼 18)
-                    leave_gen_item = self.table.item(row_idx, 18)
-                    leave_gen_text = leave_gen_item.text().strip() if leave_gen_item else ""
-                    try:
-                        row_data["연차발생수"] = float(leave_gen_text) if leave_gen_text else 0.0
-                    except ValueError:
-                        row_data["연차발생수"] = 0.0
-                    
-                    # 잔여수 (컬럼 19)
-                    remaining_item = self.table.item(row_idx, 19)
-                    remaining_text = remaining_item.text().strip() if remaining_item else ""
-                    try:
-                        row_data["잔여수"] = float(remaining_text) if remaining_text else 0.0
-                    except ValueError:
-                        row_data["잔여수"] = 0.0
-                    
-                    # 소멸내역 (컬럼 20)
-                    expiration_item = self.table.item(row_idx, 20)
-                    row_data["소멸내역"] = expiration_item.text() if expiration_item else ""
-                    
-                    data.append(row_data)
-                
-                if not data:
+                rows = self._leave_export_rows()
+                if not rows:
                     QMessageBox.warning(self, "알림", "다운로드할 데이터가 없습니다.")
                     return
                 
-                # 엑셀 파일 생성
-                with pd.ExcelWriter(file_path, engine='openpyxl', mode='w') as writer:
-                    # 시트 이름 생성
-                    sheet_name = f"{selected_year}년"
-                    # Excel 시트 이름 제한 (31자)
-                    if len(sheet_name) > 31:
-                        sheet_name = sheet_name[:31]
-                    
-                    df = pd.DataFrame(data)
-                    df.to_excel(writer, index=False, sheet_name=sheet_name)
-                    
-                    # 헤더 스타일 적용
-                    worksheet = writer.sheets[sheet_name]
-                    # 눈금선 숨기기
-                    worksheet.sheet_view.showGridLines = False
-
-                    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                    # Excel에서 글자색은 ARGB(8자리)가 안전합니다.
-                    header_font = Font(bold=True, color="FF000000")  # 검정색
-                    
-                    for cell in worksheet[1]:
-                        cell.fill = header_fill
-                        cell.font = header_font
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
-
-                    # --- 두번째 이미지 스타일: 부서(팀) 셀 세로 병합 + 전체 테두리 + 컬럼 강조 ---
-                    max_row = worksheet.max_row
-                    max_col = worksheet.max_column
-
-                    # (1) 부서(1열) 동일 구간 병합 (2행부터 데이터 시작)
-                    def _merge_dept_blocks():
-                        if max_row < 2:
-                            return
-                        start = 2
-                        current = worksheet.cell(row=2, column=1).value
-                        for r in range(3, max_row + 2):  # sentinel
-                            v = worksheet.cell(row=r, column=1).value if r <= max_row else None
-                            if v != current:
-                                end = r - 1
-                                if current and end >= start:
-                                    if end > start:
-                                        # 병합 전에 아래 셀 값을 비워야 함.
-                                        # 병합 후에는 아래 셀이 MergedCell(읽기 전용)로 바뀌어 value 대입 시 오류 발생함.
-                                        for rr in range(start + 1, end + 1):
-                                            worksheet.cell(row=rr, column=1).value = ""
-                                        worksheet.merge_cells(start_row=start, start_column=1, end_row=end, end_column=1)
-                                    # 가운데 정렬
-                                    worksheet.cell(row=start, column=1).alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-                                start = r
-                                current = v
-
-                    _merge_dept_blocks()
-
-                    # (2) 전체 테두리: 값이 있는 영역(헤더 포함)에는 무조건 얇은 테두리
-                    thin_side = Side(style="thin")
-                    thin_border = Border(left=thin_side, right=thin_side, top=thin_side, bottom=thin_side)
-                    for r in range(1, max_row + 1):
-                        for c in range(1, max_col + 1):
-                            cell = worksheet.cell(row=r, column=c)
-                            # 데이터가 있는 셀 위주(헤더는 항상)
-                            if r == 1 or (cell.value is not None and (not isinstance(cell.value, str) or cell.value.strip() != "")):
-                                cell.border = thin_border
-                                if r != 1 and c in (1, 2, 3, 4):
-                                    cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-                    # (3) 컬럼 강조/헤더 표기: 헤더 텍스트로 컬럼 위치를 찾아 적용(연도 변경/컬럼 변화에도 안전)
-                    try:
-                        # 헤더 매핑(1행)
-                        header_to_col = {}
-                        for c in range(1, max_col + 1):
-                            v = worksheet.cell(row=1, column=c).value
-                            if v is None:
-                                continue
-                            header_to_col[str(v).strip()] = c
-
-                        prev_year_key = f"{prev_year}년"
-                        selected_year_key = f"{selected_year}년"
-
-                        # 헤더를 두번째 이미지처럼 변경 (줄바꿈 + wrap)
-                        if prev_year_key in header_to_col:
-                            c_prev = header_to_col[prev_year_key]
-                            worksheet.cell(row=1, column=c_prev).value = f"{prev_year_key}\n남은연차"
-                        if selected_year_key in header_to_col:
-                            c_sel = header_to_col[selected_year_key]
-                            worksheet.cell(row=1, column=c_sel).value = f"{selected_year_key}\n사용연차"
-
-                        # 헤더 줄바꿈 표시를 위해 1행 높이/정렬 설정
-                        worksheet.row_dimensions[1].height = 28
-                        for cell in worksheet[1]:
-                            cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-                        # 컬럼 강조: 선택년도 사용연차(빨강), 잔여수(파랑 + 연녹색 채우기)
-                        red_font = Font(color="FFFF0000")
-                        blue_font = Font(color="FF0000FF")
-                        green_fill = PatternFill(start_color="FFE2F0D9", end_color="FFE2F0D9", fill_type="solid")
-
-                        c_sel = header_to_col.get(selected_year_key)
-                        c_rem = header_to_col.get("잔여수")
-                        if c_sel:
-                            for r in range(2, max_row + 1):
-                                worksheet.cell(row=r, column=c_sel).font = red_font
-                        if c_rem:
-                            for r in range(2, max_row + 1):
-                                rem_cell = worksheet.cell(row=r, column=c_rem)
-                                rem_cell.font = blue_font
-                                rem_cell.fill = green_fill
-                    except:
-                        pass
-                    
-                    # 컬럼 너비 설정: "헤더명 기반"으로 적용(연도 변경에도 안전)
-                    try:
-                        header_to_col = {}
-                        for c in range(1, worksheet.max_column + 1):
-                            v = worksheet.cell(row=1, column=c).value
-                            if v is None:
-                                continue
-                            header_to_col[str(v).split("\n")[0].strip()] = c  # 줄바꿈 앞부분 기준
-
-                        def _set_width(header_name: str, w: int):
-                            col_idx = header_to_col.get(header_name)
-                            if col_idx:
-                                worksheet.column_dimensions[get_column_letter(col_idx)].width = w
-
-                        _set_width("부서", 12)
-                        _set_width("직급", 8)
-                        _set_width("이름", 10)
-                        _set_width("입사일", 12)
-                        _set_width(f"{prev_year}년", 12)
-
-                        for m in range(1, 13):
-                            _set_width(f"{m}월", 6)
-
-                        _set_width(f"{selected_year}년", 12)
-                        _set_width("연차발생수", 10)
-                        _set_width("잔여수", 10)
-                        _set_width("소멸내역", 38)
-                    except:
-                        pass
-
-                    # (4) 전체 셀 가운데 정렬(가로/세로)
-                    # - merged cell은 value 변경이 불가하지만, 스타일은 환경에 따라 예외가 날 수 있어 안전하게 처리합니다.
-                    try:
-                        align_center = Alignment(horizontal="center", vertical="center", wrap_text=False)
-                        align_center_wrap = Alignment(horizontal="center", vertical="center", wrap_text=True)
-                        for r in range(1, worksheet.max_row + 1):
-                            for c in range(1, worksheet.max_column + 1):
-                                cell = worksheet.cell(row=r, column=c)
-                                try:
-                                    wrap = bool(getattr(getattr(cell, "alignment", None), "wrap_text", False))
-                                except Exception:
-                                    wrap = False
-                                try:
-                                    cell.alignment = align_center_wrap if wrap else align_center
-                                except Exception:
-                                    # MergedCell 등 일부 객체는 환경에 따라 스타일 대입에서 예외가 날 수 있음
-                                    pass
-                    except Exception:
-                        pass
+                # 엑셀 파일 생성 (write-only, 스타일은 셀을 쓰면서 지정)
+                workbook = openpyxl.Workbook(write_only=True)
+                write_leave_sheet(workbook, f"{selected_year}년", rows, selected_year)
+                workbook.save(file_path)
                 
                 if not silent:
                     QMessageBox.information(self, "성공", f"엑셀 파일이 생성되었습니다.\n{selected_year}년 데이터가 다운로드되었습니다.")
@@ -2416,179 +911,53 @@ if PYSIDE6_AVAILABLE:
             # 덮어쓰기/잠금 처리
             if os.path.exists(file_path):
                 try:
-                    os.remove(file_path)
-                except PermissionError:
-                    QMessageBox.warning(self, "경고", f"파일이 다른 프로그램에서 열려있습니다.\n파일을 닫고 다시 시도해주세요.\n\n파일: {file_path}")
-                    return
-
-            root, ext = os.path.splitext(file_path)
-            tmp_leave = f"{root}__tmp_leave{ext}"
-            tmp_att = f"{root}__tmp_att{ext}"
-
-            try:
-                # 통합 다운로드 시 주말 색상 검증/보강에 사용할 출퇴근 연도(출퇴근 탭 기준)
-                try:
-                    att_year = attendance_gui.year_combo.currentData()
-                    if att_year is None:
-                        att_year = datetime.now().year
-                    att_year = int(att_year)
-                except Exception:
-                    att_year = datetime.now().year
-
-                # 1) 각각 임시 파일로 조용히 생성
-                self.download_excel(file_path_override=tmp_leave, silent=True, open_after=False)
-                attendance_gui._download_attendance_excel(file_path_override=tmp_att, silent=True, open_after=False)
-
-                # 2) 임시 파일의 시트를 하나의 워크북으로 병합
-                wb_leave = openpyxl.load_workbook(tmp_leave)
-                wb_att = openpyxl.load_workbook(tmp_att)
-
-                out_wb = openpyxl.Workbook()
-                out_wb.remove(out_wb.active)
-
-                def _clone_sheet(src_ws, dest_title):
-                    from copy import copy
-                    from openpyxl.utils import column_index_from_string
-                    title = dest_title[:31]
-                    dst_ws = out_wb.create_sheet(title=title)
-                    # sheet view
-                    try:
-                        dst_ws.sheet_view.showGridLines = src_ws.sheet_view.showGridLines
-                        dst_ws.sheet_view.zoomScale = src_ws.sheet_view.zoomScale
-                    except Exception:
-                        pass
-                    # dimensions
-                    for k, dim in src_ws.column_dimensions.items():
-                        dst_ws.column_dimensions[k].width = dim.width
-                    for r, dim in src_ws.row_dimensions.items():
-                        dst_ws.row_dimensions[r].height = dim.height
-                    # cells
-                    for row in src_ws.iter_rows(min_row=1, max_row=src_ws.max_row, min_col=1, max_col=src_ws.max_column):
-                        for c in row:
-                            # src가 MergedCell일 수 있고, dst는 merge 전이어야 값/스타일 주입 가능
-                            col_raw = getattr(c, "col_idx", None)
-                            if col_raw is None:
-                                col_raw = getattr(c, "column", None)
-                            if isinstance(col_raw, str):
-                                col_idx = column_index_from_string(col_raw)
-                            else:
-                                col_idx = int(col_raw)
-
-                            dc = dst_ws.cell(row=c.row, column=col_idx, value=c.value)
-                            dc.number_format = c.number_format
-                            # StyleProxy(해시 불가) 그대로 대입하면 저장 시 "unhashable type: StyleProxy"가 날 수 있어 복제해서 주입
-                            dc.font = copy(c.font)
-                            dc.fill = copy(c.fill)
-                            dc.border = copy(c.border)
-                            dc.alignment = copy(c.alignment)
-                            dc.protection = copy(c.protection)
-                    # merges (셀 복사 후 적용해야 MergedCell read-only 문제를 피할 수 있음)
-                    for m in list(src_ws.merged_cells.ranges):
-                        dst_ws.merge_cells(str(m))
-                    return dst_ws
-
-                def _apply_border_to_used_range(ws):
-                    """통합 파일에서 테두리가 누락되는 경우를 방지하기 위해, 사용 영역 전체에 테두리를 확정 적용"""
-                    max_r = ws.max_row or 1
-                    max_c = ws.max_column or 1
-                    # 테두리 색상을 명시해서 렌더링 안정화
-                    thin = Side(style="thin", color="FF000000")
-                    thick = Side(style="thick", color="FF000000")
-                    cache = {}
-
-                    def _b(l, r, t, b):
-                        key = (l.style, r.style, t.style, b.style)
-                        if key in cache:
-                            return cache[key]
-                        bd = Border(left=l, right=r, top=t, bottom=b)
-                        cache[key] = bd
-                        return bd
-
-                    # 출퇴근 시트는 표의 상단이 2행(헤더 시작)이므로, 상단 외곽선 기준을 2행으로 맞춤
-                    # (연월차 시트는 1행이 헤더이므로 1행 기준)
-                    top_row = 2 if (ws.title.endswith("월") and ws.title[:-1].isdigit()) else 1
-
-                    for r in range(top_row, max_r + 1):
-                        for c in range(1, max_c + 1):
-                            cell = ws.cell(row=r, column=c)
-                            # 외곽선은 빈 셀이어도 반드시 보여야 하므로, 직사각형 범위 전체에 테두리 적용
-                            l = thick if c == 1 else thin
-                            rr = thick if c == max_c else thin
-                            tt = thick if r == top_row else thin
-                            bb = thick if r == max_r else thin
-                            cell.border = _b(l, rr, tt, bb)
-
-                def _apply_center_alignment_to_used_range(ws):
-                    """통합 파일에서 모든 셀 가로/세로 가운데 정렬을 확정 적용"""
-                    max_r = ws.max_row or 1
-                    max_c = ws.max_column or 1
-                    align_center = Alignment(horizontal="center", vertical="center", wrap_text=False)
-                    align_center_wrap = Alignment(horizontal="center", vertical="center", wrap_text=True)
-                    for r in range(1, max_r + 1):
-                        for c in range(1, max_c + 1):
-                            cell = ws.cell(row=r, column=c)
-                            try:
-                                wrap = bool(getattr(getattr(cell, "alignment", None), "wrap_text", False))
-                            except Exception:
-                                wrap = False
-                            try:
-                                cell.alignment = align_center_wrap if wrap else align_center
-                            except Exception:
-                                pass
-
-                def _apply_weekend_fill_to_attendance_sheet(ws, year: int):
-                    """통합 파일에서 출퇴근 시트(예: 1월)에 토/일 배경색을 확정 적용(시트 복사 과정 누락 방지)"""
-                    try:
-                        if not (ws.title.endswith("월") and ws.title[:-1].isdigit()):
-                            return
-                        m = int(ws.title[:-1])
-                        from calendar import monthrange as _mr
-                        days_in_month = _mr(int(year), m)[1]
-                        weekend_days = set()
-                        for d in range(1, days_in_month + 1):
-                            if datetime(int(year), m, d).weekday() in (5, 6):
-                                weekend_days.add(d)
-                        # 날짜 컬럼: D(4)=1일 => col = 3 + day
-                        fill_weekend = PatternFill(patternType="solid", fgColor="FFD0CECE")
-                        max_r = ws.max_row or 1
-                        for d in weekend_days:
-                            col_idx = 3 + d
-                            for r in range(2, max_r + 1):  # 헤더(2행)부터
-                                try:
-                                    ws.cell(row=r, column=col_idx).fill = fill_weekend
-                                except Exception:
-                                    pass
-                    except Exception:
-                        pass
-
-                # 연월차: 시트 이름 고정
-                leave_title = "연차집계표-최종"
-                for ws in wb_leave.worksheets:
-                    out_ws = _clone_sheet(ws, leave_title)
-                    _apply_border_to_used_range(out_ws)
-                    _apply_center_alignment_to_used_range(out_ws)
+                    os.remove(file_path)
+                except PermissionError:
+                    QMessageBox.warning(self, "경고", f"파일이 다른 프로그램에서 열려있습니다.\n파일을 닫고 다시 시도해주세요.\n\n파일: {file_path}")
+                    return
 
-                # 출퇴근: 모든 시트 복사 (시트 이름은 월만 보이도록: "1월", "2월" ...)
-                for ws in wb_att.worksheets:
-                    out_ws = _clone_sheet(ws, ws.title)
-                    _apply_border_to_used_range(out_ws)
-                    _apply_center_alignment_to_used_range(out_ws)
-                    _apply_weekend_fill_to_attendance_sheet(out_ws, att_year)
+            try:
+                selected_year = self.year_combo.currentData()
+                if selected_year is None:
+                    selected_year = datetime.now().year
+                rows = self._leave_export_rows()
+                if not rows:
+                    QMessageBox.warning(self, "알림", "다운로드할 데이터가 없습니다.")
+                    return
 
-                out_wb.save(file_path)
+                # 출퇴근 대상 월/직원 (출퇴근 탭에서 선택한 년도/월 기준)
+                att_year = attendance_gui.year_combo.currentData()
+                att_month = attendance_gui.month_combo.currentData()
+                if att_year is None:
+                    att_year = datetime.now().year
+                if att_month is None:
+                    att_month = datetime.now().month
+                att_year = int(att_year)
 
-                # 일부 Excel 환경에서 스타일이 "기록은 되는데 표시가 안 되는" 현상이 있어,
-                # 한 번 다시 로드/저장하여 스타일 테이블을 정규화합니다.
+                # 임시 파일/시트 복제 없이 한 워크북에 바로 기록
+                # (연차집계표는 격자+굵은 외곽선, 출퇴근 시트는 단독 다운로드와 동일)
+                workbook = openpyxl.Workbook(write_only=True)
+                write_leave_sheet(workbook, "연차집계표-최종", rows, selected_year, outline=True)
+                conn = attendance_gui.db.get_connection()
                 try:
-                    wb_norm = openpyxl.load_workbook(file_path)
-                    wb_norm.save(file_path)
-                except Exception:
-                    pass
+                    targets = attendance_gui._attendance_export_targets(conn.cursor(), att_year, att_month)
+                    if targets is None:
+                        return
+                    year_months, employees = targets
+                    progress_dialog, on_progress = attendance_gui._sheet_progress_dialog()
+                    try:
+                        AttendanceWorkbookWriter(conn).add_sheets(workbook, year_months, employees,
+                                                                  progress=on_progress)
+                    finally:
+                        progress_dialog.close()
+                finally:
+                    conn.close()
+                workbook.save(file_path)
 
-                # --- 최종 파일 기준으로 검증 메시지 출력(통합 다운로드에서는 silent 생성이라 기존 검증이 안 보였음) ---
+                # --- 최종 파일 기준으로 검증 메시지 출력 ---
                 verify_msg = f"\n\n[저장 경로]\n- {file_path}"
                 try:
-                    wb_chk = openpyxl.load_workbook(file_path)
+                    wb_chk = openpyxl.load_workbook(file_path, read_only=True)
                     # 출퇴근 검증 시트 선택: "1월" 우선, 없으면 첫 번째 월 시트, 그것도 없으면 active
                     att_ws = None
                     if "1월" in wb_chk.sheetnames:
@@ -2627,7 +996,7 @@ if PYSIDE6_AVAILABLE:
                                     break
                             if weekend_day is not None:
                                 col_idx = 3 + weekend_day  # 날짜 컬럼: D(4)=1일 => col=3+day
-                                r_data = 4 if att_ws.max_row >= 4 else 2
+                                r_data = 4 if (att_ws.max_row or 0) >= 4 else 2
                                 h_sc = getattr(att_ws.cell(row=2, column=col_idx).fill, "start_color", None)
                                 d_sc = getattr(att_ws.cell(row=r_data, column=col_idx).fill, "start_color", None)
                                 h_fill = getattr(h_sc, "rgb", None) or getattr(h_sc, "indexed", None)
@@ -2641,6 +1010,7 @@ if PYSIDE6_AVAILABLE:
                                 )
                     except Exception:
                         pass
+                    wb_chk.close()
                 except Exception:
                     verify_msg += "\n\n[검증] 실패(파일 재열기 불가)"
 
@@ -2651,13 +1021,6 @@ if PYSIDE6_AVAILABLE:
                     pass
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"엑셀 파일 생성 중 오류 발생: {str(e)}")
-            finally:
-                for p in (tmp_leave, tmp_att):
-                    try:
-                        if os.path.exists(p):
-                            os.remove(p)
-                    except Exception:
-                        pass
         
         def save_leave(self, dialog, emp_id, leave_date, leave_type, amount):
             """연차 사용 저장"""
@@ -2676,7 +1039,8 @@ if PYSIDE6_AVAILABLE:
                 
                 QMessageBox.information(self, "성공", "연차 사용이 등록되었습니다.")
                 dialog.accept()
-                self.refresh_data()
+                self._patch_rows({emp_id})
+                self.change_bus.leave_changed([emp_id], leave_date, leave_date, source=self)
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"등록 중 오류 발생: {str(e)}")
     
@@ -2717,7 +1081,39 @@ if PYSIDE6_AVAILABLE:
             layout.addWidget(button_box)
             
             dialog.exec()
-        
+
+        def close_year(self):
+            """연말 마감 - 선택한 년도까지 마감하지 않은 년도의 전 직원 잔여수 확정"""
+            selected_year = self._selected_year()
+            closer = AnnualClose(self.db, self.calculator)
+            with self.db.connection() as conn:
+                already_closed = is_year_closed(conn, selected_year)
+
+            if already_closed:
+                message = (f"{selected_year}년은 이미 마감되었습니다.\n"
+                           f"현재 기록으로 {selected_year}년 잔여수를 다시 확정하시겠습니까?")
+            else:
+                message = (f"{selected_year}년까지 마감하지 않은 년도의 전 직원 잔여수를 확정합니다.\n"
+                           f"마감한 년도의 잔여수는 이후 조회로 바뀌지 않습니다. 진행하시겠습니까?")
+            if QMessageBox.question(self, "연말 마감", message, QMessageBox.Yes | QMessageBox.No) != QMessageBox.Yes:
+                return
+
+            try:
+                if already_closed:
+                    results = {selected_year: closer.close_year(selected_year)}
+                else:
+                    results = closer.close_through(selected_year)
+            except ValueError as e:
+                QMessageBox.warning(self, "경고", str(e))
+                return
+            except Exception as e:
+                QMessageBox.critical(self, "오류", f"연말 마감 중 오류가 발생했습니다:\n{str(e)}")
+                return
+
+            summary = "\n".join(f"{year}년: {count}명" for year, count in results.items())
+            QMessageBox.information(self, "완료", f"연말 마감이 완료되었습니다.\n{summary}")
+            self.refresh_data()
+
         def on_cell_changed(self, item):
             """셀 편집 완료 시 호출 - 셀 값 수정 및 데이터베이스 저장"""
             if not item:
@@ -2735,279 +1131,180 @@ if PYSIDE6_AVAILABLE:
                 # item이 이미 삭제된 경우
                 return
             
-            # 입력된 값 가져오기
-            new_value = item.text().strip()
-            
-            # UserRole 데이터 확인
-            data = item.data(Qt.UserRole)
-            emp_id = None
-            if isinstance(data, dict):
-                emp_id = data.get('emp_id')
-            elif isinstance(data, int):
-                emp_id = data
-            
-            if not emp_id:
-                # 편집된 값은 그대로 유지 (데이터베이스 저장 없음)
+            # 붙여넣기/삭제 중이면 모아 두었다가 한 번에 저장
+            if self._journal_cell_edit(item, row, col):
                 return
-            
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
+            self._flush_cell_edits([item])
+        
+        def _flush_cell_edits(self, items):
+            """바뀐 셀들을 한 트랜잭션에 저장하고 요약(사용연차/잔여수)은 행마다 한 번만 갱신"""
             # 선택된 년도 가져오기
             selected_year = self.year_combo.currentData()
             if selected_year is None:
                 selected_year = datetime.now().year
             
+            summary_rows = {}  # 행 번호 -> None (순서 유지)
+            hire_date_changed = []
+            invalid = []  # (item, 복원할 값, 메시지)
             try:
-                # 부서 (컬럼 0)
-                if col == 0:
-                    if new_value:
-                        cursor.execute("""
-                            UPDATE employees
-                            SET department = ?
-                            WHERE id = ?
-                        """, (new_value, emp_id))
-                        conn.commit()
-                        # 수동 입력 값도 저장
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO leave_manual_values
-                            (employee_id, year, column_index, manual_value, updated_at)
-                            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """, (emp_id, selected_year, col, new_value))
-                        conn.commit()
-                
-                # 직급 (컬럼 1)
-                elif col == 1:
-                    if new_value:
-                        cursor.execute("""
-                            UPDATE employees
-                            SET position = ?
-                            WHERE id = ?
-                        """, (new_value, emp_id))
-                        conn.commit()
-                        # 수동 입력 값도 저장
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO leave_manual_values
-                            (employee_id, year, column_index, manual_value, updated_at)
-                            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """, (emp_id, selected_year, col, new_value))
-                        conn.commit()
+                with self.db.transaction() as conn:
+                    cursor = conn.cursor()
+                    for item in items:
+                        try:
+                            row = item.row()
+                            col = item.column()
+                        except RuntimeError:
+                            continue
+                        
+                        # UserRole 데이터 확인
+                        data = item.data(Qt.UserRole)
+                        emp_id = None
+                        if isinstance(data, dict):
+                            emp_id = data.get('emp_id')
+                        elif isinstance(data, int):
+                            emp_id = data
+                        
+                        # 표시 중인 직원만 저장 (편집된 값은 그대로 유지)
+                        if not emp_id or emp_id not in self._leave_rows:
+                            continue
+                        
+                        try:
+                            effect = self._save_leave_cell(cursor, col, emp_id, data, item.text().strip(), selected_year)
+                        except _InvalidCellValue as e:
+                            invalid.append((item, e.restore_text, str(e)))
+                            continue
+                        if effect == 'hire_date':
+                            hire_date_changed.append(emp_id)
+                        elif effect == 'summary':
+                            summary_rows[row] = None
+            except Exception as e:
+                QMessageBox.warning(self, "오류", f"데이터 저장 중 오류가 발생했습니다.\n{str(e)}")
+                return
+            
+            # 잘못 입력한 셀은 원래 값으로 복원 (복원은 저장하지 않음)
+            if invalid:
+                self._is_refreshing = True
+                try:
+                    for item, restore_text, _message in invalid:
+                        item.setText(restore_text)
+                finally:
+                    self._is_refreshing = False
+                QMessageBox.warning(self, "경고", "\n".join(dict.fromkeys(message for _, _, message in invalid)))
+            
+            if hire_date_changed:
+                # 입사일이 변경되면 연차 계산에 영향을 주므로 전체 새로고침
+                self.refresh_data()
+                self.change_bus.employees_changed(hire_date_changed, source=self)
+                return
+            
+            # 편집된 값은 그대로 유지하고, 요약 정보(사용연차, 잔여수)만 행마다 한 번 업데이트
+            for row in summary_rows:
+                self._update_summary_for_row(row)
+        
+        @staticmethod
+        def _save_manual_value(cursor, emp_id, selected_year, col, new_value):
+            """수동 입력 값 저장 (빈 값이면 삭제하여 계산된 값으로 복원)"""
+            if not new_value:
+                cursor.execute("""
+                    DELETE FROM leave_manual_values
+                    WHERE employee_id = ? AND year = ? AND column_index = ?
+                """, (emp_id, selected_year, col))
+            else:
+                cursor.execute("""
+                    INSERT OR REPLACE INTO leave_manual_values
+                    (employee_id, year, column_index, manual_value, updated_at)
+                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, (emp_id, selected_year, col, new_value))
+        
+        def _save_leave_cell(self, cursor, col, emp_id, data, new_value, selected_year):
+            """셀 하나를 저장 (커밋은 호출자)
+            
+            Returns:
+                'hire_date': 입사일 변경 (전체 새로고침 필요)
+                'summary': 해당 행 요약 갱신 필요
+                None: 추가 처리 없음
+            
+            Raises:
+                _InvalidCellValue: 형식이 잘못된 입력 (복원할 값 포함)
+            """
+            # 부서/직급/이름 (컬럼 0/1/2)
+            if col in (0, 1, 2):
+                if new_value:
+                    field = ('department', 'position', 'name')[col]
+                    cursor.execute(f"UPDATE employees SET {field} = ? WHERE id = ?", (new_value, emp_id))
+                    # 수동 입력 값도 저장
+                    self._save_manual_value(cursor, emp_id, selected_year, col, new_value)
+                return None
+            
+            # 입사일 (컬럼 3)
+            if col == 3:
+                if not new_value:
+                    return None
+                try:
+                    # 날짜 형식 검증 및 변환
+                    hire_date = datetime.strptime(new_value, "%Y-%m-%d").date()
+                except ValueError:
+                    result = cursor.execute("SELECT hire_date FROM employees WHERE id = ?", (emp_id,)).fetchone()
+                    raise _InvalidCellValue("날짜 형식이 올바르지 않습니다.\n형식: YYYY-MM-DD (예: 2024-01-01)",
+                                            str(result[0]) if result else new_value)
+                cursor.execute("UPDATE employees SET hire_date = ? WHERE id = ?", (hire_date, emp_id))
+                self._save_manual_value(cursor, emp_id, selected_year, col, new_value)
+                return 'hire_date'
+            
+            # 월별 컬럼 (5번째부터 16번째까지: 1월~12월) - 연차 사용량 저장
+            if 5 <= col <= 16:
+                month = data.get('month') if isinstance(data, dict) else None
+                if not month:
+                    return None
                 
-                # 이름 (컬럼 2)
-                elif col == 2:
-                    if new_value:
-                        cursor.execute("""
-                            UPDATE employees
-                            SET name = ?
-                            WHERE id = ?
-                        """, (new_value, emp_id))
-                        conn.commit()
-                        # 수동 입력 값도 저장
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO leave_manual_values
-                            (employee_id, year, column_index, manual_value, updated_at)
-                            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """, (emp_id, selected_year, col, new_value))
-                        conn.commit()
+                # 기존 기록 확인
+                existing = cursor.execute("""
+                    SELECT id, leave_amount
+                    FROM leave_records
+                    WHERE employee_id = ? AND year = ? AND month = ?
+                """, (emp_id, selected_year, month)).fetchone()
                 
-                # 입사일 (컬럼 3)
-                elif col == 3:
-                    if new_value:
-                        try:
-                            # 날짜 형식 검증 및 변환
-                            hire_date = datetime.strptime(new_value, "%Y-%m-%d").date()
-                            cursor.execute("""
-                                UPDATE employees
-                                SET hire_date = ?
-                                WHERE id = ?
-                            """, (hire_date, emp_id))
-                            conn.commit()
-                            # 수동 입력 값도 저장
-                            cursor.execute("""
-                                INSERT OR REPLACE INTO leave_manual_values
-                                (employee_id, year, column_index, manual_value, updated_at)
-                                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                            """, (emp_id, selected_year, col, new_value))
-                            conn.commit()
-                            # 입사일이 변경되면 연차 계산에 영향을 주므로 전체 새로고침
-                            self.refresh_data()
-                            return
-                        except ValueError:
-                            QMessageBox.warning(self, "경고", "날짜 형식이 올바르지 않습니다.\n형식: YYYY-MM-DD (예: 2024-01-01)")
-                            # 원래 값으로 복원
-                            cursor.execute("""
-                                SELECT hire_date FROM employees WHERE id = ?
-                            """, (emp_id,))
-                            result = cursor.fetchone()
-                            if result:
-                                item.setText(str(result[0]))
-                            conn.close()
-                            return
+                try:
+                    # 숫자로 변환
+                    leave_amount = float(new_value) if new_value else 0.0
+                except ValueError:
+                    old_value = existing[1] if existing and existing[1] else 0.0
+                    raise _InvalidCellValue("숫자만 입력 가능합니다.", str(old_value) if old_value else "")
                 
-                # 이전 년도 남은연차 (컬럼 4)
-                elif col == 4:
-                    # 빈 값이면 수동 입력 값 삭제 (계산된 값으로 복원)
-                    if not new_value:
+                if leave_amount > 0:
+                    if existing:
+                        # 기존 기록 업데이트
                         cursor.execute("""
-                            DELETE FROM leave_manual_values
-                            WHERE employee_id = ? AND year = ? AND column_index = ?
-                        """, (emp_id, selected_year, col))
+                            UPDATE leave_records
+                            SET leave_amount = ?
+                            WHERE employee_id = ? AND year = ? AND month = ?
+                        """, (leave_amount, emp_id, selected_year, month))
                     else:
-                        # 수동 입력 값 저장
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO leave_manual_values
-                            (employee_id, year, column_index, manual_value, updated_at)
-                            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """, (emp_id, selected_year, col, new_value))
-                    conn.commit()
-                
-                # 월별 컬럼 (5번째부터 16번째까지: 1월~12월) - 연차 사용량 저장
-                elif col >= 5 and col <= 16:
-                    month_data = data if isinstance(data, dict) else {}
-                    month = month_data.get('month')
-                    
-                    if not month:
-                        conn.close()
-                        return
-                    
-                    try:
-                        # 숫자로 변환
-                        leave_amount = float(new_value) if new_value else 0.0
-                    except ValueError:
-                        QMessageBox.warning(self, "경고", "숫자만 입력 가능합니다.")
-                        # 편집된 값 복원을 위해 새로고침하지 않고 원래 값으로 되돌림
-                        selected_year = self.year_combo.currentData() or datetime.now().year
+                        # 새로 생성 (연차로 저장)
                         cursor.execute("""
-                            SELECT leave_amount
-                            FROM leave_records
-                            WHERE employee_id = ? AND year = ? AND month = ?
-                        """, (emp_id, selected_year, month))
-                        result = cursor.fetchone()
-                        old_value = result[0] if result and result[0] else 0.0
-                        item.setText(str(old_value) if old_value else "")
-                        conn.close()
-                        return
-                    
-                    # 선택된 년도 가져오기
-                    selected_year = self.year_combo.currentData()
-                    if selected_year is None:
-                        selected_year = datetime.now().year
-                    
-                    # 기존 기록 확인
+                            INSERT INTO leave_records
+                            (employee_id, leave_type, leave_date, leave_amount, year, month)
+                            VALUES (?, ?, ?, ?, ?, ?)
+                        """, (emp_id, '연차', datetime(selected_year, month, 1).date(), leave_amount, selected_year, month))
+                elif existing:
+                    # 0이면 삭제
                     cursor.execute("""
-                        SELECT id, leave_amount
-                        FROM leave_records
+                        DELETE FROM leave_records
                         WHERE employee_id = ? AND year = ? AND month = ?
                     """, (emp_id, selected_year, month))
-                    existing = cursor.fetchone()
-                    
-                    if leave_amount > 0:
-                        if existing:
-                            # 기존 기록 업데이트
-                            cursor.execute("""
-                                UPDATE leave_records
-                                SET leave_amount = ?
-                                WHERE employee_id = ? AND year = ? AND month = ?
-                            """, (leave_amount, emp_id, selected_year, month))
-                        else:
-                            # 새로 생성 (연차로 저장)
-                            cursor.execute("""
-                                INSERT INTO leave_records
-                                (employee_id, leave_type, leave_date, leave_amount, year, month)
-                                VALUES (?, ?, ?, ?, ?, ?)
-                            """, (emp_id, '연차', datetime(selected_year, month, 1).date(), leave_amount, selected_year, month))
-                    else:
-                        # 0이면 삭제
-                        if existing:
-                            cursor.execute("""
-                                DELETE FROM leave_records
-                                WHERE employee_id = ? AND year = ? AND month = ?
-                            """, (emp_id, selected_year, month))
-                    
-                    conn.commit()
-                    
-                    # 빈 값이면 수동 입력 값 삭제 (계산된 값으로 복원)
-                    if not new_value:
-                        cursor.execute("""
-                            DELETE FROM leave_manual_values
-                            WHERE employee_id = ? AND year = ? AND column_index = ?
-                        """, (emp_id, selected_year, col))
-                    else:
-                        # 수동 입력 값도 저장
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO leave_manual_values
-                            (employee_id, year, column_index, manual_value, updated_at)
-                            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """, (emp_id, selected_year, col, new_value))
-                    conn.commit()
-                    
-                    # 편집된 값은 그대로 유지하고, 요약 정보(2025년 사용연차, 잔여수)만 업데이트
-                    # 전체 새로고침 대신 해당 행의 요약 정보만 업데이트
-                    self._update_summary_for_row(row)
-                
-                # 선택된 년도 사용연차 (컬럼 17)
-                elif col == 17:
-                    # 빈 값이면 수동 입력 값 삭제 (계산된 값으로 복원)
-                    if not new_value:
-                        cursor.execute("""
-                            DELETE FROM leave_manual_values
-                            WHERE employee_id = ? AND year = ? AND column_index = ?
-                        """, (emp_id, selected_year, col))
-                    else:
-                        # 수동 입력 값 저장
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO leave_manual_values
-                            (employee_id, year, column_index, manual_value, updated_at)
-                            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """, (emp_id, selected_year, col, new_value))
-                    conn.commit()
-                
-                # 연차발생수 (컬럼 18) - 자동 계산 값만 사용, 수동 입력 불가
-                elif col == 18:
-                    # 연차발생수는 자동 계산 값만 사용하므로 수동 입력 값 삭제
-                    cursor.execute("""
-                        DELETE FROM leave_manual_values
-                        WHERE employee_id = ? AND year = ? AND column_index = ?
-                    """, (emp_id, selected_year, col))
-                    conn.commit()
-                    # 자동 계산 값으로 복원
-                    self._update_summary_for_row(row)
-                    return  # 편집 불가
-                
-                # 잔여수 (컬럼 19) - 자동 계산 값만 사용, 수동 입력 불가
-                elif col == 19:
-                    # 잔여수는 자동 계산 값만 사용하므로 수동 입력 값 삭제
-                    cursor.execute("""
-                        DELETE FROM leave_manual_values
-                        WHERE employee_id = ? AND year = ? AND column_index = ?
-                    """, (emp_id, selected_year, col))
-                    conn.commit()
-                    # 자동 계산 값으로 복원
-                    self._update_summary_for_row(row)
-                    return  # 편집 불가
-                
-                # 소멸내역 (컬럼 20)
-                elif col == 20:
-                    # 빈 값이면 수동 입력 값 삭제 (계산된 값으로 복원)
-                    if not new_value:
-                        cursor.execute("""
-                            DELETE FROM leave_manual_values
-                            WHERE employee_id = ? AND year = ? AND column_index = ?
-                        """, (emp_id, selected_year, col))
-                    else:
-                        # 수동 입력 값 저장
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO leave_manual_values
-                            (employee_id, year, column_index, manual_value, updated_at)
-                            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """, (emp_id, selected_year, col, new_value))
-                    conn.commit()
                 
-            except Exception as e:
-                QMessageBox.warning(self, "오류", f"데이터 저장 중 오류가 발생했습니다.\n{str(e)}")
-                conn.rollback()
-            finally:
-                conn.close()
+                self._save_manual_value(cursor, emp_id, selected_year, col, new_value)
+                return 'summary'
+            
+            # 연차발생수/잔여수 (컬럼 18/19) - 자동 계산 값만 사용, 수동 입력 값 삭제 후 계산 값으로 복원
+            if col in (18, 19):
+                self._save_manual_value(cursor, emp_id, selected_year, col, "")
+                return 'summary'
+            
+            # 이전 년도 남은연차(4), 선택된 년도 사용연차(17), 소멸내역(20) - 수동 입력 값
+            if col in (4, 17, 20):
+                self._save_manual_value(cursor, emp_id, selected_year, col, new_value)
+            return None
         
         def _update_summary_for_row(self, row):
             """특정 행의 요약 정보만 업데이트 (2025년 사용연차, 잔여수)"""
@@ -3041,15 +1338,11 @@ if PYSIDE6_AVAILABLE:
                     return
                 
                 hire_date_str = hire_date_item.text()
-                hire_date_obj = datetime.strptime(hire_date_str, "%Y-%m-%d").date()
+                calendar = entitlement_calendar(hire_date_str)
+                hire_date_obj = calendar.hire_date
                 
-                # 입사기념일 계산
-                hire_month = hire_date_obj.month
-                hire_day = hire_date_obj.day
-                try:
-                    anniversary_date = datetime(selected_year, hire_month, hire_day).date()
-                except ValueError:
-                    anniversary_date = datetime(selected_year, hire_month, hire_day - 1).date()
+                # 입사기념일 (2월 29일 입사자는 평년에 2월 28일)
+                anniversary_date = calendar.anniversary(selected_year)
                 
                 # attendance_records 테이블에서 직접 사용연차 계산 (refresh_data와 동일한 로직)
                 # 입사기념일 이후부터 다음 년도 1월 1일 전까지
@@ -3073,29 +1366,10 @@ if PYSIDE6_AVAILABLE:
                     else:
                         usage_start_date = datetime(selected_year, 1, 1).date()
                 
-                cursor.execute("""
-                    SELECT work_date, leave_type, remarks
-                    FROM attendance_records
-                    WHERE employee_id = ? AND work_date >= ? AND work_date < ?
-                    AND (leave_type IN ('연차', '반차', '휴가') 
-                         OR remarks IN ('반차_출근', '반차_퇴근'))
-                """, (emp_id, usage_start_date, datetime(selected_year + 1, 1, 1).date()))
-                year_records = cursor.fetchall()
-                
-                used_current_year = 0.0
-                반차_날짜_set = set()  # 반차 중복 방지
-                
-                for work_date, leave_type, remarks in year_records:
-                    # remarks가 반차_출근 또는 반차_퇴근인 경우도 반차로 처리
-                    is_half_day = (leave_type == '반차' or remarks == '반차_출근' or remarks == '반차_퇴근')
-                    
-                    if leave_type == '연차' or leave_type == '휴가':
-                        used_current_year += 1.0
-                    elif is_half_day:
-                        # 반차는 하루에 0.5만 (같은 날짜에 여러 번 있어도 한 번만)
-                        if work_date not in 반차_날짜_set:
-                            used_current_year += 0.5
-                            반차_날짜_set.add(work_date)
+                # 월별 집계(leave_balance_monthly)에서 조회 - 입사월만 일 단위 기록 사용
+                # (반차는 하루에 0.5만, 같은 날짜는 한 번만)
+                used_current_year = usage_between(conn, emp_id, hire_date_obj, usage_start_date,
+                                                  datetime(selected_year + 1, 1, 1).date())
                 
                 # 수동 입력된 월별 연차 사용량도 사용연차에 포함
                 # 월별 컬럼은 5번(1월)부터 16번(12월)까지
@@ -3141,29 +1415,6 @@ if PYSIDE6_AVAILABLE:
                 # attendance_records에서 계산한 값과 수동 입력 월별 값을 합산
                 used_current_year += manual_used_current_year
                 
-                # 디버깅: 사용연차 계산 결과 확인 (_update_summary_for_row)
-                cursor.execute("SELECT name FROM employees WHERE id = ?", (emp_id,))
-                emp_name_result = cursor.fetchone()
-                emp_name = emp_name_result[0] if emp_name_result else "Unknown"
-                if emp_name == "김미라" or emp_name == "전금희" or emp_name == "강지승":
-                    print(f"DEBUG {emp_name} (_update_summary_for_row): 입사일={hire_date_obj}, 입사기념일={anniversary_date}, usage_start_date={usage_start_date}, year_records 개수={len(year_records)}, 반차_날짜_set={반차_날짜_set}")
-                    print(f"DEBUG {emp_name} (_update_summary_for_row): attendance_records에서 계산={used_current_year - manual_used_current_year}, 수동 입력 월별={manual_used_current_year}, 합계={used_current_year}")
-                    print(f"DEBUG {emp_name} (_update_summary_for_row): 조회 기간 = {usage_start_date} ~ {datetime(selected_year + 1, 1, 1).date()}")
-                    if manual_monthly_values:
-                        print(f"DEBUG {emp_name} (_update_summary_for_row): 수동 입력 월별 값 개수={len(manual_monthly_values)}")
-                        for col_idx, manual_val in manual_monthly_values:
-                            if manual_val:
-                                try:
-                                    month_value = float(manual_val)
-                                    month = col_idx - 4
-                                    month_start = datetime(selected_year, month, 1).date()
-                                    print(f"DEBUG {emp_name} (_update_summary_for_row): 수동 입력 - {month}월: {month_value}, month_start={month_start}, anniversary_date={anniversary_date}")
-                                except (ValueError, TypeError):
-                                    pass
-                    for work_date, leave_type, remarks in year_records:
-                        is_half_day_check = (leave_type == '반차' or remarks == '반차_출근' or remarks == '반차_퇴근')
-                        print(f"DEBUG {emp_name} (_update_summary_for_row): work_date={work_date}, leave_type={leave_type}, remarks={remarks}, is_half_day={is_half_day_check}")
-                
                 # 17번 컬럼(2025년 사용연차)은 항상 attendance_records에서 계산한 값을 사용
                 # 수동 입력 값은 무시 (출퇴근 관리대장에서 입력한 값이 우선)
                 
@@ -3177,30 +1428,16 @@ if PYSIDE6_AVAILABLE:
                 elif selected_year < current_date_for_calc.year:
                     current_date_for_calc = datetime(selected_year, 12, 31).date()
                 
-                days_from_hire_to_current = (current_date_for_calc - hire_date_obj).days
-                
                 if days_from_hire_to_anniversary < 365:
-                    if days_from_hire_to_current < 0:
-                        leave_generated = 0
-                    else:
-                        months_passed = (current_date_for_calc.year - hire_date_obj.year) * 12 + (current_date_for_calc.month - hire_date_obj.month)
-                        if current_date_for_calc.day < hire_date_obj.day:
-                            months_passed -= 1
-                        leave_generated = min(max(months_passed, 0), 11)
+                    # 입사일 기준 경과 개월 수 (월차, 최대 11개)
+                    leave_generated = calendar.months_accrued(current_date_for_calc)
                 elif anniversary_date <= datetime(selected_year, 12, 31).date():
-                    leave_generated = self.calculator.calculate_annual_leave(hire_date_obj, anniversary_date)
+                    leave_generated = calendar.annual_leave(anniversary_date)
                 else:
                     if days_from_hire_to_year_end < 365:
-                        year_end = datetime(selected_year, 12, 31).date()
-                        if year_end < hire_date_obj:
-                            leave_generated = 0
-                        else:
-                            months_passed = (year_end.year - hire_date_obj.year) * 12 + (year_end.month - hire_date_obj.month)
-                            if year_end.day < hire_date_obj.day:
-                                months_passed -= 1
-                            leave_generated = min(max(months_passed, 0), 11)
+                        leave_generated = calendar.months_accrued(datetime(selected_year, 12, 31).date())
                     else:
-                        leave_generated = self.calculator.calculate_annual_leave(hire_date_obj, datetime(selected_year, 12, 31).date())
+                        leave_generated = calendar.annual_leave(datetime(selected_year, 12, 31).date())
                 
                 # 이전 년도 남은 연차 가져오기
                 remaining_prev_year_item = self.table.item(row, 4)
@@ -3246,14 +1483,6 @@ if PYSIDE6_AVAILABLE:
                 # float 타입으로 명시적 변환
                 remaining = float(remaining) if remaining is not None else 0.0
                 
-                # 디버깅: 잔여수 계산 확인 (_update_summary_for_row)
-                cursor.execute("SELECT name FROM employees WHERE id = ?", (emp_id,))
-                emp_name_result = cursor.fetchone()
-                emp_name = emp_name_result[0] if emp_name_result else "Unknown"
-                if emp_name == "김미라":
-                    print(f"DEBUG {emp_name} (_update_summary_for_row) 잔여수 계산: leave_generated={leave_generated_float}, used_current_year={used_current_year_float}, remaining_prev_year_final={remaining_prev_year_final_float}, remaining={remaining}")
-                    print(f"DEBUG {emp_name} (_update_summary_for_row) 계산식: ({leave_generated_float} - {used_current_year_float}) + {remaining_prev_year_final_float} = {remaining}")
-                
                 conn.close()
                 
                 # 0.0 값은 빈 문자열로 변환하는 헬퍼 함수
@@ -3316,18 +1545,20 @@ if PYSIDE6_AVAILABLE:
                     
             except Exception as e:
                 # 오류 발생 시 전체 새로고침
-                print(f"요약 정보 업데이트 오류: {str(e)}")
+                logger.exception("요약 정보 업데이트 오류")
                 self.refresh_data()
 
 
-    class EmployeeManagementGUI(QWidget):
+    class EmployeeManagementGUI(ChangeListenerMixin, QWidget):
         """재직인원 관리 GUI"""
         
-        def __init__(self, parent, db_manager, leave_gui=None, attendance_gui=None):
+        def __init__(self, parent, db_manager, leave_gui=None, attendance_gui=None, change_bus=None):
             super().__init__(parent)
             self.db = db_manager
             self.leave_gui = leave_gui
             self.attendance_gui = attendance_gui
+            # 탭 간 변경 알림 (직원 정보가 바뀌면 다른 탭은 표시될 때 새로고침)
+            self._init_change_listener(change_bus)
             
             layout = QVBoxLayout(self)
             
@@ -3356,12 +1587,12 @@ if PYSIDE6_AVAILABLE:
                     self.leave_gui.show_inactive_checkbox.blockSignals(True)
                     self.leave_gui.show_inactive_checkbox.setChecked(self.show_inactive_checkbox.isChecked())
                     self.leave_gui.show_inactive_checkbox.blockSignals(False)
-                    self.leave_gui.refresh_data()
+                    self.leave_gui.request_refresh()
                 if self.attendance_gui:
                     self.attendance_gui.show_inactive_checkbox.blockSignals(True)
                     self.attendance_gui.show_inactive_checkbox.setChecked(self.show_inactive_checkbox.isChecked())
                     self.attendance_gui.show_inactive_checkbox.blockSignals(False)
-                    self.attendance_gui.refresh_data()
+                    self.attendance_gui.request_refresh()
                 self.refresh_data()
             self.show_inactive_checkbox.stateChanged.connect(on_checkbox_changed)
             option_layout.addWidget(self.show_inactive_checkbox)
@@ -3389,6 +1620,11 @@ if PYSIDE6_AVAILABLE:
             
             self.refresh_data()
         
+        def on_data_changed(self, event):
+            """다른 탭에서 직원 정보(입사일 등)를 바꾸면 새로고침"""
+            if event.source is not self and event.kind == EMPLOYEE_CHANGED:
+                self._mark_dirty(None)
+        
         def refresh_data(self):
             """데이터 새로고침"""
             self.table.setRowCount(0)
@@ -3600,10 +1836,7 @@ if PYSIDE6_AVAILABLE:
                 QMessageBox.information(self, "성공", "직원이 추가되었습니다.")
                 dialog.accept()
                 self.refresh_data()
-                if self.leave_gui:
-                    self.leave_gui.refresh_data()
-                if self.attendance_gui:
-                    self.attendance_gui.refresh_data()
+                self.change_bus.employees_changed(source=self)
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"직원 추가 중 오류 발생: {str(e)}")
         
@@ -3663,10 +1896,7 @@ if PYSIDE6_AVAILABLE:
                     
                     QMessageBox.information(self, "성공", f"{len(selected_employees)}명의 직원이 삭제되었습니다.")
                     self.refresh_data()
-                    if self.leave_gui:
-                        self.leave_gui.refresh_data()
-                    if self.attendance_gui:
-                        self.attendance_gui.refresh_data()
+                    self.change_bus.employees_changed([emp['emp_id'] for emp in selected_employees], source=self)
                 except Exception as e:
                     QMessageBox.critical(self, "오류", f"직원 삭제 중 오류 발생: {str(e)}")
         
@@ -3746,10 +1976,7 @@ if PYSIDE6_AVAILABLE:
                     
                     QMessageBox.information(self, "성공", f"{len(selected_employees)}명의 직원이 퇴사 처리되었습니다.")
                     self.refresh_data()
-                    if self.leave_gui:
-                        self.leave_gui.refresh_data()
-                    if self.attendance_gui:
-                        self.attendance_gui.refresh_data()
+                    self.change_bus.employees_changed([emp['emp_id'] for emp in selected_employees], source=self)
                 except Exception as e:
                     QMessageBox.critical(self, "오류", f"퇴사 처리 중 오류 발생: {str(e)}")
         
@@ -3804,10 +2031,7 @@ if PYSIDE6_AVAILABLE:
                     
                     QMessageBox.information(self, "성공", f"{len(selected_employees)}명의 직원이 재입사 처리되었습니다.")
                     self.refresh_data()
-                    if self.leave_gui:
-                        self.leave_gui.refresh_data()
-                    if self.attendance_gui:
-                        self.attendance_gui.refresh_data()
+                    self.change_bus.employees_changed([emp['emp_id'] for emp in selected_employees], source=self)
                 except Exception as e:
                     QMessageBox.critical(self, "오류", f"재입사 처리 중 오류 발생: {str(e)}")
         
@@ -3856,12 +2080,9 @@ if PYSIDE6_AVAILABLE:
                 conn.commit()
                 conn.close()
                 
-                # 직급 수정 시에만 다른 탭도 새로고침
+                # 직급 수정 시에만 다른 탭에 알림 (직급 순 정렬이 바뀔 수 있음)
                 if col == 1:
-                    if self.leave_gui:
-                        self.leave_gui.refresh_data()
-                    if self.attendance_gui:
-                        self.attendance_gui.refresh_data()
+                    self.change_bus.employees_changed([emp_id], source=self)
                 
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"데이터 수정 중 오류 발생: {str(e)}")
@@ -3934,33 +2155,135 @@ if PYSIDE6_AVAILABLE:
                 QMessageBox.information(self, "성공", f"{added_count}명의 직원이 추가되었습니다.")
                 dialog.accept()
                 self.refresh_data()
-                if self.leave_gui:
-                    self.leave_gui.refresh_data()
-                if self.attendance_gui:
-                    self.attendance_gui.refresh_data()
+                self.change_bus.employees_changed(source=self)
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"일괄 등록 중 오류 발생: {str(e)}")
 
 
-class DiagonalLineDelegate(QStyledItemDelegate):
-    """사선을 그리는 커스텀 델리게이트"""
+class _BackgroundLoadTask(QRunnable):
+    """BackgroundLoader의 조회 작업 (작업 스레드에서 실행)"""
+    
+    def __init__(self, loader, ticket, key):
+        super().__init__()
+        self.loader = loader
+        self.ticket = ticket
+        self.key = key
+    
+    def run(self):
+        self.loader._run(self.ticket, self.key)
+
+
+class BackgroundLoader(QObject):
+    """DB 조회를 작업 스레드(QThreadPool)에서 실행하고 결과는 GUI 스레드에서 적용
+    
+    - 짧은 시간 안에 들어온 요청은 모았다가 마지막 요청만 실행합니다.
+    - 조회 중에 새 요청이 오면 진행 중인 SQL을 중단(sqlite3 interrupt)하고,
+      끝나는 즉시 마지막 요청만 다시 실행합니다. 이전 요청의 결과는 버립니다.
+    
+    load(conn, key)는 작업 스레드에서 호출되므로 위젯에 접근하면 안 됩니다.
+    apply(key, result)와 on_error(key, error)는 GUI 스레드에서 호출됩니다.
+    """
+    
+    _finished = Signal(int, object, object, object)  # ticket, key, result, error
     
-    def __init__(self, parent=None):
+    def __init__(self, db_manager, load, apply, on_error=None, parent=None, coalesce_ms=80):
         super().__init__(parent)
-        self.target_cells = set()  # 사선을 그릴 셀의 (row, col) 튜플 집합
+        self.db = db_manager
+        self._load = load
+        self._apply = apply
+        self._on_error = on_error
+        self._ticket = 0  # 요청마다 증가 (작업 결과가 최신 요청인지 비교)
+        self._pending_key = None
+        self._has_pending = False
+        self._running = False
+        self._active_conn = None  # 작업 스레드에서 사용 중인 연결 (중단용)
+        self._lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(coalesce_ms)
+        self._timer.timeout.connect(self._start_pending)
+        self._finished.connect(self._on_finished)
+    
+    def request(self, key):
+        """key 조회 요청 (이전 요청은 취소)"""
+        self._ticket += 1
+        self._pending_key = key
+        self._has_pending = True
+        self._interrupt()
+        self._timer.start()
+    
+    def cancel(self):
+        """대기/진행 중인 요청 취소 (결과를 적용하지 않음)"""
+        self._ticket += 1
+        self._has_pending = False
+        self._timer.stop()
+        self._interrupt()
+    
+    def is_busy(self):
+        return self._running or self._has_pending
+    
+    def _interrupt(self):
+        with self._lock:
+            if self._active_conn is not None:
+                self._active_conn.interrupt()
+    
+    def _start_pending(self):
+        # 실행 중이면 끝난 뒤(_on_finished) 마지막 요청을 시작
+        if self._running or not self._has_pending:
+            return
+        key = self._pending_key
+        self._has_pending = False
+        self._pending_key = None
+        self._running = True
+        QThreadPool.globalInstance().start(_BackgroundLoadTask(self, self._ticket, key))
+    
+    def _run(self, ticket, key):
+        """작업 스레드: 최신 요청일 때만 조회"""
+        result = error = None
+        if ticket == self._ticket:
+            conn = self.db.get_connection()
+            with self._lock:
+                self._active_conn = conn
+            try:
+                result = self._load(conn, key)
+            except Exception as e:
+                error = e
+            finally:
+                with self._lock:
+                    self._active_conn = None
+                conn.close()
+        self._finished.emit(ticket, key, result, error)
     
-    def add_target_cell(self, row, col):
-        """사선을 그릴 셀 추가"""
-        self.target_cells.add((row, col))
+    def _on_finished(self, ticket, key, result, error):
+        """GUI 스레드: 최신 결과만 적용하고, 밀린 요청이 있으면 이어서 실행"""
+        self._running = False
+        if self._has_pending:
+            if not self._timer.isActive():
+                self._start_pending()
+            return
+        if ticket != self._ticket:
+            return  # 취소된 요청
+        if error is not None:
+            if self._on_error is not None:
+                self._on_error(key, error)
+            else:
+                logger.error("백그라운드 조회 오류: %s", error)
+            return
+        self._apply(key, result)
+
+
+DIAGONAL_ROLE = Qt.UserRole + 1  # 셀에 사선을 그릴지 여부 (DiagonalLineDelegate)
+
+
+class DiagonalLineDelegate(QStyledItemDelegate):
+    """사선을 그리는 커스텀 델리게이트 (모델의 DIAGONAL_ROLE 값이 참인 셀)"""
     
     def paint(self, painter, option, index):
         # 기본 그리기
         super().paint(painter, option, index)
         
         # 해당 셀이 사선을 그릴 대상인지 확인
-        row = index.row()
-        col = index.column()
-        if (row, col) in self.target_cells:
+        if index.data(DIAGONAL_ROLE):
             # 사선 그리기
             rect = option.rect
             pen = QPen(QColor("#808080"), 1)  # 회색 사선
@@ -3969,12 +2292,14 @@ class DiagonalLineDelegate(QStyledItemDelegate):
             painter.drawLine(rect.topLeft(), rect.bottomRight())
 
 
-class EditableTableWidget(QTableWidget):
-    """복사/붙여넣기 기능이 있는 커스텀 테이블 위젯"""
+class CellClipboardMixin:
+    """표의 복사/붙여넣기/삭제 (Ctrl+C, Ctrl+V, Delete)
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.parent_gui = None  # AttendanceManagementGUI 참조
+    QTableWidget과 같은 셀 API(item, selectedItems, selectedRanges, currentRow/currentColumn,
+    rowCount, itemChanged)를 가진 표에 섞어 씁니다.
+    """
+    
+    parent_gui = None  # 편집을 기록할 부모 GUI
     
     def set_parent_gui(self, parent_gui):
         """부모 GUI 참조 설정"""
@@ -4069,248 +2394,589 @@ class EditableTableWidget(QTableWidget):
             clipboard = QApplication.clipboard()
             clipboard.setText(clipboard_text)
     
-    def paste_to_selected_cells(self):
-        """클립보드의 텍스트를 선택된 셀에 붙여넣기 (엑셀 방식 지원)"""
-        if not self.parent_gui:
-            return
-        
-        clipboard = QApplication.clipboard()
-        clipboard_text = clipboard.text()
-        
-        if not clipboard_text:
-            return
-        
-        # 클립보드 텍스트를 파싱 (엑셀 형식: 탭으로 열 구분, 줄바꿈으로 행 구분)
-        # \r\n, \n, \r 모두 처리
-        lines = clipboard_text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
-        
-        # 각 줄을 파싱하여 2차원 배열로 변환
-        clipboard_data = []
-        for line in lines:
-            # 빈 줄은 건너뛰지만, 탭만 있는 줄(빈 행)은 빈 배열로 추가
-            if '\t' in line:
-                # 탭으로 구분된 값들 (빈 셀은 빈 문자열로 처리)
-                values = line.split('\t')
-                # 각 값의 앞뒤 공백 제거
-                cleaned_values = [v.strip() for v in values]
-                clipboard_data.append(cleaned_values)
-            elif line.strip():
-                # 탭이 없는 단일 값
-                clipboard_data.append([line.strip()])
-            # 완전히 빈 줄은 무시
-        
-        if not clipboard_data:
-            return
-        
-        # 클립보드 데이터 크기
-        clipboard_rows = len(clipboard_data)
-        clipboard_cols = len(clipboard_data[0]) if clipboard_data else 0
-        
-        summary_start = 34
-        
-        # 선택된 범위 또는 셀 가져오기
-        selected_ranges = self.selectedRanges()
+    # 붙여넣기/삭제 가능한 열 범위 (날짜 컬럼: 3번째부터 요약 컬럼 전까지)
+    FIRST_EDIT_COL = 3
+    SUMMARY_START_COL = 34
+    
+    @staticmethod
+    def parse_clipboard_block(clipboard_text):
+        """엑셀 복사 텍스트(TSV)를 2차원 값 목록으로 (탭으로 열, 줄바꿈으로 행 구분)
         
-        if selected_ranges:
-            # 모든 선택된 범위에 대해 붙여넣기 수행
-            for range_obj in selected_ranges:
-                start_row = range_obj.topRow()
-                start_col = range_obj.leftColumn()
-                end_row = range_obj.bottomRow()
-                end_col = range_obj.rightColumn()
-                
-                # 선택된 범위 크기 계산
-                selected_rows = end_row - start_row + 1
-                selected_cols = end_col - start_col + 1
-                
-                # 클립보드 데이터 크기와 선택된 범위 크기가 정확히 같은 경우
-                if clipboard_rows == selected_rows and clipboard_cols == selected_cols:
-                    # 정확히 1:1 매핑하여 붙여넣기
-                    for row_idx in range(clipboard_rows):
-                        for col_idx in range(clipboard_cols):
-                            target_row = start_row + row_idx
-                            target_col = start_col + col_idx
-                            
-                            # 날짜 컬럼만 붙여넣기 가능
-                            if target_col >= 3 and target_col < summary_start:
-                                item = self.item(target_row, target_col)
-                                if item:
-                                    value = clipboard_data[row_idx][col_idx]
-                                    # 빈 값도 처리 (셀 삭제를 위해)
-                                    if value:
-                                        item.setText(value)
-                                    else:
-                                        item.setText("")
-                else:
-                    # 크기가 다른 경우 반복하여 붙여넣기 (엑셀 방식)
-                    for row in range(start_row, end_row + 1):
-                        for col in range(start_col, end_col + 1):
-                            # 날짜 컬럼만 붙여넣기 가능
-                            if col >= 3 and col < summary_start:
-                                item = self.item(row, col)
-                                if item:
-                                    # 클립보드 데이터에서 해당 위치의 값을 가져오기 (반복)
-                                    clipboard_row_idx = (row - start_row) % clipboard_rows
-                                    clipboard_col_idx = (col - start_col) % clipboard_cols
-                                    
-                                    value = clipboard_data[clipboard_row_idx][clipboard_col_idx]
-                                    # 빈 값도 처리 (셀 삭제를 위해)
-                                    if value:
-                                        item.setText(value)
-                                    else:
-                                        item.setText("")
-        else:
-            # 범위가 없으면 선택된 아이템 또는 현재 셀에 붙여넣기
-            selected_items = self.selectedItems()
-            current_row = self.currentRow()
-            current_col = self.currentColumn()
-            
-            # 선택된 셀이 없고 현재 셀이 날짜 컬럼인 경우, 현재 셀부터 붙여넣기
-            if not selected_items and current_row >= 0 and current_col >= 3 and current_col < summary_start:
-                # 현재 셀부터 시작하여 클립보드 데이터를 붙여넣기
-                start_row = current_row
-                start_col = current_col
-                
-                for row_idx, clipboard_row in enumerate(clipboard_data):
-                    target_row = start_row + row_idx
-                    
-                    # 테이블 범위를 벗어나면 중단
-                    if target_row >= self.rowCount():
-                        break
-                    
-                    for col_idx, value in enumerate(clipboard_row):
-                        target_col = start_col + col_idx
-                        
-                        # 날짜 컬럼 범위를 벗어나면 다음 행으로
-                        if target_col >= summary_start:
-                            break
-                        
-                        # 날짜 컬럼만 붙여넣기 가능
-                        if target_col >= 3:
-                            item = self.item(target_row, target_col)
-                            if item:
-                                # 빈 값도 처리 (셀 삭제를 위해)
-                                if value:
-                                    # item.setText()만 호출하면 itemChanged 시그널이 자동으로 발생하여 
-                                    # on_cell_changed가 호출됨 (직접 호출 불필요)
-                                    item.setText(value)
-                                else:
-                                    item.setText("")
-                return
-            
-            # 선택된 아이템이 있는 경우
-            if not selected_items:
-                return
-            
-            # 날짜 컬럼만 붙여넣기 가능
-            valid_items = []
-            for item in selected_items:
-                col = item.column()
-                if col >= 3 and col < summary_start:
-                    valid_items.append(item)
-            
-            if not valid_items:
-                return
-            
-            # 선택된 셀에 순서대로 붙여넣기 (클립보드 데이터 반복)
-            sorted_items = sorted(valid_items, key=lambda x: (x.row(), x.column()))
-            
-            # 클립보드 데이터를 1차원 리스트로 변환
-            flat_values = []
-            for row in clipboard_data:
-                flat_values.extend(row)
-            
-            if not flat_values:
-                return
-            
-            # 선택된 셀에 순서대로 붙여넣기 (반복)
-            for i, item in enumerate(sorted_items):
-                value_idx = i % len(flat_values)
-                value = flat_values[value_idx]
-                # 빈 값도 처리 (셀 삭제를 위해)
-                if value:
-                    # item.setText()만 호출하면 itemChanged 시그널이 자동으로 발생하여 
-                    # on_cell_changed가 호출됨 (직접 호출 불필요)
+        \r\n, \n, \r 모두 처리하고 값의 앞뒤 공백은 제거합니다.
+        완전히 빈 줄은 무시하고, 탭만 있는 줄(빈 행)은 빈 값 행으로 유지합니다.
+        """
+        block = []
+        for line in clipboard_text.replace('\r\n', '\n').replace('\r', '\n').split('\n'):
+            if '\t' in line:
+                block.append([value.strip() for value in line.split('\t')])
+            elif line.strip():
+                block.append([line.strip()])
+        return block
+    
+    def _is_edit_col(self, col):
+        return self.FIRST_EDIT_COL <= col < self.SUMMARY_START_COL
+    
+    def _paste_targets(self, block):
+        """붙여넣을 [(행, 열, 값), ...] (엑셀 방식)
+        
+        - 선택 범위가 있으면 범위마다: 크기가 같으면 1:1, 다르면 블록을 반복하여 범위를 채움
+        - 선택이 없으면 현재 셀부터 블록 크기만큼 (표/날짜 컬럼 범위를 벗어난 부분은 버림)
+        - 범위 없이 선택된 셀만 있으면 셀 순서(행, 열)대로 블록 값을 반복
+        """
+        block_rows = len(block)
+        block_cols = len(block[0])
+        
+        def block_value(row_idx, col_idx):
+            values = block[row_idx]
+            return values[col_idx] if col_idx < len(values) else ""
+        
+        targets = []
+        selected_ranges = self.selectedRanges()
+        if selected_ranges:
+            for range_obj in selected_ranges:
+                top, left = range_obj.topRow(), range_obj.leftColumn()
+                for row in range(top, range_obj.bottomRow() + 1):
+                    for col in range(left, range_obj.rightColumn() + 1):
+                        if self._is_edit_col(col):
+                            targets.append((row, col, block_value((row - top) % block_rows,
+                                                                  (col - left) % block_cols)))
+            return targets
+        
+        selected_items = self.selectedItems()
+        current_row = self.currentRow()
+        current_col = self.currentColumn()
+        if not selected_items:
+            if current_row < 0 or not self._is_edit_col(current_col):
+                return targets
+            for row_idx, values in enumerate(block[:max(self.rowCount() - current_row, 0)]):
+                for col_idx, value in enumerate(values[:self.SUMMARY_START_COL - current_col]):
+                    targets.append((current_row + row_idx, current_col + col_idx, value))
+            return targets
+        
+        flat_values = [value for values in block for value in values]
+        cells = sorted((item.row(), item.column()) for item in selected_items if self._is_edit_col(item.column()))
+        return [(row, col, flat_values[i % len(flat_values)]) for i, (row, col) in enumerate(cells)]
+    
+    def _apply_cell_values(self, targets):
+        """셀 값을 시그널 없이 한 번에 기록하고, 값이 바뀐 셀만 부모 GUI에 한 번의 편집으로 전달
+        
+        셀마다 itemChanged를 처리하지 않으므로 시간 해석/DB 저장은 부모 GUI가 모아서 한 번에 합니다.
+        """
+        changed = {}
+        self.blockSignals(True)
+        try:
+            for row, col, value in targets:
+                item = self.item(row, col)
+                if item is not None and item.text() != value:
                     item.setText(value)
-                else:
-                    item.setText("")
+                    changed[(row, col)] = item
+        finally:
+            self.blockSignals(False)
+        if not changed:
+            return
+        if isinstance(self.parent_gui, CellEditJournalMixin):
+            self.parent_gui.record_cell_edits(list(changed.values()))
+        else:
+            for item in changed.values():
+                self.itemChanged.emit(item)
+    
+    def paste_to_selected_cells(self):
+        """클립보드의 텍스트를 선택된 셀에 붙여넣기 (엑셀 방식 지원)
+        
+        블록을 한 번 해석해 붙여넣을 셀을 모두 계산한 뒤 한 번에 기록합니다.
+        """
+        if not self.parent_gui:
+            return
+        block = self.parse_clipboard_block(QApplication.clipboard().text())
+        if not block:
+            return
+        self._apply_cell_values(self._paste_targets(block))
     
     def delete_selected_cells(self):
-        """선택된 셀들의 내용 삭제"""
+        """선택된 날짜 셀들의 내용 삭제 (한 번의 편집으로 처리 - 데이터베이스에서도 삭제됨)"""
         if not self.parent_gui:
             return
         
-        summary_start = 34  # 3(기본) + 31(날짜) = 34
-        
-        # 선택된 범위 또는 셀 가져오기
         selected_ranges = self.selectedRanges()
-        
         if selected_ranges:
-            # 선택된 범위의 모든 셀 삭제
-            for range_obj in selected_ranges:
-                for row in range(range_obj.topRow(), range_obj.bottomRow() + 1):
-                    for col in range(range_obj.leftColumn(), range_obj.rightColumn() + 1):
-                        # 날짜 컬럼만 삭제 가능
-                        if col >= 3 and col < summary_start:
-                            item = self.item(row, col)
-                            if item:
-                                # 빈 문자열로 설정하면 on_cell_changed가 호출되어 데이터베이스에서도 삭제됨
-                                item.setText("")
+            cells = [(row, col)
+                     for range_obj in selected_ranges
+                     for row in range(range_obj.topRow(), range_obj.bottomRow() + 1)
+                     for col in range(range_obj.leftColumn(), range_obj.rightColumn() + 1)]
         else:
-            # 선택된 아이템이 있으면 삭제
             selected_items = self.selectedItems()
-            if not selected_items:
+            if selected_items:
+                cells = [(item.row(), item.column()) for item in selected_items]
+            else:
                 # 선택된 아이템이 없으면 현재 셀 삭제
-                current_row = self.currentRow()
-                current_col = self.currentColumn()
-                if current_row >= 0 and current_col >= 3 and current_col < summary_start:
-                    item = self.item(current_row, current_col)
-                    if item:
-                        item.setText("")
-                return
-            
-            # 선택된 셀들 삭제
-            for item in selected_items:
-                col = item.column()
-                if col >= 3 and col < summary_start:
-                    # 빈 문자열로 설정하면 on_cell_changed가 호출되어 데이터베이스에서도 삭제됨
-                    item.setText("")
+                cells = [(self.currentRow(), self.currentColumn())] if self.currentRow() >= 0 else []
+        self._apply_cell_values([(row, col, "") for row, col in cells if self._is_edit_col(col)])
+
+
+class EditableTableWidget(CellClipboardMixin, QTableWidget):
+    """복사/붙여넣기 기능이 있는 커스텀 테이블 위젯"""
+
+
+class _MonthEmployee:
+    """월간 표의 직원 한 명 (출근/퇴근 2행) - MonthGrid에서 이 직원의 행 번호"""
+    
+    __slots__ = ('emp', 'number', 'grid', 'index', 'cells')
+    
+    def __init__(self, emp, number, grid):
+        self.emp = emp  # (id, 부서, 직급, 이름, 입사일, 표시 순서, 재직 여부, 퇴사일)
+        self.number = number  # 행 번호 (출근 행 세로 헤더)
+        self.set_grid(grid)
+    
+    def set_grid(self, grid):
+        self.grid = grid
+        self.index = grid.row_of(self.emp[0])
+        self.cells = None  # (출근 행, 퇴근 행) 셀 목록 - 처음 그릴 때 MonthGrid에서 읽음
+
+
+class MonthGridCell:
+    """MonthGridModel의 셀 하나 - 붙여넣기/편집 코드가 쓰는 QTableWidgetItem 호환 API"""
+    
+    __slots__ = ('_model', '_row', '_column')
+    
+    def __init__(self, model, row, column):
+        self._model = model
+        self._row = row
+        self._column = column
+    
+    def row(self):
+        return self._row
+    
+    def column(self):
+        return self._column
+    
+    def text(self):
+        return self._model.cell_text(self._row, self._column)
+    
+    def data(self, role):
+        return self._model.data(self._model.index(self._row, self._column), role)
+    
+    def setText(self, text):
+        self._model.set_cell_text(self._row, self._column, text)
+    
+    def setForeground(self, color):
+        self._model.set_cell_foreground(self._row, self._column, color)
 
 
-class AttendanceManagementGUI(QWidget):
-    """출퇴근 관리 GUI - QTableWidget 사용, 셀별 스타일링 지원"""
+class MonthGridModel(QAbstractTableModel):
+    """출퇴근 관리대장 월간 표 모델 - 셀 텍스트/스타일/사선은 MonthGrid 배열에서 바로 읽음
+    
+    셀마다 QTableWidgetItem을 만들지 않고 화면에 보이는 셀만 data()로 그립니다.
+    행 구성은 부서 구분 행 1행 + 직원별 출근/퇴근 2행이며, 병합/숨김 행은 MonthGridView가,
+    사선은 DiagonalLineDelegate가 DIAGONAL_ROLE로 처리합니다.
+    저장하지 않은 편집 값은 셀별로 따로 보관하여 원래 값 대신 표시합니다 (다시 조회하면 지워짐).
+    """
+    
+    cellEdited = Signal(int, int)  # 셀을 직접 편집함 (행, 열)
+    
+    FIRST_DATE_COL = 3
+    SUMMARY_START_COL = 34
+    
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._rows = []  # 행별 (구분 행 텍스트, 배경 브러시) 또는 (_MonthEmployee, 퇴근 행 여부)
+        self._edits = {}  # (행, 열) -> [편집한 텍스트, 글자색 브러시 또는 None]
+        self._period = None  # (년도, 월, 일수) - 날짜 컬럼 헤더(요일) 표시용
+        self._batched = None  # batch_updates() 중 바뀐 셀 범위 [위, 왼쪽, 아래, 오른쪽]
+        self._cell_styles = None
+        self._separator_font = QFont("Arial", 10, QFont.Bold)
+        self._header_font = QFont()
+        self._header_font.setPointSize(8)  # 날짜\n요일 두 줄이 잘 보이도록 작게
+    
+    # --- 행 구성 ---
+    
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._edits = {}
+        self.endResetModel()
+    
+    def set_period(self, year, month, days_in_month):
+        self._period = (year, month, days_in_month)
+        self.headerDataChanged.emit(Qt.Horizontal, self.FIRST_DATE_COL, self.SUMMARY_START_COL - 1)
     
     @staticmethod
-    def is_third_wednesday_17_00(work_date, departure_time):
-        """
-        매월 셋째주 수요일 17:00 퇴근인지 확인
-        Args:
-            work_date: 날짜 (date 객체)
-            departure_time: 퇴근시간 (time 객체)
-        Returns:
-            bool: 셋째주 수요일이고 17:00 퇴근이면 True
+    def separator_rows(text, background):
+        """부서/월 구분 행 (모든 컬럼에 걸쳐 병합, 선택 불가)"""
+        return [(text, QBrush(QColor(background)))]
+    
+    @staticmethod
+    def employee_rows(emp, number, grid):
+        """직원 한 명의 출근/퇴근 행"""
+        employee = _MonthEmployee(emp, number, grid)
+        return [(employee, False), (employee, True)]
+    
+    def append_rows(self, rows):
+        """행 추가 - 추가한 첫 행 번호"""
+        first = len(self._rows)
+        if rows:
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+        return first
+    
+    def set_employee_grid(self, arrival_row, grid):
+        """출근 행이 arrival_row인 직원의 값을 새로 조회한 MonthGrid로 교체 (편집 중인 값은 버림)"""
+        employee, departure = self._rows[arrival_row]
+        employee.set_grid(grid)
+        for row in (arrival_row, arrival_row + 1):
+            for col in range(len(self._columns)):
+                self._edits.pop((row, col), None)
+        self.dataChanged.emit(self.index(arrival_row, 0), self.index(arrival_row + 1, len(self._columns) - 1))
+    
+    def spans(self, row):
+        """row에서 시작하는 병합 [(열, 행 수, 열 수), ...]
+        
+        직급/이름/요약 컬럼과 병합 대상 날짜(휴가성 텍스트/입사 전/퇴사 후)는 출근/퇴근 행을 병합합니다.
         """
-        # 수요일인지 확인 (weekday() == 2가 수요일)
-        if work_date.weekday() != 2:  # 수요일이 아니면 False
-            return False
+        entry = self._rows[row]
+        if isinstance(entry[0], str):
+            return [(0, 1, len(self._columns))]
+        employee, departure = entry
+        if departure:
+            return []
+        days_in_month = employee.grid.days_in_month
+        merged_days = [d for d in employee.grid.merged[employee.index].nonzero()[0].tolist() if d < days_in_month]
+        cols = [0, 1] + [self.FIRST_DATE_COL + d for d in merged_days] + list(range(self.SUMMARY_START_COL,
+                                                                                       len(self._columns)))
+        return [(col, 2, 1) for col in cols]
+    
+    # --- 셀 값 ---
+    
+    def cell_styles(self, leave_styles=None):
+        """셀 스타일 (배경, 글자색, 가운데 정렬) - 브러시는 한 번만 만들어 모든 셀이 공유
         
-        # 셋째주 수요일인지 확인 (15일~21일 사이)
-        if not (15 <= work_date.day <= 21):
+        leave_styles: 근태 구분 배경 스타일 {코드: 배경색} (MonthGrid.leave_styles, 바뀌면 다시 만듦)
+        """
+        def _style(background=None, foreground=None, centered=True):
+            return (QBrush(QColor(background)) if background else None,
+                    QBrush(QColor(foreground)) if foreground else None,
+                    centered)
+        
+        if self._cell_styles is None:
+            styles = {
+                STYLE_EMPTY: _style("#F0F0F0"),  # 빈 셀 음영
+                STYLE_PLAIN: _style(),
+                STYLE_LEAVE: _style("#F8CBAD"),  # 출근하지 않은 날
+                STYLE_EARLY: _style(foreground="#008000"),  # 08시 이전 출근 - 초록색
+                STYLE_LATE: _style(foreground="#FF0000"),  # 09시 이후 지각 - 빨간색
+                STYLE_NIGHT: _style(foreground="#0000FF"),  # 20시 이후 퇴근 - 파랑색
+            }
+            # 입사일 이전/퇴사일 이후 날짜 (연한 회색 배경)
+            shaded_brush = QBrush(QColor("#E8E8E8"))
+            shaded_styles = {code: (shaded_brush, foreground, centered)
+                             for code, (background, foreground, centered) in styles.items()}
+            self._cell_styles = {
+                'styles': styles,
+                'shaded': shaded_styles,
+                'avg_departure': _style(centered=False),
+                'avg_departure_empty': _style("#F0F0F0", centered=False),
+                'leave_styles': {},
+            }
+        if leave_styles and leave_styles != self._cell_styles['leave_styles']:
+            # 구분마다 등록된 배경색 (글자색/정렬은 기본 구분 배경과 같음)
+            shaded_brush = self._cell_styles['shaded'][STYLE_LEAVE][0]
+            for code, color in leave_styles.items():
+                style = _style(color)
+                self._cell_styles['styles'][code] = style
+                self._cell_styles['shaded'][code] = (shaded_brush, *style[1:])
+            self._cell_styles['leave_styles'] = dict(leave_styles)
+        return self._cell_styles
+    
+    def _employee_cells(self, employee):
+        """직원의 (출근 행, 퇴근 행) 셀 목록 - 셀은 (텍스트, 스타일, 편집 키, 사선) 또는 None(셀 없음)"""
+        emp_id, dept, pos, name = employee.emp[:4]
+        grid, i = employee.grid, employee.index
+        cell_styles = self.cell_styles(grid.leave_styles)
+        styles = cell_styles['styles']
+        shaded_styles = cell_styles['shaded']
+        plain, empty = styles[STYLE_PLAIN], styles[STYLE_EMPTY]
+        
+        def _count_cell(value):
+            # 0이면 빈 셀로 표시
+            return (str(value), plain, None, False) if value else ("", empty, None, False)
+        
+        # 직급, 이름, 구분 (퇴근 행의 직급/이름은 병합되어 보이지 않는 빈칸)
+        arrival = [(pos, plain, None, False), (name, plain, None, False), ("출근", plain, None, False)]
+        departure = [("", plain, None, False), ("", plain, None, False), ("퇴근", plain, None, False)]
+        
+        # 날짜별 데이터 (말일 이후 날짜는 셀 없음)
+        arrival_text = grid.arrival_text[i].tolist()
+        departure_text = grid.departure_text[i].tolist()
+        arrival_style = grid.arrival_style[i].tolist()
+        departure_style = grid.departure_style[i].tolist()
+        merged = grid.merged[i].tolist()
+        shaded = grid.shaded[i].tolist()
+        diagonal = grid.diagonal[i].tolist()
+        for d in range(self.SUMMARY_START_COL - self.FIRST_DATE_COL):
+            if d >= grid.days_in_month:
+                arrival.append(None)
+                departure.append(None)
+                continue
+            day = d + 1
+            arrival.append((arrival_text[d], (shaded_styles if shaded[d] else styles)[arrival_style[d]],
+                            {'emp_id': emp_id, 'day': day, 'category': '출근'}, diagonal[d]))
+            # 병합 대상 텍스트/입사 전/퇴사 후: 출근행과 퇴근행 병합 (퇴근행 셀 없음)
+            departure.append(None if merged[d] else
+                             (departure_text[d], styles[departure_style[d]],
+                              {'emp_id': emp_id, 'day': day, 'category': '퇴근'}, False))
+        
+        # 요약 컬럼 (출근 행: 조기출근/지각/야근/연차사용/평균 출근시간/평균 퇴근시간)
+        late_dep_count = int(grid.late_departure_count[i])
+        avg_arrival = grid.avg_arrival[i]
+        avg_departure = grid.avg_departure[i]
+        arrival += [
+            _count_cell(int(grid.early_count[i])),
+            _count_cell(int(grid.late_arrival_count[i])),
+            # 야근/평균 퇴근시간은 퇴근 행의 값을 출근 행에도 표시하고 병합
+            _count_cell(late_dep_count),
+            _count_cell(float(grid.leave_amount[i])),
+            (avg_arrival, plain, None, False) if avg_arrival else ("", empty, None, False),
+            (avg_departure, cell_styles['avg_departure'], None, False) if avg_departure
+            else ("", cell_styles['avg_departure_empty'], None, False),
+        ]
+        # 퇴근 행 요약 컬럼 (해당 없는 컬럼은 음영 처리)
+        blank = ("", empty, None, False)
+        departure += [blank, blank, _count_cell(late_dep_count), blank, blank,
+                      (avg_departure, plain, None, False) if avg_departure else blank]
+        return arrival, departure
+    
+    def _cell(self, row, col):
+        """(텍스트, 스타일, 편집 키, 사선) 또는 None - 구분 행은 0번 컬럼만 셀이 있음"""
+        if not (0 <= row < len(self._rows) and 0 <= col < len(self._columns)):
+            return None
+        entry = self._rows[row]
+        if isinstance(entry[0], str):
+            return (entry[0], (entry[1], None, False), None, False) if col == 0 else None
+        employee, departure = entry
+        if employee.cells is None:
+            employee.cells = self._employee_cells(employee)
+        return employee.cells[departure][col]
+    
+    def has_cell(self, row, col):
+        return self._cell(row, col) is not None
+    
+    def cell_text(self, row, col):
+        edit = self._edits.get((row, col))
+        if edit is not None:
+            return edit[0]
+        cell = self._cell(row, col)
+        return cell[0] if cell is not None else ""
+    
+    @contextmanager
+    def batch_updates(self):
+        """블록 안에서 바뀐 셀은 끝날 때 한 번에 다시 그림 (붙여넣기/삭제 - 셀마다 dataChanged를 보내지 않음)"""
+        if self._batched is not None:
+            yield
+            return
+        self._batched = []
+        try:
+            yield
+        finally:
+            changed, self._batched = self._batched, None
+            if changed:
+                self.dataChanged.emit(self.index(changed[0], changed[1]), self.index(changed[2], changed[3]))
+    
+    def _cell_changed(self, row, col, roles):
+        changed = self._batched
+        if changed is None:
+            index = self.index(row, col)
+            self.dataChanged.emit(index, index, roles)
+        elif changed:
+            changed[:] = [min(changed[0], row), min(changed[1], col), max(changed[2], row), max(changed[3], col)]
+        else:
+            changed[:] = [row, col, row, col]
+    
+    def set_cell_text(self, row, col, text):
+        """셀 값 변경 (편집 알림 없음 - 붙여넣기/삭제는 호출한 쪽에서 한 번에 기록)"""
+        edit = self._edits.setdefault((row, col), [text, None])
+        edit[0] = text
+        self._cell_changed(row, col, [Qt.DisplayRole, Qt.EditRole])
+    
+    def set_cell_foreground(self, row, col, color):
+        edit = self._edits.setdefault((row, col), [self.cell_text(row, col), None])
+        edit[1] = QBrush(color)
+        self._cell_changed(row, col, [Qt.ForegroundRole])
+    
+    # --- QAbstractTableModel ---
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        row, col = index.row(), index.column()
+        cell = self._cell(row, col)
+        if cell is None:
+            return None
+        text, (background, foreground, centered), key, diagonal = cell
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            edit = self._edits.get((row, col))
+            return edit[0] if edit is not None else text
+        if role == Qt.BackgroundRole:
+            return background
+        if role == Qt.ForegroundRole:
+            edit = self._edits.get((row, col))
+            return edit[1] if edit is not None and edit[1] is not None else foreground
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter if centered else None
+        if role == Qt.UserRole:
+            return key
+        if role == DIAGONAL_ROLE:
+            return diagonal
+        if role == Qt.FontRole and isinstance(self._rows[row][0], str):
+            return self._separator_font
+        return None
+    
+    def flags(self, index):
+        row, col = index.row(), index.column()
+        if 0 <= row < len(self._rows) and isinstance(self._rows[row][0], str):
+            return Qt.NoItemFlags  # 구분 행은 선택 불가
+        cell = self._cell(row, col)
+        if cell is not None and cell[2] is not None:
+            return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable  # 날짜 셀만 직접 편집
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        """편집기에서 입력한 값 - 값이 바뀌었으면 cellEdited로 알림"""
+        row, col = index.row(), index.column()
+        if role != Qt.EditRole or not self.has_cell(row, col):
             return False
-        
-        # 퇴근시간이 17:00인지 확인
-        if departure_time and departure_time.hour == 17 and departure_time.minute == 0:
-            return True
-        
-        return False
+        text = "" if value is None else str(value)
+        if text != self.cell_text(row, col):
+            self.set_cell_text(row, col, text)
+            self.cellEdited.emit(row, col)
+        return True
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Vertical:
+            # 출근 행에만 직원 번호 표시 (구분 행/퇴근 행은 공란)
+            entry = self._rows[section] if 0 <= section < len(self._rows) else None
+            numbered = entry is not None and not isinstance(entry[0], str) and not entry[1]
+            if role == Qt.DisplayRole:
+                return str(entry[0].number) if numbered else ""
+            if role == Qt.TextAlignmentRole and numbered:
+                return Qt.AlignCenter | Qt.AlignVCenter
+            return None
+        
+        day = section - self.FIRST_DATE_COL + 1
+        if self._period is None or not 1 <= day <= self._period[2]:
+            return self._columns[section] if role == Qt.DisplayRole and 0 <= section < len(self._columns) else None
+        # 날짜 컬럼: 날짜\n요일, 토요일 파란색/일요일 빨간색
+        weekday = datetime(self._period[0], self._period[1], day).weekday()  # 0=월요일, 6=일요일
+        if role == Qt.DisplayRole:
+            return f"{day}\n{'월화수목금토일'[weekday]}"
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.FontRole:
+            return self._header_font
+        if role == Qt.ForegroundRole and weekday >= 5:
+            return QColor("#0000FF" if weekday == 5 else "#FF0000")
+        return None
+
+
+class MonthGridView(CellClipboardMixin, QTableView):
+    """출퇴근 관리대장 월간 표 (MonthGridModel 표시, 병합/사선/복사/붙여넣기)
+    
+    붙여넣기/삭제/더블클릭 편집 코드가 그대로 쓸 수 있도록 QTableWidget과 같은 셀 API
+    (item, selectedItems, selectedRanges, setRangeSelected, itemChanged, cellDoubleClicked)를 MonthGridCell로 제공합니다.
+    """
+    
+    itemChanged = Signal(object)  # 직접 편집한 셀 (MonthGridCell)
+    cellDoubleClicked = Signal(int, int)
+    
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(DiagonalLineDelegate(self))
+        model.cellEdited.connect(self._on_cell_edited)
+        self.doubleClicked.connect(self._on_double_clicked)
+    
+    def _on_cell_edited(self, row, col):
+        self.itemChanged.emit(MonthGridCell(self.model(), row, col))
+    
+    def _on_double_clicked(self, index):
+        self.cellDoubleClicked.emit(index.row(), index.column())
     
-    def __init__(self, parent, db_manager, attendance_calculator, leave_gui=None, employee_gui=None):
+    def _apply_cell_values(self, targets):
+        # 붙여넣기/삭제로 바뀐 셀(기록 후 글자색 포함)은 한 번에 다시 그림
+        with self.model().batch_updates():
+            super()._apply_cell_values(targets)
+    
+    def apply_spans(self, rows):
+        """숨기지 않은 행의 병합을 모델 기준으로 설정"""
+        model = self.model()
+        for row in rows:
+            if self.isRowHidden(row):
+                continue
+            for col, row_span, column_span in model.spans(row):
+                self.setSpan(row, col, row_span, column_span)
+    
+    def refresh_date_spans(self, arrival_row):
+        """직원 행의 날짜 셀 병합을 다시 설정 (기록이 바뀌어 병합 대상 날짜가 달라졌을 때)"""
+        for col in range(MonthGridModel.FIRST_DATE_COL, MonthGridModel.SUMMARY_START_COL):
+            if self.rowSpan(arrival_row, col) > 1:
+                self.setSpan(arrival_row, col, 1, 1)
+        self.apply_spans([arrival_row])
+    
+    # --- QTableWidget 호환 셀 API ---
+    
+    def rowCount(self):
+        return self.model().rowCount()
+    
+    def columnCount(self):
+        return self.model().columnCount()
+    
+    def currentRow(self):
+        return self.currentIndex().row()
+    
+    def currentColumn(self):
+        return self.currentIndex().column()
+    
+    def item(self, row, col):
+        model = self.model()
+        return MonthGridCell(model, row, col) if model.has_cell(row, col) else None
+    
+    def selectedItems(self):
+        model = self.model()
+        return [MonthGridCell(model, index.row(), index.column())
+                for index in self.selectionModel().selectedIndexes()
+                if not self.isIndexHidden(index) and model.has_cell(index.row(), index.column())]
+    
+    def selectedRanges(self):
+        return [QTableWidgetSelectionRange(selection.top(), selection.left(), selection.bottom(), selection.right())
+                for selection in self.selectionModel().selection()]
+    
+    def setRangeSelected(self, selection_range, select):
+        model = self.model()
+        selection = QItemSelection(model.index(selection_range.topRow(), selection_range.leftColumn()),
+                                   model.index(selection_range.bottomRow(), selection_range.rightColumn()))
+        self.selectionModel().select(selection, QItemSelectionModel.Select if select else QItemSelectionModel.Deselect)
+
+
+class AttendanceManagementGUI(ChangeListenerMixin, CellEditJournalMixin, QWidget):
+    """출퇴근 관리 GUI - MonthGridModel/MonthGridView 사용, 셀별 스타일링 지원"""
+    
+    def __init__(self, parent, db_manager, attendance_calculator, leave_gui=None, employee_gui=None, change_bus=None):
         super().__init__(parent)
         self.db = db_manager
         self.calculator = attendance_calculator
         self.leave_gui = leave_gui  # 연월차 관리대장 참조
         self.employee_gui = employee_gui  # 재직인원 탭 참조
         self._is_refreshing = False  # 데이터 새로고침 중 플래그
+        # 탭 간 변경 알림 (다른 탭에서 저장하면 관련 직원 행만 갱신)
+        self._init_change_listener(change_bus)
+        # 붙여넣기/삭제로 바뀐 셀은 모아서 한 번에 변경 사항에 반영
+        self._init_cell_edit_journal()
+        self._month_rows = {}  # 직원 ID -> (출근 행 번호, 직원 정보, 숨김 여부)
+        self._month_rows_period = None
         
         layout = QVBoxLayout(self)
         
@@ -4339,6 +3005,10 @@ class AttendanceManagementGUI(QWidget):
         # 편집된 데이터를 임시 저장할 딕셔너리
         self.pending_changes = {}
         
+        # 년/월 변경 시 조회는 작업 스레드에서 실행 (연속 변경은 마지막 선택만 계산)
+        self._month_loader = BackgroundLoader(self.db, self._load_month_in_background, self._apply_loaded_month,
+                                              self._on_month_load_error, parent=self)
+        
         month_layout = QHBoxLayout()
         month_layout.addWidget(QLabel("조회 기간:"))
         
@@ -4351,7 +3021,7 @@ class AttendanceManagementGUI(QWidget):
             self.year_combo.addItem(str(year), year)
         self.year_combo.setCurrentText(str(current_year))
         self.year_combo.setMaxVisibleItems(20)  # 드롭다운 열었을 때 모든 년도가 보이도록 설정
-        self.year_combo.currentIndexChanged.connect(self.refresh_data)  # 년도 변경 시 자동 새로고침
+        self.year_combo.currentIndexChanged.connect(self.request_refresh)  # 년도 변경 시 자동 새로고침 (백그라운드)
         month_layout.addWidget(QLabel("년"))
         month_layout.addWidget(self.year_combo)
         
@@ -4363,7 +3033,7 @@ class AttendanceManagementGUI(QWidget):
         self.month_combo.setCurrentIndex(current_month - 1)  # 현재 월로 설정 (인덱스는 0부터 시작)
         self.month_combo.setMinimumWidth(80)  # 드롭다운 너비 조정
         self.month_combo.setMaxVisibleItems(12)  # 드롭다운 열었을 때 1월부터 12월까지 모두 보이게
-        self.month_combo.currentIndexChanged.connect(self.refresh_data)  # 월 변경 시 자동 새로고침
+        self.month_combo.currentIndexChanged.connect(self.request_refresh)  # 월 변경 시 자동 새로고침 (백그라운드)
         month_layout.addWidget(self.month_combo)
         month_layout.addStretch()
         layout.addLayout(month_layout)
@@ -4376,12 +3046,11 @@ class AttendanceManagementGUI(QWidget):
             self.show_inactive_checkbox.setChecked(self.employee_gui.show_inactive_checkbox.isChecked())
             # 재직인원 탭의 체크박스 상태 변경 시 이 탭의 체크박스도 업데이트 (비동기로 처리)
             def sync_from_employee():
-                from PySide6.QtCore import QTimer
                 self.show_inactive_checkbox.blockSignals(True)
                 self.show_inactive_checkbox.setChecked(self.employee_gui.show_inactive_checkbox.isChecked())
                 self.show_inactive_checkbox.blockSignals(False)
-                # 비동기로 새로고침하여 데이터베이스 충돌 방지
-                QTimer.singleShot(50, lambda: self.refresh_data())
+                # 백그라운드로 새로고침 (다른 탭에서 연달아 요청해도 마지막 한 번만 계산)
+                self.request_refresh()
             self.employee_gui.show_inactive_checkbox.stateChanged.connect(sync_from_employee)
             # 이 탭의 체크박스 상태 변경 시 재직인원 탭의 체크박스도 업데이트 (비동기로 처리)
             def sync_to_employee():
@@ -4397,19 +3066,19 @@ class AttendanceManagementGUI(QWidget):
                     self.employee_gui.leave_gui.show_inactive_checkbox.blockSignals(True)
                     self.employee_gui.leave_gui.show_inactive_checkbox.setChecked(self.show_inactive_checkbox.isChecked())
                     self.employee_gui.leave_gui.show_inactive_checkbox.blockSignals(False)
-                    QTimer.singleShot(100, lambda: self.employee_gui.leave_gui.refresh_data() if self.employee_gui and self.employee_gui.leave_gui else None)
+                    self.employee_gui.leave_gui.request_refresh()
                 if self.employee_gui.attendance_gui and self.employee_gui.attendance_gui != self:
                     self.employee_gui.attendance_gui.show_inactive_checkbox.blockSignals(True)
                     self.employee_gui.attendance_gui.show_inactive_checkbox.setChecked(self.show_inactive_checkbox.isChecked())
                     self.employee_gui.attendance_gui.show_inactive_checkbox.blockSignals(False)
-                    QTimer.singleShot(150, lambda: self.employee_gui.attendance_gui.refresh_data() if self.employee_gui and self.employee_gui.attendance_gui else None)
-                # 이 탭도 비동기로 새로고침
-                QTimer.singleShot(0, lambda: self.refresh_data())
+                    self.employee_gui.attendance_gui.request_refresh()
+                # 이 탭도 백그라운드로 새로고침
+                self.request_refresh()
             self.show_inactive_checkbox.stateChanged.connect(sync_to_employee)
         else:
             # 재직인원 탭이 없으면 독립적으로 동작
             self.show_inactive_checkbox.setChecked(False)
-            self.show_inactive_checkbox.stateChanged.connect(self.refresh_data)
+            self.show_inactive_checkbox.stateChanged.connect(self.request_refresh)
         option_layout.addWidget(self.show_inactive_checkbox)
         option_layout.addStretch()
         layout.addLayout(option_layout)
@@ -4419,517 +3088,159 @@ class AttendanceManagementGUI(QWidget):
         date_columns = [str(i) for i in range(1, 32)]
         summary_columns = ["조기출근\n(8시이전)", "지각\n(9시이후)", "야근\n(20시이후)", "연차사용", "평균 출근시간", "평균 퇴근시간"]
         columns = ["직급", "이름", "구분"] + date_columns + summary_columns
-        
-        self.table = EditableTableWidget()
-        self.table.set_parent_gui(self)  # 부모 GUI 참조 설정
-        self.table.setColumnCount(len(columns))
-        # 헤더는 refresh_data에서 요일 정보와 함께 설정
-        self.table.setHorizontalHeaderLabels(columns)
-        self.table.horizontalHeader().setStretchLastSection(True)
-        # 헤더 높이 조정 (요일 정보 표시를 위해)
-        self.table.horizontalHeader().setMinimumHeight(50)
-        self.table.setSelectionBehavior(QAbstractItemView.SelectItems)  # 셀 단위 선택
-        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)  # CTRL/SHIFT로 다중 선택
-        # 날짜 컬럼(3번째부터)은 직접 편집 가능, 나머지는 편집 불가
-        # DoubleClicked만 사용하여 여러 셀 선택 가능하도록 함
-        self.table.setEditTriggers(QAbstractItemView.DoubleClicked)
-        
-        # 셀 편집 완료 시 이벤트 연결
-        self.table.itemChanged.connect(self.on_cell_changed)
-        
-        # 컬럼 너비 설정
-        # 직급, 이름, 구분 컬럼
-        self.table.setColumnWidth(0, 60)  # 직급
-        self.table.setColumnWidth(1, 70)  # 이름
-        self.table.setColumnWidth(2, 60)  # 구분
-        
-        # 날짜 컬럼 (1-31일) - 시간 형식에 맞게
-        for i in range(3, 34):  # 3번부터 33번까지 (1일~31일)
-            self.table.setColumnWidth(i, 45)  # HH:MM 형식에 맞는 너비 (3글자 텍스트 입력 가능)
-        
-        # 요약 컬럼들
-        summary_start = 34  # 3(기본) + 31(날짜) = 34
-        self.table.setColumnWidth(summary_start, 100)      # 조기출근(8시이전)
-        self.table.setColumnWidth(summary_start + 1, 100)  # 지각(9시이후)
-        self.table.setColumnWidth(summary_start + 2, 100)  # 야근(20시이후)
-        self.table.setColumnWidth(summary_start + 3, 80)   # 연차사용
-        self.table.setColumnWidth(summary_start + 4, 110)  # 평균 출근시간
-        self.table.setColumnWidth(summary_start + 5, 110)  # 평균 퇴근시간
-        
-        # 더블클릭 이벤트
-        self.table.cellDoubleClicked.connect(self.on_cell_double_clicked)
-        
-        # 테이블에 포커스 설정 (키보드 이벤트 처리를 위해)
-        self.table.setFocusPolicy(Qt.StrongFocus)
-        
-        # verticalHeader의 행 높이를 조정하여 출근/퇴근 행 병합 효과
-        # 출근 행과 퇴근 행이 하나의 번호를 공유하도록 설정
-        self.table.verticalHeader().setDefaultSectionSize(25)  # 기본 행 높이 설정
-        
-        layout.addWidget(self.table)
-        
-        self.refresh_data()
-    
-    def save_changes(self):
-        """저장 버튼 또는 Ctrl+S로 변경 사항 저장"""
-        if not self.pending_changes:
-            QMessageBox.information(self, "알림", "저장할 변경 사항이 없습니다.")
-            return
-        
-        try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            saved_count = 0
-            for change_key, change_data in self.pending_changes.items():
-                emp_id, work_date, category = change_key
-                new_value = change_data['new_value']
-                formatted_time = change_data['formatted_time']
-                is_time = change_data['is_time']
-                is_delete = change_data.get('is_delete', False)
-                
-                # 삭제 처리 - 출근행/퇴근행 각각 처리
-                if is_delete:
-                    try:
-                        # 기존 기록 확인
-                        cursor.execute("""
-                            SELECT arrival_time, departure_time, leave_type, remarks
-                            FROM attendance_records
-                            WHERE employee_id = ? AND work_date = ?
-                        """, (emp_id, work_date))
-                        existing = cursor.fetchone()
-                        
-                        if existing:
-                            arrival_time_str = existing[0]
-                            departure_time_str = existing[1]
-                            leave_type = existing[2]
-                            remarks = existing[3]
-                            
-                            # 문자열 시간을 time 객체로 변환하는 헬퍼 함수
-                            def parse_time_safe(time_str):
-                                if not time_str:
-                                    return None
-                                if isinstance(time_str, str):
-                                    try:
-                                        # HH:MM:SS 형식
-                                        if len(time_str) >= 8:
-                                            return datetime.strptime(time_str, "%H:%M:%S").time()
-                                        # HH:MM 형식
-                                        elif len(time_str) >= 5:
-                                            return datetime.strptime(time_str, "%H:%M").time()
-                                    except:
-                                        pass
-                                return time_str  # 이미 time 객체이거나 변환 실패 시 그대로 반환
-                            
-                            arrival_time = parse_time_safe(arrival_time_str)
-                            departure_time = parse_time_safe(departure_time_str)
-                            
-                            # category에 따라 해당 시간만 삭제
-                            if category == '출근':
-                                # 출근행만 삭제: arrival_time을 None으로, departure_time은 유지
-                                arrival_time = None
-                                
-                                # leave_type이 반차/연차/휴가인 경우 leave_records에서도 삭제하고 leave_type도 None으로 설정
-                                # remarks가 "{type}_출근"이거나 remarks가 없는 경우(직접 입력한 연차 등)
-                                if leave_type in ['반차', '연차', '휴가']:
-                                    if not remarks or remarks == f'{leave_type}_출근':
-                                        year = self.year_combo.currentData() or datetime.now().year
-                                        month = self.month_combo.currentData() or datetime.now().month
-                                        cursor.execute("""
-                                            DELETE FROM leave_records
-                                            WHERE employee_id = ? AND leave_date = ? AND leave_type = ?
-                                        """, (emp_id, work_date, leave_type))
-                                        # leave_type도 None으로 설정 (출근행 삭제 시)
-                                        leave_type = None
-                                        remarks = None
-                                
-                                # departure_time이 없고 leave_type도 없으면 전체 삭제
-                                if not departure_time and not leave_type:
-                                    cursor.execute("""
-                                        DELETE FROM attendance_records
-                                        WHERE employee_id = ? AND work_date = ?
-                                    """, (emp_id, work_date))
-                                    # leave_records에서도 삭제
-                                    year = self.year_combo.currentData() or datetime.now().year
-                                    month = self.month_combo.currentData() or datetime.now().month
-                                    cursor.execute("""
-                                        DELETE FROM leave_records
-                                        WHERE employee_id = ? AND leave_date = ?
-                                    """, (emp_id, work_date))
-                                else:
-                                    # arrival_time만 None으로 업데이트 (leave_type도 함께 업데이트)
-                                    self.calculator.process_attendance_record(
-                                        emp_id, work_date, arrival_time, departure_time,
-                                        leave_type, remarks, conn
-                                    )
-                            elif category == '퇴근':
-                                # 퇴근행만 삭제: departure_time을 None으로, arrival_time은 유지
-                                departure_time = None
-                                
-                                # leave_type이 반차/연차/휴가인 경우 leave_records에서도 삭제
-                                # remarks가 "{type}_퇴근"이거나 remarks가 없는 경우(직접 입력한 연차 등)
-                                # 단, 퇴근행만 삭제하는 경우는 leave_type을 유지 (출근행에 반차가 있을 수 있음)
-                                if leave_type in ['반차', '연차', '휴가']:
-                                    if remarks == f'{leave_type}_퇴근':
-                                        # remarks가 "{type}_퇴근"인 경우만 leave_records에서 삭제하고 leave_type도 None으로 설정
-                                        year = self.year_combo.currentData() or datetime.now().year
-                                        month = self.month_combo.currentData() or datetime.now().month
-                                        cursor.execute("""
-                                            DELETE FROM leave_records
-                                            WHERE employee_id = ? AND leave_date = ? AND leave_type = ?
-                                        """, (emp_id, work_date, leave_type))
-                                        # leave_type도 None으로 설정 (퇴근행만 삭제하는 경우)
-                                        leave_type = None
-                                        remarks = None
-                                
-                                # arrival_time이 없고 leave_type도 없으면 전체 삭제
-                                if not arrival_time and not leave_type:
-                                    cursor.execute("""
-                                        DELETE FROM attendance_records
-                                        WHERE employee_id = ? AND work_date = ?
-                                    """, (emp_id, work_date))
-                                    # leave_records에서도 삭제
-                                    year = self.year_combo.currentData() or datetime.now().year
-                                    month = self.month_combo.currentData() or datetime.now().month
-                                    cursor.execute("""
-                                        DELETE FROM leave_records
-                                        WHERE employee_id = ? AND leave_date = ?
-                                    """, (emp_id, work_date))
-                                else:
-                                    # departure_time만 None으로 업데이트 (leave_type도 함께 업데이트)
-                                    self.calculator.process_attendance_record(
-                                        emp_id, work_date, arrival_time, departure_time,
-                                        leave_type, remarks, conn
-                                    )
-                            else:
-                                # category가 없으면 전체 삭제
-                                cursor.execute("""
-                                    DELETE FROM attendance_records
-                                    WHERE employee_id = ? AND work_date = ?
-                                """, (emp_id, work_date))
-                                # leave_records에서도 삭제
-                                year = self.year_combo.currentData() or datetime.now().year
-                                month = self.month_combo.currentData() or datetime.now().month
-                                cursor.execute("""
-                                    DELETE FROM leave_records
-                                    WHERE employee_id = ? AND leave_date = ?
-                                """, (emp_id, work_date))
-                        else:
-                            # 기존 기록이 없으면 삭제할 것도 없음
-                            pass
-                        
-                        saved_count += 1
-                        continue
-                    except Exception as e:
-                        raise Exception(f"데이터 삭제 중 오류: {str(e)}")
-                
-                # 기존 기록 확인
-                cursor.execute("""
-                    SELECT arrival_time, departure_time, leave_type, remarks
-                    FROM attendance_records
-                    WHERE employee_id = ? AND work_date = ?
-                """, (emp_id, work_date))
-                existing = cursor.fetchone()
-                
-                # pending_changes에서 같은 날짜의 다른 카테고리 변경사항 확인
-                # 예: 출근 행에 "반차" 입력 시, pending_changes에 퇴근 시간이 있는지 확인
-                pending_arrival_time = None
-                pending_departure_time = None
-                pending_leave_type = None
-                pending_remarks = None
-                for other_key, other_data in self.pending_changes.items():
-                    other_emp_id, other_work_date, other_category = other_key
-                    if other_emp_id == emp_id and other_work_date == work_date and other_category != category:
-                        # 같은 직원, 같은 날짜, 다른 카테고리
-                        if other_data.get('is_time') and not other_data.get('is_delete', False):
-                            try:
-                                other_formatted_time = other_data.get('formatted_time', '')
-                                if ':' in other_formatted_time:
-                                    other_time_obj = datetime.strptime(other_formatted_time, "%H:%M").time()
-                                    if other_category == '출근':
-                                        pending_arrival_time = other_time_obj
-                                    elif other_category == '퇴근':
-                                        pending_departure_time = other_time_obj
-                            except:
-                                pass
-                        elif not other_data.get('is_time') and not other_data.get('is_delete', False):
-                            # 텍스트 입력 (반차, 연차 등)
-                            other_new_value = other_data.get('new_value', '').strip()
-                            # "연차", "경조사", "예비군", "설날", "추석", "박람회", "출장"을 제외한 나머지는 독립적으로 처리
-                            merge_texts = ['연차', '경조사', '예비군', '설날', '추석', '박람회', '출장']
-                            if other_category == '출근' and other_new_value not in merge_texts:
-                                pending_leave_type = other_new_value
-                                pending_remarks = f"{other_new_value}_출근"
-                            elif other_category == '퇴근' and other_new_value not in merge_texts:
-                                pending_leave_type = other_new_value
-                                pending_remarks = f"{other_new_value}_퇴근"
-                
-                if is_time:
-                    # 시간 형식인 경우
-                    try:
-                        time_obj = datetime.strptime(formatted_time, "%H:%M").time()
-                    except:
-                        is_time = False
-                
-                if is_time:
-                    # 시간 형식인 경우
-                    if category == '출근':
-                        arrival_time = time_obj
-                        # pending_changes에서 퇴근 시간 확인 (같은 날짜의 퇴근 행 변경사항)
-                        departure_time = pending_departure_time
-                        # pending_changes에 없으면 기존 데이터베이스에서 조회
-                        if departure_time is None and existing and existing[1]:
-                            try:
-                                departure_time = datetime.strptime(existing[1], "%H:%M:%S").time()
-                            except:
-                                pass
-                        
-                        # 출근 행에 시간을 입력할 때는 퇴근 행의 기존 leave_type과 remarks를 보존
-                        # 기존 데이터에서 퇴근 행의 정보 확인
-                        leave_type_to_use = None
-                        remarks_to_use = None
-                        if existing and existing[2] and existing[3]:
-                            # 기존 데이터베이스에서 leave_type과 remarks 확인
-                            existing_leave_type = existing[2]
-                            existing_remarks = existing[3]
-                            # remarks가 "{text}_퇴근"인 경우만 유지 (퇴근 행에 텍스트가 있는 경우)
-                            merge_texts = ['연차', '경조사', '예비군', '설날', '추석', '박람회', '출장']
-                            if existing_leave_type not in merge_texts and existing_remarks == f'{existing_leave_type}_퇴근':
-                                leave_type_to_use = existing_leave_type
-                                remarks_to_use = existing_remarks
-                            # remarks가 "{text}_출근"인 경우는 무시 (출근 행에만 텍스트가 있는 경우)
-                            # 병합 처리 텍스트(연차, 경조사, 예비군 등)는 remarks가 없으면 출퇴근 모두 병합이므로 유지
-                            elif existing_leave_type in merge_texts and not existing_remarks:
-                                leave_type_to_use = existing_leave_type
-                                remarks_to_use = ""
-                        elif existing and existing[2]:
-                            # remarks가 없는 경우도 확인
-                            existing_leave_type = existing[2]
-                            merge_texts = ['연차', '경조사', '예비군', '설날', '추석', '박람회', '출장']
-                            # remarks가 없고 leave_type이 병합 처리 텍스트인 경우는 유지
-                            if existing_leave_type in merge_texts:
-                                leave_type_to_use = existing_leave_type
-                                remarks_to_use = ""
-                    else:  # 퇴근
-                        # pending_changes에서 출근 시간 확인 (같은 날짜의 출근 행 변경사항)
-                        arrival_time = pending_arrival_time
-                        departure_time = time_obj
-                        # pending_changes에 없으면 기존 데이터베이스에서 조회
-                        if arrival_time is None and existing and existing[0]:
-                            try:
-                                arrival_time = datetime.strptime(existing[0], "%H:%M:%S").time()
-                            except:
-                                pass
-                        
-                        # 퇴근 행에 시간을 입력할 때는 출근 행의 기존 leave_type과 remarks를 보존
-                        # 기존 데이터에서 출근 행의 정보 확인
-                        leave_type_to_use = None
-                        remarks_to_use = None
-                        if existing and existing[2] and existing[3]:
-                            # 기존 데이터베이스에서 leave_type과 remarks 확인
-                            existing_leave_type = existing[2]
-                            existing_remarks = existing[3]
-                            merge_texts = ['연차', '경조사', '예비군', '설날', '추석', '박람회', '출장']
-                            # remarks가 "{text}_출근"인 경우만 유지 (출근 행에 텍스트가 있는 경우)
-                            if existing_leave_type not in merge_texts and existing_remarks == f'{existing_leave_type}_출근':
-                                leave_type_to_use = existing_leave_type
-                                remarks_to_use = existing_remarks
-                            # remarks가 "{text}_퇴근"인 경우는 무시 (퇴근 행에만 텍스트가 있는 경우)
-                            # 병합 처리 텍스트(연차, 경조사, 예비군 등)는 remarks가 없으면 출퇴근 모두 병합이므로 유지
-                            elif existing_leave_type in merge_texts and not existing_remarks:
-                                leave_type_to_use = existing_leave_type
-                                remarks_to_use = ""
-                        elif existing and existing[2]:
-                            # remarks가 없는 경우도 확인
-                            existing_leave_type = existing[2]
-                            merge_texts = ['연차', '경조사', '예비군', '설날', '추석', '박람회', '출장']
-                            # remarks가 없고 leave_type이 병합 처리 텍스트인 경우는 유지
-                            if existing_leave_type in merge_texts:
-                                leave_type_to_use = existing_leave_type
-                                remarks_to_use = ""
-                    
-                    try:
-                        self.calculator.process_attendance_record(
-                            emp_id, work_date, arrival_time, departure_time,
-                            leave_type_to_use, remarks_to_use if remarks_to_use is not None else "", conn
-                        )
-                        saved_count += 1
-                    except Exception as e:
-                        raise Exception(f"출퇴근 기록 처리 중 오류: {str(e)}")
-                else:
-                    # 텍스트 입력
-                    input_text = new_value.strip()
-                    
-                    # "연차", "경조사", "예비군", "설날", "추석", "박람회", "출장"을 제외한 나머지 텍스트는 출근/퇴근을 독립적으로 처리
-                    # 독립적으로 처리할 텍스트: 반차, 미팅, 공휴, 민방위, 교육, 휴가 등
-                    # 병합 처리할 텍스트: 연차, 경조사, 예비군, 설날, 추석, 박람회, 출장
-                    merge_texts = ['연차', '경조사', '예비군', '설날', '추석', '박람회', '출장']
-                    if input_text not in merge_texts:
-                        if category == '출근':
-                            arrival_time = None
-                            # pending_changes에서 퇴근 시간 확인 (같은 날짜의 퇴근 행 변경사항)
-                            departure_time = pending_departure_time
-                            # pending_changes에 없으면 기존 데이터베이스에서 조회
-                            if departure_time is None and existing and existing[1]:
-                                try:
-                                    departure_time = datetime.strptime(existing[1], "%H:%M:%S").time()
-                                except:
-                                    pass
-                            
-                            # 출근 행에 텍스트를 입력할 때는 퇴근 행의 기존 leave_type과 remarks를 보존
-                            # 기존 데이터에서 퇴근 행의 정보 확인
-                            leave_type_to_use = input_text
-                            remarks_to_use = f"{input_text}_출근"
-                            if existing and existing[2] and existing[3]:
-                                existing_leave_type = existing[2]
-                                existing_remarks = existing[3]
-                                # 기존에 퇴근 행에 같은 텍스트가 있는 경우 (remarks가 "{text}_퇴근"인 경우)
-                                if existing_leave_type == input_text and existing_remarks == f'{input_text}_퇴근':
-                                    # 출근 행과 퇴근 행 모두 같은 텍스트이므로 leave_type은 유지
-                                    # remarks는 "{text}_출근"으로 설정 (출근 행에 텍스트가 있으므로)
-                                    leave_type_to_use = input_text
-                                    remarks_to_use = f"{input_text}_출근"
-                                # 기존에 병합 처리 텍스트(연차, 경조사, 예비군, 설날, 추석, 박람회, 출장)가 있는 경우 (remarks가 없는 경우)
-                                elif existing_leave_type in ['연차', '경조사', '예비군'] and not existing_remarks:
-                                    # 출근 행에 독립 텍스트를 입력하면 병합 텍스트는 무시되고 독립 텍스트로 변경
-                                    leave_type_to_use = input_text
-                                    remarks_to_use = f"{input_text}_출근"
-                            
-                            try:
-                                self.calculator.process_attendance_record(
-                                    emp_id, work_date, arrival_time, departure_time,
-                                    leave_type_to_use, remarks_to_use, conn
-                                )
-                                saved_count += 1
-                            except Exception as e:
-                                raise Exception(f"출퇴근 기록 처리 중 오류: {str(e)}")
-                            # leave_records에도 기록 (반차만)
-                            if input_text == '반차':
-                                year = self.year_combo.currentData() or datetime.now().year
-                                month = self.month_combo.currentData() or datetime.now().month
-                                cursor.execute("""
-                                    INSERT OR REPLACE INTO leave_records
-                                    (employee_id, leave_type, leave_date, leave_amount, year, month)
-                                    VALUES (?, ?, ?, ?, ?, ?)
-                                """, (emp_id, input_text, work_date, 0.5, year, month))
-                        else:  # 퇴근
-                            # pending_changes에서 출근 시간 확인 (같은 날짜의 출근 행 변경사항)
-                            arrival_time = pending_arrival_time
-                            departure_time = None
-                            # pending_changes에 없으면 기존 데이터베이스에서 조회
-                            if arrival_time is None and existing and existing[0]:
-                                try:
-                                    arrival_time = datetime.strptime(existing[0], "%H:%M:%S").time()
-                                except:
-                                    pass
-                            
-                            # 퇴근 행에 텍스트를 입력할 때는 출근 행의 기존 leave_type과 remarks를 보존
-                            # 기존 데이터에서 출근 행의 정보 확인
-                            leave_type_to_use = input_text
-                            remarks_to_use = f"{input_text}_퇴근"
-                            if existing and existing[2] and existing[3]:
-                                existing_leave_type = existing[2]
-                                existing_remarks = existing[3]
-                                # 기존에 출근 행에 같은 텍스트가 있는 경우 (remarks가 "{text}_출근"인 경우)
-                                if existing_leave_type == input_text and existing_remarks == f'{input_text}_출근':
-                                    # 출근 행과 퇴근 행 모두 같은 텍스트이므로 leave_type은 유지
-                                    # remarks는 "{text}_퇴근"으로 설정 (퇴근 행에 텍스트가 있으므로)
-                                    leave_type_to_use = input_text
-                                    remarks_to_use = f"{input_text}_퇴근"
-                                # 기존에 병합 처리 텍스트(연차, 경조사, 예비군, 설날, 추석, 박람회, 출장)가 있는 경우 (remarks가 없는 경우)
-                                elif existing_leave_type in ['연차', '경조사', '예비군'] and not existing_remarks:
-                                    # 퇴근 행에 독립 텍스트를 입력하면 병합 텍스트는 무시되고 독립 텍스트로 변경
-                                    leave_type_to_use = input_text
-                                    remarks_to_use = f"{input_text}_퇴근"
-                            
-                            try:
-                                self.calculator.process_attendance_record(
-                                    emp_id, work_date, arrival_time, departure_time,
-                                    leave_type_to_use, remarks_to_use, conn
-                                )
-                                saved_count += 1
-                            except Exception as e:
-                                raise Exception(f"출퇴근 기록 처리 중 오류: {str(e)}")
-                            # leave_records에도 기록 (반차만)
-                            if input_text == '반차':
-                                year = self.year_combo.currentData() or datetime.now().year
-                                month = self.month_combo.currentData() or datetime.now().month
-                                cursor.execute("""
-                                    INSERT OR REPLACE INTO leave_records
-                                    (employee_id, leave_type, leave_date, leave_amount, year, month)
-                                    VALUES (?, ?, ?, ?, ?, ?)
-                                """, (emp_id, input_text, work_date, 0.5, year, month))
-                    else:
-                        # "연차", "경조사", "예비군", "설날", "추석", "박람회", "출장"은 출퇴근 병합 처리
-                        try:
-                            self.calculator.process_attendance_record(
-                                emp_id, work_date, None, None,
-                                input_text, "", conn
-                            )
-                            saved_count += 1
-                        except Exception as e:
-                            raise Exception(f"출퇴근 기록 처리 중 오류: {str(e)}")
-                        # 연차나 휴가인 경우 leave_records에도 기록
-                        if input_text in ['연차', '휴가']:
-                            year = self.year_combo.currentData() or datetime.now().year
-                            month = self.month_combo.currentData() or datetime.now().month
-                            leave_amount = 1.0
-                            cursor.execute("""
-                                INSERT OR REPLACE INTO leave_records
-                                (employee_id, leave_type, leave_date, leave_amount, year, month)
-                                VALUES (?, ?, ?, ?, ?, ?)
-                            """, (emp_id, input_text, work_date, leave_amount, year, month))
-                        elif input_text == '반차':
-                            year = self.year_combo.currentData() or datetime.now().year
-                            month = self.month_combo.currentData() or datetime.now().month
-                            leave_amount = 0.5
-                            cursor.execute("""
-                                INSERT OR REPLACE INTO leave_records
-                                (employee_id, leave_type, leave_date, leave_amount, year, month)
-                                VALUES (?, ?, ?, ?, ?, ?)
-                            """, (emp_id, input_text, work_date, leave_amount, year, month))
-            
-            conn.commit()
-            conn.close()
-            
-            # 저장 완료 후 pending_changes 초기화
-            self.pending_changes = {}
-            
-            # 데이터 새로고침을 비동기로 처리하여 데이터베이스 잠금 해제 대기
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(100, lambda: self.refresh_data())
-            
-            # 연월차 관리대장도 새로고침 (비동기)
-            if self.leave_gui:
-                QTimer.singleShot(150, lambda: self.leave_gui.refresh_data() if self.leave_gui else None)
-            
-            QMessageBox.information(self, "저장 완료", f"{saved_count}건의 변경 사항이 저장되었습니다.")
+        
+        # 셀 값은 MonthGrid에서 바로 읽어 그림 (셀마다 QTableWidgetItem을 만들지 않음)
+        self.month_model = MonthGridModel(columns, self)
+        self.table = MonthGridView(self.month_model)
+        self.table.set_parent_gui(self)  # 부모 GUI 참조 설정
+        self.table.horizontalHeader().setStretchLastSection(True)
+        # 헤더 높이 조정 (요일 정보 표시를 위해)
+        self.table.horizontalHeader().setMinimumHeight(50)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectItems)  # 셀 단위 선택
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)  # CTRL/SHIFT로 다중 선택
+        # 날짜 컬럼(3번째부터)은 직접 편집 가능, 나머지는 편집 불가
+        # DoubleClicked만 사용하여 여러 셀 선택 가능하도록 함
+        self.table.setEditTriggers(QAbstractItemView.DoubleClicked)
+        
+        # 셀 편집 완료 시 이벤트 연결
+        self.table.itemChanged.connect(self.on_cell_changed)
+        
+        # 컬럼 너비 설정
+        # 직급, 이름, 구분 컬럼
+        self.table.setColumnWidth(0, 60)  # 직급
+        self.table.setColumnWidth(1, 70)  # 이름
+        self.table.setColumnWidth(2, 60)  # 구분
+        
+        # 날짜 컬럼 (1-31일) - 시간 형식에 맞게
+        for i in range(3, 34):  # 3번부터 33번까지 (1일~31일)
+            self.table.setColumnWidth(i, 45)  # HH:MM 형식에 맞는 너비 (3글자 텍스트 입력 가능)
+        
+        # 요약 컬럼들
+        summary_start = 34  # 3(기본) + 31(날짜) = 34
+        self.table.setColumnWidth(summary_start, 100)      # 조기출근(8시이전)
+        self.table.setColumnWidth(summary_start + 1, 100)  # 지각(9시이후)
+        self.table.setColumnWidth(summary_start + 2, 100)  # 야근(20시이후)
+        self.table.setColumnWidth(summary_start + 3, 80)   # 연차사용
+        self.table.setColumnWidth(summary_start + 4, 110)  # 평균 출근시간
+        self.table.setColumnWidth(summary_start + 5, 110)  # 평균 퇴근시간
+        
+        # 더블클릭 이벤트
+        self.table.cellDoubleClicked.connect(self.on_cell_double_clicked)
+        
+        # 테이블에 포커스 설정 (키보드 이벤트 처리를 위해)
+        self.table.setFocusPolicy(Qt.StrongFocus)
+        
+        # verticalHeader의 행 높이를 조정하여 출근/퇴근 행 병합 효과
+        # 출근 행과 퇴근 행이 하나의 번호를 공유하도록 설정
+        self.table.verticalHeader().setDefaultSectionSize(25)  # 기본 행 높이 설정
+        
+        layout.addWidget(self.table)
+        
+        self.refresh_data()
+    
+    def save_changes(self):
+        """저장 버튼 또는 Ctrl+S로 변경 사항 저장"""
+        if not self.pending_changes:
+            QMessageBox.information(self, "알림", "저장할 변경 사항이 없습니다.")
+            return
+        
+        year = self.year_combo.currentData() or datetime.now().year
+        month = self.month_combo.currentData() or datetime.now().month
+        try:
+            # (직원, 날짜)별로 출근/퇴근 편집을 병합하여 한 트랜잭션에 일괄 저장
+            with self.db.transaction() as conn:
+                saved_count = commit_pending_changes(conn, self.calculator, self.pending_changes, year, month)
         except Exception as e:
-            # 오류 발생 시에도 연결 닫기
-            try:
-                if 'conn' in locals():
-                    conn.close()
-            except:
-                pass
             QMessageBox.warning(self, "오류", f"데이터 저장 중 오류가 발생했습니다.\n{str(e)}")
+            return
+        
+        # 저장 완료 후 pending_changes 초기화
+        changed_keys = list(self.pending_changes)
+        self.pending_changes = {}
+        
+        # 저장한 직원 행만 다시 그리고 (요약/색상 갱신) 연월차 관리대장 등 다른 탭에 알림
+        work_dates = [str(work_date) for emp_id, work_date, category in changed_keys]
+        self._apply_attendance_change({emp_id for emp_id, work_date, category in changed_keys},
+                                      min(work_dates), max(work_dates))
+        
+        QMessageBox.information(self, "저장 완료", f"{saved_count}건의 변경 사항이 저장되었습니다.")
     
     def refresh_data(self):
-        """데이터 새로고침 - QTableWidget 사용, 빈 셀 음영 처리"""
+        """데이터 새로고침 - 빈 셀 음영 처리"""
+        # 진행 중인 백그라운드 조회는 취소하고 최신 데이터로 바로 다시 그림 (저장 직후 등)
+        self._month_loader.cancel()
+        year, month = self._selected_period()
+        self._show_month(year, month)
+    
+    def request_refresh(self):
+        """년/월 변경 시 백그라운드에서 조회 (빠르게 바꿔도 마지막 선택만 계산, 화면은 멈추지 않음)"""
+        # 조회가 끝날 때까지 이전 달 셀을 편집하지 않도록 잠금 (적용 시 해제)
+        self.table.setEnabled(False)
+        self._month_loader.request(self._selected_period())
+    
+    def cancel_background_refresh(self):
+        self._month_loader.cancel()
+    
+    def _selected_period(self):
+        """드롭다운에서 선택한 (년도, 월) - 선택이 없으면 현재 년월"""
+        year = self.year_combo.currentData()
+        month = self.month_combo.currentData()
+        if year is None:
+            year = datetime.now().year
+        if month is None:
+            month = datetime.now().month
+        return year, month
+    
+    def _load_month_in_background(self, conn, key):
+        """작업 스레드: 해당 월 직원/기록 조회 (위젯 접근 없음)"""
+        year, month = key
+        return self._load_month_data(conn.cursor(), year, month)
+    
+    def _apply_loaded_month(self, key, loaded):
+        year, month = key
+        if (year, month) != self._selected_period():
+            return  # 그 사이 선택이 바뀜 (새 요청이 이어서 처리)
+        self._show_month(year, month, loaded)
+    
+    def _on_month_load_error(self, key, error):
+        # 동기 새로고침으로 다시 시도 (오류 메시지는 refresh_data에서 표시)
+        self.refresh_data()
+    
+    def on_data_changed(self, event):
+        """다른 탭의 변경 알림 - 표시 중인 월과 겹치는 출퇴근 변경만 반영"""
+        if event.source is self:
+            return
+        if event.kind == EMPLOYEE_CHANGED:
+            # 부서가 바뀌었을 수 있으므로 부서별 근무 규칙 대상도 다시 읽음
+            self.calculator.reload_rules()
+            self._mark_dirty(None)
+        elif event.kind == ATTENDANCE_CHANGED and event.overlaps(*month_date_range(*self._selected_period())):
+            self._mark_dirty(event.employee_ids)
+    
+    def _full_refresh(self):
+        self.request_refresh()
+    
+    @staticmethod
+    def _month_bounds(year, month):
+        """해당 월의 (1일, 말일) 'YYYY-MM-DD'"""
+        from calendar import monthrange
+        return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month:02d}-{monthrange(year, month)[1]:02d}"
+    
+    def _apply_attendance_change(self, employee_ids, start_date=None, end_date=None):
+        """이 탭에서 저장한 출퇴근 변경 반영 - 해당 직원 행만 다시 그리고 다른 탭에 알림"""
+        employee_ids = set(employee_ids)
+        self._patch_rows(employee_ids)
+        self.change_bus.attendance_changed(employee_ids, start_date, end_date, source=self)
+    
+    def _show_month(self, year, month, loaded=None):
+        """해당 월을 화면에 표시 (loaded: 백그라운드에서 미리 조회한 결과)"""
         try:
             self._is_refreshing = True  # 새로고침 시작
-            self.table.setRowCount(0)
-            
-            # 드롭다운에서 년도와 월 가져오기
-            year = self.year_combo.currentData()
-            month = self.month_combo.currentData()
+            self.table.clearSpans()
+            self.month_model.clear()
             
-            if year is None:
-                year = datetime.now().year
-            if month is None:
-                month = datetime.now().month
-            
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
+            conn = self.db.get_connection() if loaded is None else None
+            cursor = conn.cursor() if conn is not None else None
             
             try:
                 # 월별 조회
@@ -4948,12 +3259,15 @@ class AttendanceManagementGUI(QWidget):
                     col = 2 + day
                     self.table.setColumnHidden(col, False)
                 
-                self._refresh_month_data(conn, cursor, year, month, days_in_month, is_year_mode=False)
-                conn.close()
+                self._refresh_month_data(conn, cursor, year, month, days_in_month, is_year_mode=False,
+                                         loaded=loaded)
+                if conn is not None:
+                    conn.close()
             except Exception as e:
                 # 데이터베이스 작업 중 예외 발생 시 연결 닫기
                 try:
-                    conn.close()
+                    if conn is not None:
+                        conn.close()
                 except:
                     pass
                 # 예외를 상위로 전파하지 않고 내부에서 처리
@@ -4970,10 +3284,10 @@ class AttendanceManagementGUI(QWidget):
                     try:
                         QMessageBox.warning(self, "오류", f"데이터 새로고침 중 오류가 발생했습니다.\n{str(e)}")
                     except:
-                        # QMessageBox 호출 실패 시 콘솔에 출력
-                        print(f"데이터 새로고침 중 오류 발생: {str(e)}")
+                        # QMessageBox 호출 실패 시 로그로 남김
+                        logger.exception("데이터 새로고침 중 오류 발생")
                 else:
-                    print(f"데이터 새로고침 중 오류 발생: {str(e)}")
+                    logger.exception("데이터 새로고침 중 오류 발생")
             except Exception:
                 # 모든 예외를 잡아서 프로그램이 종료되지 않도록 함
                 print(f"데이터 새로고침 중 오류 발생: {str(e)}")
@@ -4981,58 +3295,12 @@ class AttendanceManagementGUI(QWidget):
             # 항상 플래그 해제 (예외 발생 여부와 관계없이)
             try:
                 self._is_refreshing = False  # 새로고침 완료 (항상 실행)
+                self.table.setEnabled(True)
             except:
                 pass
     
-    def _refresh_month_data(self, conn, cursor, year, month, days_in_month=None, is_year_mode=False):
-        """특정 월의 데이터를 새로고침"""
-        if days_in_month is None:
-            from calendar import monthrange
-            days_in_month = monthrange(year, month)[1]
-        
-        # 입사일 이전 날짜 셀에 사선을 그리기 위한 델리게이트 (전체 직원 공통)
-        diagonal_delegate = DiagonalLineDelegate()
-        
-        # 날짜 컬럼 헤더에 요일 정보 추가 (월별 조회 시에만)
-        if not is_year_mode:
-            weekday_names = ['월', '화', '수', '목', '금', '토', '일']
-            for day in range(1, days_in_month + 1):
-                try:
-                    date_obj = datetime(year, month, day).date()
-                    weekday = date_obj.weekday()  # 0=월요일, 6=일요일
-                    weekday_name = weekday_names[weekday]
-                    col = 2 + day  # 3번 컬럼부터 시작 (인덱스는 2부터)
-                    
-                    # 헤더 아이템 생성 (날짜\n요일 형식)
-                    header_item = QTableWidgetItem(f"{day}\n{weekday_name}")
-                    header_item.setTextAlignment(Qt.AlignCenter)
-                    # 헤더 폰트 설정 (작게 하여 두 줄이 잘 보이도록)
-                    header_font = QFont()
-                    header_font.setPointSize(8)
-                    header_item.setFont(header_font)
-                    
-                    # 토요일/일요일 색상 설정
-                    if weekday == 5:  # 토요일
-                        header_item.setForeground(QColor("#0000FF"))  # 파란색
-                    elif weekday == 6:  # 일요일
-                        header_item.setForeground(QColor("#FF0000"))  # 빨간색
-                    
-                    # 헤더에 설정
-                    self.table.setHorizontalHeaderItem(col, header_item)
-                except ValueError:
-                    pass  # 유효하지 않은 날짜는 무시
-        
-        # 년도별 조회인 경우 월별 헤더 추가
-        if is_year_mode:
-            month_header_row = self.table.rowCount()
-            self.table.insertRow(month_header_row)
-            month_header = QTableWidgetItem(f"━━━ {year}년 {month}월 ━━━")
-            month_header.setFlags(Qt.NoItemFlags)
-            month_header.setBackground(QColor("#D0D0D0"))
-            month_header.setFont(QFont("Arial", 10, QFont.Bold))
-            self.table.setItem(month_header_row, 0, month_header)
-            self.table.setSpan(month_header_row, 0, 1, len(self.table.horizontalHeaderLabels()))
-        
+    def _load_month_data(self, cursor, year, month):
+        """해당 월 표시용 (직원 목록, MonthGrid) 조회 - 위젯에 접근하지 않으므로 작업 스레드에서도 호출 가능"""
         cursor.execute("""
             SELECT e.id, e.department, e.position, e.name, e.hire_date,
                    COALESCE(e.display_order, 0) as display_order,
@@ -5060,9 +3328,6 @@ class AttendanceManagementGUI(QWidget):
         """)
         all_employees = cursor.fetchall()
         
-        # 퇴사자 표시 옵션 확인
-        show_inactive = self.show_inactive_checkbox.isChecked()
-        
         # 퇴사일을 고려한 필터링: 모든 직원을 포함하되, is_active 정보도 함께 저장
         employees = []
         for emp in all_employees:
@@ -5078,679 +3343,107 @@ class AttendanceManagementGUI(QWidget):
             # 모든 직원을 포함하되, is_active와 resignation_date 정보도 함께 저장
             employees.append((emp_id, dept, pos, name, hire_date, display_order, is_active, resignation_date))
         
-        current_department = None
-        employee_row_number = 1  # 실제 직원 행 번호 카운터 (출근/퇴근 행을 하나로 카운트)
+        # 해당 월 전체 직원의 기록을 직원 x 일자 배열로 한 번에 계산 (텍스트/스타일/병합/요약)
+        return employees, MonthGrid.load(cursor, year, month, [(emp[0], emp[4], emp[7]) for emp in employees],
+                                         rules=self.calculator.rules,
+                                         leave_registry=self.calculator.leave_registry)
+    
+    def _refresh_month_data(self, conn, cursor, year, month, days_in_month=None, is_year_mode=False, loaded=None):
+        """특정 월의 데이터를 새로고침 (loaded가 있으면 조회 없이 그대로 표시)"""
+        if days_in_month is None:
+            from calendar import monthrange
+            days_in_month = monthrange(year, month)[1]
+        
+        model = self.month_model
+        table = self.table
+        
+        # 날짜 컬럼 헤더에 요일 정보 추가 (월별 조회 시에만)
+        if not is_year_mode:
+            model.set_period(year, month, days_in_month)
+        
+        # 년도별 조회인 경우 월별 헤더 추가
+        if is_year_mode:
+            month_header_row = model.append_rows(model.separator_rows(f"━━━ {year}년 {month}월 ━━━", "#D0D0D0"))
+            table.apply_spans([month_header_row])
+        
+        if loaded is None:
+            loaded = self._load_month_data(cursor, year, month)
+        employees, grid = loaded
+        
+        # 퇴사자 표시 옵션 확인
+        show_inactive = self.show_inactive_checkbox.isChecked()
+        
+        # 행 배치를 먼저 계산하고 한 번에 행 추가 (부서 구분자 1행 + 직원별 출근/퇴근 2행)
+        # 셀 값은 모델이 그릴 때 MonthGrid에서 읽으므로 여기서는 행 구성만 넘김
         separator_rows = []  # 구분자 행 추적 (부서, 행 번호)
-        for emp_id, dept, pos, name, hire_date_str, display_order, is_active, resignation_date in employees:
-            # 입사일 파싱
-            hire_date = None
-            if hire_date_str:
-                try:
-                    if isinstance(hire_date_str, str):
-                        hire_date = datetime.strptime(hire_date_str, "%Y-%m-%d").date()
-                    else:
-                        hire_date = hire_date_str
-                except:
-                    pass
-            
-            # 퇴사일 파싱
-            if resignation_date and isinstance(resignation_date, str):
-                try:
-                    resignation_date = datetime.strptime(resignation_date, "%Y-%m-%d").date()
-                except:
-                    resignation_date = None
-            # 부서가 변경되면 구분자 추가
+        employee_rows = []  # 직원별 출근 행 번호
+        visible_departments = set()  # 표시되는 직원이 있는 부서
+        rows = []
+        current_department = None
+        first_row = model.rowCount()
+        for employee_index, emp in enumerate(employees):
+            dept = emp[1]
             if current_department != dept:
-                # 구분자 행 추가 (출근 행만)
-                separator_row = self.table.rowCount()
-                self.table.insertRow(separator_row)
-                
-                # 구분자 행 추적
-                separator_rows.append({'dept': dept, 'row': separator_row, 'has_visible_employee': False})
-                
-                # 구분자 행의 행 번호를 공란으로 설정
-                self.table.setVerticalHeaderItem(separator_row, QTableWidgetItem(""))
-                
-                # 구분자 아이템 생성
-                separator_item = QTableWidgetItem(f"━━━ {dept} ━━━")
-                separator_item.setFlags(Qt.NoItemFlags)  # 선택 불가
-                separator_item.setBackground(QColor("#E0E0E0"))
-                separator_item.setFont(QFont("Arial", 10, QFont.Bold))
-                self.table.setItem(separator_row, 0, separator_item)
-                # 모든 컬럼에 걸쳐 병합
-                summary_start = 3 + 31  # 3(기본) + 31(날짜)
-                self.table.setSpan(separator_row, 0, 1, self.table.columnCount())
-                
+                separator_rows.append((dept, first_row + len(rows)))
+                rows.extend(model.separator_rows(f"━━━ {dept} ━━━", "#E0E0E0"))
                 current_department = dept
-            cursor.execute("""
-                SELECT work_date, arrival_time, departure_time,
-                       early_arrival, late_arrival, late_departure, leave_type, remarks
-                FROM attendance_records
-                WHERE employee_id = ? AND strftime('%Y-%m', work_date) = ?
-                ORDER BY work_date
-            """, (emp_id, f"{year:04d}-{month:02d}"))
-            
-            records = cursor.fetchall()
-            records_dict = {}
-            for record in records:
-                work_date, arrival, departure, early, late_arr, late_dep, leave_type, remarks = record
-                day = int(work_date.split('-')[2])
-                records_dict[day] = {
-                    'arrival': arrival,
-                    'departure': departure,
-                    'early': early,
-                    'late_arr': late_arr,
-                    'late_dep': late_dep,
-                    'leave_type': leave_type,
-                    'remarks': remarks
-                }
-            
-            # 출근 행 추가
-            arrival_row = self.table.rowCount()
-            self.table.insertRow(arrival_row)
-            
-            # 실제 직원 행의 행 번호 설정 (출근 행에만 번호 표시, 가운데 정렬하여 두 행의 중간에 위치)
-            header_item_arrival = QTableWidgetItem(str(employee_row_number))
-            header_item_arrival.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            self.table.setVerticalHeaderItem(arrival_row, header_item_arrival)
-            
-            # 직급, 이름, 구분
-            pos_item = QTableWidgetItem(pos)
-            pos_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(arrival_row, 0, pos_item)
-            name_item = QTableWidgetItem(name)
-            name_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(arrival_row, 1, name_item)
-            category_item = QTableWidgetItem("출근")
-            category_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(arrival_row, 2, category_item)
-            
-            # 날짜별 데이터 (3번 컬럼부터)
-            arrival_times = []
-            for day in range(1, days_in_month + 1):
-                col = 2 + day  # 3번 컬럼부터 시작
-                if day in records_dict:
-                    record = records_dict[day]
-                    # "연차", "경조사", "예비군", "설날", "추석", "박람회", "출장"을 제외한 나머지는 remarks로 출근/퇴근 구분
-                    remarks = record.get('remarks', '')
-                    leave_type = record.get('leave_type')
-                    merge_texts = ['연차', '경조사', '예비군', '설날', '추석', '박람회', '출장']
-                    
-                    # remarks가 "{type}_출근" 형식인 경우 (독립 처리 텍스트)
-                    if leave_type and remarks == f'{leave_type}_출근':
-                        # 출근 행에 텍스트 표시 → 평균 출근시간에서 제외
-                        item = QTableWidgetItem(leave_type)
-                        item.setTextAlignment(Qt.AlignCenter)
-                        # 연차 또는 경조사 등 출근하지 않은 경우 배경색 처리
-                        if leave_type in ['연차', '반차', '경조사', '공휴', '박람회', '예비군', '추석', '설날', '민방위', '출장', '교육']:
-                            item.setBackground(QColor("#F8CBAD"))
-                    elif leave_type and remarks == f'{leave_type}_퇴근':
-                        # 퇴근 행용이므로 출근 행에는 시간 표시 → 평균 출근시간에 포함 (퇴근행에 텍스트가 있으므로)
-                        if record['arrival']:
-                            arrival_str = str(record['arrival'])[:5] if record['arrival'] else ""
-                            item = QTableWidgetItem(arrival_str)
-                            item.setTextAlignment(Qt.AlignCenter)
-                            try:
-                                arrival_time_obj = datetime.strptime(arrival_str, "%H:%M").time()
-                                # 토요일(5)과 일요일(6)은 평균 출근시간에서 제외
-                                work_date_obj = datetime(year, month, day).date()
-                                weekday = work_date_obj.weekday()  # 0=월요일, 5=토요일, 6=일요일
-                                if weekday != 5 and weekday != 6:  # 토요일, 일요일이 아닐 때만 추가
-                                    arrival_times.append(arrival_time_obj)
-                                # 08시 이전 출근 - 초록색
-                                if arrival_time_obj < datetime.strptime("08:00", "%H:%M").time():
-                                    item.setForeground(QColor("#008000"))
-                                # 09시 이후 지각 - 빨간색
-                                elif arrival_time_obj > datetime.strptime("09:00", "%H:%M").time():
-                                    item.setForeground(QColor("#FF0000"))
-                            except:
-                                pass
-                        else:
-                            item = QTableWidgetItem("")  # 빈 셀
-                            item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                            item.setTextAlignment(Qt.AlignCenter)
-                    elif leave_type and not remarks:
-                        # remarks가 없는 경우
-                        # "연차", "경조사", "예비군", "설날", "추석", "박람회", "출장"은 출퇴근 병합 처리
-                        # 나머지는 remarks로 출근/퇴근을 구분하므로, remarks가 없으면 시간 표시
-                        if leave_type in merge_texts:
-                            # 병합 처리 텍스트는 출퇴근이 병합되므로 출근 행에도 텍스트 표시
-                            item = QTableWidgetItem(leave_type)
-                            item.setTextAlignment(Qt.AlignCenter)
-                            # 연차 또는 경조사 등 출근하지 않은 경우 배경색 처리
-                            if leave_type in ['연차', '경조사', '예비군', '설날', '추석', '박람회', '출장']:
-                                item.setBackground(QColor("#F8CBAD"))
-                        else:
-                            # 독립 처리 텍스트인데 remarks가 없으면 이전 데이터이거나 잘못된 데이터
-                            # 출근 행에는 시간이 있으면 시간 표시, 없으면 빈 셀
-                            if record['arrival']:
-                                arrival_str = str(record['arrival'])[:5] if record['arrival'] else ""
-                                item = QTableWidgetItem(arrival_str)
-                                item.setTextAlignment(Qt.AlignCenter)
-                                try:
-                                    arrival_time_obj = datetime.strptime(arrival_str, "%H:%M").time()
-                                    work_date_obj = datetime(year, month, day).date()
-                                    weekday = work_date_obj.weekday()
-                                    if weekday != 5 and weekday != 6:
-                                        arrival_times.append(arrival_time_obj)
-                                    if arrival_time_obj < datetime.strptime("08:00", "%H:%M").time():
-                                        item.setForeground(QColor("#008000"))
-                                    elif arrival_time_obj > datetime.strptime("09:00", "%H:%M").time():
-                                        item.setForeground(QColor("#FF0000"))
-                                except:
-                                    pass
-                            else:
-                                item = QTableWidgetItem("")  # 빈 셀
-                                item.setBackground(QColor("#F0F0F0"))
-                                item.setTextAlignment(Qt.AlignCenter)
-                    elif record['arrival']:
-                        # 일반 시간 입력 → 평균 출근시간에 포함
-                        arrival_str = str(record['arrival'])[:5] if record['arrival'] else ""
-                        item = QTableWidgetItem(arrival_str)
-                        item.setTextAlignment(Qt.AlignCenter)
-                        try:
-                            arrival_time_obj = datetime.strptime(arrival_str, "%H:%M").time()
-                            # 토요일(5)과 일요일(6)은 평균 출근시간에서 제외
-                            work_date_obj = datetime(year, month, day).date()
-                            weekday = work_date_obj.weekday()  # 0=월요일, 5=토요일, 6=일요일
-                            if weekday != 5 and weekday != 6:  # 토요일, 일요일이 아닐 때만 추가
-                                arrival_times.append(arrival_time_obj)
-                            # 08시 이전 출근 - 초록색
-                            if arrival_time_obj < datetime.strptime("08:00", "%H:%M").time():
-                                item.setForeground(QColor("#008000"))
-                            # 09시 이후 지각 - 빨간색
-                            elif arrival_time_obj > datetime.strptime("09:00", "%H:%M").time():
-                                item.setForeground(QColor("#FF0000"))
-                        except:
-                            pass
-                    else:
-                        item = QTableWidgetItem("")  # 빈 셀
-                        item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                        item.setTextAlignment(Qt.AlignCenter)
-                else:
-                    item = QTableWidgetItem("")  # 빈 셀
-                    item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                    item.setTextAlignment(Qt.AlignCenter)
-                
-                item.setData(Qt.UserRole, {'emp_id': emp_id, 'day': day, 'category': '출근'})
-                self.table.setItem(arrival_row, col, item)
-            
-            # 요약 컬럼 계산
-            early_count = sum(1 for r in records_dict.values() if r.get('early'))
-            late_arr_count = sum(1 for r in records_dict.values() if r.get('late_arr'))
-            # 연차사용 계산: "연차"와 "휴가"는 1.0, "반차"는 0.5만 반영
-            # 공휴, 박람회, 출장, 교육, 추석, 설날, 민방위 등은 연차사용에 반영 안 함
-            leave_amount = 0.0
-            for r in records_dict.values():
-                leave_type = r.get('leave_type')
-                remarks = r.get('remarks', '')
-                if leave_type:
-                    if leave_type == '연차' or leave_type == '휴가':
-                        # 연차와 휴가는 1.0
-                        leave_amount += 1.0
-                    elif leave_type == '반차':
-                        # 반차는 0.5 (출근 또는 퇴근 중 하나)
-                        leave_amount += 0.5
-                    # 그 외 휴가 유형(공휴, 박람회, 출장, 교육, 추석, 설날, 민방위 등)은 연차사용에 반영 안 함
-            
-            avg_arrival = ""
-            if arrival_times:
-                total_seconds = sum(t.hour * 3600 + t.minute * 60 + t.second for t in arrival_times)
-                avg_seconds = total_seconds // len(arrival_times)
-                avg_arrival = f"{avg_seconds // 3600:02d}:{(avg_seconds % 3600) // 60:02d}"
-            
-            # 요약 컬럼 설정
-            summary_start = 3 + 31  # 3(기본) + 31(날짜)
-            # 조기출근: 0이면 빈 셀로 표시
-            if early_count > 0:
-                early_item = QTableWidgetItem(str(early_count))
-                early_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(arrival_row, summary_start, early_item)
-            else:
-                early_item = QTableWidgetItem("")
-                early_item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                early_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(arrival_row, summary_start, early_item)
-            # 지각: 0이면 빈 셀로 표시
-            if late_arr_count > 0:
-                late_arr_item = QTableWidgetItem(str(late_arr_count))
-                late_arr_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(arrival_row, summary_start + 1, late_arr_item)
-            else:
-                late_arr_item = QTableWidgetItem("")
-                late_arr_item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                late_arr_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(arrival_row, summary_start + 1, late_arr_item)
-            # 출근 행의 야근 컬럼은 해당 없으므로 음영 처리
-            late_dep_item_arr = QTableWidgetItem("")
-            late_dep_item_arr.setBackground(QColor("#F0F0F0"))  # 음영 처리
-            late_dep_item_arr.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(arrival_row, summary_start + 2, late_dep_item_arr)
-            # 연차사용: 0이면 빈 셀로 표시
-            if leave_amount > 0:
-                leave_item = QTableWidgetItem(str(leave_amount))
-                leave_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(arrival_row, summary_start + 3, leave_item)
-            else:
-                leave_item = QTableWidgetItem("")
-                leave_item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                leave_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(arrival_row, summary_start + 3, leave_item)
-            # 평균 출근시간: 값이 없으면 빈 셀로 표시
-            if avg_arrival:
-                avg_arrival_item = QTableWidgetItem(avg_arrival)
-                avg_arrival_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(arrival_row, summary_start + 4, avg_arrival_item)
-            else:
-                avg_arrival_item = QTableWidgetItem("")
-                avg_arrival_item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                avg_arrival_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(arrival_row, summary_start + 4, avg_arrival_item)
-            # 출근 행의 평균 퇴근시간 컬럼은 해당 없으므로 음영 처리
-            avg_departure_item_arr = QTableWidgetItem("")
-            avg_departure_item_arr.setBackground(QColor("#F0F0F0"))  # 음영 처리
-            avg_departure_item_arr.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(arrival_row, summary_start + 5, avg_departure_item_arr)
-            
-            # 퇴근 행 추가
-            departure_row = self.table.rowCount()
-            self.table.insertRow(departure_row)
-            
-            # 퇴근 행의 행 번호는 공란으로 설정 (출근 행의 번호가 두 행에 걸쳐 보이도록)
-            self.table.setVerticalHeaderItem(departure_row, QTableWidgetItem(""))
-            
-            dep_pos_item = QTableWidgetItem("")  # 직급 빈칸
-            dep_pos_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(departure_row, 0, dep_pos_item)
-            dep_name_item = QTableWidgetItem("")  # 이름 빈칸 (시각적 병합)
-            dep_name_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(departure_row, 1, dep_name_item)
-            dep_category_item = QTableWidgetItem("퇴근")
-            dep_category_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(departure_row, 2, dep_category_item)
-            
-            departure_times = []
-            for day in range(1, days_in_month + 1):
-                col = 2 + day
-                if day in records_dict:
-                    record = records_dict[day]
-                    # "연차", "경조사", "예비군", "설날", "추석", "박람회", "출장"을 제외한 나머지는 remarks로 출근/퇴근 구분
-                    remarks = record.get('remarks', '')
-                    leave_type = record.get('leave_type')
-                    merge_texts = ['연차', '경조사', '예비군', '설날', '추석', '박람회', '출장']
-                    
-                    # remarks가 "{type}_퇴근" 형식인 경우 (독립 처리 텍스트)
-                    if leave_type and remarks == f'{leave_type}_퇴근':
-                        # 퇴근 행에 텍스트 표시 → 평균 퇴근시간에서 제외
-                        item = QTableWidgetItem(leave_type)
-                        item.setTextAlignment(Qt.AlignCenter)
-                        # 연차 또는 경조사 등 출근하지 않은 경우 배경색 처리
-                        if leave_type in ['연차', '반차', '경조사', '공휴', '박람회', '예비군', '추석', '설날', '민방위', '출장', '교육']:
-                            item.setBackground(QColor("#F8CBAD"))
-                        self.table.setItem(departure_row, col, item)
-                    elif leave_type and remarks == f'{leave_type}_출근':
-                        # 출근 행용이므로 퇴근 행에는 시간 표시 → 평균 퇴근시간에 포함 (출근행에 텍스트가 있으므로)
-                        if record['departure']:
-                            departure_str = str(record['departure'])[:5] if record['departure'] else ""
-                            item = QTableWidgetItem(departure_str)
-                            item.setTextAlignment(Qt.AlignCenter)
-                            try:
-                                departure_time_obj = datetime.strptime(departure_str, "%H:%M").time()
-                                work_date_obj = datetime(year, month, day).date()
-                                weekday = work_date_obj.weekday()  # 0=월요일, 5=토요일, 6=일요일
-                                # 토요일(5)과 일요일(6)은 평균 퇴근시간에서 제외
-                                # 매월 셋째주 수요일 17:00 퇴근도 평균 계산에서 제외
-                                if weekday != 5 and weekday != 6:  # 토요일, 일요일이 아닐 때만 체크
-                                    if not self.is_third_wednesday_17_00(work_date_obj, departure_time_obj):
-                                        departure_times.append(departure_time_obj)
-                                # 20시 이후 퇴근 - 파랑색
-                                if departure_time_obj >= datetime.strptime("20:00", "%H:%M").time():
-                                    item.setForeground(QColor("#0000FF"))
-                            except:
-                                pass
-                        else:
-                            item = QTableWidgetItem("")  # 빈 셀
-                            item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                            item.setTextAlignment(Qt.AlignCenter)
-                        self.table.setItem(departure_row, col, item)
-                    elif leave_type and not remarks:
-                        # remarks가 없는 경우
-                        # "연차", "경조사", "예비군", "설날", "추석", "박람회", "출장"은 출퇴근 병합 처리
-                        # 나머지는 remarks로 출근/퇴근을 구분하므로, remarks가 없으면 시간 표시
-                        if leave_type in merge_texts:
-                            # 병합 처리 텍스트는 출퇴근이 병합되므로 퇴근 행에도 텍스트 표시
-                            item = QTableWidgetItem(leave_type)
-                            item.setTextAlignment(Qt.AlignCenter)
-                            # 연차 또는 경조사 등 출근하지 않은 경우 배경색 처리
-                            if leave_type in ['연차', '경조사', '예비군', '설날', '추석', '박람회', '출장']:
-                                item.setBackground(QColor("#F8CBAD"))
-                            self.table.setItem(departure_row, col, item)
-                        else:
-                            # 독립 처리 텍스트인데 remarks가 없으면 이전 데이터이거나 잘못된 데이터
-                            # 퇴근 행에는 시간이 있으면 시간 표시, 없으면 빈 셀
-                            if record['departure']:
-                                departure_str = str(record['departure'])[:5] if record['departure'] else ""
-                                item = QTableWidgetItem(departure_str)
-                                item.setTextAlignment(Qt.AlignCenter)
-                                try:
-                                    departure_time_obj = datetime.strptime(departure_str, "%H:%M").time()
-                                    work_date_obj = datetime(year, month, day).date()
-                                    weekday = work_date_obj.weekday()
-                                    if weekday != 5 and weekday != 6:
-                                        if not self.is_third_wednesday_17_00(work_date_obj, departure_time_obj):
-                                            departure_times.append(departure_time_obj)
-                                    if departure_time_obj >= datetime.strptime("20:00", "%H:%M").time():
-                                        item.setForeground(QColor("#0000FF"))
-                                except:
-                                    pass
-                            else:
-                                item = QTableWidgetItem("")  # 빈 셀
-                                item.setBackground(QColor("#F0F0F0"))
-                                item.setTextAlignment(Qt.AlignCenter)
-                        self.table.setItem(departure_row, col, item)
-                    elif record['departure']:
-                        # 일반 시간 입력 → 평균 퇴근시간에 포함
-                        departure_str = str(record['departure'])[:5] if record['departure'] else ""
-                        item = QTableWidgetItem(departure_str)
-                        item.setTextAlignment(Qt.AlignCenter)
-                        try:
-                            departure_time_obj = datetime.strptime(departure_str, "%H:%M").time()
-                            work_date_obj = datetime(year, month, day).date()
-                            weekday = work_date_obj.weekday()  # 0=월요일, 5=토요일, 6=일요일
-                            # 토요일(5)과 일요일(6)은 평균 퇴근시간에서 제외
-                            # 매월 셋째주 수요일 17:00 퇴근도 평균 계산에서 제외
-                            if weekday != 5 and weekday != 6:  # 토요일, 일요일이 아닐 때만 체크
-                                if not self.is_third_wednesday_17_00(work_date_obj, departure_time_obj):
-                                    departure_times.append(departure_time_obj)
-                            # 20시 이후 퇴근 - 파랑색
-                            if departure_time_obj >= datetime.strptime("20:00", "%H:%M").time():
-                                item.setForeground(QColor("#0000FF"))
-                        except:
-                            pass
-                        self.table.setItem(departure_row, col, item)
-                    else:
-                        item = QTableWidgetItem("")  # 빈 셀
-                        item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                        item.setTextAlignment(Qt.AlignCenter)
-                        self.table.setItem(departure_row, col, item)
-                else:
-                    item = QTableWidgetItem("")  # 빈 셀
-                    item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                    item.setTextAlignment(Qt.AlignCenter)
-                
-                item.setData(Qt.UserRole, {'emp_id': emp_id, 'day': day, 'category': '퇴근'})
-                self.table.setItem(departure_row, col, item)
-            
-            late_dep_count = sum(1 for r in records_dict.values() if r.get('late_dep'))
-            avg_departure = ""
-            if departure_times:
-                total_seconds = sum(t.hour * 3600 + t.minute * 60 + t.second for t in departure_times)
-                avg_seconds = total_seconds // len(departure_times)
-                avg_departure = f"{avg_seconds // 3600:02d}:{(avg_seconds % 3600) // 60:02d}"
-            
-            # 퇴근 행의 조기출근 컬럼은 해당 없으므로 음영 처리
-            early_item_dep = QTableWidgetItem("")
-            early_item_dep.setBackground(QColor("#F0F0F0"))  # 음영 처리
-            early_item_dep.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(departure_row, summary_start, early_item_dep)
-            
-            # 퇴근 행의 지각 컬럼은 해당 없으므로 음영 처리
-            late_arr_item_dep = QTableWidgetItem("")
-            late_arr_item_dep.setBackground(QColor("#F0F0F0"))  # 음영 처리
-            late_arr_item_dep.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(departure_row, summary_start + 1, late_arr_item_dep)
-            
-            # 야근: 0이면 빈 셀로 표시
-            if late_dep_count > 0:
-                late_dep_item = QTableWidgetItem(str(late_dep_count))
-                late_dep_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(departure_row, summary_start + 2, late_dep_item)
-            else:
-                late_dep_item = QTableWidgetItem("")
-                late_dep_item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                late_dep_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(departure_row, summary_start + 2, late_dep_item)
-            
-            # 퇴근 행의 연차사용 컬럼은 해당 없으므로 음영 처리
-            leave_item_dep = QTableWidgetItem("")
-            leave_item_dep.setBackground(QColor("#F0F0F0"))  # 음영 처리
-            leave_item_dep.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(departure_row, summary_start + 3, leave_item_dep)
-            
-            # 퇴근 행의 평균 출근시간 컬럼은 해당 없으므로 음영 처리
-            avg_arrival_item_dep = QTableWidgetItem("")
-            avg_arrival_item_dep.setBackground(QColor("#F0F0F0"))  # 음영 처리
-            avg_arrival_item_dep.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(departure_row, summary_start + 4, avg_arrival_item_dep)
-            
-            # 평균 퇴근시간: 값이 없으면 빈 셀로 표시
-            if avg_departure:
-                avg_departure_item = QTableWidgetItem(avg_departure)
-                avg_departure_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(departure_row, summary_start + 5, avg_departure_item)
-            else:
-                avg_departure_item = QTableWidgetItem("")
-                avg_departure_item.setBackground(QColor("#F0F0F0"))  # 음영 처리
-                avg_departure_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(departure_row, summary_start + 5, avg_departure_item)
-            
-            # 출근 행과 퇴근 행을 날짜 컬럼을 제외한 컬럼에서 병합
-            # 직급, 이름 컬럼 병합
-            self.table.setSpan(arrival_row, 0, 2, 1)  # 직급 병합 (2행, 1열)
-            self.table.setSpan(arrival_row, 1, 2, 1)  # 이름 병합 (2행, 1열)
-            
-            # 요약 컬럼들 병합
-            # 조기출근: 출근 행의 값 사용
-            self.table.setSpan(arrival_row, summary_start, 2, 1)
-            
-            # 지각: 출근 행의 값 사용
-            self.table.setSpan(arrival_row, summary_start + 1, 2, 1)
-            
-            # 야근: 퇴근 행의 값 사용 - 출근 행의 셀을 퇴근 행의 값으로 덮어쓰고 병합
-            if late_dep_count > 0:
-                late_dep_merged = QTableWidgetItem(str(late_dep_count))
-                late_dep_merged.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(arrival_row, summary_start + 2, late_dep_merged)
-            else:
-                late_dep_merged = QTableWidgetItem("")
-                late_dep_merged.setBackground(QColor("#F0F0F0"))
-                late_dep_merged.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(arrival_row, summary_start + 2, late_dep_merged)
-            self.table.setSpan(arrival_row, summary_start + 2, 2, 1)
-            
-            # 연차사용: 출근 행의 값 사용
-            self.table.setSpan(arrival_row, summary_start + 3, 2, 1)
-            
-            # 평균 출근시간: 출근 행의 값 사용
-            self.table.setSpan(arrival_row, summary_start + 4, 2, 1)
-            
-            # 평균 퇴근시간: 퇴근 행의 값 사용 - 출근 행의 셀을 퇴근 행의 값으로 덮어쓰고 병합
-            if avg_departure:
-                self.table.setItem(arrival_row, summary_start + 5, QTableWidgetItem(avg_departure))
-            else:
-                avg_dep_merged = QTableWidgetItem("")
-                avg_dep_merged.setBackground(QColor("#F0F0F0"))
-                self.table.setItem(arrival_row, summary_start + 5, avg_dep_merged)
-            self.table.setSpan(arrival_row, summary_start + 5, 2, 1)
-            
-            # 특정 텍스트(연차, 박람회, 예비군, 경조사, 추석, 설날, 공휴)가 있는 날짜 컬럼에서 출근행과 퇴근행 병합
-            merge_texts = ['연차', '박람회', '예비군', '경조사', '추석', '설날', '공휴']
-            for day in range(1, days_in_month + 1):
-                col = 2 + day  # 3번 컬럼부터 시작
-                arrival_item = self.table.item(arrival_row, col)
-                departure_item = self.table.item(departure_row, col)
-                
-                # 이미 병합된 셀인지 확인 (rowSpan이 2 이상이면 이미 병합됨)
-                if self.table.rowSpan(arrival_row, col) >= 2:
-                    continue
-                
-                # 출근행과 퇴근행 모두에 셀이 있는 경우
-                if arrival_item and departure_item:
-                    arrival_text = arrival_item.text().strip()
-                    departure_text = departure_item.text().strip()
-                    
-                    # 출근행과 퇴근행의 텍스트가 같고, 병합 대상 텍스트인 경우
-                    if arrival_text == departure_text and arrival_text in merge_texts:
-                        # 퇴근행의 셀을 먼저 제거 (병합 전에 제거해야 함)
-                        self.table.setItem(departure_row, col, None)
-                        # 출근행과 퇴근행 병합 (2행, 1열)
-                        self.table.setSpan(arrival_row, col, 2, 1)
-                elif day in records_dict:
-                    record = records_dict[day]
-                    leave_type = record.get('leave_type')
-                    # leave_type이 병합 대상 텍스트 중 하나인 경우
-                    if leave_type in merge_texts:
-                        # 출근행의 셀을 가져와서 병합
-                        if arrival_item:
-                            # 퇴근행의 셀을 먼저 제거 (병합 전에 제거해야 함)
-                            if departure_item:
-                                self.table.setItem(departure_row, col, None)
-                            # 출근행과 퇴근행 병합 (2행, 1열)
-                            self.table.setSpan(arrival_row, col, 2, 1)
-            
-            # 입사일 이전 날짜에 대해 병합 및 사선 처리
-            if hire_date:
-                for day in range(1, days_in_month + 1):
-                    try:
-                        current_date = datetime(year, month, day).date()
-                        # 입사일 이전 날짜인 경우만 대각선 처리 (입사일 당일은 제외)
-                        # 예: 11월 25일 입사 → 11월 1일~24일만 대각선, 12월 1일 이후는 대각선 없음
-                        if current_date < hire_date:
-                            col = 2 + day  # 3번 컬럼부터 시작
-                            
-                            # 이미 병합된 셀인지 확인 (rowSpan이 2 이상이면 이미 병합됨)
-                            if self.table.rowSpan(arrival_row, col) >= 2:
-                                # 이미 병합된 경우 배경색만 설정
-                                arrival_item = self.table.item(arrival_row, col)
-                                if arrival_item:
-                                    arrival_item.setBackground(QColor("#E8E8E8"))
-                                continue
-                            
-                            # 출근행의 셀 확인
-                            arrival_item = self.table.item(arrival_row, col)
-                            if not arrival_item:
-                                # 셀이 없으면 빈 셀 생성
-                                arrival_item = QTableWidgetItem("")
-                                arrival_item.setBackground(QColor("#E8E8E8"))
-                                self.table.setItem(arrival_row, col, arrival_item)
-                            else:
-                                # 배경색 설정 (연한 회색)
-                                arrival_item.setBackground(QColor("#E8E8E8"))
-                            
-                            # 출근행과 퇴근행 병합 (2행, 1열)
-                            self.table.setSpan(arrival_row, col, 2, 1)
-                            
-                            # 퇴근행의 셀 제거
-                            departure_item = self.table.item(departure_row, col)
-                            if departure_item:
-                                self.table.setItem(departure_row, col, None)
-                            
-                            # 사선을 그릴 셀 추가
-                            diagonal_delegate.add_target_cell(arrival_row, col)
-                    except ValueError:
-                        pass  # 유효하지 않은 날짜는 무시
-            
-            # 퇴사일 이후 날짜에 대해 병합 및 사선 처리
-            if resignation_date:
-                for day in range(1, days_in_month + 1):
-                    try:
-                        current_date = datetime(year, month, day).date()
-                        # 퇴사일 이후 날짜인 경우만 대각선 처리 (퇴사일 당일은 제외)
-                        # 예: 12월 8일 퇴사 → 12월 9일부터 대각선
-                        if current_date > resignation_date:
-                            col = 2 + day  # 3번 컬럼부터 시작
-                            
-                            # 이미 병합된 셀인지 확인 (rowSpan이 2 이상이면 이미 병합됨)
-                            if self.table.rowSpan(arrival_row, col) >= 2:
-                                # 이미 병합된 경우 배경색만 설정
-                                arrival_item = self.table.item(arrival_row, col)
-                                if arrival_item:
-                                    arrival_item.setBackground(QColor("#E8E8E8"))
-                                else:
-                                    # 셀이 없으면 빈 셀 생성
-                                    arrival_item = QTableWidgetItem("")
-                                    arrival_item.setBackground(QColor("#E8E8E8"))
-                                    self.table.setItem(arrival_row, col, arrival_item)
-                                # 사선을 그릴 셀 추가
-                                diagonal_delegate.add_target_cell(arrival_row, col)
-                                continue
-                            
-                            # 출근행의 셀 확인
-                            arrival_item = self.table.item(arrival_row, col)
-                            if not arrival_item:
-                                # 셀이 없으면 빈 셀 생성
-                                arrival_item = QTableWidgetItem("")
-                                arrival_item.setBackground(QColor("#E8E8E8"))
-                                self.table.setItem(arrival_row, col, arrival_item)
-                            else:
-                                # 배경색 설정 (연한 회색)
-                                arrival_item.setBackground(QColor("#E8E8E8"))
-                            
-                            # 출근행과 퇴근행 병합 (2행, 1열)
-                            self.table.setSpan(arrival_row, col, 2, 1)
-                            
-                            # 퇴근행의 셀 제거
-                            departure_item = self.table.item(departure_row, col)
-                            if departure_item:
-                                self.table.setItem(departure_row, col, None)
-                            
-                            # 사선을 그릴 셀 추가
-                            diagonal_delegate.add_target_cell(arrival_row, col)
-                    except ValueError:
-                        pass  # 유효하지 않은 날짜는 무시
-            
-            # 퇴사자이고 체크박스가 OFF일 경우 출근행과 퇴근행 숨김 처리
-            if is_active != 1 and not show_inactive:
-                # 모든 병합 해제 (숨기기 전에 병합을 해제해야 완전히 숨김 처리됨)
-                summary_start = 3 + 31  # 3(기본) + 31(날짜)
-                
-                # 직급, 이름 컬럼 병합 해제
-                self.table.setSpan(arrival_row, 0, 1, 1)
-                self.table.setSpan(arrival_row, 1, 1, 1)
-                
-                # 요약 컬럼들 병합 해제
-                for col_idx in range(summary_start, summary_start + 6):
-                    if self.table.rowSpan(arrival_row, col_idx) >= 2:
-                        self.table.setSpan(arrival_row, col_idx, 1, 1)
-                
-                # 날짜 컬럼들의 병합 해제
-                for day in range(1, days_in_month + 1):
-                    col = 2 + day
-                    if self.table.rowSpan(arrival_row, col) >= 2:
-                        self.table.setSpan(arrival_row, col, 1, 1)
-                
-                # 행 숨김 처리
-                self.table.setRowHidden(arrival_row, True)
-                self.table.setRowHidden(departure_row, True)
-            else:
-                # 표시되는 직원이 있으면 해당 부서의 구분자 행도 표시
-                for sep_info in separator_rows:
-                    if sep_info['dept'] == dept:
-                        sep_info['has_visible_employee'] = True
-                        break
-            
-            # 다음 직원을 위한 행 번호 증가
-            employee_row_number += 1
-        
-        # 모든 구분자 행 처리: 표시되는 직원이 없는 부서의 구분자 행 숨김
-        for sep_info in separator_rows:
-            if not sep_info['has_visible_employee']:
-                # 구분자 행의 병합 해제 (숨기기 전에 병합을 해제해야 완전히 숨김 처리됨)
-                sep_row = sep_info['row']
-                # 구분자 행은 모든 컬럼에 걸쳐 병합되어 있으므로 병합 해제
-                if self.table.columnSpan(sep_row, 0) > 1:
-                    self.table.setSpan(sep_row, 0, 1, 1)
-                # 행 숨김 처리
-                self.table.setRowHidden(sep_row, True)
+            employee_rows.append(first_row + len(rows))
+            # 출근 행에만 번호 표시 (퇴근 행은 공란)
+            rows.extend(model.employee_rows(emp, employee_index + 1, grid))
+            if emp[6] == 1 or show_inactive:
+                visible_departments.add(dept)
+        model.append_rows(rows)
+        
+        table.setUpdatesEnabled(False)
+        try:
+            # 퇴사자이고 체크박스가 OFF일 경우 출근행과 퇴근행 숨김 (병합 없이)
+            for emp, arrival_row in zip(employees, employee_rows):
+                if emp[6] != 1 and not show_inactive:
+                    table.setRowHidden(arrival_row, True)
+                    table.setRowHidden(arrival_row + 1, True)
+            # 구분자 행: 표시되는 직원이 없으면 숨김
+            for dept, separator_row in separator_rows:
+                if dept not in visible_departments:
+                    table.setRowHidden(separator_row, True)
+            # 직급, 이름, 요약 컬럼, 병합 대상 날짜는 출근/퇴근 행 병합 (구분자 행은 모든 컬럼에 걸쳐 병합)
+            table.apply_spans(range(first_row, model.rowCount()))
+        finally:
+            table.setUpdatesEnabled(True)
+        
+        # 직원별 행 위치 (다른 탭 변경 시 해당 직원 행만 갱신)
+        self._month_rows = {emp[0]: (arrival_row, emp, emp[6] != 1 and not show_inactive)
+                            for emp, arrival_row in zip(employees, employee_rows)}
+        self._month_rows_period = (year, month)
         
         # 재직인원 수 계산 (구분자 행 제외, 활성 직원만 카운트)
         active_employee_count = sum(1 for emp in employees if emp[6] == 1)  # emp[6]은 is_active
         if hasattr(self, 'employee_count_label'):
             self.employee_count_label.setText(f"재직인원: {active_employee_count}명")
+    
+    def _patch_rows(self, employee_ids):
+        """표시 중인 월에서 해당 직원의 출근/퇴근 행만 다시 조회/표시"""
+        year, month = self._selected_period()
+        if self._month_rows_period != (year, month) or self._month_loader.is_busy():
+            self.request_refresh()
+            return
+        targets = [self._month_rows[emp_id] for emp_id in employee_ids if emp_id in self._month_rows]
+        if not targets:
+            return
+        try:
+            with self.db.connection() as conn:
+                grid = MonthGrid.load(conn.cursor(), year, month,
+                                      [(emp[0], emp[4], emp[7]) for arrival_row, emp, hidden in targets],
+                                      only_listed=True, rules=self.calculator.rules,
+                                      leave_registry=self.calculator.leave_registry)
+        except Exception as e:
+            logger.exception("출퇴근 행 갱신 오류")
+            return
         
-        # 모든 직원 처리 완료 후 델리게이트 적용
-        if diagonal_delegate.target_cells:
-            self.table.setItemDelegate(diagonal_delegate)
+        for arrival_row, emp, hidden in targets:
+            self.month_model.set_employee_grid(arrival_row, grid)
+            # 병합 대상 날짜가 바뀌었을 수 있으므로 날짜 셀 병합을 다시 설정
+            self.table.refresh_date_spans(arrival_row)
+    
     
     def on_cell_double_clicked(self, row, col):
         """셀 더블클릭 이벤트 - 시간 편집 (여러 셀 선택 지원)"""
@@ -5851,140 +3544,159 @@ class AttendanceManagementGUI(QWidget):
             emp_id = data.get('emp_id')
             day = data.get('day')
             category = data.get('category')
-            
+            
+            if not all([emp_id, day, category]):
+                return
+            
+            # 붙여넣기/삭제 중이면 모아 두었다가 한 번에 반영
+            if self._journal_cell_edit(item, row, col):
+                return
+            
+            # emp_id가 유효한지 확인 (퇴사자 포함 - 조회한 월의 직원 목록 기준)
+            if emp_id not in self._month_rows:
+                QMessageBox.warning(self, "오류", "유효하지 않은 직원 ID입니다.")
+                return
+            
+            self._record_cell_edit(item, emp_id, day, category)
+        except Exception as e:
+            # 최상위 예외 처리 - 예상치 못한 오류 발생 시
+            logger.exception("셀 편집 처리 중 오류 발생")
+    
+    def _flush_cell_edits(self, items):
+        """붙여넣기/삭제로 바뀐 셀들을 변경 사항(pending_changes)에 한 번에 반영"""
+        # 글자색 변경으로 다시 발생하는 itemChanged는 무시 (같은 값을 다시 기록할 뿐)
+        self.table.blockSignals(True)
+        try:
+            self._record_cell_edits(items)
+        finally:
+            self.table.blockSignals(False)
+    
+    def _record_cell_edits(self, items):
+        """셀마다 pending_changes에 기록 (직원 확인은 조회한 월의 직원 목록 기준, 경고는 한 번만)
+        
+        붙여넣은 블록의 값은 time_input_minutes로 한 번에 해석합니다 (서로 다른 값마다 한 번).
+        """
+        invalid_count = 0
+        cells = []
+        for item in items:
+            try:
+                data = item.data(Qt.UserRole)
+            except RuntimeError:
+                continue  # 그 사이 삭제된 셀
+            if not data or not isinstance(data, dict):
+                continue
+            emp_id = data.get('emp_id')
+            day = data.get('day')
+            category = data.get('category')
             if not all([emp_id, day, category]):
-                return
-            
-            # emp_id가 유효한지 확인 (퇴사자 포함 - is_active와 관계없이 확인)
-            conn_check = self.db.get_connection()
-            cursor_check = conn_check.cursor()
+                continue
+            if emp_id not in self._month_rows:
+                invalid_count += 1
+                continue
+            cells.append((item, emp_id, day, category, item.text().strip()))
+        
+        block_minutes = time_input_minutes([text for *_, text in cells])
+        rules = self.calculator.rules if cells else None
+        for (item, emp_id, day, category, text), minutes in zip(cells, block_minutes):
+            parsed = (format_minutes(minutes), int(minutes)) if minutes >= 0 else (text, None)
             try:
-                cursor_check.execute("SELECT id FROM employees WHERE id = ?", (emp_id,))
-                if not cursor_check.fetchone():
-                    conn_check.close()
-                    QMessageBox.warning(self, "오류", "유효하지 않은 직원 ID입니다.")
-                    return
+                self._record_cell_edit(item, emp_id, day, category, parsed, rules)
             except Exception as e:
-                conn_check.close()
-                QMessageBox.warning(self, "오류", f"직원 정보 확인 중 오류 발생: {str(e)}")
-                return
-            finally:
-                conn_check.close()
-            
-            # 년도와 월 가져오기
-            year = self.year_combo.currentData()
-            month = self.month_combo.currentData()
-            if year is None:
-                year = datetime.now().year
-            if month is None:
-                month = datetime.now().month
-            
-            try:
-                work_date = datetime(year, month, day).date()
-            except ValueError:
-                return
-            
-            # 입력된 값 가져오기
-            new_value = item.text().strip()
-            input_text = None  # 연월차 관리대장 업데이트를 위해 변수 초기화
-            
-            # 빈 값 처리 - pending_changes에 저장 (저장 버튼에서 처리)
-            if not new_value:
-                # 빈 값이면 기록 삭제를 pending_changes에 저장
-                change_key = (emp_id, work_date, category)
-                self.pending_changes[change_key] = {
-                    'new_value': '',
-                    'formatted_time': '',
-                    'is_time': False,
-                    'item': item,
-                    'is_delete': True  # 삭제 플래그
-                }
-                
-                return
+                logger.exception("셀 편집 처리 중 오류 발생")
+        if invalid_count:
+            QMessageBox.warning(self, "오류", f"유효하지 않은 직원 ID입니다. ({invalid_count}개 셀 제외)")
+    
+    def _record_cell_edit(self, item, emp_id, day, category, parsed=None, rules=None):
+        """셀 값 하나를 pending_changes에 기록 (시간이면 기준 시각에 따라 글자색 표시)
         
-            # 시간 형식 변환 (예: 1000 -> 10:00)
-            def format_time_input(time_str):
-                time_str = time_str.strip()
-                if ':' in time_str:
-                    return time_str
-                if time_str.isdigit():
-                    if len(time_str) == 4:
-                        return f"{time_str[:2]}:{time_str[2:]}"
-                    elif len(time_str) == 3:
-                        return f"0{time_str[0]}:{time_str[1:]}"
-                return time_str
-            
-            formatted_time = format_time_input(new_value)
-            
-            # 시간 형식인지 확인 (':' 포함 또는 숫자만)
-            is_time = ':' in formatted_time or (formatted_time.isdigit() and len(formatted_time) >= 3)
-            
-            # 시간 형식인 경우 색상 업데이트만 수행
-            if is_time:
-                try:
-                    # 시간 형식 변환 시도
-                    if ':' in formatted_time:
-                        time_obj = datetime.strptime(formatted_time, "%H:%M").time()
-                    elif formatted_time.isdigit() and len(formatted_time) == 4:
-                        time_obj = datetime.strptime(f"{formatted_time[:2]}:{formatted_time[2:]}", "%H:%M").time()
-                    else:
-                        is_time = False
-                    
-                    if is_time:
-                        # 색상 업데이트만 수행
-                        if category == '출근':
-                            # 08시 이전 출근 - 초록색
-                            if time_obj < datetime.strptime("08:00", "%H:%M").time():
-                                item.setForeground(QColor("#008000"))
-                            # 09시 이후 지각 - 빨간색
-                            elif time_obj > datetime.strptime("09:00", "%H:%M").time():
-                                item.setForeground(QColor("#FF0000"))
-                            else:
-                                # 08시~09시 사이 또는 정확히 09시 - 검정색 (기본 색상)
-                                item.setForeground(QColor("#000000"))
-                        else:  # 퇴근
-                            # 20시 이후 야근 - 파랑색
-                            if time_obj >= datetime.strptime("20:00", "%H:%M").time():
-                                item.setForeground(QColor("#0000FF"))
-                            else:
-                                # 20시 이전 - 검정색 (기본 색상)
-                                item.setForeground(QColor("#000000"))
-                except:
-                    is_time = False
-            
-            # 모든 변경사항을 pending_changes에 저장 (저장 버튼에서 일괄 처리)
+        parsed: 이미 해석한 (표시 텍스트, 분 또는 None) - 없으면 normalize_time_input으로 해석
+        rules: 근무 규칙 (여러 셀을 기록할 때 한 번 읽은 값, 없으면 calculator.rules)
+        """
+        # 년도와 월 가져오기
+        year = self.year_combo.currentData()
+        month = self.month_combo.currentData()
+        if year is None:
+            year = datetime.now().year
+        if month is None:
+            month = datetime.now().month
+        
+        try:
+            work_date = datetime(year, month, day).date()
+        except ValueError:
+            return
+        
+        # 입력된 값 가져오기
+        new_value = item.text().strip()
+        input_text = None  # 연월차 관리대장 업데이트를 위해 변수 초기화
+        
+        # 빈 값 처리 - pending_changes에 저장 (저장 버튼에서 처리)
+        if not new_value:
+            # 빈 값이면 기록 삭제를 pending_changes에 저장
             change_key = (emp_id, work_date, category)
             self.pending_changes[change_key] = {
-                'new_value': new_value,
-                'formatted_time': formatted_time,
-                'is_time': is_time,
-                'item': item
+                'new_value': '',
+                'formatted_time': '',
+                'is_time': False,
+                'item': item,
+                'is_delete': True  # 삭제 플래그
             }
             
-            # 텍스트 입력 시 색상을 검정색으로 원복 (시간이 아닌 경우)
-            if not is_time and (category == '출근' or category == '퇴근'):
-                item.setForeground(QColor("#000000"))
-            
-            # 즉시 저장하지 않고 pending_changes에만 저장 (저장 버튼에서 일괄 처리)
-        except Exception as e:
-            # 최상위 예외 처리 - 예상치 못한 오류 발생 시
-            import traceback
-            print(f"셀 편집 처리 중 오류 발생: {str(e)}")
-            print(traceback.format_exc())
+            return
+    
+        # 시간 형식 변환 (예: 1000 -> 10:00, 8:30:00 -> 08:30)
+        formatted_time, minutes = parsed if parsed is not None else normalize_time_input(new_value)
+        is_time = minutes is not None
+        
+        # 시간 형식인 경우 색상 업데이트만 수행
+        if is_time:
+            # 기준 시각은 근무 규칙의 해당 직원/날짜 값, 분 단위
+            early_before, late_after, night_from = (rules or self.calculator.rules).thresholds(emp_id, work_date)
+            if category == '출근':
+                # 기준(기본 08시) 이전 출근 - 초록색
+                if minutes < early_before:
+                    item.setForeground(QColor("#008000"))
+                # 기준(기본 09시) 이후 지각 - 빨간색
+                elif minutes > late_after:
+                    item.setForeground(QColor("#FF0000"))
+                else:
+                    # 두 기준 사이 또는 정확히 지각 기준 - 검정색 (기본 색상)
+                    item.setForeground(QColor("#000000"))
+            else:  # 퇴근
+                # 기준(기본 20시) 이후 야근 - 파랑색
+                if minutes >= night_from:
+                    item.setForeground(QColor("#0000FF"))
+                else:
+                    # 20시 이전 - 검정색 (기본 색상)
+                    item.setForeground(QColor("#000000"))
+        
+        # 모든 변경사항을 pending_changes에 저장 (저장 버튼에서 일괄 처리)
+        change_key = (emp_id, work_date, category)
+        self.pending_changes[change_key] = {
+            'new_value': new_value,
+            'formatted_time': formatted_time,
+            'is_time': is_time,
+            'item': item
+        }
+        
+        # 텍스트 입력 시 색상을 검정색으로 원복 (시간이 아닌 경우)
+        if not is_time and (category == '출근' or category == '퇴근'):
+            item.setForeground(QColor("#000000"))
     
     def sync_leave_records(self):
-        """출퇴근 관리대장의 연차/반차 기록을 leave_records에 동기화"""
+        """출퇴근 관리대장의 연차 차감 구분(연차/반차/휴가 등) 기록을 leave_records에 동기화"""
+        # 차감량은 근태 구분 등록부 기준
+        leave_registry = self.calculator.leave_registry
         conn = self.db.get_connection()
         cursor = conn.cursor()
         
         try:
-            # attendance_records에서 연차/반차 기록 조회
-            cursor.execute("""
+            # attendance_records에서 차감 구분 기록 조회 (기본 구분은 부분 인덱스 사용)
+            cursor.execute(f"""
                 SELECT ar.employee_id, ar.work_date, ar.leave_type, ar.remarks,
                        e.name
                 FROM attendance_records ar
                 JOIN employees e ON ar.employee_id = e.id
-                WHERE ar.leave_type IN ('연차', '반차', '휴가')
+                WHERE {leave_registry.deduction_condition('ar.leave_type')}
                 ORDER BY ar.work_date
             """)
             attendance_records = cursor.fetchall()
@@ -5993,8 +3705,8 @@ class AttendanceManagementGUI(QWidget):
             updated_count = 0
             skipped_count = 0
             
-            # 반차 중복 방지를 위한 집합 (하루에 한 번만 기록)
-            반차_processed = set()
+            # 중복 방지를 위한 집합 (하루에 한 번만 기록)
+            processed = set()
             
             for emp_id, work_date, leave_type, remarks, emp_name in attendance_records:
                 if isinstance(work_date, str):
@@ -6003,18 +3715,12 @@ class AttendanceManagementGUI(QWidget):
                 year = work_date.year
                 month = work_date.month
                 
-                # 반차의 경우 중복 방지
-                if leave_type == '반차':
-                    반차_key = (emp_id, work_date)
-                    if 반차_key in 반차_processed:
-                        skipped_count += 1
-                        continue
-                    반차_processed.add(반차_key)
-                    leave_amount = 0.5
-                elif leave_type in ['연차', '휴가']:
-                    leave_amount = 1.0
-                else:
+                key = (emp_id, work_date)
+                if key in processed:
+                    skipped_count += 1
                     continue
+                processed.add(key)
+                leave_amount = leave_registry.deduction(leave_type)
                 
                 # 기존 leave_records 확인
                 cursor.execute("""
@@ -6024,10 +3730,7 @@ class AttendanceManagementGUI(QWidget):
                 existing = cursor.fetchone()
                 
                 if existing:
-                    # 기존 기록이 있으면 업데이트 (leave_amount가 다를 수 있음)
-                    # 반차의 경우 항상 0.5로 강제 업데이트
-                    if leave_type == '반차':
-                        leave_amount = 0.5
+                    # 기존 기록이 있으면 업데이트 (차감량을 등록부 값으로 맞춤)
                     cursor.execute("""
                         UPDATE leave_records
                         SET leave_amount = ?, year = ?, month = ?
@@ -6056,9 +3759,8 @@ class AttendanceManagementGUI(QWidget):
             
             QMessageBox.information(self, "동기화 완료", message)
             
-            # 연월차 관리대장도 새로고침
-            if self.leave_gui:
-                self.leave_gui.refresh_data()
+            # 연월차 관리대장에 알림 (전체 재계산)
+            self.change_bus.leave_changed(source=self)
             
         except Exception as e:
             QMessageBox.critical(self, "오류", f"동기화 중 오류 발생: {str(e)}")
@@ -6095,22 +3797,6 @@ class AttendanceManagementGUI(QWidget):
         
         layout.addWidget(QLabel("시간 형식: HH:MM (예: 09:00) 또는 휴가 유형 (예: 연차, 반차, 공휴)"))
         
-        def format_time_input(time_str):
-            """시간 입력 형식 변환 (예: 1000 -> 10:00)"""
-            time_str = time_str.strip()
-            if ':' in time_str:
-                return time_str
-            if time_str.isdigit():
-                if len(time_str) == 4:
-                    return f"{time_str[:2]}:{time_str[2:]}"
-                elif len(time_str) == 3:
-                    return f"0{time_str[0]}:{time_str[1:]}"
-                elif len(time_str) == 2:
-                    return f"00:{time_str}"
-                elif len(time_str) == 1:
-                    return f"00:0{time_str}"
-            return time_str
-        
         def save_time():
             try:
                 time_str = time_entry.text().strip()
@@ -6128,54 +3814,45 @@ class AttendanceManagementGUI(QWidget):
                     
                     QMessageBox.information(self, "성공", "기록이 삭제되었습니다.")
                     dialog.accept()
-                    self.refresh_data()
+                    self._apply_attendance_change([emp_id], work_date, work_date)
                     return
                 
-                time_str = format_time_input(time_str)
+                # 시간 형식 변환 (예: 1000 -> 10:00)
+                time_str, minutes = normalize_time_input(time_str)
                 
                 arrival_time = None
                 departure_time = None
                 leave_type = None
                 
-                if ':' in time_str and len(time_str) <= 5:
-                    try:
-                        time_obj = datetime.strptime(time_str, "%H:%M").time()
-                        if category == "출근":
-                            arrival_time = time_obj
-                            # 기존 퇴근 시간 유지
-                            conn = self.db.get_connection()
-                            cursor = conn.cursor()
-                            cursor.execute("""
-                                SELECT departure_time FROM attendance_records
-                                WHERE employee_id = ? AND work_date = ?
-                            """, (emp_id, work_date))
-                            existing = cursor.fetchone()
-                            if existing and existing[0]:
-                                try:
-                                    departure_time = datetime.strptime(existing[0], "%H:%M:%S").time()
-                                except:
-                                    pass
-                            conn.close()
-                        else:
-                            departure_time = time_obj
-                            # 기존 출근 시간 유지
-                            conn = self.db.get_connection()
-                            cursor = conn.cursor()
-                            cursor.execute("""
-                                SELECT arrival_time FROM attendance_records
-                                WHERE employee_id = ? AND work_date = ?
-                            """, (emp_id, work_date))
-                            existing = cursor.fetchone()
-                            if existing and existing[0]:
-                                try:
-                                    arrival_time = datetime.strptime(existing[0], "%H:%M:%S").time()
-                                except:
-                                    pass
-                            conn.close()
-                    except ValueError:
-                        QMessageBox.critical(self, "오류", "시간 형식이 올바르지 않습니다. (HH:MM 형식)")
-                        return
-                elif time_str in ['연차', '반차', '반반차', '공휴', '박람회', '민방위', '출장', '교육', '추석', '설날']:
+                if minutes is not None:
+                    time_obj = input_time(time_str)
+                    if category == "출근":
+                        arrival_time = time_obj
+                        # 기존 퇴근 시간 유지
+                        conn = self.db.get_connection()
+                        cursor = conn.cursor()
+                        cursor.execute("""
+                            SELECT departure_time FROM attendance_records
+                            WHERE employee_id = ? AND work_date = ?
+                        """, (emp_id, work_date))
+                        existing = cursor.fetchone()
+                        if existing and existing[0]:
+                            departure_time = input_time(existing[0])
+                        conn.close()
+                    else:
+                        departure_time = time_obj
+                        # 기존 출근 시간 유지
+                        conn = self.db.get_connection()
+                        cursor = conn.cursor()
+                        cursor.execute("""
+                            SELECT arrival_time FROM attendance_records
+                            WHERE employee_id = ? AND work_date = ?
+                        """, (emp_id, work_date))
+                        existing = cursor.fetchone()
+                        if existing and existing[0]:
+                            arrival_time = input_time(existing[0])
+                        conn.close()
+                elif time_str in self.calculator.leave_registry.keywords:
                     leave_type = time_str
                 else:
                     QMessageBox.critical(self, "오류", "시간 형식(HH:MM) 또는 휴가 유형을 입력해주세요.")
@@ -6188,7 +3865,7 @@ class AttendanceManagementGUI(QWidget):
                 
                 QMessageBox.information(self, "성공", "시간이 수정되었습니다.")
                 dialog.accept()
-                self.refresh_data()
+                self._apply_attendance_change([emp_id], work_date, work_date)
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"수정 중 오류 발생: {str(e)}")
         
@@ -6224,18 +3901,6 @@ class AttendanceManagementGUI(QWidget):
         time_layout.addWidget(time_entry)
         layout.addLayout(time_layout)
         
-        def format_time_input(time_str):
-            """시간 입력 형식 변환 (예: 1000 -> 10:00)"""
-            time_str = time_str.strip()
-            if ':' in time_str:
-                return time_str
-            if time_str.isdigit():
-                if len(time_str) == 4:
-                    return f"{time_str[:2]}:{time_str[2:]}"
-                elif len(time_str) == 3:
-                    return f"0{time_str[0]}:{time_str[1:]}"
-            return time_str
-        
         def save_time():
             try:
                 time_str = time_entry.text().strip()
@@ -6283,15 +3948,16 @@ class AttendanceManagementGUI(QWidget):
                     if deleted_count > 0:
                         QMessageBox.information(dialog, "완료", f"{deleted_count}개 셀의 데이터가 삭제되었습니다.")
                     dialog.accept()
-                    self.refresh_data()
+                    self._apply_attendance_change([cell['emp_id'] for cell in valid_cells],
+                                                  *self._month_bounds(base_year, base_month))
                     return
                 
-                # 시간 형식 변환
-                formatted_time = format_time_input(time_str)
+                # 시간 형식 변환 (예: 1000 -> 10:00)
+                formatted_time, minutes = normalize_time_input(time_str)
                 
                 # 시간 또는 휴가 유형인지 확인
-                is_time = ':' in formatted_time
-                is_leave_type = formatted_time in ['연차', '반차', '반반차', '공휴', '박람회', '민방위', '출장', '교육', '추석', '설날']
+                is_time = minutes is not None
+                is_leave_type = formatted_time in self.calculator.leave_registry.keywords
                 
                 if not is_time and not is_leave_type:
                     QMessageBox.warning(dialog, "경고", "올바른 시간 형식(HH:MM) 또는 휴가 유형을 입력해주세요.")
@@ -6314,671 +3980,127 @@ class AttendanceManagementGUI(QWidget):
                     # 셀의 날짜 정보를 사용할 수 없으므로 현재 선택된 월 사용
                     
                     try:
-                        work_date = datetime(year, month, cell['day']).date()
-                    except ValueError:
-                        continue
-                    
-                    # 기존 기록 확인
-                    cursor.execute("""
-                        SELECT arrival_time, departure_time, leave_type
-                        FROM attendance_records
-                        WHERE employee_id = ? AND work_date = ?
-                    """, (cell['emp_id'], work_date))
-                    existing = cursor.fetchone()
-                    
-                    if is_time:
-                        # 시간 형식인 경우
-                        try:
-                            time_obj = datetime.strptime(formatted_time, "%H:%M").time()
-                        except:
-                            continue
-                        
-                        if cell['category'] == '출근':
-                            arrival_time = time_obj
-                            departure_time = None
-                            if existing and existing[1]:
-                                try:
-                                    departure_time = datetime.strptime(existing[1], "%H:%M:%S").time()
-                                except:
-                                    pass
-                        else:  # 퇴근
-                            arrival_time = None
-                            departure_time = time_obj
-                            if existing and existing[0]:
-                                try:
-                                    arrival_time = datetime.strptime(existing[0], "%H:%M:%S").time()
-                                except:
-                                    pass
-                        
-                        self.calculator.process_attendance_record(
-                            cell['emp_id'], work_date, arrival_time, departure_time,
-                            None, ""
-                        )
-                    else:
-                        # 휴가 유형인 경우
-                        self.calculator.process_attendance_record(
-                            cell['emp_id'], work_date, None, None,
-                            formatted_time, ""
-                        )
-                    
-                    updated_count += 1
-                
-                conn.commit()
-                conn.close()
-                
-                QMessageBox.information(dialog, "완료", f"{updated_count}개 셀이 수정되었습니다.")
-                dialog.accept()
-                self.refresh_data()
-                
-            except Exception as e:
-                QMessageBox.critical(dialog, "오류", f"수정 중 오류 발생: {str(e)}")
-        
-        # Enter 키로 저장
-        time_entry.returnPressed.connect(save_time)
-        
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(save_time)
-        button_box.rejected.connect(dialog.reject)
-        layout.addWidget(button_box)
-        
-        time_entry.setFocus()
-        dialog.exec()
-    
-    def upload_excel(self):
-        """엑셀 파일 업로드 - 개선된 로직"""
-        file_path, _ = QFileDialog.getOpenFileName(self, "엑셀 파일 선택", "", "Excel files (*.xlsx *.xls);;All files (*.*)")
-        if not file_path:
-            return
-        
-        try:
-            file_ext = Path(file_path).suffix.lower()
-            if file_ext == '.xls':
-                try:
-                    df = pd.read_excel(file_path, header=None, engine='xlrd')
-                except Exception as e:
-                    QMessageBox.critical(self, "오류", f".xls 파일 읽기 오류: {str(e)}\n\nxlrd 라이브러리가 필요합니다: pip install xlrd>=2.0.1")
-                    return
-            else:
-                df = pd.read_excel(file_path, header=None, engine='openpyxl')
-            
-            # 헤더 찾기
-            name_col_idx = None
-            category_col_idx = None
-            date_cols = {}
-            
-            for idx, row in df.iterrows():
-                for col_idx, cell in enumerate(row):
-                    cell_str = str(cell).strip() if pd.notna(cell) else ""
-                    if '이름' in cell_str or 'name' in cell_str.lower():
-                        name_col_idx = col_idx
-                    if '구분' in cell_str or 'category' in cell_str.lower():
-                        category_col_idx = col_idx
-                    try:
-                        day = int(cell_str)
-                        if 1 <= day <= 31:
-                            date_cols[day] = col_idx
-                    except:
-                        pass
-                
-                if name_col_idx is not None and len(date_cols) > 0:
-                    break
-            
-            if name_col_idx is None:
-                QMessageBox.critical(self, "오류", "엑셀 파일에서 '이름' 컬럼을 찾을 수 없습니다.")
-                return
-            
-            if not date_cols:
-                QMessageBox.critical(self, "오류", "엑셀 파일에서 날짜 컬럼(1~31)을 찾을 수 없습니다.")
-                return
-            
-            year = self.year_combo.currentData()
-            month = self.month_combo.currentData()
-            if year is None:
-                year = datetime.now().year
-            if month is None:
-                month = datetime.now().month
-            
-            from calendar import monthrange
-            days_in_month = monthrange(year, month)[1]
-            
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT id, name FROM employees")
-            employees = cursor.fetchall()
-            employee_dict = {name: emp_id for emp_id, name in employees}
-            # 전금희(지문) 매칭 처리
-            employee_dict['전금희(지문)'] = employee_dict.get('전금희', None)
-            if '전금희(지문)' in employee_dict and employee_dict['전금희(지문)'] is None:
-                # 전금희가 없으면 전금희(지문)도 None으로 설정
-                del employee_dict['전금희(지문)']
-            
-            records_added = 0
-            current_name = None
-            
-            def format_time_input(time_value):
-                """시간 형식 정규화: 다양한 입력 형식 -> HH:MM"""
-                # None이나 빈 값 처리
-                if time_value is None or (isinstance(time_value, str) and time_value.strip() == ''):
-                    return None
-                
-                # datetime.time 객체인 경우 (직접)
-                from datetime import time as dt_time
-                if isinstance(time_value, dt_time):
-                    return time_value.strftime("%H:%M")
-                
-                # datetime 객체인 경우
-                if isinstance(time_value, datetime):
-                    return time_value.time().strftime("%H:%M")
-                
-                # pandas Timestamp 객체인 경우
-                if hasattr(time_value, 'time'):
-                    try:
-                        time_obj = time_value.time()
-                        if isinstance(time_obj, dt_time):
-                            return time_obj.strftime("%H:%M")
-                        elif isinstance(time_obj, datetime):
-                            return time_obj.time().strftime("%H:%M")
-                    except:
-                        pass
-                
-                # pandas의 datetime64 타입 처리
-                try:
-                    if isinstance(time_value, pd.Timestamp):
-                        return time_value.to_pydatetime().time().strftime("%H:%M")
-                except:
-                    pass
-                
-                # 문자열로 변환
-                time_str = str(time_value).strip()
-                
-                # 이미 HH:MM 형식인 경우
-                if ':' in time_str:
-                    parts = time_str.split(':')
-                    if len(parts) >= 2:
-                        try:
-                            hour = int(parts[0])
-                            minute = int(parts[1])
-                            if 0 <= hour <= 23 and 0 <= minute <= 59:
-                                return f"{hour:02d}:{minute:02d}"
-                        except:
-                            pass
-                        # HH:MM:SS 형식
-                        if len(parts) >= 3:
-                            try:
-                                hour = int(parts[0])
-                                minute = int(parts[1])
-                                if 0 <= hour <= 23 and 0 <= minute <= 59:
-                                    return f"{hour:02d}:{minute:02d}"
-                            except:
-                                pass
-                
-                # 숫자 형식 (예: 1837 -> 18:37)
-                if time_str.isdigit():
-                    if len(time_str) == 4:
-                        try:
-                            hour = int(time_str[:2])
-                            minute = int(time_str[2:])
-                            if 0 <= hour <= 23 and 0 <= minute <= 59:
-                                return f"{hour:02d}:{minute:02d}"
-                        except:
-                            pass
-                    elif len(time_str) == 3:
-                        try:
-                            hour = int(time_str[0])
-                            minute = int(time_str[1:])
-                            if 0 <= hour <= 23 and 0 <= minute <= 59:
-                                return f"0{hour}:{minute:02d}"
-                        except:
-                            pass
-                
-                return time_str
-            
-            def parse_time(time_value):
-                """시간 값을 time 객체로 변환 (다양한 형식 지원)"""
-                if time_value is None:
-                    return None
-                
-                # datetime.time 객체인 경우 (직접)
-                from datetime import time as dt_time
-                if isinstance(time_value, dt_time):
-                    return time_value
-                
-                # datetime 객체인 경우
-                if isinstance(time_value, datetime):
-                    return time_value.time()
-                
-                # pandas Timestamp 객체인 경우
-                if hasattr(time_value, 'time'):
-                    try:
-                        time_obj = time_value.time()
-                        if isinstance(time_obj, dt_time):
-                            return time_obj
-                        elif isinstance(time_obj, datetime):
-                            return time_obj.time()
-                    except:
-                        pass
-                
-                # pandas의 datetime64 타입 처리
-                try:
-                    if isinstance(time_value, pd.Timestamp):
-                        return time_value.to_pydatetime().time()
-                except:
-                    pass
-                
-                # 문자열로 변환
-                time_str = format_time_input(time_value)
-                if time_str is None:
-                    return None
-                
-                # 여러 형식 시도
-                for fmt in ["%H:%M", "%H:%M:%S"]:
-                    try:
-                        return datetime.strptime(time_str, fmt).time()
-                    except:
-                        continue
-                
-                return None
-            
-            for idx, row in df.iterrows():
-                try:
-                    name_cell = str(row[name_col_idx]).strip() if pd.notna(row[name_col_idx]) else ""
-                    
-                    category_cell = ""
-                    if category_col_idx is not None:
-                        category_cell = str(row[category_col_idx]).strip() if pd.notna(row[category_col_idx]) else ""
-                    
-                    is_arrival = (category_cell == '출근')
-                    is_departure = (category_cell == '퇴근')
-                    
-                    if not is_arrival and not is_departure:
-                        continue
-                    
-                    if name_cell and name_cell != 'nan' and name_cell not in ['출근', '퇴근']:
-                        current_name = name_cell
-                    
-                    if current_name is None or current_name not in employee_dict:
-                        continue
-                    
-                    emp_id = employee_dict[current_name]
-                    
-                    # 출근 행을 찾으면, 다음 행(퇴근 행)도 함께 확인
-                    next_row = None
-                    next_row_category = ""
-                    if is_arrival and idx + 1 < len(df):
-                        try:
-                            next_row = df.iloc[idx + 1]
-                            if category_col_idx is not None:
-                                next_row_category = str(next_row[category_col_idx]).strip() if pd.notna(next_row[category_col_idx]) else ""
-                        except:
-                            pass
-                    
-                    # 출근 행이면서 다음 행이 퇴근인 경우, 함께 처리
-                    if is_arrival and next_row_category == '퇴근':
-                            # 출근 행과 퇴근 행을 함께 처리
-                            for day in range(1, days_in_month + 1):
-                                if day not in date_cols:
-                                    continue
-                                
-                                col_idx = date_cols[day]
-                                arrival_cell_value = row[col_idx]
-                                departure_cell_value = next_row[col_idx]
-                                
-                                # 출근 시간 파싱
-                                arrival_time = None
-                                leave_type = None
-                                
-                                if not (pd.isna(arrival_cell_value) or (isinstance(arrival_cell_value, str) and arrival_cell_value.strip() == '')):
-                                    arrival_cell_time_value = arrival_cell_value
-                                    arrival_cell_str = format_time_input(arrival_cell_value)
-                                    
-                                    # 1단계: 원본 값 직접 파싱
-                                    arrival_time = parse_time(arrival_cell_time_value)
-                                    
-                                    # 2단계: 포맷된 문자열로 파싱 시도
-                                    if arrival_time is None and arrival_cell_str is not None:
-                                        if ':' in arrival_cell_str:
-                                            arrival_time = parse_time(arrival_cell_str)
-                                        elif arrival_cell_str in ['연차', '반차', '반반차', '공휴', '박람회', '민방위', '출장', '교육', '추석', '설날']:
-                                            leave_type = arrival_cell_str
-                                    
-                                    # 3단계: 원본 값의 문자열 표현으로 파싱 시도
-                                    if arrival_time is None and leave_type is None:
-                                        original_str = str(arrival_cell_value).strip()
-                                        if original_str and original_str != 'nan' and original_str != 'None':
-                                            arrival_time = parse_time(original_str)
-                                    
-                                    # 4단계: pandas의 경우 직접 타입 확인
-                                    if arrival_time is None and leave_type is None:
-                                        try:
-                                            if isinstance(arrival_cell_value, pd.Timestamp):
-                                                arrival_time = arrival_cell_value.to_pydatetime().time()
-                                            elif isinstance(arrival_cell_value, (float, int)):
-                                                if 0.0 <= arrival_cell_value < 1.0:
-                                                    total_seconds = int(arrival_cell_value * 86400)
-                                                    hours = total_seconds // 3600
-                                                    minutes = (total_seconds % 3600) // 60
-                                                    from datetime import time as dt_time
-                                                    arrival_time = dt_time(hours, minutes)
-                                        except:
-                                            pass
-                                
-                                # 퇴근 시간 파싱
-                                departure_time = None
-                                
-                                if not (pd.isna(departure_cell_value) or (isinstance(departure_cell_value, str) and departure_cell_value.strip() == '')):
-                                    departure_cell_time_value = departure_cell_value
-                                    departure_cell_str = format_time_input(departure_cell_value)
-                                    
-                                    # 1단계: 원본 값 직접 파싱
-                                    departure_time = parse_time(departure_cell_time_value)
-                                    
-                                    # 2단계: 포맷된 문자열로 파싱 시도
-                                    if departure_time is None and departure_cell_str is not None:
-                                        departure_time = parse_time(departure_cell_str)
-                                    
-                                    # 3단계: 원본 값의 문자열 표현으로 파싱 시도
-                                    if departure_time is None:
-                                        original_str = str(departure_cell_value).strip()
-                                        if original_str and original_str != 'nan' and original_str != 'None':
-                                            departure_time = parse_time(original_str)
-                                    
-                                    # 4단계: pandas의 경우 직접 타입 확인
-                                    if departure_time is None:
-                                        try:
-                                            if isinstance(departure_cell_value, pd.Timestamp):
-                                                departure_time = departure_cell_value.to_pydatetime().time()
-                                            elif isinstance(departure_cell_value, (float, int)):
-                                                if 0.0 <= departure_cell_value < 1.0:
-                                                    total_seconds = int(departure_cell_value * 86400)
-                                                    hours = total_seconds // 3600
-                                                    minutes = (total_seconds % 3600) // 60
-                                                    from datetime import time as dt_time
-                                                    departure_time = dt_time(hours, minutes)
-                                        except:
-                                            pass
-                                
-                                # 출근 시간이나 휴가 유형이 있는 경우만 처리 (각 날짜별로 처리)
-                                if arrival_time is not None or leave_type is not None or departure_time is not None:
-                                    try:
-                                        work_date = datetime(year, month, day).date()
-                                    except ValueError:
-                                        continue
-                                    
-                                    # 기존 데이터 확인 - 기존 데이터와 병합하여 저장
-                                    cursor.execute("""
-                                        SELECT arrival_time, departure_time, leave_type
-                                        FROM attendance_records
-                                        WHERE employee_id = ? AND work_date = ?
-                                    """, (emp_id, work_date))
-                                    existing = cursor.fetchone()
-                                    
-                                    # 기존(수동 입력) 데이터는 유지하고, 비어 있는 값만 엑셀 값으로 채운다
-                                    existing_arrival = None
-                                    existing_departure = None
-                                    existing_leave_type = None
-                                    
-                                    if existing:
-                                        existing_arrival, existing_departure, existing_leave_type = existing
-                                        # DB에는 "HH:MM:SS" 문자열로 저장되어 있으므로 time 객체로 변환
-                                        try:
-                                            if existing_arrival:
-                                                existing_arrival = datetime.strptime(existing_arrival, "%H:%M:%S").time()
-                                        except Exception:
-                                            existing_arrival = None
-                                        try:
-                                            if existing_departure:
-                                                existing_departure = datetime.strptime(existing_departure, "%H:%M:%S").time()
-                                        except Exception:
-                                            existing_departure = None
-                                    
-                                    # 기존 값이 있으면 그대로 두고, 없는 값만 엑셀 값으로 채운다
-                                    final_arrival = existing_arrival or arrival_time
-                                    final_departure = existing_departure or departure_time
-                                    final_leave_type = (
-                                        existing_leave_type if existing_leave_type not in (None, "")
-                                        else leave_type
-                                    )
-                                    
-                                    # 최종 값이 기존 값과 완전히 같다면 DB를 다시 쓰지 않는다
-                                    if (
-                                        not existing
-                                        or final_arrival != existing_arrival
-                                        or final_departure != existing_departure
-                                        or final_leave_type != existing_leave_type
-                                    ):
-                                        if (
-                                            final_arrival is not None
-                                            or final_departure is not None
-                                            or final_leave_type is not None
-                                        ):
-                                            # 수동 입력을 보존한 상태로 병합 결과 저장
-                                            self.calculator.process_attendance_record(
-                                                emp_id, work_date, final_arrival, final_departure,
-                                                final_leave_type, ""
-                                            )
-                                        records_added += 1
-                    
-                    # 출근 행을 처리했으므로 다음 행(퇴근 행)은 건너뛰기
-                    continue
+                        work_date = datetime(year, month, cell['day']).date()
+                    except ValueError:
+                        continue
                     
-                    # 출근 행이지만 다음 행이 퇴근이 아니거나, 퇴근 행인 경우 (기존 로직)
-                    for day in range(1, days_in_month + 1):
-                        if day not in date_cols:
-                            continue
-                        
-                        col_idx = date_cols[day]
-                        cell_value = row[col_idx]
+                    # 기존 기록 확인
+                    cursor.execute("""
+                        SELECT arrival_time, departure_time, leave_type
+                        FROM attendance_records
+                        WHERE employee_id = ? AND work_date = ?
+                    """, (cell['emp_id'], work_date))
+                    existing = cursor.fetchone()
                     
-                        # 빈 셀 처리: pd.isna 또는 빈 문자열이면 None
-                        if pd.isna(cell_value) or (isinstance(cell_value, str) and cell_value.strip() == ''):
-                            cell_str = None
-                            cell_time_value = None
-                        else:
-                            # 시간 값은 원본과 포맷된 문자열 모두 저장
-                            cell_time_value = cell_value
-                            cell_str = format_time_input(cell_value)
-                        
-                        try:
-                            work_date = datetime(year, month, day).date()
-                        except ValueError:
-                            continue
-                        
-                        # 각 날짜별로 출근/퇴근 데이터를 먼저 수집한 후 일괄 처리
-                        # 하지만 현재 구조에서는 각 행을 순차 처리하므로,
-                        # 출근 행과 퇴근 행을 각각 처리하되, 기존 데이터를 올바르게 병합해야 함
+                    if is_time:
+                        # 시간 형식인 경우
+                        time_obj = input_time(formatted_time)
                         
-                        if is_arrival:
+                        if cell['category'] == '출근':
+                            arrival_time = time_obj
+                            departure_time = None
+                            if existing and existing[1]:
+                                departure_time = input_time(existing[1])
+                        else:  # 퇴근
                             arrival_time = None
-                            leave_type = None
-                            
-                            if cell_time_value is not None:
-                                # 1단계: 원본 값 직접 파싱
-                                arrival_time = parse_time(cell_time_value)
-                                
-                                # 2단계: 포맷된 문자열로 파싱 시도
-                                if arrival_time is None and cell_str is not None:
-                                    # 시간 형식인지 확인
-                                    if ':' in cell_str:
-                                        arrival_time = parse_time(cell_str)
-                                    # 휴가 유형인지 확인
-                                    elif cell_str in ['연차', '반차', '반반차', '공휴', '박람회', '민방위', '출장', '교육', '추석', '설날']:
-                                        leave_type = cell_str
-                                
-                                # 3단계: 원본 값의 문자열 표현으로 파싱 시도
-                                if arrival_time is None and leave_type is None:
-                                    original_str = str(cell_value).strip()
-                                    if original_str and original_str != 'nan' and original_str != 'None':
-                                        arrival_time = parse_time(original_str)
-                                
-                                # 4단계: pandas의 경우 직접 타입 확인
-                                if arrival_time is None and leave_type is None:
-                                    try:
-                                        # pandas가 datetime64로 읽은 경우
-                                        if isinstance(cell_value, pd.Timestamp):
-                                            arrival_time = cell_value.to_pydatetime().time()
-                                        # 또는 float/int로 읽은 경우 (엑셀의 시간 셀)
-                                        elif isinstance(cell_value, (float, int)):
-                                            # 엑셀의 시간 값은 0.0~1.0 사이의 소수로 저장됨
-                                            if 0.0 <= cell_value < 1.0:
-                                                total_seconds = int(cell_value * 86400)  # 하루 = 86400초
-                                                hours = total_seconds // 3600
-                                                minutes = (total_seconds % 3600) // 60
-                                                from datetime import time as dt_time
-                                                arrival_time = dt_time(hours, minutes)
-                                    except Exception as e:
-                                        pass
-                            
-                            # 출근 시간이나 휴가 유형이 있는 경우만 처리
-                            if arrival_time is not None or leave_type is not None:
-                                cursor.execute("""
-                                    SELECT arrival_time, departure_time, leave_type
-                                    FROM attendance_records
-                                    WHERE employee_id = ? AND work_date = ?
-                                """, (emp_id, work_date))
-                                existing = cursor.fetchone()
-                                
-                                # 기존(수동 입력) 데이터를 우선으로 유지하고, 비어 있는 값만 엑셀 값으로 채운다
-                                existing_arrival = None
-                                existing_departure = None
-                                existing_leave_type = None
-                                
-                                if existing:
-                                    existing_arrival, existing_departure, existing_leave_type = existing
-                                    try:
-                                        if existing_arrival:
-                                            existing_arrival = datetime.strptime(existing_arrival, "%H:%M:%S").time()
-                                    except Exception:
-                                        existing_arrival = None
-                                    try:
-                                        if existing_departure:
-                                            existing_departure = datetime.strptime(existing_departure, "%H:%M:%S").time()
-                                    except Exception:
-                                        existing_departure = None
-                                
-                                # 출근은 엑셀 값이 우선이 아니라, 기존 값이 있으면 유지하고 없을 때만 채운다
-                                final_arrival = existing_arrival or arrival_time
-                                final_departure = existing_departure  # 이 분기에서는 새 퇴근 시간 없음
-                                final_leave_type = (
-                                    existing_leave_type if existing_leave_type not in (None, "")
-                                    else leave_type
-                                )
-                                
-                                # 실제로 변경이 발생한 경우에만 저장
-                                if (
-                                    not existing
-                                    or final_arrival != existing_arrival
-                                    or final_departure != existing_departure
-                                    or final_leave_type != existing_leave_type
-                                ):
-                                    if final_arrival is not None or final_leave_type is not None or final_departure is not None:
-                                        self.calculator.process_attendance_record(
-                                            emp_id, work_date, final_arrival, final_departure,
-                                            final_leave_type, ""
-                                        )
-                                    records_added += 1
-                            # 빈 셀인 경우는 건너뛰기 (출근 시간이 없으면 기록하지 않음)
+                            departure_time = time_obj
+                            if existing and existing[0]:
+                                arrival_time = input_time(existing[0])
                         
-                        elif is_departure:
-                            departure_time = None
-                            
-                            # 퇴근 시간 파싱 시도 (엑셀 셀에 값이 있는 경우)
-                            if cell_time_value is not None:
-                                # 1단계: 원본 값 직접 파싱
-                                departure_time = parse_time(cell_time_value)
-                                
-                                # 2단계: 포맷된 문자열로 파싱 시도
-                                if departure_time is None and cell_str is not None:
-                                    departure_time = parse_time(cell_str)
-                                
-                                # 3단계: 원본 값의 문자열 표현으로 파싱 시도
-                                if departure_time is None:
-                                    original_str = str(cell_value).strip()
-                                    if original_str and original_str != 'nan' and original_str != 'None':
-                                        departure_time = parse_time(original_str)
-                                
-                                # 4단계: pandas의 경우 직접 타입 확인
-                                if departure_time is None:
-                                    try:
-                                        # pandas가 datetime64로 읽은 경우
-                                        if isinstance(cell_value, pd.Timestamp):
-                                            departure_time = cell_value.to_pydatetime().time()
-                                        # 또는 float/int로 읽은 경우 (엑셀의 시간 셀)
-                                        elif isinstance(cell_value, (float, int)):
-                                            # 엑셀의 시간 값은 0.0~1.0 사이의 소수로 저장됨
-                                            if 0.0 <= cell_value < 1.0:
-                                                total_seconds = int(cell_value * 86400)  # 하루 = 86400초
-                                                hours = total_seconds // 3600
-                                                minutes = (total_seconds % 3600) // 60
-                                                from datetime import time as dt_time
-                                                departure_time = dt_time(hours, minutes)
-                                    except Exception as e:
-                                        pass
-                                
-                                # 디버깅: 파싱 성공 여부 확인
-                                if departure_time is not None:
-                                    print(f"✅ 퇴근 시간 파싱 성공: 직원={current_name}, 날짜={work_date}, "
-                                          f"시간={departure_time}, 원본값={cell_value}, 타입={type(cell_value).__name__}")
-                                else:
-                                    print(f"⚠️ 퇴근 시간 파싱 실패: 직원={current_name}, 날짜={work_date}, "
-                                          f"원본값={cell_value}, 타입={type(cell_value).__name__}, "
-                                          f"포맷된문자열={cell_str}")
-                            
-                            # 퇴근 행 처리 - 기존 데이터와 병합하여 저장
-                            if departure_time is not None:
-                                cursor.execute("""
-                                    SELECT arrival_time, departure_time, leave_type
-                                    FROM attendance_records
-                                    WHERE employee_id = ? AND work_date = ?
-                                """, (emp_id, work_date))
-                                existing = cursor.fetchone()
-                                
-                                existing_arrival = None
-                                existing_departure = None
-                                existing_leave_type = None
-                                
-                                if existing:
-                                    existing_arrival, existing_departure, existing_leave_type = existing
-                                    try:
-                                        if existing_arrival:
-                                            existing_arrival = datetime.strptime(existing_arrival, "%H:%M:%S").time()
-                                    except Exception:
-                                        existing_arrival = None
-                                    try:
-                                        if existing_departure:
-                                            existing_departure = datetime.strptime(existing_departure, "%H:%M:%S").time()
-                                    except Exception:
-                                        existing_departure = None
-                                
-                                # 기존 퇴근 시간이 있으면 유지, 없을 때만 엑셀 값으로 채운다
-                                final_arrival = existing_arrival
-                                final_departure = existing_departure or departure_time
-                                final_leave_type = existing_leave_type
-                                
-                                if (
-                                    not existing
-                                    or final_departure != existing_departure
-                                    or final_arrival != existing_arrival
-                                    or final_leave_type != existing_leave_type
-                                ):
-                                    if final_departure is not None or final_arrival is not None or final_leave_type is not None:
-                                        self.calculator.process_attendance_record(
-                                            emp_id, work_date, final_arrival, final_departure,
-                                            final_leave_type, ""
-                                        )
-                                    records_added += 1
+                        self.calculator.process_attendance_record(
+                            cell['emp_id'], work_date, arrival_time, departure_time,
+                            None, ""
+                        )
+                    else:
+                        # 휴가 유형인 경우
+                        self.calculator.process_attendance_record(
+                            cell['emp_id'], work_date, None, None,
+                            formatted_time, ""
+                        )
+                    
+                    updated_count += 1
                 
-                except Exception as e:
-                    print(f"행 {idx + 2} 처리 중 오류: {str(e)}")
-                    continue
-            
-            conn.commit()
-            conn.close()
-            
-            QMessageBox.information(self, "업로드 완료", f"엑셀 업로드 완료!\n\n추가/업데이트된 기록: {records_added}건")
-            self.refresh_data()
+                conn.commit()
+                conn.close()
+                
+                QMessageBox.information(dialog, "완료", f"{updated_count}개 셀이 수정되었습니다.")
+                dialog.accept()
+                self._apply_attendance_change([cell['emp_id'] for cell in valid_cells],
+                                              *self._month_bounds(base_year, base_month))
+                
+            except Exception as e:
+                QMessageBox.critical(dialog, "오류", f"수정 중 오류 발생: {str(e)}")
+        
+        # Enter 키로 저장
+        time_entry.returnPressed.connect(save_time)
+        
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(save_time)
+        button_box.rejected.connect(dialog.reject)
+        layout.addWidget(button_box)
+        
+        time_entry.setFocus()
+        dialog.exec()
+    
+    def upload_excel(self):
+        """엑셀 파일 업로드 - 시트를 한 번 읽어 하나의 트랜잭션으로 일괄 저장"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "엑셀 파일 선택", "", "Excel files (*.xlsx *.xls);;All files (*.*)")
+        if not file_path:
+            return
+        
+        year = self.year_combo.currentData()
+        month = self.month_combo.currentData()
+        if year is None:
+            year = datetime.now().year
+        if month is None:
+            month = datetime.now().month
+        
+        progress_dialog = QProgressDialog("엑셀 파일을 읽는 중...", None, 0, 0, self)
+        progress_dialog.setWindowTitle("엑셀 업로드")
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setMinimumDuration(300)
+        progress_dialog.setValue(0)
+        
+        def on_progress(done, total):
+            progress_dialog.setLabelText("출퇴근 기록 확인 중...")
+            progress_dialog.setMaximum(max(total, 1))
+            progress_dialog.setValue(min(done, total))
+        
+        importer = AttendanceImporter(self.db, self.calculator)
+        try:
+            result = importer.import_file(file_path, year, month, progress=on_progress)
+        except ValueError as e:
+            progress_dialog.close()
+            QMessageBox.critical(self, "오류", str(e))
+            return
+        except ImportError as e:
+            progress_dialog.close()
+            QMessageBox.critical(self, "오류", f".xls 파일 읽기 오류: {str(e)}\n\nxlrd 라이브러리가 필요합니다: pip install xlrd>=2.0.1")
+            return
         except Exception as e:
+            progress_dialog.close()
             QMessageBox.critical(self, "오류", f"엑셀 파일 업로드 중 오류 발생: {str(e)}")
+            return
+        progress_dialog.close()
+        
+        message = QMessageBox(self)
+        message.setWindowTitle("업로드 완료")
+        text = f"엑셀 업로드 완료!\n\n추가/업데이트된 기록: {result.written}건"
+        if result.unchanged:
+            text += f"\n기존과 같아 건너뛴 기록: {result.unchanged}건"
+        if result.errors:
+            message.setIcon(QMessageBox.Warning)
+            text += f"\n확인이 필요한 항목: {len(result.errors)}건 (자세히 보기)"
+            message.setDetailedText(result.error_report())
+        else:
+            message.setIcon(QMessageBox.Information)
+        message.setText(text)
+        message.exec()
+        
+        if result.written:
+            self.refresh_data()
+            self.change_bus.attendance_changed(result.employee_ids, result.start_date, result.end_date,
+                                               source=self)
     
     def download_excel(self):
         """엑셀 파일 다운로드 - 전체 데이터를 월별 시트로 다운로드"""
@@ -6990,6 +4112,80 @@ class AttendanceManagementGUI(QWidget):
             return self.leave_gui.download_combined_excel()
         return self.download_excel()
 
+    def _sheet_progress_dialog(self):
+        """출퇴근 시트 작성 진행 대화상자와 progress(작성한 시트 수, 전체 시트 수) 콜백"""
+        progress_dialog = QProgressDialog("출퇴근 시트 작성 중...", None, 0, 0, self)
+        progress_dialog.setWindowTitle("엑셀 다운로드")
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setMinimumDuration(300)
+        progress_dialog.setValue(0)
+        
+        def on_progress(done, total):
+            progress_dialog.setLabelText(f"출퇴근 시트 작성 중... ({done}/{total})")
+            progress_dialog.setMaximum(max(total, 1))
+            progress_dialog.setValue(min(done, total))
+        
+        return progress_dialog, on_progress
+
+    def _attendance_export_targets(self, cursor, year, month):
+        """출퇴근 엑셀 대상 (년, 월) 목록과 직원 목록. 데이터가 없으면 알림 후 None"""
+        # 2025년은 월별(1~12월) 시트를 모두 생성
+        # 그 외에는 기존처럼 선택한 월만 생성 (동작 변경 최소화)
+        if int(year) == 2025:
+            year_months = [(int(year), m) for m in range(1, 13)]
+            # 연도 기준으로 데이터 존재 여부만 확인 (없으면 생성 중단)
+            cursor.execute("""
+                SELECT COUNT(*)
+                FROM attendance_records
+                WHERE work_date >= ? AND work_date < ?
+            """, (f"{int(year):04d}-01-01", f"{int(year) + 1:04d}-01-01"))
+            data_count = cursor.fetchone()[0]
+            if data_count == 0:
+                QMessageBox.warning(self, "알림", f"{year}년 출퇴근 데이터가 없습니다.")
+                return None
+        else:
+            # 선택한 년도-월만 사용
+            year_months = [(int(year), int(month))]
+            
+            # 해당 월에 데이터가 있는지 확인
+            cursor.execute("""
+                SELECT COUNT(*) 
+                FROM attendance_records
+                WHERE work_date >= ? AND work_date < ?
+            """, month_date_range(year, month))
+            data_count = cursor.fetchone()[0]
+            
+            if data_count == 0:
+                QMessageBox.warning(self, "알림", f"{year}년 {month}월 출퇴근 데이터가 없습니다.")
+                return None
+        
+        # 모든 직원 정보 조회 (부서별 정렬, 퇴사자 포함)
+        cursor.execute("""
+            SELECT e.id, e.department, e.position, e.name, e.hire_date,
+                   COALESCE(e.display_order, 0) as display_order
+            FROM employees e
+            ORDER BY
+                CASE e.department
+                    WHEN '경영지원팀' THEN 1
+                    WHEN '영업팀' THEN 2
+                    WHEN '글로벌비즈니스팀' THEN 3
+                    ELSE 999
+                END,
+                e.department,
+                CASE e.position
+                    WHEN '이사' THEN 1
+                    WHEN '팀장' THEN 2
+                    WHEN '파트장' THEN 3
+                    WHEN '과장' THEN 4
+                    WHEN '대리' THEN 5
+                    WHEN '프로' THEN 6
+                    ELSE 999
+                END,
+                e.hire_date ASC
+        """)
+        return year_months, [(emp_id, pos, name, hire_date)
+                             for emp_id, dept, pos, name, hire_date, display_order in cursor.fetchall()]
+
     def _download_attendance_excel(self, file_path_override=None, silent=False, open_after=True):
         """(내부용) 출퇴근 엑셀 생성. file_path_override가 있으면 다이얼로그 없이 저장."""
         if file_path_override:
@@ -7019,526 +4215,25 @@ class AttendanceManagementGUI(QWidget):
                 month = datetime.now().month
             
             conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            # 2025년은 월별(1~12월) 시트를 모두 생성
-            # 그 외에는 기존처럼 선택한 월만 생성 (동작 변경 최소화)
-            if int(year) == 2025:
-                year_months = [(f"{year}-{m:02d}",) for m in range(1, 13)]
-                # 연도 기준으로 데이터 존재 여부만 확인 (없으면 생성 중단)
-                cursor.execute("""
-                    SELECT COUNT(*)
-                    FROM attendance_records
-                    WHERE strftime('%Y', work_date) = ?
-                """, (str(year),))
-                data_count = cursor.fetchone()[0]
-                if data_count == 0:
-                    QMessageBox.warning(self, "알림", f"{year}년 출퇴근 데이터가 없습니다.")
-                    conn.close()
-                    return
-            else:
-                # 선택한 년도-월만 사용
-                year_month = f"{year}-{month:02d}"
-                year_months = [(year_month,)]
-                
-                # 해당 월에 데이터가 있는지 확인
-                cursor.execute("""
-                    SELECT COUNT(*) 
-                    FROM attendance_records
-                    WHERE strftime('%Y-%m', work_date) = ?
-                """, (year_month,))
-                data_count = cursor.fetchone()[0]
-                
-                if data_count == 0:
-                    QMessageBox.warning(self, "알림", f"{year}년 {month}월 출퇴근 데이터가 없습니다.")
-                    conn.close()
-                    return
-            
-            # 모든 직원 정보 조회 (부서별 정렬, 퇴사자 포함)
-            cursor.execute("""
-                SELECT e.id, e.department, e.position, e.name, e.hire_date,
-                       COALESCE(e.display_order, 0) as display_order
-                FROM employees e
-                ORDER BY
-                    CASE e.department
-                        WHEN '경영지원팀' THEN 1
-                        WHEN '영업팀' THEN 2
-                        WHEN '글로벌비즈니스팀' THEN 3
-                        ELSE 999
-                    END,
-                    e.department,
-                    CASE e.position
-                        WHEN '이사' THEN 1
-                        WHEN '팀장' THEN 2
-                        WHEN '파트장' THEN 3
-                        WHEN '과장' THEN 4
-                        WHEN '대리' THEN 5
-                        WHEN '프로' THEN 6
-                        ELSE 999
-                    END,
-                    e.hire_date ASC
-            """)
-            employees = cursor.fetchall()
-            
-            from calendar import monthrange
-            
-            # openpyxl Workbook 직접 사용
-            workbook = openpyxl.Workbook()
-            # 기본 시트 제거 (나중에 생성할 시트로 대체)
-            workbook.remove(workbook.active)
+            targets = self._attendance_export_targets(conn.cursor(), year, month)
+            if targets is None:
+                conn.close()
+                return
+            year_months, employees = targets
             
-            # 각 년도-월별로 시트 생성
-            for year_month_tuple in year_months:
-                year_month = year_month_tuple[0]
-                year, month = map(int, year_month.split('-'))
-                days_in_month = monthrange(year, month)[1]
-                
-                # 프로그램과 동일한 컬럼 구조 (헤더는 별도로 처리)
-                date_columns = [str(i) for i in range(1, 32)]
-                summary_columns = ["조기출근(8시이전)", "지각(9시이후)", "야근(20시이후)", "연차사용", "평균 출근시간", "평균 퇴근시간"]
-                columns = ["직급", "이름", "구분"] + date_columns + summary_columns
-                
-                # 데이터 준비
-                data = []
-                merge_info = []
-                merge_info_set = set()
-                def _add_merge(m_row, m_col, r_span, c_span):
-                    """중복 병합 방지용"""
-                    t = (m_row, m_col, r_span, c_span)
-                    if t in merge_info_set:
-                        return
-                    merge_info_set.add(t)
-                    merge_info.append(t)
-                diagonal_cells = []
-                current_department = None
-                row_idx = 0
-                employee_departure_rows = []
-                
-                for emp_id, dept, pos, name, hire_date_str, display_order in employees:
-                    # 입사일 파싱
-                    hire_date = None
-                    if hire_date_str:
-                        try:
-                            if isinstance(hire_date_str, str):
-                                hire_date = datetime.strptime(hire_date_str, "%Y-%m-%d").date()
-                            else: hire_date = hire_date_str
-                        except: pass
-                    
-                    # 부서 변경 체크 (구분자 행은 엑셀에서 제외)
-                    if current_department != dept:
-                        current_department = dept
-                    
-                    cursor.execute("""
-                        SELECT work_date, arrival_time, departure_time, early_arrival, late_arrival, late_departure, leave_type, remarks
-                        FROM attendance_records
-                        WHERE employee_id = ? AND strftime('%Y-%m', work_date) = ?
-                        ORDER BY work_date
-                    """, (emp_id, year_month))
-                    
-                    records = cursor.fetchall()
-                    records_dict = {}
-                    for record in records:
-                        work_date, arr, dep, early, late_arr, late_dep, l_type, remarks = record
-                        day = int(work_date.split('-')[2]) if isinstance(work_date, str) else work_date.day
-                        records_dict[day] = {'arrival': arr, 'departure': dep, 'early': early, 'late_arr': late_arr, 'late_dep': late_dep, 'leave_type': l_type, 'remarks': remarks}
-                    
-                    # 출근 행 추가
-                    arrival_row_idx = row_idx
-                    arrival_row = {"직급": pos, "이름": name, "구분": "출근"}
-                    arrival_times = []
-                    
-                    for day in range(1, days_in_month + 1):
-                        if day in records_dict:
-                            record = records_dict[day]
-                            rmk, l_type = record.get('remarks', ''), record.get('leave_type')
-                            if l_type and rmk == f'{l_type}_출근': arrival_row[str(day)] = l_type
-                            elif l_type and rmk == f'{l_type}_퇴근':
-                                if record['arrival']:
-                                    arr_s = str(record['arrival'])[:5]
-                                    arrival_row[str(day)] = arr_s
-                                    try:
-                                        at = datetime.strptime(arr_s, "%H:%M").time()
-                                        if datetime(year, month, day).weekday() < 5: arrival_times.append(at)
-                                    except: pass
-                                else: arrival_row[str(day)] = ""
-                            elif l_type and not rmk: arrival_row[str(day)] = l_type
-                            elif record['arrival']:
-                                arr_s = str(record['arrival'])[:5]
-                                arrival_row[str(day)] = arr_s
-                                try:
-                                    at = datetime.strptime(arr_s, "%H:%M").time()
-                                    if datetime(year, month, day).weekday() < 5: arrival_times.append(at)
-                                except: pass
-                            else: arrival_row[str(day)] = ""
-                        else: arrival_row[str(day)] = ""
-                    for day in range(days_in_month + 1, 32): arrival_row[str(day)] = ""
-                    
-                    early_count = sum(1 for r in records_dict.values() if r.get('early'))
-                    late_arr_count = sum(1 for r in records_dict.values() if r.get('late_arr'))
-                    leave_amount = 0.0
-                    for r in records_dict.values():
-                        lt = r.get('leave_type')
-                        if lt in ['연차', '휴가']: leave_amount += 1.0
-                        elif lt == '반차': leave_amount += 0.5
-                    
-                    avg_arr = ""
-                    if arrival_times:
-                        ts = sum(t.hour * 3600 + t.minute * 60 + t.second for t in arrival_times)
-                        av = ts // len(arrival_times)
-                        avg_arr = f"{av // 3600:02d}:{(av % 3600) // 60:02d}"
-                    
-                    arrival_row["조기출근(8시이전)"] = str(early_count) if early_count > 0 else ""
-                    arrival_row["지각(9시이후)"] = str(late_arr_count) if late_arr_count > 0 else ""
-                    arrival_row["야근(20시이후)"] = ""
-                    arrival_row["연차사용"] = str(leave_amount) if leave_amount > 0 else ""
-                    arrival_row["평균 출근시간"] = avg_arr
-                    arrival_row["평균 퇴근시간"] = ""
-                    data.append(arrival_row)
-                    row_idx += 1
-                    
-                    # 퇴근 행 추가
-                    departure_row_idx = row_idx
-                    departure_row = {"직급": "", "이름": "", "구분": "퇴근"}
-                    departure_times = []
-                    
-                    for day in range(1, days_in_month + 1):
-                        if day in records_dict:
-                            record = records_dict[day]
-                            rmk, l_type = record.get('remarks', ''), record.get('leave_type')
-                            if l_type and rmk == f'{l_type}_퇴근': departure_row[str(day)] = l_type
-                            elif l_type and rmk == f'{l_type}_출근':
-                                if record['departure']:
-                                    dep_s = str(record['departure'])[:5]
-                                    departure_row[str(day)] = dep_s
-                                    try:
-                                        dt = datetime.strptime(dep_s, "%H:%M").time()
-                                        d_obj = datetime(year, month, day).date()
-                                        if d_obj.weekday() < 5 and not self.is_third_wednesday_17_00(d_obj, dt):
-                                            departure_times.append(dt)
-                                    except: pass
-                                else: departure_row[str(day)] = ""
-                            elif l_type and not rmk: departure_row[str(day)] = l_type
-                            elif record['departure']:
-                                dep_s = str(record['departure'])[:5]
-                                departure_row[str(day)] = dep_s
-                                try:
-                                    dt = datetime.strptime(dep_s, "%H:%M").time()
-                                    d_obj = datetime(year, month, day).date()
-                                    if d_obj.weekday() < 5 and not self.is_third_wednesday_17_00(d_obj, dt):
-                                        departure_times.append(dt)
-                                except: pass
-                            else: departure_row[str(day)] = ""
-                        else: departure_row[str(day)] = ""
-                    for day in range(days_in_month + 1, 32): departure_row[str(day)] = ""
-                    
-                    late_dep_count = sum(1 for r in records_dict.values() if r.get('late_dep'))
-                    avg_dep = ""
-                    if departure_times:
-                        ts = sum(t.hour * 3600 + t.minute * 60 + t.second for t in departure_times)
-                        av = ts // len(departure_times)
-                        avg_dep = f"{av // 3600:02d}:{(av % 3600) // 60:02d}"
-                    
-                    departure_row["조기출근(8시이전)"] = ""
-                    departure_row["지각(9시이후)"] = ""
-                    departure_row["야근(20시이후)"] = str(late_dep_count) if late_dep_count > 0 else ""
-                    departure_row["연차사용"] = ""
-                    departure_row["평균 출근시간"] = ""
-                    departure_row["평균 퇴근시간"] = avg_dep
-                    data.append(departure_row)
-                    employee_departure_rows.append(row_idx)
-                    row_idx += 1
-                    
-                    # 병합 정보 저장
-                    _add_merge(arrival_row_idx, 0, 2, 1) # 직급
-                    _add_merge(arrival_row_idx, 1, 2, 1) # 이름
-                    sum_col = 34
-                    _add_merge(arrival_row_idx, sum_col, 2, 1)
-                    _add_merge(arrival_row_idx, sum_col + 1, 2, 1)
-                    if late_dep_count > 0: data[arrival_row_idx]["야근(20시이후)"] = str(late_dep_count)
-                    _add_merge(arrival_row_idx, sum_col + 2, 2, 1)
-                    _add_merge(arrival_row_idx, sum_col + 3, 2, 1)
-                    _add_merge(arrival_row_idx, sum_col + 4, 2, 1)
-                    if avg_dep: data[arrival_row_idx]["평균 퇴근시간"] = avg_dep
-                    _add_merge(arrival_row_idx, sum_col + 5, 2, 1)
-                    
-                    for day in range(1, days_in_month + 1):
-                        if hire_date:
-                            try:
-                                if datetime(year, month, day).date() < hire_date:
-                                    _add_merge(arrival_row_idx, 2 + day, 2, 1)
-                                    diagonal_cells.append((arrival_row_idx, 2 + day))
-                                    data[arrival_row_idx][str(day)] = ""
-                                    data[departure_row_idx][str(day)] = ""
-                            except: pass
-                
-                # 시트 이름을 월만 표시 (예: "1월", "2월")
-                sheet_name = f"{month}월"[:31]
-                worksheet = workbook.create_sheet(title=sheet_name)
-                excel_row = 4
-                excel_row_map = {}
-                for i, row_data in enumerate(data):
-                    excel_row_map[i] = excel_row
-                    for c_idx, col_name in enumerate(columns, 1):
-                        worksheet.cell(row=excel_row, column=c_idx).value = row_data.get(col_name, "")
-                    excel_row += 1
-                
-                worksheet.sheet_view.showGridLines = False
-                worksheet.sheet_view.zoomScale = 100
-                worksheet.row_dimensions[1].height = 25
-                worksheet.merge_cells('D1:I1')
-                worksheet.cell(row=1, column=4).value = f"{year}년 {month}월"
-                worksheet.cell(row=1, column=4).font = Font(name='맑은 고딕', size=12, bold=True)
-                worksheet.cell(row=1, column=4).alignment = Alignment(horizontal='center', vertical='center')
-                
-                worksheet.row_dimensions[2].height = 17.4
-                worksheet.row_dimensions[3].height = 17.4
-                for col_idx, text in enumerate(['직급', '이름', '구분'], 1):
-                    worksheet.cell(row=2, column=col_idx).value = text
-                    worksheet.merge_cells(start_row=2, start_column=col_idx, end_row=3, end_column=col_idx)
-                
-                wd_names = ['월', '화', '수', '목', '금', '토', '일']
-                for day in range(1, days_in_month + 1):
-                    col_idx = 3 + day
-                    try:
-                        wd = datetime(year, month, day).weekday()
-                        worksheet.cell(row=2, column=col_idx).value = f"{day}\n{wd_names[wd]}"
-                        worksheet.merge_cells(start_row=2, start_column=col_idx, end_row=3, end_column=col_idx)
-                    except: pass
-                
-                sum_hdrs = ["조기출근(8시이전)", "지각(9시이후)", "야근(20시이후)", "연차사용", "평균 출근시간", "평균 퇴근시간"]
-                for idx, text in enumerate(sum_hdrs):
-                    col_idx = 35 + idx
-                    worksheet.cell(row=2, column=col_idx).value = text
-                    worksheet.merge_cells(start_row=2, start_column=col_idx, end_row=3, end_column=col_idx)
-                
-                for m_row, m_col, r_span, c_span in merge_info:
-                    if m_row in excel_row_map:
-                        e_r = excel_row_map[m_row]
-                        # 중복 병합/겹침 병합은 openpyxl에서 예외가 날 수 있어 안전하게 처리
-                        try:
-                            worksheet.merge_cells(start_row=e_r, start_column=m_col + 1, end_row=e_r + r_span - 1, end_column=m_col + c_span)
-                        except Exception:
-                            pass
-
-                # 3.5 출근행/퇴근행 동일 텍스트(예: 추석/연차)가 연속되는 구간은 "가로"로도 병합
-                # - 날짜 영역(D~말일)만 대상으로 하며, 값이 비어있지 않고(공백 제외) 출근/퇴근이 동일할 때만 병합합니다.
-                # - 기존 단일 셀 병합(2행×1열)도 이 로직에서 자연스럽게 포함됩니다.
-                try:
-                    align_center = Alignment(horizontal="center", vertical="center", wrap_text=False)
-                    start_day_col = 4
-                    end_day_col = 3 + days_in_month
-                    # data는 항상 [출근, 퇴근] 2행이 한 묶음
-                    for i in range(0, len(data), 2):
-                        if i + 1 >= len(data):
-                            break
-                        top_r = excel_row_map.get(i)
-                        bot_r = excel_row_map.get(i + 1)
-                        if not top_r or not bot_r:
-                            continue
-
-                        run_val = None
-                        run_start = None
-
-                        def _flush(run_end_col_exclusive: int):
-                            nonlocal run_val, run_start
-                            if run_val is None or run_start is None:
-                                run_val, run_start = None, None
-                                return
-                            run_end = run_end_col_exclusive - 1
-                            if run_end < run_start:
-                                run_val, run_start = None, None
-                                return
-
-                            # 기존 병합과 겹치면 스킵(겹침 병합 예외 방지)
-                            intersects = False
-                            for rr in (top_r, bot_r):
-                                for cc in range(run_start, run_end + 1):
-                                    try:
-                                        coord = f"{get_column_letter(cc)}{rr}"
-                                        if coord in worksheet.merged_cells:
-                                            intersects = True
-                                            break
-                                    except Exception:
-                                        pass
-                                if intersects:
-                                    break
-                            if intersects:
-                                run_val, run_start = None, None
-                                return
-
-                            # 병합 전에 하위/우측 셀 값을 비움(병합 후 MergedCell value 대입 불가)
-                            try:
-                                # 하단행(퇴근행) run_start 포함 전체 비움
-                                for cc in range(run_start, run_end + 1):
-                                    worksheet.cell(row=bot_r, column=cc).value = ""
-                                # 상단행은 run_start 제외 비움
-                                for cc in range(run_start + 1, run_end + 1):
-                                    worksheet.cell(row=top_r, column=cc).value = ""
-
-                                worksheet.merge_cells(start_row=top_r, start_column=run_start, end_row=bot_r, end_column=run_end)
-                                master = worksheet.cell(row=top_r, column=run_start)
-                                master.value = run_val
-                                master.alignment = align_center
-                            except Exception:
-                                pass
-                            finally:
-                                run_val, run_start = None, None
-
-                        for col in range(start_day_col, end_day_col + 2):  # +sentinel
-                            if col <= end_day_col:
-                                v1 = worksheet.cell(row=top_r, column=col).value
-                                v2 = worksheet.cell(row=bot_r, column=col).value
-                                s1 = str(v1).strip() if v1 is not None else ""
-                                s2 = str(v2).strip() if v2 is not None else ""
-                                val = s1 if (s1 and s1 == s2) else None
-                            else:
-                                val = None
-
-                            if val is None:
-                                _flush(col)
-                            else:
-                                if run_val is None:
-                                    run_val = val
-                                    run_start = col
-                                elif val != run_val:
-                                    _flush(col)
-                                    run_val = val
-                                    run_start = col
-                except Exception:
-                    pass
-                
-                for day in range(1, 32): worksheet.column_dimensions[get_column_letter(3 + day)].width = 6.1
-                
-                # 4. 전체 스타일 및 테두리 최종 적용 (A1 ~ AN 마지막행까지 전수 주입)
-                border_limit_row = max(excel_row - 1, 45)
-                
-                # Side 도구 설정
-                # 일부 엑셀 환경에서 rgb 색상 지정이 무시되는 케이스가 있어, "indexed color"를 사용합니다.
-                from openpyxl.styles.colors import Color
-                thin_side = Side(style='thin', color=Color(indexed=8))   # black
-                outer_side = Side(style='thick', color=Color(indexed=8)) # black
-                diag_side = Side(style='thin', color=Color(indexed=22))  # gray
-                # Border 객체는 캐싱해서 재사용 (스타일 수 폭증/표시 불안정 방지)
-                border_cache = {}
-
-                # 스타일 객체는 "재사용"해야 엑셀에서 안정적으로 렌더링됩니다. (스타일 수 폭증 방지)
-                # Excel 호환성이 가장 좋은 fgColor 방식 사용
-                # 토/일 배경색: 요청에 따라 #D0CECE 로 처리
-                # - openpyxl에서 rgb는 ARGB(8자리)가 안전합니다. (#D0CECE = FFD0CECE)
-                fill_weekend = PatternFill(patternType="solid", fgColor="FFD0CECE")
-                fill_diag = PatternFill(patternType="solid", fgColor=Color(indexed=23))     # light gray(variant)
-                align_header = Alignment(horizontal='center', vertical='center', wrap_text=True)
-                align_data = Alignment(horizontal='center', vertical='center', wrap_text=False)
-                align_data_wrap = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
-                font_header = Font(name='맑은 고딕', size=10, bold=True)
-                font_header_sat = Font(name='맑은 고딕', size=10, color="FF0000FF", bold=True)
-                font_header_sun = Font(name='맑은 고딕', size=10, color="FFFF0000", bold=True)
-                font_data = Font(name='맑은 고딕', size=10, bold=False)
-                font_data_bold = Font(name='맑은 고딕', size=10, bold=True)
-
-                weekend_days = set()
-                try:
-                    for d in range(1, days_in_month + 1):
-                        wd = datetime(year, month, d).weekday()  # 5=토, 6=일
-                        if wd in (5, 6):
-                            weekend_days.add(d)
-                except Exception:
-                    weekend_days = set()
-
-                def _get_border(l, r, t, b, diag: bool) -> Border:
-                    key = (l.style, getattr(l.color, "rgb", None), r.style, getattr(r.color, "rgb", None),
-                           t.style, getattr(t.color, "rgb", None), b.style, getattr(b.color, "rgb", None), diag)
-                    cached = border_cache.get(key)
-                    if cached is not None:
-                        return cached
-                    if diag:
-                        cached = Border(left=l, right=r, top=t, bottom=b, diagonal=diag_side, diagonalDown=True)
-                    else:
-                        cached = Border(left=l, right=r, top=t, bottom=b)
-                    border_cache[key] = cached
-                    return cached
-                
-                # 퇴근 행 데이터 준비
-                dep_rows_excel = {excel_row_map[i] for i in employee_departure_rows if i in excel_row_map}
-                
-                # 모든 시트 내 셀을 순회하며 스타일 강제 주입
-                for r in range(1, border_limit_row + 1):
-                    for c in range(1, 41):  # A(1) ~ AN(40)
-                        cell = worksheet.cell(row=r, column=c)
-                        
-                        # [1] Row 1 (D1:I1 제목 영역) 특별 처리
-                        if r == 1:
-                            if 4 <= c <= 9:
-                                cell.border = Border(
-                                    top=outer_side, bottom=outer_side,
-                                    left=outer_side if c == 4 else None,
-                                    right=outer_side if c == 9 else None
-                                )
-                            continue
-
-                        # [2] 폰트 및 정렬 설정 (객체 재사용)
-                        if r <= 3:
-                            # 헤더 (2~3행)
-                            if 4 <= c <= 3 + days_in_month:
-                                try:
-                                    wd = datetime(year, month, c - 3).weekday()
-                                    if wd == 5:
-                                        cell.font = font_header_sat
-                                    elif wd == 6:
-                                        cell.font = font_header_sun
-                                    else:
-                                        cell.font = font_header
-                                except: pass
-                            if cell.font is None:
-                                cell.font = font_header
-                            cell.alignment = align_header
-                        else:
-                            # 데이터 (4행 이상)
-                            # 굵게 여부만 유지하고, 폰트 객체는 재사용
-                            is_bold = False
-                            try:
-                                if cell.font and getattr(cell.font, 'bold', False):
-                                    is_bold = True
-                            except Exception:
-                                pass
-                            cell.font = font_data_bold if is_bold else font_data
-                            cell.alignment = align_data_wrap if (c in [2, 3]) else align_data
-
-                        # 배경색: 기본 흰색은 굳이 셀마다 채우지 않음(스타일 폭증 방지)
-                        # 토/일 날짜 컬럼은 연한 회색 음영 처리 (사선/특수 채움은 아래에서 덮어씀)
-                        if r >= 2 and 4 <= c <= 3 + days_in_month:
-                            if (c - 3) in weekend_days:
-                                cell.fill = fill_weekend
-
-                        # [3] 테두리 결정 (캐시된 Border 재사용)
-                        l_b = outer_side if c == 1 else thin_side
-                        r_b = outer_side if c == 40 else thin_side
-                        t_b = outer_side if r == 2 else thin_side
-                        b_b = outer_side if (r == border_limit_row or r in dep_rows_excel) else thin_side
-                        
-                        # [4] 사선 및 최종 테두리 주입
-                        is_diag_cell = False
-                        for dr, dc in diagonal_cells:
-                            if dr in excel_row_map:
-                                base_r = excel_row_map[dr]
-                                if (r == base_r or r == base_r + 1) and c == dc + 1:
-                                    is_diag_cell = True; break
-                        
-                        if is_diag_cell:
-                            cell.border = _get_border(l_b, r_b, t_b, b_b, True)
-                            cell.fill = fill_diag
-                        else:
-                            cell.border = _get_border(l_b, r_b, t_b, b_b, False)
-
-            # 파일 저장
-            workbook.save(file_path)
+            # 월별 시트를 한 행씩 기록 (연도별 한 번의 조회, write-only 모드)
+            progress_dialog, on_progress = (None, None) if silent else self._sheet_progress_dialog()
+            try:
+                AttendanceWorkbookWriter(conn).write(file_path, year_months, employees, progress=on_progress)
+            finally:
+                if progress_dialog is not None:
+                    progress_dialog.close()
 
             # --- 저장 후 테두리 "실제 기록 여부"를 항상 표시 (사용자 환경에서 원인 분리용) ---
             # 여기서 읽힌 값이 존재하는데도 엑셀에서 안 보이면, 다른 파일을 열었거나 뷰어/캐시 문제일 가능성이 큼.
             verify_msg = f"\n\n[저장 경로]\n- {file_path}"
             try:
-                wb_check = openpyxl.load_workbook(file_path)
+                wb_check = openpyxl.load_workbook(file_path, read_only=True)
                 # 사용자가 실제로 확인하는 시트를 우선 체크
                 # 시트 이름을 월만 표시하므로 검증 대상도 동일 규칙 사용
                 # 2025년처럼 월별 12시트를 생성하는 경우에도 "1월"이 항상 존재
@@ -7576,7 +4271,7 @@ class AttendanceManagementGUI(QWidget):
                         # 날짜 컬럼은 D열부터(=4) 시작 => col = 3 + day
                         col_idx = 3 + weekend_day
                         # 헤더행(2행)과 데이터행(4행이 있으면 4행)에서 fill 확인
-                        r_data = 4 if ws_check.max_row >= 4 else 2
+                        r_data = 4 if (ws_check.max_row or 0) >= 4 else 2
                         c_header = ws_check.cell(row=2, column=col_idx)
                         c_data = ws_check.cell(row=r_data, column=col_idx)
                         h_fill = getattr(getattr(c_header.fill, "start_color", None), "rgb", None)
@@ -7595,6 +4290,7 @@ class AttendanceManagementGUI(QWidget):
                         "수정한 .py가 아니라 다른 실행파일(exe)로 실행 중이거나,\n"
                         "다른 파일을 열어 확인 중일 수 있습니다."
                     )
+                wb_check.close()
             except Exception:
                 verify_msg = f"{verify_msg}\n\n[테두리 검증] 실패(파일 재열기 불가)"
             
@@ -7669,17 +4365,15 @@ class AttendanceManagementGUI(QWidget):
                 
                 arrival_time = None
                 if arrival_entry.text().strip():
-                    try:
-                        arrival_time = datetime.strptime(arrival_entry.text().strip(), "%H:%M").time()
-                    except:
+                    arrival_time = input_time(arrival_entry.text())
+                    if arrival_time is None:
                         QMessageBox.critical(self, "오류", "출근 시간 형식이 올바르지 않습니다. (HH:MM 형식)")
                         return
                 
                 departure_time = None
                 if departure_entry.text().strip():
-                    try:
-                        departure_time = datetime.strptime(departure_entry.text().strip(), "%H:%M").time()
-                    except:
+                    departure_time = input_time(departure_entry.text())
+                    if departure_time is None:
                         QMessageBox.critical(self, "오류", "퇴근 시간 형식이 올바르지 않습니다. (HH:MM 형식)")
                         return
                 
@@ -7689,7 +4383,7 @@ class AttendanceManagementGUI(QWidget):
                 
                 QMessageBox.information(self, "성공", "출퇴근이 등록되었습니다.")
                 dialog.accept()
-                self.refresh_data()
+                self._apply_attendance_change([emp_id], work_date, work_date)
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"등록 중 오류 발생: {str(e)}")
         
@@ -7750,6 +4444,7 @@ class AttendanceManagementGUI(QWidget):
                 
                 # 데이터 새로고침
                 self.refresh_data()
+                self.change_bus.attendance_changed(None, *self._month_bounds(year, month), source=self)
                 
             except Exception as e:
                 conn.rollback()
@@ -7778,16 +4473,28 @@ class MainApplication(QMainWindow):
         self.leave_calculator = LeaveCalculator(self.db)
         self.attendance_calculator = AttendanceCalculator(self.db)
         
+        # 연월차 소멸 처리: 시작 시 한 번 실행 (새로고침 경로에서는 소멸 기록을 쓰지 않음)
+        self.expiration_scheduler = ExpirationScheduler(self.db, self.leave_calculator)
+        try:
+            self.expiration_scheduler.run()
+        except Exception as e:
+            logger.exception("연월차 소멸 처리 오류")
+        
         tab_widget = QTabWidget()
         
+        # 탭 간 변경 알림 (저장한 탭이 변경 내용을 알리면 각 탭이 필요한 행만 갱신)
+        self.change_bus = ChangeBus()
+        
         # 재직인원 탭 (먼저 생성)
-        employee_gui = EmployeeManagementGUI(tab_widget, self.db, None, None)
+        employee_gui = EmployeeManagementGUI(tab_widget, self.db, None, None, change_bus=self.change_bus)
         
         # 연월차 관리대장 탭 (재직인원 탭 참조 전달)
-        leave_gui = LeaveManagementGUI(tab_widget, self.db, self.leave_calculator, employee_gui)
+        leave_gui = LeaveManagementGUI(tab_widget, self.db, self.leave_calculator, employee_gui,
+                                       change_bus=self.change_bus)
         
         # 출퇴근 관리대장 탭 (연월차 관리대장 참조 전달)
-        attendance_gui = AttendanceManagementGUI(tab_widget, self.db, self.attendance_calculator, leave_gui, employee_gui)
+        attendance_gui = AttendanceManagementGUI(tab_widget, self.db, self.attendance_calculator, leave_gui, employee_gui,
+                                                 change_bus=self.change_bus)
         
         # 재직인원 탭에 다른 탭 참조 설정
         employee_gui.leave_gui = leave_gui
@@ -7800,6 +4507,13 @@ class MainApplication(QMainWindow):
         tab_widget.addTab(attendance_gui, "출퇴근 관리대장")
         
         self.setCentralWidget(tab_widget)
+        self.leave_gui = leave_gui
+        self.attendance_gui = attendance_gui
+        
+        # 날짜가 바뀌면(자정 경과) 소멸 처리 재실행 (1분마다 확인)
+        self.date_check_timer = QTimer(self)
+        self.date_check_timer.timeout.connect(self.on_date_check)
+        self.date_check_timer.start(60 * 1000)
         
         # 상태바에 저작권 정보 추가
         status_bar = QStatusBar()
@@ -7807,12 +4521,34 @@ class MainApplication(QMainWindow):
         copyright_label.setStyleSheet("color: gray; padding: 2px;")
         status_bar.addPermanentWidget(copyright_label)
         self.setStatusBar(status_bar)
+    
+    def on_date_check(self):
+        """날짜 변경 시 연월차 소멸 처리 후 연월차 탭에 알림 (보이지 않으면 표시될 때 새로고침)"""
+        try:
+            if self.expiration_scheduler.run_if_date_changed() > 0:
+                self.change_bus.leave_changed()
+        except Exception as e:
+            logger.exception("연월차 소멸 처리 오류")
+    
+    def closeEvent(self, event):
+        """종료 시 연결 풀 정리"""
+        self.date_check_timer.stop()
+        # 백그라운드 조회가 연결을 쓰는 중일 수 있으므로 중단 후 끝날 때까지 대기
+        for gui in (self.leave_gui, self.attendance_gui):
+            gui.cancel_background_refresh()
+        QThreadPool.globalInstance().waitForDone(5000)
+        self.db.close_all()
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
     import sys
     import os
     import subprocess
+    import multiprocessing
+    
+    # exe(PyInstaller)에서 엑셀 내보내기 작업 프로세스가 GUI를 다시 띄우지 않도록 가장 먼저 호출
+    multiprocessing.freeze_support()
     
     # PySide6가 설치되어 있는지 확인
     if not PYSIDE6_AVAILABLE:
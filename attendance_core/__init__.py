@@ -0,0 +1,35 @@
+"""
+근태관리 데이터 계층
+
+GUI(PySide6)·pandas·openpyxl 없이 import 가능한 경량 패키지입니다.
+배치 작업, 야간 재계산, 벤치마크 등 헤드리스 환경에서 사용합니다.
+
+    from attendance_core import DatabaseManager, LeaveCalculator, AttendanceCalculator
+"""
+
+from .database import DatabaseManager
+from .leave_calculator import LeaveCalculator
+from .attendance_calculator import AttendanceCalculator
+from .month_loader import load_month_records
+from .month_grid import MonthGrid
+from .month_summary import MonthSummary
+from .leave_ledger import LeaveLedger
+from .expiration_scheduler import ExpirationScheduler
+from .change_bus import ChangeBus, ChangeEvent
+from .attendance_importer import AttendanceImporter
+from .attendance_export import AttendanceWorkbookWriter
+
+__all__ = [
+    "DatabaseManager",
+    "LeaveCalculator",
+    "AttendanceCalculator",
+    "load_month_records",
+    "MonthGrid",
+    "MonthSummary",
+    "LeaveLedger",
+    "ExpirationScheduler",
+    "ChangeBus",
+    "ChangeEvent",
+    "AttendanceImporter",
+    "AttendanceWorkbookWriter",
+]
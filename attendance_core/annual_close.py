@@ -0,0 +1,152 @@
+"""
+연말 마감 (Qt 비의존)
+
+년도가 끝나면 전 직원의 해당 년도 잔여수(다음 년도 이월분)를 한 번에 계산하여
+leave_remaining_by_year에 저장하고 leave_year_closes에 마감 기록을 남깁니다.
+다음 년도 조회는 전년도/전전년도 사용 이력을 다시 계산하지 않고 저장된 한 행을
+읽습니다 (LeaveLedger - 2026년 이상 조회). 마감한 년도는 화면 조회로 잔여수를
+덮어쓰지 않으며, 기록을 수정했다면 마감을 취소한 뒤 다시 마감합니다.
+
+    python -m attendance_core.annual_close leave_attendance.db --through 2025
+    python -m attendance_core.annual_close leave_attendance.db --reopen 2025
+"""
+
+import argparse
+from datetime import date, datetime
+
+from .leave_ledger import LeaveLedger
+
+
+def closed_years(conn):
+    """마감한 년도 집합"""
+    return {year for (year,) in conn.execute("SELECT year FROM leave_year_closes")}
+
+
+def is_year_closed(conn, year):
+    return conn.execute("SELECT 1 FROM leave_year_closes WHERE year = ?", (year,)).fetchone() is not None
+
+
+class AnnualClose:
+    """연말 마감 작업
+
+    사용 예:
+        closer = AnnualClose(db_manager, leave_calculator)
+        closer.close_year(2025)        # 2025년 잔여수 확정
+        closer.close_through(2025)     # 마감하지 않은 지난 년도를 순서대로 마감
+    """
+
+    def __init__(self, db_manager, leave_calculator):
+        self.db = db_manager
+        self.calculator = leave_calculator
+
+    @staticmethod
+    def _employees(conn, year):
+        """해당 년도 말까지 입사한 전 직원 (퇴사자 포함) [(emp_id, name, hire_date), ...]"""
+        employees = []
+        for emp_id, name, hire_date in conn.execute("""
+            SELECT id, name, hire_date FROM employees
+            WHERE hire_date <= ?
+            ORDER BY id
+        """, (f"{year}-12-31",)).fetchall():
+            try:
+                datetime.strptime(str(hire_date), "%Y-%m-%d")
+            except ValueError:
+                continue
+            employees.append((emp_id, name, hire_date))
+        return employees
+
+    def close_year(self, year, today=None):
+        """해당 년도 마감 - 기준일(12월 31일)의 잔여수를 전 직원 한 번에 계산/저장
+
+        Returns:
+            저장한 직원 수 (1년 이상 재직인원)
+
+        Raises:
+            ValueError: 아직 끝나지 않은 년도
+        """
+        if today is None:
+            today = datetime.now().date()
+        if year >= today.year:
+            raise ValueError(f"{year}년은 아직 끝나지 않아 마감할 수 없습니다.")
+        reference_date = date(year, 12, 31)
+
+        with self.db.transaction() as conn:
+            employees = self._employees(conn, year)
+            ledger = LeaveLedger(self.calculator).build(conn, employees, year, today=reference_date)
+            frozen = ledger.loc[ledger['is_one_year_or_more'].astype(bool), 'remaining']
+            conn.executemany("""
+                INSERT OR REPLACE INTO leave_remaining_by_year
+                (employee_id, year, remaining_amount, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, [(emp_id, year, float(remaining)) for emp_id, remaining in frozen.items()])
+            conn.execute("""
+                INSERT OR REPLACE INTO leave_year_closes (year, reference_date, employee_count, closed_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, (year, str(reference_date), len(frozen)))
+        return len(frozen)
+
+    def close_through(self, last_year=None, today=None):
+        """마감하지 않은 년도를 last_year(기본: 작년)까지 오래된 순서로 마감
+
+        다음 년도 계산이 전년도 마감 값을 읽으므로 반드시 순서대로 마감합니다.
+
+        Returns:
+            {년도: 저장한 직원 수}
+        """
+        if today is None:
+            today = datetime.now().date()
+        if last_year is None:
+            last_year = today.year - 1
+        with self.db.connection() as conn:
+            first_hire = conn.execute("SELECT MIN(hire_date) FROM employees").fetchone()[0]
+            done = closed_years(conn)
+        if not first_hire:
+            return {}
+        first_year = int(str(first_hire)[:4])
+        if done:
+            first_year = max(first_year, max(done) + 1)
+        return {year: self.close_year(year, today=today) for year in range(first_year, last_year + 1)}
+
+    def reopen_year(self, year):
+        """마감 취소 (잔여수는 다음 화면 조회 또는 재마감 시 다시 계산됨). 취소했으면 True"""
+        with self.db.transaction() as conn:
+            return conn.execute("DELETE FROM leave_year_closes WHERE year = ?", (year,)).rowcount > 0
+
+
+def main(argv=None):
+    from .database import DatabaseManager
+    from .leave_calculator import LeaveCalculator
+
+    parser = argparse.ArgumentParser(description="연말 마감 (전 직원 잔여수 확정)")
+    parser.add_argument("db_path", help="DB 파일 경로")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--year", type=int, help="해당 년도만 마감 (다시 마감 포함)")
+    group.add_argument("--through", type=int, help="마감하지 않은 년도를 이 년도까지 순서대로 마감 (기본: 작년)")
+    group.add_argument("--reopen", type=int, help="해당 년도 마감 취소")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(args.db_path)
+    try:
+        closer = AnnualClose(db, LeaveCalculator(db))
+        if args.reopen is not None:
+            print(f"{args.reopen}년 마감 취소" if closer.reopen_year(args.reopen) else f"{args.reopen}년은 마감되지 않았습니다.")
+            return 0
+        try:
+            if args.year is not None:
+                results = {args.year: closer.close_year(args.year)}
+            else:
+                results = closer.close_through(args.through)
+        except ValueError as e:
+            print(str(e))
+            return 1
+        for year, count in results.items():
+            print(f"{year}년 마감: {count:,}명")
+        if not results:
+            print("마감할 년도가 없습니다.")
+        return 0
+    finally:
+        db.close_all()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
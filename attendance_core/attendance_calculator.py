@@ -0,0 +1,158 @@
+"""
+출퇴근 계산 (Qt 비의존)
+"""
+
+from datetime import datetime, time
+
+from .time_input import input_time
+
+
+# 근무 규칙(work_rules)이 없을 때의 기준
+EARLY_ARRIVAL_BEFORE = time(8, 0)    # 이 시각 이전 출근은 조기출근
+LATE_ARRIVAL_AFTER = time(9, 0)      # 이 시각 이후 출근은 지각
+LATE_DEPARTURE_FROM = time(20, 0)    # 이 시각 이후 퇴근은 야근
+
+# 같은 기준의 분 단위 값 (attendance_records.arrival_minute/departure_minute와 비교)
+EARLY_ARRIVAL_BEFORE_MINUTE = EARLY_ARRIVAL_BEFORE.hour * 60 + EARLY_ARRIVAL_BEFORE.minute
+LATE_ARRIVAL_AFTER_MINUTE = LATE_ARRIVAL_AFTER.hour * 60 + LATE_ARRIVAL_AFTER.minute
+LATE_DEPARTURE_FROM_MINUTE = LATE_DEPARTURE_FROM.hour * 60 + LATE_DEPARTURE_FROM.minute
+
+# 같은 (직원, 날짜) 기록은 UPDATE로 바꿈 (INSERT OR REPLACE는 지우는 행의 DELETE 트리거가
+# recursive_triggers 설정에 따라 실행되지 않아 leave_balance_monthly가 이중 집계됨)
+UPSERT_ATTENDANCE_SQL = """
+    INSERT INTO attendance_records
+    (employee_id, work_date, arrival_time, departure_time,
+     early_arrival, late_arrival, late_departure, leave_type, remarks,
+     arrival_minute, departure_minute)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (employee_id, work_date) DO UPDATE SET
+        arrival_time = excluded.arrival_time,
+        departure_time = excluded.departure_time,
+        early_arrival = excluded.early_arrival,
+        late_arrival = excluded.late_arrival,
+        late_departure = excluded.late_departure,
+        leave_type = excluded.leave_type,
+        remarks = excluded.remarks,
+        arrival_minute = excluded.arrival_minute,
+        departure_minute = excluded.departure_minute
+"""
+
+
+class AttendanceCalculator:
+    """출퇴근 계산 클래스"""
+    
+    def __init__(self, db_manager):
+        self.db = db_manager
+        self._rules = None
+        self._rules_version = None
+        self._leave_registry = None
+        self._leave_registry_version = None
+    
+    @property
+    def rules(self):
+        """컴파일된 근무 규칙 (work_rules.WorkRules)
+
+        DB의 규칙 변경 번호를 확인하여 처음 사용할 때와 규칙/직원 부서가 바뀐 뒤(다른 프로세스 포함) 다시 읽습니다.
+        """
+        from .work_rules import WorkRules, rules_version
+        with self.db.connection() as conn:
+            version = rules_version(conn)
+            if self._rules is None or self._rules_version != version:
+                self._rules = WorkRules.load(conn)
+                self._rules_version = version
+        return self._rules
+    
+    def reload_rules(self):
+        """다음 사용 시 규칙과 근태 구분을 변경 번호와 관계없이 다시 읽음"""
+        self._rules = None
+        self._leave_registry = None
+    
+    @property
+    def leave_registry(self):
+        """근태 구분 분류 (leave_types.LeaveTypeRegistry)
+
+        DB의 구분 변경 번호를 확인하여 처음 사용할 때와 구분이 바뀐 뒤(다른 프로세스 포함) 다시 읽습니다.
+        """
+        from .leave_types import LeaveTypeRegistry, leave_types_version
+        with self.db.connection() as conn:
+            version = leave_types_version(conn)
+            if self._leave_registry is None or self._leave_registry_version != version:
+                self._leave_registry = LeaveTypeRegistry.load(conn)
+                self._leave_registry_version = version
+        return self._leave_registry
+    
+    def attendance_row(self, employee_id, work_date, arrival_time, departure_time, leave_type=None, remarks=None,
+                       rules=None):
+        """UPSERT_ATTENDANCE_SQL에 바인딩할 값 튜플 (조기출근/지각/야근 플래그 계산 포함)
+        
+        arrival_time, departure_time은 datetime.time 또는 None입니다.
+        기준 시각은 근무 규칙(work_rules)의 해당 직원/날짜 값입니다.
+        여러 행을 만들 때는 rules에 self.rules를 한 번 읽어 넘기면 행마다 변경 번호를 조회하지 않습니다.
+        """
+        early_arrival = 0
+        late_arrival = 0
+        late_departure = 0
+        arrival_minute = None
+        departure_minute = None
+        early_before, late_after, night_from = (rules or self.rules).thresholds(employee_id, work_date)
+        
+        if arrival_time is not None:
+            arrival_minute = arrival_time.hour * 60 + arrival_time.minute
+            early_arrival = 1 if arrival_minute < early_before else 0
+            # 09:00:30처럼 초가 있으면 09:00 이후이므로 지각 (저장되는 'HH:MM:SS' 기준)
+            late_arrival = 1 if (arrival_minute > late_after
+                                 or (arrival_minute == late_after and arrival_time.second)) else 0
+        
+        if departure_time is not None:
+            departure_minute = departure_time.hour * 60 + departure_time.minute
+            late_departure = 1 if departure_minute >= night_from else 0
+        
+        arrival_time_str = arrival_time.strftime("%H:%M:%S") if arrival_time else None
+        departure_time_str = departure_time.strftime("%H:%M:%S") if departure_time else None
+        return (employee_id, work_date, arrival_time_str, departure_time_str,
+                early_arrival, late_arrival, late_departure, leave_type, remarks,
+                arrival_minute, departure_minute)
+    
+    def process_attendance_record(self, employee_id, work_date, arrival_time, departure_time, leave_type=None, remarks=None, conn=None):
+        """출퇴근 기록 처리 및 계산
+        
+        Args:
+            employee_id: 직원 ID
+            work_date: 근무일
+            arrival_time: 출근 시간
+            departure_time: 퇴근 시간
+            leave_type: 휴가 유형
+            remarks: 비고
+            conn: 데이터베이스 연결 (None이면 새로 생성)
+        """
+        try:
+            if isinstance(work_date, str):
+                work_date = datetime.strptime(work_date, "%Y-%m-%d").date()
+            # HH:MM:SS, HH:MM 등 문자열은 시간 입력 규칙으로 해석 (실패 시 None)
+            if isinstance(arrival_time, str):
+                arrival_time = input_time(arrival_time)
+            if isinstance(departure_time, str):
+                departure_time = input_time(departure_time)
+            
+            # connection이 제공되지 않으면 새로 생성
+            should_close = False
+            if conn is None:
+                conn = self.db.get_connection()
+                should_close = True
+            
+            cursor = conn.cursor()
+            
+            try:
+                cursor.execute(UPSERT_ATTENDANCE_SQL, self.attendance_row(
+                    employee_id, work_date, arrival_time, departure_time, leave_type, remarks))
+                
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise Exception(f"데이터베이스 저장 중 오류: {str(e)}")
+            finally:
+                if should_close:
+                    conn.close()
+        except Exception as e:
+            # 예외를 다시 발생시켜 호출자가 처리할 수 있도록 함
+            raise
@@ -0,0 +1,242 @@
+"""
+출퇴근 관리대장 편집 일괄 저장 (Qt 비의존)
+
+화면에서 모은 셀 편집(pending_changes)을 (직원, 날짜)별로 묶어 메모리에서 병합합니다.
+기존 기록은 한 번의 범위 조회로 미리 읽고, 같은 날짜의 출근/퇴근 편집은 편집 순서대로
+메모리의 기록에 차례로 반영한 뒤 최종 결과만 테이블별 executemany로 저장합니다.
+한 칸씩 저장하던 때와 결과가 같도록 같은 날짜의 앞선 편집 결과를 다음 편집이 기존 기록으로 봅니다.
+
+    with db.transaction() as conn:
+        saved = commit_pending_changes(conn, calculator, pending_changes, 2025, 3)
+
+pending_changes: {(emp_id, work_date(date), '출근'|'퇴근'): {'new_value', 'formatted_time', 'is_time', 'is_delete'}}
+"""
+
+from .attendance_calculator import UPSERT_ATTENDANCE_SQL
+from .month_loader import MAX_EMPLOYEE_FILTER
+from .time_input import input_time
+
+def _stored_time(value):
+    """저장된 'HH:MM:SS' 값 -> time (문자열이 아니거나 해석 불가면 None)"""
+    return input_time(value) if isinstance(value, str) else None
+
+
+def _loose_time(value):
+    """저장된 시간 값 -> time ('HH:MM:SS' 또는 'HH:MM', 해석 불가 None, 문자열이 아니면 그대로)"""
+    if not value:
+        return None
+    if not isinstance(value, str):
+        return value
+    return input_time(value)
+
+
+def _pending_time(change):
+    """같은 날짜 다른 행 편집의 시간 (시간 입력이 아니거나 삭제면 None)"""
+    if not change.get('is_time') or change.get('is_delete', False):
+        return None
+    return input_time(change.get('formatted_time', ''))
+
+
+def _kept_text(existing, other_category, both_rows):
+    """시간 입력 시 보존할 다른 행의 (구분, 비고)
+
+    다른 행에만 입력된 텍스트('{구분}_{다른 행}')와 비고 없는 두 행 표시 구분(both_rows)만 유지합니다.
+    """
+    if existing and existing[2]:
+        leave_type, remarks = existing[2], existing[3]
+        if remarks:
+            if leave_type not in both_rows and remarks == f'{leave_type}_{other_category}':
+                return leave_type, remarks
+        elif leave_type in both_rows:
+            return leave_type, ""
+    return None, ""
+
+
+class _LeaveChanges:
+    """한 날짜의 leave_records 변경 (편집 순서대로 반영한 최종 결과)"""
+
+    __slots__ = ("delete_all", "deleted", "inserted")
+
+    def __init__(self):
+        self.delete_all = False
+        self.deleted = set()
+        self.inserted = {}
+
+    def delete(self, leave_type):
+        self.inserted.pop(leave_type, None)
+        self.deleted.add(leave_type)
+
+    def clear(self):
+        self.inserted.clear()
+        self.deleted.clear()
+        self.delete_all = True
+
+    def insert(self, leave_type, amount):
+        self.inserted[leave_type] = amount
+
+
+def _fetch_existing(conn, days):
+    """{(emp_id, 'YYYY-MM-DD'): (arrival_time, departure_time, leave_type, remarks)} - 한 번의 범위 조회"""
+    employee_ids = sorted({emp_id for emp_id, _ in days})
+    work_dates = [work_date for _, work_date in days]
+    params = (min(work_dates), max(work_dates))
+    employee_filter = ""
+    if len(employee_ids) <= MAX_EMPLOYEE_FILTER:
+        employee_filter = f"employee_id IN ({', '.join('?' * len(employee_ids))}) AND "
+        params = (*employee_ids, *params)
+    rows = conn.execute(f"""
+        SELECT employee_id, work_date, arrival_time, departure_time, leave_type, remarks
+        FROM attendance_records
+        WHERE {employee_filter}work_date >= ? AND work_date <= ?
+    """, params).fetchall()
+    return {(emp_id, str(work_date)): tuple(values)
+            for emp_id, work_date, *values in rows if (emp_id, str(work_date)) in days}
+
+
+def _apply_change(calculator, registry, rules, emp_id, work_date, category, change, existing, pending_times, leave):
+    """편집 하나를 기존 기록(existing)에 반영한 새 기록
+
+    registry: 근태 구분 분류 (두 행 표시 구분, 연차 차감 구분은 leave_records도 함께 관리)
+    rules: 근무 규칙 (calculator.rules를 일괄 저장마다 한 번 읽은 값)
+
+    Returns:
+        (바뀌었는지, UPSERT_ATTENDANCE_SQL 값 튜플 또는 삭제면 None)
+    """
+    # 삭제 - 출근행/퇴근행 각각 처리
+    if change.get('is_delete', False):
+        if not existing:
+            return False, None
+        arrival_time = _loose_time(existing[0])
+        departure_time = _loose_time(existing[1])
+        leave_type, remarks = existing[2], existing[3]
+        if category == '출근':
+            arrival_time = None
+            # 비고 없이 입력했거나 출근 행에 입력한 차감 구분(연차/반차/휴가 등)은 leave_records에서도 삭제
+            if leave_type in registry.deductions and (not remarks or remarks == f'{leave_type}_출근'):
+                leave.delete(leave_type)
+                leave_type = remarks = None
+            remaining = departure_time
+        elif category == '퇴근':
+            departure_time = None
+            # 퇴근 행에 입력한 경우만 삭제 (출근 행의 반차 등은 유지)
+            if leave_type in registry.deductions and remarks == f'{leave_type}_퇴근':
+                leave.delete(leave_type)
+                leave_type = remarks = None
+            remaining = arrival_time
+        else:
+            remaining = leave_type = None
+        # 남은 시간도 구분도 없으면 전체 삭제
+        if not remaining and not leave_type:
+            leave.clear()
+            return True, None
+        return True, calculator.attendance_row(emp_id, work_date, arrival_time, departure_time, leave_type, remarks,
+                                             rules=rules)
+
+    time_obj = input_time(change['formatted_time']) if change['is_time'] else None
+
+    # 시간 입력 - 다른 행의 시간(같은 저장의 편집 우선)과 다른 행 텍스트 보존
+    if time_obj is not None:
+        if category == '출근':
+            arrival_time = time_obj
+            departure_time = pending_times.get('퇴근')
+            if departure_time is None and existing and existing[1]:
+                departure_time = _stored_time(existing[1])
+            leave_type, remarks = _kept_text(existing, '퇴근', registry.both_rows)
+        else:
+            arrival_time = pending_times.get('출근')
+            departure_time = time_obj
+            if arrival_time is None and existing and existing[0]:
+                arrival_time = _stored_time(existing[0])
+            leave_type, remarks = _kept_text(existing, '출근', registry.both_rows)
+        return True, calculator.attendance_row(emp_id, work_date, arrival_time, departure_time, leave_type, remarks,
+                                             rules=rules)
+
+    input_text = change['new_value'].strip()
+
+    # 두 행 표시 구분 - 출퇴근 시간 없이 두 행 모두 텍스트 (차감 구분은 leave_records에 기록)
+    deduction = registry.deduction(input_text)
+    if input_text in registry.both_rows:
+        if deduction:
+            leave.insert(input_text, deduction)
+        return True, calculator.attendance_row(emp_id, work_date, None, None, input_text, "", rules=rules)
+
+    # 독립 구분 (반차, 미팅, 공휴, 민방위, 교육, 휴가 등) - 입력한 행에만 텍스트, 다른 행 시간은 유지
+    # (반일 차감인 반차만 leave_records에 기록 - 휴가처럼 하루 차감은 연차 동기화가 기록, 기존 동작)
+    if category == '출근':
+        arrival_time = None
+        departure_time = pending_times.get('퇴근')
+        if departure_time is None and existing and existing[1]:
+            departure_time = _stored_time(existing[1])
+        remarks = f"{input_text}_출근"
+    else:
+        arrival_time = pending_times.get('출근')
+        departure_time = None
+        if arrival_time is None and existing and existing[0]:
+            arrival_time = _stored_time(existing[0])
+        remarks = f"{input_text}_퇴근"
+    if 0 < deduction < 1:
+        leave.insert(input_text, deduction)
+    return True, calculator.attendance_row(emp_id, work_date, arrival_time, departure_time, input_text, remarks,
+                                         rules=rules)
+
+
+def commit_pending_changes(conn, calculator, pending_changes, year, month):
+    """화면 편집을 한 트랜잭션(conn)에 일괄 저장
+
+    Args:
+        calculator: AttendanceCalculator (조기출근/지각/야근 플래그 계산)
+        pending_changes: {(emp_id, work_date, 구분): 편집} (입력 순서 유지)
+        year, month: 조회 중인 월 (leave_records의 year/month)
+
+    Returns:
+        저장한 편집 수
+    """
+    groups = {}
+    for (emp_id, work_date, category), change in pending_changes.items():
+        groups.setdefault((emp_id, str(work_date)), []).append((work_date, category, change))
+    if not groups:
+        return 0
+    existing_rows = _fetch_existing(conn, groups)
+    registry = calculator.leave_registry
+    rules = calculator.rules
+
+    upserts, deletes = [], []
+    leave_deletes_all, leave_deletes, leave_inserts = [], [], []
+    for (emp_id, day), edits in groups.items():
+        pending_times = {category: _pending_time(change) for _, category, change in edits}
+        pending_times = {category: value for category, value in pending_times.items() if value is not None}
+        existing = existing_rows.get((emp_id, day))
+        row = existing
+        written = False
+        leave = _LeaveChanges()
+        for work_date, category, change in edits:
+            changed, new_row = _apply_change(calculator, registry, rules, emp_id, work_date, category, change,
+                                             existing, pending_times, leave)
+            if not changed:
+                continue
+            written = True
+            row = new_row
+            existing = None if new_row is None else (new_row[2], new_row[3], new_row[7], new_row[8])
+        if written:
+            if row is None:
+                deletes.append((emp_id, day))
+            else:
+                upserts.append(row)
+        if leave.delete_all:
+            leave_deletes_all.append((emp_id, day))
+        leave_deletes.extend((emp_id, day, leave_type) for leave_type in leave.deleted)
+        leave_inserts.extend((emp_id, leave_type, day, amount, year, month)
+                             for leave_type, amount in leave.inserted.items())
+
+    conn.executemany("DELETE FROM attendance_records WHERE employee_id = ? AND work_date = ?", deletes)
+    conn.executemany(UPSERT_ATTENDANCE_SQL, upserts)
+    conn.executemany("DELETE FROM leave_records WHERE employee_id = ? AND leave_date = ?", leave_deletes_all)
+    conn.executemany("""
+        DELETE FROM leave_records WHERE employee_id = ? AND leave_date = ? AND leave_type = ?
+    """, leave_deletes)
+    conn.executemany("""
+        INSERT OR REPLACE INTO leave_records
+        (employee_id, leave_type, leave_date, leave_amount, year, month)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, leave_inserts)
+    return len(pending_changes)
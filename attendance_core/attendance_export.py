@@ -0,0 +1,499 @@
+"""
+출퇴근 관리대장 엑셀 내보내기 (Qt 비의존)
+
+openpyxl write-only 모드로 시트를 한 행씩 기록합니다. 연도별로 한 번의 범위 조회
+(work_date 순)로 기록을 읽어 월 단위로 끊어 처리하므로, 메모리에는 한 달치 기록과
+현재 쓰는 직원 두 행만 남습니다. 셀 스타일(폰트/테두리/채우기/정렬)은 조합마다
+한 번만 만들어 재사용합니다.
+
+연 단위처럼 시트가 많으면 월별 시트 내용(행 값, 스타일 키, 병합 범위)을 프로세스
+풀에서 나눠 계산하고, 현재 프로세스는 받은 내용을 날짜순으로 기록만 합니다.
+
+    writer = AttendanceWorkbookWriter(conn)
+    writer.write("출퇴근.xlsx", [(2025, m) for m in range(1, 13)], employees)
+"""
+
+import os
+import sqlite3
+from calendar import monthrange
+from copy import copy
+from datetime import date
+from itertools import groupby
+from pathlib import Path
+
+from .month_grid import _to_date
+from .month_summary import MonthSummary
+
+
+SUMMARY_HEADERS = ("조기출근(8시이전)", "지각(9시이후)", "야근(20시이후)", "연차사용", "평균 출근시간", "평균 퇴근시간")
+WEEKDAY_NAMES = ('월', '화', '수', '목', '금', '토', '일')
+
+# 열 배치: A 직급, B 이름, C 구분, D~AH 1~31일, AI~AN 요약
+FIRST_DAY_COL = 4
+FIRST_SUMMARY_COL = 35
+LAST_COL = 40
+FIRST_DATA_ROW = 4
+# 데이터가 적어도 이 행까지는 테두리를 그림 (인쇄 양식 유지)
+MIN_BORDER_ROW = 45
+# 시트 수 x 직원 수가 이 이상일 때만 프로세스 풀 사용
+# (직원-월당 계산 약 0.3ms, 작업 프로세스 기동은 Windows spawn 기준 1~2초)
+PARALLEL_MIN_EMPLOYEE_MONTHS = 6000
+
+
+def _text_flags(leave_type, remarks):
+    """(출근 행 텍스트 여부, 퇴근 행 텍스트 여부)
+
+    remarks가 '{구분}_출근' / '{구분}_퇴근'이면 해당 행에만, 비고 없는 구분은 두 행 모두 텍스트
+    """
+    if not leave_type:
+        return False, False
+    return (remarks == f'{leave_type}_출근' or not remarks,
+            remarks == f'{leave_type}_퇴근' or not remarks)
+
+
+def _month_summary(year, month, employees, records, leave_registry):
+    """시트의 전체 직원 요약 (MonthSummary) - 텍스트로 표시하는 칸의 시각은 평균에서 제외"""
+    import numpy as np
+
+    emp_idx, day_idx, early, late_arr, late_dep, leave_types, arrival_minutes, departure_minutes = \
+        [], [], [], [], [], [], [], []
+    for i, employee in enumerate(employees):
+        for day, (_arr, _dep, e, la, ld, leave_type, remarks, arr_min, dep_min) in records.get(employee[0], {}).items():
+            text_in, text_out = _text_flags(leave_type, remarks)
+            emp_idx.append(i)
+            day_idx.append(day - 1)
+            early.append(bool(e))
+            late_arr.append(bool(la))
+            late_dep.append(bool(ld))
+            leave_types.append(leave_type or '')
+            arrival_minutes.append(-1 if text_in or arr_min is None else arr_min)
+            departure_minutes.append(-1 if text_out or dep_min is None else dep_min)
+    return MonthSummary.compute(year, month, len(employees), emp_idx, day_idx, early, late_arr, late_dep,
+                                np.array(leave_types, dtype=object), arrival_minutes, departure_minutes,
+                                leave_registry=leave_registry)
+
+
+def _employee_rows(year, month, days_in_month, hire_date, records, summary_values, leave_registry):
+    """직원 한 명의 (출근 행 값, 퇴근 행 값, 사선 일자 목록)
+
+    records: {일: (출근, 퇴근, 조기출근, 지각, 야근, 구분, 비고, 출근 분, 퇴근 분)}
+    summary_values: 직원의 요약 6개 (MonthSummary.values)
+    구분 텍스트는 등록부의 엑셀 표시 이름으로 씁니다.
+    값 목록은 A~AN 40칸이며 빈 칸은 None입니다. 요약 값은 출근 행에 둡니다(2행 병합).
+    """
+    arrival = [None] * LAST_COL
+    departure = [None] * LAST_COL
+
+    for day, (arr, dep, _early, _late_arr, _late_dep, leave_type, remarks, _arr_min, _dep_min) in records.items():
+        if day > days_in_month:
+            continue
+        col = FIRST_DAY_COL + day - 2
+        text_in, text_out = _text_flags(leave_type, remarks)
+        if text_in or text_out:
+            leave_type = leave_registry.export_label(leave_type)
+        if text_in:
+            arrival[col] = leave_type
+        elif arr:
+            arrival[col] = str(arr)[:5]
+        if text_out:
+            departure[col] = leave_type
+        elif dep:
+            departure[col] = str(dep)[:5]
+
+    early_count, late_arrival_count, late_departure_count, leave_amount, avg_arrival, avg_departure = summary_values
+    summary = FIRST_SUMMARY_COL - 1
+    arrival[summary] = str(early_count) if early_count else None
+    arrival[summary + 1] = str(late_arrival_count) if late_arrival_count else None
+    arrival[summary + 2] = str(late_departure_count) if late_departure_count else None
+    arrival[summary + 3] = str(leave_amount) if leave_amount > 0 else None
+    arrival[summary + 4] = avg_arrival or None
+    arrival[summary + 5] = avg_departure or None
+
+    # 입사 전 날짜는 비우고 사선 표시
+    diagonal_days = []
+    if hire_date:
+        for day in range(1, days_in_month + 1):
+            if date(year, month, day) < hire_date:
+                col = FIRST_DAY_COL + day - 2
+                arrival[col] = departure[col] = None
+                diagonal_days.append(day)
+    return arrival, departure, diagonal_days
+
+
+def _text_runs(arrival, departure, days_in_month):
+    """출근/퇴근 행 텍스트가 같은 연속 날짜 구간 [(시작 열, 끝 열), ...] (열 번호는 1부터)"""
+    runs = []
+    run_value = None
+    run_start = None
+    for col in range(FIRST_DAY_COL, FIRST_DAY_COL + days_in_month + 1):  # 마지막은 구간 종료용
+        value = None
+        if col < FIRST_DAY_COL + days_in_month:
+            top = str(arrival[col - 1]).strip() if arrival[col - 1] is not None else ""
+            bottom = str(departure[col - 1]).strip() if departure[col - 1] is not None else ""
+            if top and top == bottom:
+                value = top
+        if value != run_value:
+            if run_value is not None:
+                runs.append((run_start, col - 1))
+            run_value, run_start = value, col
+    return runs
+
+
+def _load_months(conn, year, months):
+    """해당 연도 months 범위를 work_date 순으로 조회하여 (월, {emp_id: {일: 기록}})을 차례로 생성"""
+    start = f"{year:04d}-{months[0]:02d}-01"
+    last = months[-1]
+    end = f"{year + 1:04d}-01-01" if last == 12 else f"{year:04d}-{last + 1:02d}-01"
+    rows = conn.execute("""
+        SELECT work_date, employee_id, arrival_time, departure_time,
+               early_arrival, late_arrival, late_departure, leave_type, remarks,
+               arrival_minute, departure_minute
+        FROM attendance_records
+        WHERE work_date >= ? AND work_date < ?
+        ORDER BY work_date
+    """, (start, end))
+    for year_month, month_rows in groupby(rows, key=lambda row: str(row[0])[:7]):
+        records = {}
+        for work_date, emp_id, *values in month_rows:
+            try:
+                day = int(str(work_date)[8:10])
+            except ValueError:
+                continue
+            records.setdefault(emp_id, {})[day] = values
+        yield int(year_month[5:7]), records
+
+
+def _month_records(conn, year_months):
+    """(년, 월, {emp_id: {일: 기록}})을 순서대로 생성
+
+    연도마다 한 번의 범위 조회를 열어 두고 월 단위로 읽으므로 한 달치 기록만 메모리에 둡니다.
+    """
+    for year, group in groupby(year_months, key=lambda year_month: year_month[0]):
+        months = [month for _, month in group]
+        loaded = _load_months(conn, year, months)
+        pending = next(loaded, None)
+        for month in months:
+            while pending is not None and pending[0] < month:
+                pending = next(loaded, None)
+            if pending is not None and pending[0] == month:
+                yield year, month, pending[1]
+                pending = next(loaded, None)
+            else:
+                yield year, month, {}
+
+
+class MonthSheet:
+    """한 달 시트 내용 (openpyxl 객체 없이 피클 가능 - 작업 프로세스에서 계산해 넘김)
+
+    rows: 1행부터 [[(값, 스타일 키), ...], ...]
+        스타일 키는 (폰트, 정렬, 채우기, 테두리)이며 앞의 셋은 작성기 속성 이름(또는 None),
+        테두리는 (왼쪽, 오른쪽, 위, 아래 변 속성 이름, 사선 여부)입니다.
+    merges: [(min_row, min_col, max_row, max_col), ...] (서로 겹치지 않음)
+    """
+
+    def __init__(self, year, month, rows, merges):
+        self.year = year
+        self.month = month
+        self.rows = rows
+        self.merges = merges
+
+
+def render_month(year, month, employees, records, leave_registry=None):
+    """한 달 시트 내용 계산
+
+    Args:
+        employees: [(emp_id, 직급, 이름, 입사일(date)), ...] 행 순서
+        records: {emp_id: {일: 기록}}
+        leave_registry: 근태 구분 등록부 (엑셀 표시 이름, 연차 차감량, None이면 기본 구분)
+
+    Returns:
+        MonthSheet
+    """
+    if leave_registry is None:
+        from .leave_types import DEFAULT_LEAVE_TYPES
+        leave_registry = DEFAULT_LEAVE_TYPES
+    days_in_month = monthrange(year, month)[1]
+    last_day_col = FIRST_DAY_COL + days_in_month - 1
+    weekdays = {day: date(year, month, day).weekday() for day in range(1, days_in_month + 1)}
+    weekend_cols = {FIRST_DAY_COL + day - 1 for day, wd in weekdays.items() if wd >= 5}
+    last_data_row = FIRST_DATA_ROW + 2 * len(employees) - 1
+    border_limit_row = max(last_data_row, MIN_BORDER_ROW)
+    rows = []
+    merges = []
+    # 같은 스타일 키는 한 객체만 쓰도록 모아 둠 (피클 크기 절감)
+    keys = {}
+
+    def style(font=None, alignment=None, fill=None, border=None):
+        key = (font, alignment, fill, border)
+        return keys.setdefault(key, key)
+
+    def grid_border(row, col, bottom_thick=False, diagonal=False):
+        return ('outer_side' if col == 1 else 'thin_side',
+                'outer_side' if col == LAST_COL else 'thin_side',
+                'outer_side' if row == 2 else 'thin_side',
+                'outer_side' if (bottom_thick or row == border_limit_row) else 'thin_side',
+                diagonal)
+
+    def data_style(row, col, bottom_thick=False, diagonal=False):
+        fill = 'fill_diag' if diagonal else 'fill_weekend' if col in weekend_cols else None
+        return style('font_data', 'align_data_wrap' if col in (2, 3) else 'align_data', fill,
+                     grid_border(row, col, bottom_thick, diagonal))
+
+    # 1행: 제목 (D1:I1)
+    title_row = [(None, style())] * 3
+    for col in range(4, 10):
+        border = ('outer_side' if col == 4 else None, 'outer_side' if col == 9 else None,
+                  'outer_side', 'outer_side', False)
+        if col == 4:
+            title_row.append((f"{year}년 {month}월", style('font_title', 'align_title', border=border)))
+        else:
+            title_row.append((None, style(border=border)))
+    rows.append(title_row)
+    merges.append((1, 4, 1, 9))
+
+    # 2~3행: 헤더
+    header_values = {1: '직급', 2: '이름', 3: '구분'}
+    for day, wd in weekdays.items():
+        header_values[FIRST_DAY_COL + day - 1] = f"{day}\n{WEEKDAY_NAMES[wd]}"
+    for idx, text in enumerate(SUMMARY_HEADERS):
+        header_values[FIRST_SUMMARY_COL + idx] = text
+    for col in header_values:
+        merges.append((2, col, 3, col))
+    for row in (2, 3):
+        cells = []
+        for col in range(1, LAST_COL + 1):
+            font = None
+            if FIRST_DAY_COL <= col <= last_day_col:
+                wd = weekdays[col - FIRST_DAY_COL + 1]
+                font = 'font_header_sat' if wd == 5 else 'font_header_sun' if wd == 6 else 'font_header'
+            cells.append((header_values.get(col) if row == 2 else None,
+                          style(font, 'align_header', 'fill_weekend' if col in weekend_cols else None,
+                                grid_border(row, col))))
+        rows.append(cells)
+
+    # 4행~: 직원별 출근/퇴근 두 행
+    row = FIRST_DATA_ROW
+    month_summary = _month_summary(year, month, employees, records, leave_registry)
+    for i, (emp_id, position, name, hire_date) in enumerate(employees):
+        arrival, departure, diagonal_days = _employee_rows(
+            year, month, days_in_month, hire_date, records.get(emp_id, {}), month_summary.values(i), leave_registry)
+        arrival[0], arrival[1], arrival[2] = position, name, "출근"
+        departure[2] = "퇴근"
+        diagonal_cols = {FIRST_DAY_COL + day - 1 for day in diagonal_days}
+
+        for col in (1, 2, *range(FIRST_SUMMARY_COL, LAST_COL + 1)):
+            merges.append((row, col, row + 1, col))
+            departure[col - 1] = None
+        for col in diagonal_cols:
+            merges.append((row, col, row + 1, col))
+        for start_col, end_col in _text_runs(arrival, departure, days_in_month):
+            merges.append((row, start_col, row + 1, end_col))
+            for col in range(start_col, end_col + 1):
+                departure[col - 1] = None
+                if col > start_col:
+                    arrival[col - 1] = None
+
+        for values, bottom_thick in ((arrival, False), (departure, True)):
+            rows.append([(values[col - 1], data_style(row, col, bottom_thick, col in diagonal_cols))
+                         for col in range(1, LAST_COL + 1)])
+            row += 1
+
+    # 인쇄 양식 유지를 위해 빈 행에도 테두리
+    while row <= border_limit_row:
+        rows.append([(None, data_style(row, col)) for col in range(1, LAST_COL + 1)])
+        row += 1
+    return MonthSheet(year, month, rows, merges)
+
+
+def _database_file(conn):
+    """연결된 main DB 파일 경로 (메모리 DB면 빈 문자열)"""
+    return conn.execute("PRAGMA database_list").fetchone()[2] or ""
+
+
+def _render_month_task(db_path, year, month, employees):
+    """(작업 프로세스) 읽기 전용 연결로 한 달 기록을 읽어 시트 내용 계산"""
+    from .leave_types import LeaveTypeRegistry
+
+    conn = sqlite3.connect(Path(db_path).as_uri() + "?mode=ro", uri=True)
+    try:
+        leave_registry = LeaveTypeRegistry.load(conn)
+        for _, records in _load_months(conn, year, [month]):
+            return render_month(year, month, employees, records, leave_registry)
+        return render_month(year, month, employees, {}, leave_registry)
+    finally:
+        conn.close()
+
+
+class AttendanceWorkbookWriter:
+    """출퇴근 관리대장 월별 시트 엑셀 작성기
+
+    시트 양식: 1행 제목(D1:I1), 2~3행 헤더, 4행부터 직원별 출근/퇴근 두 행.
+    직급/이름/요약 열과 입사 전 날짜는 두 행 병합, 출근/퇴근 텍스트가 같은
+    연속 날짜(연차, 추석 등)는 가로로도 병합합니다.
+
+    시트가 여럿이고 작업량이 PARALLEL_MIN_EMPLOYEE_MONTHS 이상이면 월별 시트 내용을
+    프로세스 풀에서 계산하고(작업마다 DB 읽기 전용 연결), 엑셀 기록은 현재 프로세스에서
+    날짜순으로 합니다. openpyxl 스타일 표는 워크북 단위라 기록은 나눌 수 없고,
+    앞 시트를 기록하는 동안 뒤 시트 계산이 진행됩니다.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def write(self, file_path, year_months, employees, progress=None, processes=None):
+        """엑셀 파일 작성
+
+        Args:
+            year_months: [(년, 월), ...] 시트 대상 (시트는 날짜순으로 생성)
+            employees: [(emp_id, 직급, 이름, 입사일), ...] 행 순서
+            progress: progress(작성한 시트 수, 전체 시트 수) 콜백 (선택)
+            processes: 작업 프로세스 수 (None이면 작업량과 CPU 수로 결정, 1이면 현재 프로세스에서만)
+
+        Returns:
+            생성한 시트 수
+        """
+        import openpyxl
+
+        workbook = openpyxl.Workbook(write_only=True)
+        count = self.add_sheets(workbook, year_months, employees, progress, processes)
+        workbook.save(file_path)
+        return count
+
+    def add_sheets(self, workbook, year_months, employees, progress=None, processes=None):
+        """write-only 워크북에 월별 시트 추가 (다른 시트와 한 파일로 묶을 때 사용)
+
+        Returns:
+            추가한 시트 수
+        """
+        year_months = sorted(set(year_months))
+        self._init_styles(workbook)
+        multi_year = len({year for year, _ in year_months}) > 1
+        employees = [(emp_id, position, name, _to_date(hire_date))
+                     for emp_id, position, name, hire_date in employees]
+
+        total = len(year_months)
+        for done, sheet in enumerate(self._render_months(year_months, employees, processes), 1):
+            title = f"{sheet.year}년 {sheet.month}월" if multi_year else f"{sheet.month}월"
+            self._write_sheet(workbook.create_sheet(title=title[:31]), sheet)
+            if progress is not None:
+                progress(done, total)
+        return total
+
+    def _render_months(self, year_months, employees, processes):
+        """MonthSheet를 날짜순으로 생성 (조건이 맞으면 프로세스 풀에서 계산)"""
+        if processes is None:
+            processes = 1
+            if len(year_months) * len(employees) >= PARALLEL_MIN_EMPLOYEE_MONTHS:
+                processes = min(len(year_months), os.cpu_count() or 1)
+        db_path = _database_file(self.conn) if processes > 1 and len(year_months) > 1 else ""
+        if not db_path:
+            from .leave_types import LeaveTypeRegistry
+            leave_registry = LeaveTypeRegistry.load(self.conn)
+            for year, month, records in _month_records(self.conn, year_months):
+                yield render_month(year, month, employees, records, leave_registry)
+            return
+
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # GUI(Qt 스레드)가 떠 있는 프로세스를 fork하지 않도록 모든 OS에서 spawn (Windows 기본값과 동일)
+        pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futures = [pool.submit(_render_month_task, db_path, year, month, employees)
+                       for year, month in year_months]
+            for future in futures:
+                yield future.result()
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # 스타일 (조합마다 한 번만 생성)
+    # ------------------------------------------------------------------
+    def _init_styles(self, workbook):
+        from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+        from openpyxl.styles.colors import Color
+
+        self._workbook = workbook
+        self._cell_styles = {}
+        self._Border = Border
+
+        # 일부 엑셀 환경에서 rgb 색상 지정이 무시되는 경우가 있어 indexed color 사용
+        self.thin_side = Side(style='thin', color=Color(indexed=8))    # black
+        self.outer_side = Side(style='thick', color=Color(indexed=8))  # black
+        self.diag_side = Side(style='thin', color=Color(indexed=22))   # gray
+
+        # 토/일 배경색 #D0CECE (openpyxl rgb는 ARGB 8자리)
+        self.fill_weekend = PatternFill(patternType="solid", fgColor="FFD0CECE")
+        self.fill_diag = PatternFill(patternType="solid", fgColor=Color(indexed=23))
+        self.align_title = Alignment(horizontal='center', vertical='center')
+        self.align_header = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        self.align_data = Alignment(horizontal='center', vertical='center', wrap_text=False)
+        self.align_data_wrap = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
+        self.font_title = Font(name='맑은 고딕', size=12, bold=True)
+        self.font_header = Font(name='맑은 고딕', size=10, bold=True)
+        self.font_header_sat = Font(name='맑은 고딕', size=10, color="FF0000FF", bold=True)
+        self.font_header_sun = Font(name='맑은 고딕', size=10, color="FFFF0000", bold=True)
+        self.font_data = Font(name='맑은 고딕', size=10, bold=False)
+
+    def _border(self, key):
+        left, right, top, bottom, diagonal = (getattr(self, name) if isinstance(name, str) else name
+                                              for name in key)
+        if diagonal:
+            return self._Border(left=left, right=right, top=top, bottom=bottom,
+                                diagonal=self.diag_side, diagonalDown=True)
+        return self._Border(left=left, right=right, top=top, bottom=bottom)
+
+    def _style(self, worksheet, key):
+        """스타일 키에 해당하는 셀 스타일 (조합마다 워크북에 한 번만 등록)"""
+        from openpyxl.cell import WriteOnlyCell
+
+        style = self._cell_styles.get(key)
+        if style is None:
+            font, alignment, fill, border = key
+            template = WriteOnlyCell(worksheet)
+            if font is not None:
+                template.font = getattr(self, font)
+            if alignment is not None:
+                template.alignment = getattr(self, alignment)
+            if fill is not None:
+                template.fill = getattr(self, fill)
+            if border is not None:
+                template.border = self._border(border)
+            style = self._cell_styles[key] = template._style
+        return style
+
+    # ------------------------------------------------------------------
+    # 시트 기록
+    # ------------------------------------------------------------------
+    def _write_sheet(self, worksheet, sheet):
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+        from openpyxl.worksheet.cell_range import CellRange
+
+        # 행 높이/열 너비/보기 설정은 셀보다 먼저 지정해야 함 (write-only)
+        worksheet.sheet_view.showGridLines = False
+        worksheet.sheet_view.zoomScale = 100
+        worksheet.row_dimensions[1].height = 25
+        worksheet.row_dimensions[2].height = 17.4
+        worksheet.row_dimensions[3].height = 17.4
+        for day in range(1, 32):
+            worksheet.column_dimensions[get_column_letter(FIRST_DAY_COL + day - 1)].width = 6.1
+
+        # render_month의 병합 범위는 서로 겹치지 않으므로 MultiCellRange.add의
+        # 포함 검사(기존 범위 전체 순회)를 건너뛰고 바로 등록
+        ranges = worksheet.merged_cells.ranges
+        for min_row, min_col, max_row, max_col in sheet.merges:
+            ranges.add(CellRange(min_col=min_col, min_row=min_row, max_col=max_col, max_row=max_row))
+
+        styles = {}
+        for values in sheet.rows:
+            cells = []
+            for value, key in values:
+                style = styles.get(key)
+                if style is None:
+                    style = styles[key] = self._style(worksheet, key)
+                cell = WriteOnlyCell(worksheet, value)
+                cell._style = copy(style)
+                cells.append(cell)
+            worksheet.append(cells)
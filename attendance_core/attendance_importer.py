@@ -0,0 +1,367 @@
+"""
+출퇴근 엑셀(지문 인식기 내보내기) 일괄 가져오기 (Qt 비의존)
+
+시트를 openpyxl read_only 모드로 한 번만 읽어 헤더(이름/구분/일자 열)를 찾고,
+셀 값은 서로 다른 값마다 한 번만 시간으로 해석합니다. 해당 월의 기존 기록은
+한 번의 범위 조회로 읽어 병합(수동 입력 값 우선)한 뒤, 바뀐 기록만
+executemany로 하나의 트랜잭션에 저장합니다.
+
+    importer = AttendanceImporter(db_manager, attendance_calculator)
+    result = importer.import_file("지문.xlsx", 2025, 3, progress=callback)
+    result.written, result.errors
+"""
+
+import re
+from calendar import monthrange
+from pathlib import Path
+
+from .attendance_calculator import UPSERT_ATTENDANCE_SQL
+from .month_loader import month_date_range
+from .time_input import input_time
+
+# 엑셀 이름과 등록된 직원 이름이 다른 경우 (엑셀 이름 -> 직원 이름)
+NAME_ALIASES = {'전금희(지문)': '전금희'}
+
+# '3월', '12월' 처럼 월 이름이 붙은 시트는 해당 월로 가져옴 (연간 파일)
+_MONTH_SHEET = re.compile(r"\s*(\d{1,2})\s*월\s*")
+
+# 진행률 콜백 호출 간격 (행 수)
+PROGRESS_STEP = 200
+
+
+class ImportIssue:
+    """행 단위 오류/경고 (엑셀 행 번호는 1부터)"""
+
+    __slots__ = ("sheet", "row", "name", "day", "value", "message")
+
+    def __init__(self, sheet, row, name, day, value, message):
+        self.sheet = sheet
+        self.row = row
+        self.name = name
+        self.day = day
+        self.value = value
+        self.message = message
+
+    def __str__(self):
+        where = f"[{self.sheet}] {self.row}행"
+        if self.name:
+            where += f" {self.name}"
+        if self.day:
+            where += f" {self.day}일"
+        if self.value is not None:
+            return f"{where}: {self.message} ({self.value})"
+        return f"{where}: {self.message}"
+
+
+class ImportResult:
+    """가져오기 결과
+
+    written: 새로 쓰거나 바뀐 기록 수, unchanged: 엑셀 값이 있었지만 기존 기록과 같아 건너뛴 수
+    employee_ids / start_date / end_date: 변경 알림(ChangeBus)에 쓸 범위
+    """
+
+    def __init__(self):
+        self.written = 0
+        self.unchanged = 0
+        self.errors = []
+        self.employee_ids = set()
+        self.start_date = None
+        self.end_date = None
+
+    def _touch(self, emp_id, work_date):
+        self.employee_ids.add(emp_id)
+        if self.start_date is None or work_date < self.start_date:
+            self.start_date = work_date
+        if self.end_date is None or work_date > self.end_date:
+            self.end_date = work_date
+
+    def error_report(self, limit=None):
+        lines = [str(issue) for issue in self.errors[:limit]]
+        if limit is not None and len(self.errors) > limit:
+            lines.append(f"... 외 {len(self.errors) - limit}건")
+        return "\n".join(lines)
+
+
+def _cell_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def parse_cell(value, leave_keywords=None):
+    """엑셀 셀 값 해석 (시간 형식은 time_input과 같은 규칙)
+
+    leave_keywords: 출근 행에 시간 대신 적혀 있으면 근태 구분으로 저장하는 값
+        (근태 구분 등록부에서 시간 대신 입력 가능한 구분, None이면 기본 구분)
+
+    Returns:
+        (time 또는 None, 근태 구분 또는 None, 해석 실패 여부)
+    """
+    if value is None:
+        return None, None, False
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None, None, False
+        if leave_keywords is None:
+            from .leave_types import DEFAULT_LEAVE_TYPES
+            leave_keywords = DEFAULT_LEAVE_TYPES.keywords
+        if value in leave_keywords:
+            return None, value, False
+    parsed = input_time(value)
+    return parsed, None, parsed is None
+
+
+def find_header(rows):
+    """이름/구분/일자(1~31) 열 위치를 찾음
+
+    이름 열과 일자 열이 모두 나온 행까지 위에서부터 훑습니다.
+
+    Returns:
+        (이름 열, 구분 열 또는 None, {일: 열}, 헤더 다음 행 인덱스)
+    """
+    name_col = None
+    category_col = None
+    date_cols = {}
+    for row_idx, row in enumerate(rows):
+        for col_idx, cell in enumerate(row):
+            text = _cell_text(cell)
+            if not text:
+                continue
+            if '이름' in text or 'name' in text.lower():
+                name_col = col_idx
+            if '구분' in text or 'category' in text.lower():
+                category_col = col_idx
+            if text.isdigit() and 1 <= int(text) <= 31:
+                date_cols[int(text)] = col_idx
+        if name_col is not None and date_cols:
+            return name_col, category_col, date_cols, row_idx + 1
+    return name_col, category_col, date_cols, len(rows)
+
+
+def read_workbook(file_path):
+    """엑셀 파일의 시트별 행 목록 [(시트 이름, [행 튜플, ...]), ...]
+
+    .xlsx는 openpyxl read_only 모드, .xls는 xlrd로 읽습니다.
+    """
+    if Path(file_path).suffix.lower() == '.xls':
+        return _read_xls(file_path)
+
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        return [(sheet.title, list(sheet.iter_rows(values_only=True))) for sheet in workbook.worksheets]
+    finally:
+        workbook.close()
+
+
+def _read_xls(file_path):
+    import xlrd
+
+    book = xlrd.open_workbook(file_path)
+    sheets = []
+    for sheet in book.sheets():
+        rows = []
+        for row_idx in range(sheet.nrows):
+            row = []
+            for cell in sheet.row(row_idx):
+                if cell.ctype == xlrd.XL_CELL_DATE:
+                    row.append(xlrd.xldate.xldate_as_datetime(cell.value, book.datemode))
+                elif cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+                    row.append(None)
+                else:
+                    row.append(cell.value)
+            rows.append(tuple(row))
+        sheets.append((sheet.name, rows))
+    return sheets
+
+
+def _parse_stored_time(value):
+    """DB에 저장된 'HH:MM:SS' / 'HH:MM' 문자열을 time으로"""
+    if not value or not isinstance(value, str):
+        return None
+    return input_time(value)
+
+
+class AttendanceImporter:
+    """출퇴근 엑셀 일괄 가져오기
+
+    엑셀 형식: 직원마다 '구분' 열이 '출근'인 행과 바로 아래 '퇴근'인 행이 한 쌍이며,
+    일자(1~31) 열에 시간(또는 출근 행에 연차 등 근태 구분)이 들어 있습니다.
+    기존 기록의 값은 유지하고 비어 있는 값만 엑셀 값으로 채웁니다.
+    """
+
+    def __init__(self, db_manager, attendance_calculator):
+        self.db = db_manager
+        self.calculator = attendance_calculator
+
+    def import_file(self, file_path, year, month, progress=None):
+        """파일 가져오기
+
+        '1월'~'12월' 이름의 시트가 있으면 각 시트를 해당 월로, 없으면 첫 시트를
+        year/month로 가져옵니다.
+
+        Args:
+            progress: progress(처리한 행 수, 전체 행 수) 콜백 (선택)
+
+        Returns:
+            ImportResult
+
+        Raises:
+            ValueError: 이름 열이나 일자 열을 찾을 수 없는 경우
+        """
+        sheets = read_workbook(file_path)
+        month_sheets = []
+        for title, rows in sheets:
+            match = _MONTH_SHEET.fullmatch(title)
+            if match and 1 <= int(match.group(1)) <= 12:
+                month_sheets.append((title, rows, int(match.group(1))))
+        if not month_sheets:
+            if not sheets:
+                raise ValueError("엑셀 파일에 시트가 없습니다.")
+            month_sheets = [(sheets[0][0], sheets[0][1], month)]
+        return self.import_sheets([(title, rows, year, sheet_month)
+                                   for title, rows, sheet_month in month_sheets], progress)
+
+    def import_sheets(self, sheets, progress=None):
+        """[(시트 이름, 행 목록, 년, 월), ...] 가져오기 (하나의 트랜잭션)"""
+        result = ImportResult()
+        total_rows = sum(len(rows) for _, rows, _, _ in sheets)
+
+        with self.db.connection() as conn:
+            employee_ids = {}
+            for emp_id, name in conn.execute("SELECT id, name FROM employees ORDER BY id"):
+                employee_ids[name] = emp_id
+        for alias, name in NAME_ALIASES.items():
+            if name in employee_ids:
+                employee_ids[alias] = employee_ids[name]
+
+        # 엑셀 값 해석 (DB 접근 없음)
+        parsed = {}  # (year, month) -> {(emp_id, day): [arrival, departure, leave_type]}
+        done_rows = 0
+        for title, rows, year, month in sheets:
+            imported = parsed.setdefault((year, month), {})
+
+            def report(row_idx, offset=done_rows):
+                if progress is not None:
+                    progress(offset + row_idx, total_rows)
+
+            self._parse_sheet(title, rows, year, month, employee_ids, imported, result, report)
+            done_rows += len(rows)
+            report(0)
+
+        # 기존 기록과 병합하여 한 번에 저장
+        with self.db.transaction() as conn:
+            for (year, month), imported in parsed.items():
+                if imported:
+                    self._merge_month(conn, year, month, imported, result)
+        return result
+
+    def _parse_sheet(self, title, rows, year, month, employee_ids, imported, result, report):
+        name_col, category_col, date_cols, start_row = find_header(rows)
+        if name_col is None:
+            raise ValueError(f"[{title}] 엑셀 파일에서 '이름' 컬럼을 찾을 수 없습니다.")
+        if not date_cols:
+            raise ValueError(f"[{title}] 엑셀 파일에서 날짜 컬럼(1~31)을 찾을 수 없습니다.")
+        if category_col is None:
+            result.errors.append(ImportIssue(title, start_row, None, None, None,
+                                             "'구분'(출근/퇴근) 컬럼이 없어 시트를 건너뜀"))
+            return
+
+        days_in_month = monthrange(year, month)[1]
+        day_cols = [(day, col) for day, col in sorted(date_cols.items()) if day <= days_in_month]
+        cache = {}
+        leave_keywords = self.calculator.leave_registry.keywords
+
+        def parse(value):
+            try:
+                return cache[value]
+            except KeyError:
+                parsed = cache[value] = parse_cell(value, leave_keywords)
+                return parsed
+            except TypeError:  # 해시 불가 값
+                return parse_cell(value, leave_keywords)
+
+        def cell(row, col):
+            return row[col] if col < len(row) else None
+
+        current_name = None
+        unknown_names = set()
+        for row_idx in range(start_row, len(rows) - 1):
+            if row_idx % PROGRESS_STEP == 0:
+                report(row_idx)
+            row = rows[row_idx]
+            if _cell_text(cell(row, category_col)) != '출근':
+                continue
+            name = _cell_text(cell(row, name_col))
+            if name and name not in ('출근', '퇴근', 'nan', 'None'):
+                current_name = name
+            # 출근 행 바로 아래가 퇴근 행인 쌍만 가져옴
+            next_row = rows[row_idx + 1]
+            if _cell_text(cell(next_row, category_col)) != '퇴근':
+                continue
+            if current_name is None:
+                continue
+            emp_id = employee_ids.get(current_name)
+            if emp_id is None:
+                if current_name not in unknown_names:
+                    unknown_names.add(current_name)
+                    result.errors.append(ImportIssue(title, row_idx + 1, current_name, None, None,
+                                                     "등록되지 않은 직원 - 건너뜀"))
+                continue
+
+            for day, col in day_cols:
+                arrival, leave_type, arrival_bad = parse(cell(row, col))
+                departure, _, departure_bad = parse(cell(next_row, col))
+                if arrival_bad:
+                    result.errors.append(ImportIssue(title, row_idx + 1, current_name, day,
+                                                     cell(row, col), "출근 시간 형식 오류"))
+                if departure_bad:
+                    result.errors.append(ImportIssue(title, row_idx + 2, current_name, day,
+                                                     cell(next_row, col), "퇴근 시간 형식 오류"))
+                if arrival is None and leave_type is None and departure is None:
+                    continue
+                # 같은 직원/날짜가 여러 번 나오면 먼저 나온 값 우선 (비어 있는 값만 채움)
+                values = imported.get((emp_id, day))
+                if values is None:
+                    imported[(emp_id, day)] = [arrival, departure, leave_type]
+                else:
+                    for i, value in enumerate((arrival, departure, leave_type)):
+                        if values[i] is None:
+                            values[i] = value
+
+    def _merge_month(self, conn, year, month, imported, result):
+        start, end = month_date_range(year, month)
+        existing = {}
+        for emp_id, work_date, arrival, departure, leave_type in conn.execute("""
+            SELECT employee_id, work_date, arrival_time, departure_time, leave_type
+            FROM attendance_records
+            WHERE work_date >= ? AND work_date < ?
+        """, (start, end)):
+            existing[(emp_id, str(work_date)[:10])] = (
+                _parse_stored_time(arrival), _parse_stored_time(departure), leave_type)
+
+        rules = self.calculator.rules
+        rows = []
+        for (emp_id, day), (arrival, departure, leave_type) in imported.items():
+            work_date = f"{year:04d}-{month:02d}-{day:02d}"
+            stored = existing.get((emp_id, work_date))
+            if stored is None:
+                final = (arrival, departure, leave_type)
+            else:
+                # 기존(수동 입력) 값은 유지하고 비어 있는 값만 엑셀 값으로 채움
+                final = (stored[0] or arrival,
+                         stored[1] or departure,
+                         stored[2] if stored[2] not in (None, "") else leave_type)
+                if final == (stored[0], stored[1], stored[2] or None):
+                    result.unchanged += 1
+                    continue
+            rows.append(self.calculator.attendance_row(emp_id, work_date, *final, "", rules=rules))
+            result._touch(emp_id, work_date)
+
+        if rows:
+            conn.executemany(UPSERT_ATTENDANCE_SQL, rows)
+        result.written += len(rows)
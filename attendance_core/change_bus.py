@@ -0,0 +1,99 @@
+"""
+탭 간 변경 알림 (Qt 비의존)
+
+한 탭에서 데이터를 저장하면 다른 탭 전체를 새로고침하지 않고,
+무엇이 바뀌었는지(직원 / 출퇴근 기록 / 연월차)를 이벤트로 알립니다.
+각 탭은 자신과 관련된 이벤트만 골라 해당 직원 행만 다시 그리거나,
+화면에 보이지 않으면 표시될 때까지 갱신을 미룹니다.
+
+    bus = ChangeBus()
+    bus.subscribe(handler)
+    bus.publish(ChangeEvent(ATTENDANCE_CHANGED, [emp_id], '2025-03-01', '2025-03-31'))
+"""
+
+import logging
+from datetime import date, datetime
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 종류
+EMPLOYEE_CHANGED = "employee"      # 직원 추가/삭제/정보 변경 (화면 구성이 바뀜)
+ATTENDANCE_CHANGED = "attendance"  # 출퇴근 기록 변경 (직원, 날짜 범위)
+LEAVE_CHANGED = "leave"            # 연월차 기록 변경 - 원장 재계산 필요 (직원, 날짜 범위)
+
+
+def _to_iso(value):
+    if value is None:
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return str(value)[:10]
+
+
+class ChangeEvent:
+    """변경 이벤트
+
+    employee_ids가 None이면 전체 직원, start_date/end_date가 None이면 기간 제한 없음입니다.
+    날짜는 'YYYY-MM-DD' 문자열로 보관하며 end_date를 포함하는 구간입니다.
+    source는 발행한 쪽(탭)으로, 발행한 탭은 이미 직접 반영했으므로 자신의 이벤트를 무시합니다.
+    """
+
+    __slots__ = ("kind", "employee_ids", "start_date", "end_date", "source")
+
+    def __init__(self, kind, employee_ids=None, start_date=None, end_date=None, source=None):
+        self.kind = kind
+        self.employee_ids = frozenset(employee_ids) if employee_ids is not None else None
+        self.start_date = _to_iso(start_date)
+        self.end_date = _to_iso(end_date)
+        self.source = source
+
+    def overlaps(self, start_date, end_date):
+        """[start_date, end_date) 구간과 겹치는지"""
+        if self.start_date is not None and self.start_date >= _to_iso(end_date):
+            return False
+        if self.end_date is not None and self.end_date < _to_iso(start_date):
+            return False
+        return True
+
+    def overlaps_years(self, first_year, last_year):
+        """first_year ~ last_year (포함) 기간과 겹치는지"""
+        return self.overlaps(f"{first_year:04d}-01-01", f"{last_year + 1:04d}-01-01")
+
+    def __repr__(self):
+        return (f"ChangeEvent({self.kind!r}, employee_ids={self.employee_ids!r}, "
+                f"start_date={self.start_date!r}, end_date={self.end_date!r})")
+
+
+class ChangeBus:
+    """변경 이벤트 발행/구독
+
+    구독자는 발행한 스레드(일반적으로 GUI 스레드)에서 등록 순서대로 호출됩니다.
+    한 구독자의 오류가 다른 구독자 알림을 막지 않습니다.
+    """
+
+    def __init__(self):
+        self._subscribers = []
+
+    def subscribe(self, callback):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def publish(self, event):
+        for callback in list(self._subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.exception("변경 알림 처리 오류 (%s)", event.kind)
+
+    def employees_changed(self, employee_ids=None, source=None):
+        self.publish(ChangeEvent(EMPLOYEE_CHANGED, employee_ids, source=source))
+
+    def attendance_changed(self, employee_ids=None, start_date=None, end_date=None, source=None):
+        self.publish(ChangeEvent(ATTENDANCE_CHANGED, employee_ids, start_date, end_date, source))
+
+    def leave_changed(self, employee_ids=None, start_date=None, end_date=None, source=None):
+        self.publish(ChangeEvent(LEAVE_CHANGED, employee_ids, start_date, end_date, source))
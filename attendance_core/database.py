@@ -0,0 +1,372 @@
+"""
+데이터베이스 관리 (Qt 비의존)
+"""
+
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+
+from .migrations import apply_migrations
+
+
+# 연결마다 적용하는 PRAGMA (journal_mode=WAL은 DB 파일에 영구 저장되므로 초기화 시 한 번만 설정)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",    # WAL 모드에서는 NORMAL로도 안전
+    "PRAGMA cache_size=-16000",     # 페이지 캐시 약 16MB
+    "PRAGMA mmap_size=268435456",   # 메모리 맵 I/O 256MB
+    "PRAGMA temp_store=MEMORY",     # 정렬/임시 테이블을 메모리에서 처리
+)
+
+# 스레드별로 보관할 유휴 연결 최대 수 (초과분은 실제로 닫음)
+MAX_IDLE_CONNECTIONS = 4
+
+
+class PooledConnection(sqlite3.Connection):
+    """풀에서 재사용되는 연결
+
+    close()를 호출하면 실제로 닫지 않고 풀에 반환합니다.
+    커밋하지 않은 변경은 기존 close()와 동일하게 롤백됩니다.
+    """
+
+    def close(self):
+        pool = getattr(self, "_pool", None)
+        if pool is None:
+            super().close()
+            return
+        if not getattr(self, "_in_use", False):
+            return  # 이미 반환된 연결 (중복 close 무시)
+        if self.in_transaction:
+            self.rollback()
+        self._in_use = False
+        pool.release(self)
+
+    def close_physically(self):
+        """풀에 반환하지 않고 실제로 연결 종료"""
+        self._pool = None
+        super().close()
+
+
+class ConnectionPool:
+    """스레드별 유휴 연결 목록을 관리하는 연결 풀
+
+    sqlite3 연결은 스레드 간 공유하지 않습니다. 각 스레드는 자신이 반환한
+    연결만 다시 꺼내 쓰며, 중첩 호출(외부 연결을 연 채 내부에서 다시
+    get_connection 호출)에는 서로 다른 연결이 주어져 기존 동작과 같습니다.
+    """
+
+    def __init__(self, db_path, timeout=30.0):
+        self.db_path = db_path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all = weakref.WeakSet()  # close()하지 않고 버려진 연결은 기존처럼 GC 시 정리
+
+    def _idle(self):
+        idle = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = self._local.idle = []
+        return idle
+
+    def acquire(self):
+        idle = self._idle()
+        if idle:
+            conn = idle.pop()
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout,
+                                   factory=PooledConnection, check_same_thread=False)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            conn._pool = self
+            with self._lock:
+                self._all.add(conn)
+        conn._in_use = True
+        return conn
+
+    def release(self, conn):
+        idle = self._idle()
+        if len(idle) >= MAX_IDLE_CONNECTIONS:
+            with self._lock:
+                self._all.discard(conn)
+            conn.close_physically()
+            return
+        idle.append(conn)
+
+    def close_all(self):
+        """풀의 모든 연결 종료 (프로그램 종료 시 호출)"""
+        with self._lock:
+            conns = list(self._all)
+            self._all = weakref.WeakSet()
+        for conn in conns:
+            try:
+                conn.close_physically()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+
+class DatabaseManager:
+    """데이터베이스 관리 클래스"""
+    
+    def __init__(self, db_path="leave_attendance.db"):
+        # exe 파일로 실행 중인지 확인
+        import sys
+        import os
+        import shutil
+        
+        if getattr(sys, 'frozen', False):
+            # exe로 실행 중인 경우
+            # 먼저 사용자 AppData 폴더에 저장 시도 (권한 문제 방지)
+            try:
+                appdata_dir = os.path.join(os.getenv('APPDATA', ''), '근태관리프로그램')
+                os.makedirs(appdata_dir, exist_ok=True)
+                appdata_db_path = os.path.join(appdata_dir, db_path)
+                
+                # AppData 폴더에 쓰기 권한이 있는지 테스트
+                test_file = os.path.join(appdata_dir, '.test_write')
+                try:
+                    with open(test_file, 'w') as f:
+                        f.write('test')
+                    os.remove(test_file)
+                    # 쓰기 가능하면 AppData 폴더 사용
+                    self.db_path = appdata_db_path
+                except (IOError, OSError):
+                    # AppData 폴더에 쓰기 불가능하면 EXE 파일 디렉토리 사용
+                    exe_dir = os.path.dirname(sys.executable)
+                    self.db_path = os.path.join(exe_dir, db_path)
+            except Exception:
+                # 모든 시도 실패 시 EXE 파일 디렉토리 사용
+                exe_dir = os.path.dirname(sys.executable)
+                self.db_path = os.path.join(exe_dir, db_path)
+            
+            # 포함된 데이터베이스 파일이 있으면 복사
+            try:
+                # PyInstaller의 임시 디렉토리에서 데이터베이스 파일 찾기
+                if hasattr(sys, '_MEIPASS'):
+                    bundled_db = os.path.join(sys._MEIPASS, db_path)
+                    if os.path.exists(bundled_db):
+                        # 실행 디렉토리에 데이터베이스가 없거나, 포함된 데이터베이스가 더 최신이면 복사
+                        if not os.path.exists(self.db_path):
+                            # 데이터베이스 파일이 없으면 포함된 파일 복사
+                            try:
+                                shutil.copy2(bundled_db, self.db_path)
+                            except (IOError, OSError, PermissionError):
+                                # 복사 실패 시 AppData 폴더에 복사 시도
+                                try:
+                                    appdata_dir = os.path.join(os.getenv('APPDATA', ''), '근태관리프로그램')
+                                    os.makedirs(appdata_dir, exist_ok=True)
+                                    appdata_db_path = os.path.join(appdata_dir, db_path)
+                                    shutil.copy2(bundled_db, appdata_db_path)
+                                    self.db_path = appdata_db_path
+                                except Exception:
+                                    pass
+                        # 실행 디렉토리에 데이터베이스가 있으면 그대로 사용 (사용자가 수정한 데이터 유지)
+            except Exception as e:
+                # 오류 발생 시에도 계속 진행 (기존 데이터베이스 사용)
+                pass
+        else:
+            # Python 스크립트로 실행 중인 경우
+            self.db_path = db_path
+        
+        self.pool = ConnectionPool(self.db_path, timeout=30.0)  # 타임아웃 30초 설정
+        self.init_database()
+    
+    def get_connection(self):
+        """데이터베이스 연결 반환 (풀에서 재사용, close() 시 풀에 반환)"""
+        return self.pool.acquire()
+    
+    @contextmanager
+    def connection(self):
+        """읽기용 연결 컨텍스트
+
+            with db.connection() as conn:
+                conn.execute(...)
+        """
+        conn = self.get_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """쓰기 트랜잭션 컨텍스트 (정상 종료 시 커밋, 예외 시 롤백)
+
+        BEGIN IMMEDIATE로 시작하여 쓰기 잠금을 미리 확보합니다.
+        WAL 모드이므로 다른 연결의 읽기는 이 트랜잭션에 막히지 않습니다.
+        """
+        conn = self.get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+    
+    def close_all(self):
+        """풀의 모든 연결 종료"""
+        self.pool.close_all()
+    
+    def init_database(self):
+        """데이터베이스 초기화 및 테이블 생성"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        # WAL 저널 모드: 읽기와 쓰기가 서로를 막지 않음 (DB 파일에 영구 저장)
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
+        # 직원 정보 테이블
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS employees (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                department TEXT NOT NULL,
+                position TEXT NOT NULL,
+                name TEXT NOT NULL,
+                hire_date DATE NOT NULL,
+                display_order INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(department, position, name, hire_date)
+            )
+        """)
+        
+        # display_order 컬럼이 없으면 추가 (기존 데이터베이스 호환성)
+        cursor.execute("PRAGMA table_info(employees)")
+        columns = [col[1] for col in cursor.fetchall()]
+        if 'display_order' not in columns:
+            cursor.execute("ALTER TABLE employees ADD COLUMN display_order INTEGER DEFAULT 0")
+        
+        # is_active 컬럼이 없으면 추가 (중도 퇴사자 숨김 기능)
+        if 'is_active' not in columns:
+            cursor.execute("ALTER TABLE employees ADD COLUMN is_active INTEGER DEFAULT 1")
+        
+        # resignation_date 컬럼이 없으면 추가 (퇴사일 저장)
+        if 'resignation_date' not in columns:
+            cursor.execute("ALTER TABLE employees ADD COLUMN resignation_date DATE")
+        
+        # phone 컬럼이 없으면 추가 (연락처 저장)
+        if 'phone' not in columns:
+            cursor.execute("ALTER TABLE employees ADD COLUMN phone TEXT")
+        
+        # email 컬럼이 없으면 추가 (이메일 저장)
+        if 'email' not in columns:
+            cursor.execute("ALTER TABLE employees ADD COLUMN email TEXT")
+        
+        # 연월차 관리 테이블
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS leave_records (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                employee_id INTEGER NOT NULL,
+                leave_type TEXT NOT NULL,
+                leave_date DATE NOT NULL,
+                leave_amount REAL NOT NULL,
+                year INTEGER NOT NULL,
+                month INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (employee_id) REFERENCES employees(id),
+                UNIQUE(employee_id, leave_date, leave_type)
+            )
+        """)
+
+        # leave_records 테이블 컬럼 호환성 검사 (기존 데이터베이스 업그레이드)
+        cursor.execute("PRAGMA table_info(leave_records)")
+        lr_columns = [col[1] for col in cursor.fetchall()]
+        if 'year' not in lr_columns:
+            cursor.execute("ALTER TABLE leave_records ADD COLUMN year INTEGER")
+        if 'month' not in lr_columns:
+            cursor.execute("ALTER TABLE leave_records ADD COLUMN month INTEGER")
+        
+        # 연월차 소멸 내역 테이블
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS leave_expirations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                employee_id INTEGER NOT NULL,
+                leave_type TEXT NOT NULL,
+                expired_amount REAL NOT NULL,
+                expiration_date DATE NOT NULL,
+                year INTEGER NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (employee_id) REFERENCES employees(id)
+            )
+        """)
+        
+        # 출퇴근 기록 테이블
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS attendance_records (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                employee_id INTEGER NOT NULL,
+                work_date DATE NOT NULL,
+                arrival_time TIME,
+                departure_time TIME,
+                early_arrival INTEGER DEFAULT 0,
+                late_arrival INTEGER DEFAULT 0,
+                late_departure INTEGER DEFAULT 0,
+                leave_type TEXT,
+                remarks TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (employee_id) REFERENCES employees(id),
+                UNIQUE(employee_id, work_date)
+            )
+        """)
+
+        # attendance_records 테이블 컬럼 호환성 검사 (기존 데이터베이스 업그레이드)
+        cursor.execute("PRAGMA table_info(attendance_records)")
+        ar_columns = [col[1] for col in cursor.fetchall()]
+        if 'early_arrival' not in ar_columns:
+            cursor.execute("ALTER TABLE attendance_records ADD COLUMN early_arrival INTEGER DEFAULT 0")
+        if 'late_arrival' not in ar_columns:
+            cursor.execute("ALTER TABLE attendance_records ADD COLUMN late_arrival INTEGER DEFAULT 0")
+        if 'late_departure' not in ar_columns:
+            cursor.execute("ALTER TABLE attendance_records ADD COLUMN late_departure INTEGER DEFAULT 0")
+        if 'leave_type' not in ar_columns:
+            cursor.execute("ALTER TABLE attendance_records ADD COLUMN leave_type TEXT")
+        if 'remarks' not in ar_columns:
+            cursor.execute("ALTER TABLE attendance_records ADD COLUMN remarks TEXT")
+        
+        # 연월차 관리대장 수동 입력 값 저장 테이블
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS leave_manual_values (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                employee_id INTEGER NOT NULL,
+                year INTEGER NOT NULL,
+                column_index INTEGER NOT NULL,
+                manual_value TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (employee_id) REFERENCES employees(id),
+                UNIQUE(employee_id, year, column_index)
+            )
+        """)
+        
+        # 연도별 잔여수 저장 테이블 (1년 이상 재직인원의 이전 년도 잔여수 저장)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS leave_remaining_by_year (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                employee_id INTEGER NOT NULL,
+                year INTEGER NOT NULL,
+                remaining_amount REAL NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (employee_id) REFERENCES employees(id),
+                UNIQUE(employee_id, year)
+            )
+        """)
+
+        # 직원별 소멸 계산 완료일 (소멸 스케줄러 watermark, 입사일 변경 시 재계산)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS leave_expiration_watermarks (
+                employee_id INTEGER PRIMARY KEY,
+                hire_date DATE NOT NULL,
+                computed_through DATE NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (employee_id) REFERENCES employees(id)
+            )
+        """)
+
+        conn.commit()
+        
+        # 버전별 스키마 변경 (인덱스 등)
+        apply_migrations(conn)
+        conn.close()
@@ -0,0 +1,203 @@
+"""
+연월차 소멸 스케줄러 (Qt 비의존)
+
+직원별로 "소멸 계산 완료일(watermark)"을 저장해 두고, 그 이후에 지난
+입사기념일만 처리합니다. 프로그램 시작 시 또는 날짜가 바뀌었을 때 한 번
+실행하며, 모든 소멸 기록은 하나의 트랜잭션으로 저장합니다.
+(화면 새로고침 경로에서는 더 이상 소멸 기록을 쓰지 않습니다.)
+"""
+
+from datetime import datetime, timedelta
+
+from .leave_calendar import entitlement_calendar
+from .leave_ledger import LeaveLedger
+
+
+class ExpirationScheduler:
+    """입사기념일 기준 연월차 소멸 처리 스케줄러
+
+    사용 예:
+        scheduler = ExpirationScheduler(db_manager, leave_calculator)
+        scheduler.run()                 # 오늘 기준
+        scheduler.run_if_date_changed() # 날짜가 바뀐 경우에만
+    """
+
+    def __init__(self, db_manager, leave_calculator):
+        self.db = db_manager
+        self.calculator = leave_calculator
+        self.last_run_date = None
+
+    def run_if_date_changed(self, target_date=None):
+        """마지막 실행 이후 날짜가 바뀐 경우에만 실행. 새로 기록한 소멸 건수 반환"""
+        if target_date is None:
+            target_date = datetime.now().date()
+        if self.last_run_date == target_date:
+            return 0
+        return self.run(target_date)
+
+    def run(self, target_date=None):
+        """watermark 이후 지난 입사기념일의 소멸을 일괄 기록
+
+        Returns:
+            새로 기록한 소멸 건수
+        """
+        if target_date is None:
+            target_date = datetime.now().date()
+        if isinstance(target_date, str):
+            target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT id, name, hire_date FROM employees")
+            employees = cursor.fetchall()
+
+            watermarks = {
+                emp_id: (hire_date, computed_through)
+                for emp_id, hire_date, computed_through in cursor.execute("""
+                    SELECT employee_id, hire_date, computed_through
+                    FROM leave_expiration_watermarks
+                """).fetchall()
+            }
+            existing = {
+                (emp_id, leave_type, str(exp_date))
+                for emp_id, leave_type, exp_date in cursor.execute("""
+                    SELECT employee_id, leave_type, expiration_date
+                    FROM leave_expirations
+                """).fetchall()
+            }
+
+            new_expirations = []
+            carryover_candidates = []
+            processed = []
+            for emp_id, name, hire_date_str in employees:
+                try:
+                    calendar = entitlement_calendar(hire_date_str)
+                except (TypeError, ValueError):
+                    continue
+                hire_date = calendar.hire_date
+
+                # 입사일이 바뀌었거나 처음 처리하는 직원은 입사일부터 다시 계산
+                stored = watermarks.get(emp_id)
+                if stored and stored[0] == hire_date_str:
+                    computed_through = datetime.strptime(stored[1], "%Y-%m-%d").date()
+                else:
+                    computed_through = hire_date - timedelta(days=1)
+                if computed_through >= target_date:
+                    continue
+
+                new_expirations.extend(self._monthly_expirations(
+                    cursor, emp_id, name, hire_date, computed_through, target_date, existing))
+                new_expirations.extend(self._annual_expirations(
+                    cursor, emp_id, name, hire_date, computed_through, target_date, existing))
+
+                # 당해 입사기념일이 새로 지난 직원은 이월 연차 소멸 대상 (2026년 이상)
+                anniversary = calendar.anniversary(target_date.year)
+                if target_date.year >= 2026 and computed_through < anniversary <= target_date:
+                    carryover_candidates.append((emp_id, name, hire_date_str))
+
+                processed.append((emp_id, hire_date_str, target_date))
+
+            if carryover_candidates:
+                new_expirations.extend(self._carryover_expirations(
+                    conn, carryover_candidates, target_date, existing))
+
+            cursor.executemany("""
+                INSERT INTO leave_expirations
+                (employee_id, leave_type, expired_amount, expiration_date, year)
+                VALUES (?, ?, ?, ?, ?)
+            """, new_expirations)
+            cursor.executemany("""
+                INSERT OR REPLACE INTO leave_expiration_watermarks
+                (employee_id, hire_date, computed_through, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, processed)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        self.last_run_date = target_date
+        return len(new_expirations)
+
+    def _used_leave(self, cursor, emp_id, leave_type, start_date, end_date):
+        """leave_records 기준 기간 내 사용량"""
+        cursor.execute("""
+            SELECT SUM(leave_amount) as total_used
+            FROM leave_records
+            WHERE employee_id = ? AND leave_type = ?
+            AND leave_date >= ? AND leave_date < ?
+        """, (emp_id, leave_type, start_date, end_date))
+        result = cursor.fetchone()
+        return result[0] if result and result[0] else 0
+
+    def _monthly_expirations(self, cursor, emp_id, name, hire_date, computed_through, target_date, existing):
+        """월차 소멸 - 1년 미만자만, 입사 1년 되는 날 소멸"""
+        if self.calculator.is_one_year_or_more(name, hire_date, target_date):
+            return []
+        one_year_date = entitlement_calendar(hire_date).anniversaries[1]
+        if not (computed_through < one_year_date <= target_date):
+            return []
+        if (emp_id, '월차', str(one_year_date)) in existing:
+            return []
+
+        total_used = self._used_leave(cursor, emp_id, '월차', hire_date, one_year_date)
+        max_monthly_leave = min(11, self.calculator.calculate_monthly_leave(hire_date, one_year_date - timedelta(days=1)))
+        expired_amount = max_monthly_leave - total_used
+        if expired_amount <= 0:
+            return []
+        existing.add((emp_id, '월차', str(one_year_date)))
+        return [(emp_id, '월차', expired_amount, one_year_date, target_date.year)]
+
+    def _annual_expirations(self, cursor, emp_id, name, hire_date, computed_through, target_date, existing):
+        """연차 소멸 - watermark 이후 지난 입사기념일만 처리
+
+        n번째 입사기념일에 (n-1)번째 입사기념일에 생성된 연차 중 사용하지 않은 부분이 소멸됩니다.
+        1년 미만자(첫 입사기념일)는 입사일부터의 발생분 기준으로 계산합니다.
+        """
+        is_one_year = self.calculator.is_one_year_or_more(name, hire_date, target_date)
+        calendar = entitlement_calendar(hire_date)
+        rows = []
+        for year_offset in range(1, 51):  # 최대 50년까지 확인
+            anniversary = calendar.anniversaries[year_offset]
+            if anniversary > target_date:
+                break
+            if anniversary <= computed_through:
+                continue
+            if (emp_id, '연차', str(anniversary)) in existing:
+                continue
+
+            if year_offset == 1:
+                period_start = hire_date
+            else:
+                period_start = calendar.anniversaries[year_offset - 1]
+
+            if is_one_year and year_offset > 1:
+                # 이전 입사기념일에 생성된 연차 - 다음 입사기념일 직전까지 사용한 연차
+                generated = calendar.annual_leave(period_start)
+            else:
+                # 입사일(또는 이전 입사기념일)부터 현재 입사기념일 직전까지 발생한 연차
+                generated = calendar.annual_leave(anniversary - timedelta(days=1))
+                if year_offset > 1:
+                    generated -= calendar.annual_leave(period_start - timedelta(days=1))
+
+            expired_amount = generated - self._used_leave(cursor, emp_id, '연차', period_start, anniversary)
+            if expired_amount > 0:
+                existing.add((emp_id, '연차', str(anniversary)))
+                rows.append((emp_id, '연차', expired_amount, anniversary, target_date.year))
+        return rows
+
+    def _carryover_expirations(self, conn, candidates, target_date, existing):
+        """이전 년도 잔여 연차 중 당해 입사기념일까지 사용하지 않은 부분 소멸 (2026년 이상)"""
+        ledger = LeaveLedger(self.calculator).build(conn, candidates, target_date.year, today=target_date)
+        rows = []
+        for emp_id, amount, exp_date in ledger.loc[ledger['carryover_expired'] > 0,
+                                                  ['carryover_expired', 'carryover_expiration_date']].itertuples():
+            key = (emp_id, '연차', str(exp_date))
+            if key in existing:
+                continue
+            existing.add(key)
+            rows.append((emp_id, '연차', float(amount), exp_date, target_date.year))
+        return rows
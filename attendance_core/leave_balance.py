@@ -0,0 +1,189 @@
+"""
+연차 사용 월별 집계 (leave_balance_monthly) 조회·재구성
+
+attendance_records의 연차성 기록은 트리거가 (년, 월, 직원)별 일수로 바로
+집계해 두므로(migrations 2번), 기간 사용량을 구할 때 원본 기록을 다시 읽지
+않고 월별 집계 행만 읽습니다.
+
+사용량 기간의 경계는 항상 월 초이거나 입사일/입사기념일(입사월 안)입니다.
+그래서 직원별 입사월만 원본 기록을 일 단위로 읽고, 나머지 월은 집계 행을
+그 달 1일자 사용량으로 돌려주면 [시작, 끝) 구간 합계가 원본과 같습니다.
+
+발생/소멸 연차는 조회 기준일(오늘)과 근속 규칙에 따라 달라지므로 집계하지
+않습니다 (leave_expirations는 작고 인덱스로 조회됨).
+
+    python -m attendance_core.leave_balance leave_attendance.db           # 일치 검사
+    python -m attendance_core.leave_balance leave_attendance.db --rebuild # 재구성
+"""
+
+import argparse
+from datetime import date, datetime
+
+from .migrations import LEAVE_BALANCE_BACKFILL, LEAVE_BALANCE_SELECT, LEAVE_ROW_CONDITION
+
+# 연차 사용으로 집계하는 근태 유형
+FULL_DAY_LEAVE_TYPES = ('연차', '휴가')
+HALF_DAY_LEAVE_TYPE = '반차'
+HALF_DAY_REMARKS = ('반차_출근', '반차_퇴근')
+
+# employee_id IN (...)으로 거를 최대 직원 수 (초과 시 Python에서 거름)
+MAX_EMPLOYEE_FILTER = 500
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    return value
+
+
+def _month_index(value):
+    return value.year * 12 + value.month - 1
+
+
+def _month_start(index):
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _raw_amounts(leave_type, remarks):
+    """원본 기록 한 건의 (사용량, 구분 기준 사용량) - 연차/휴가 1.0, 반차 0.5"""
+    if leave_type in FULL_DAY_LEAVE_TYPES:
+        return 1.0, 1.0
+    if leave_type == HALF_DAY_LEAVE_TYPE:
+        return 0.5, 0.5
+    if remarks in HALF_DAY_REMARKS:
+        return 0.5, 0.0
+    return 0.0, 0.0
+
+
+def _employee_filter(employee_ids, params):
+    """employee_id 조건 SQL (직원이 많으면 빈 문자열 - 호출한 쪽에서 거름)"""
+    if len(employee_ids) > MAX_EMPLOYEE_FILTER:
+        return ""
+    params.extend(employee_ids)
+    return f" AND employee_id IN ({','.join('?' * len(employee_ids))})"
+
+
+def load_usage_rows(conn, hire_dates, start_date, end_date):
+    """[start_date, end_date)가 속한 월 전체의 직원별 연차 사용량 행
+
+    Args:
+        hire_dates: {employee_id: 입사일} - 조회 대상 직원 (입사월은 일 단위 원본 기록으로 반환)
+        start_date, end_date: 조회 구간 (월 단위로 넓혀 조회)
+
+    Returns:
+        [(employee_id, 'YYYY-MM-DD', amount, strict_amount), ...]
+        amount: 연차/휴가 1.0, 반차(구분 또는 비고) 0.5
+        strict_amount: 구분이 '반차'인 경우만 반차로 계산 (전전년도 계산용)
+        입사월이 아닌 월은 그 달 1일자 한 행으로 합산됨
+    """
+    first = _month_index(_as_date(start_date))
+    end = _as_date(end_date)
+    last = _month_index(end) + (0 if end.day == 1 else 1)  # 미포함
+    hire_months = {}
+    for emp_id, hire_date in hire_dates.items():
+        hire_date = _as_date(hire_date)
+        hire_months[emp_id] = hire_date.month if hire_date is not None else None
+    if last <= first or not hire_months:
+        return []
+
+    employee_ids = list(hire_months)
+    first_month, last_month = _month_start(first), _month_start(last)
+    params = [first_month.year, first_month.month, last_month.year, last_month.month]
+    sql = """
+        SELECT employee_id, month, printf('%04d-%02d-01', year, month),
+               full_days + 0.5 * half_days, full_days + 0.5 * typed_half_days
+        FROM leave_balance_monthly
+        WHERE (year, month) >= (?, ?) AND (year, month) < (?, ?)
+    """ + _employee_filter(employee_ids, params)
+    rows = [(emp_id, work_date, amount, strict_amount)
+            for emp_id, month, work_date, amount, strict_amount in conn.execute(sql, params)
+            if emp_id in hire_months and hire_months[emp_id] != month]
+
+    # 입사월: 입사일/입사기념일 경계가 월 중간에 있으므로 일 단위 원본 기록
+    employees_by_month = {}
+    for emp_id, month in hire_months.items():
+        if month is not None:
+            employees_by_month.setdefault(month, []).append(emp_id)
+    for index in range(first, last):
+        month_start = _month_start(index)
+        month_employees = employees_by_month.get(month_start.month)
+        if not month_employees:
+            continue
+        params = [str(month_start), str(_month_start(index + 1))]
+        sql = f"""
+            SELECT employee_id, work_date, leave_type, remarks
+            FROM attendance_records
+            WHERE work_date >= ? AND work_date < ?
+            AND {LEAVE_ROW_CONDITION}
+        """ + _employee_filter(month_employees, params)
+        wanted = set(month_employees)
+        for emp_id, work_date, leave_type, remarks in conn.execute(sql, params):
+            if emp_id in wanted:
+                rows.append((emp_id, work_date) + _raw_amounts(leave_type, remarks))
+    return rows
+
+
+def usage_between(conn, employee_id, hire_date, start_date, end_date):
+    """직원 한 명의 [start_date, end_date) 연차 사용량 (연차/휴가 1.0, 반차 0.5)
+
+    start_date/end_date는 월 초 또는 입사월 안의 날짜여야 합니다.
+    """
+    start, end = str(_as_date(start_date)), str(_as_date(end_date))
+    return float(sum(amount for _emp_id, work_date, amount, _strict
+                     in load_usage_rows(conn, {employee_id: hire_date}, start_date, end_date)
+                     if start <= work_date < end))
+
+
+def rebuild_leave_balance(conn):
+    """원본 기록에서 월별 집계 전체를 다시 계산 (호출한 쪽에서 커밋). 집계 행 수 반환"""
+    conn.execute("DELETE FROM leave_balance_monthly")
+    conn.execute(LEAVE_BALANCE_BACKFILL)
+    return conn.execute("SELECT COUNT(*) FROM leave_balance_monthly").fetchone()[0]
+
+
+def find_leave_balance_mismatches(conn):
+    """집계 테이블과 원본 기록의 차이
+
+    Returns:
+        [((employee_id, year, month), 저장된 (full, half, typed_half), 원본 기준 값), ...]
+        한쪽에만 있는 키는 다른 쪽 값이 None
+    """
+    stored = {row[:3]: row[3:] for row in conn.execute("""
+        SELECT employee_id, year, month, full_days, half_days, typed_half_days
+        FROM leave_balance_monthly
+    """)}
+    expected = {row[:3]: row[3:] for row in conn.execute(LEAVE_BALANCE_SELECT)}
+    return [(key, stored.get(key), expected.get(key))
+            for key in sorted(stored.keys() | expected.keys())
+            if stored.get(key) != expected.get(key)]
+
+
+def main(argv=None):
+    from .database import DatabaseManager
+
+    parser = argparse.ArgumentParser(description="연차 사용 월별 집계 일치 검사/재구성")
+    parser.add_argument("db_path", help="DB 파일 경로")
+    parser.add_argument("--rebuild", action="store_true", help="원본 기록에서 집계 테이블 재구성")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(args.db_path)
+    try:
+        if args.rebuild:
+            with db.transaction() as conn:
+                count = rebuild_leave_balance(conn)
+            print(f"재구성 완료: {count:,}행")
+            return 0
+        with db.connection() as conn:
+            mismatches = find_leave_balance_mismatches(conn)
+        for key, stored, expected in mismatches[:20]:
+            print(f"불일치 (직원, 년, 월)={key}: 저장={stored}, 원본={expected}")
+        print(f"불일치 {len(mismatches):,}건" if mismatches else "일치")
+        return 1 if mismatches else 0
+    finally:
+        db.close_all()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,190 @@
+"""
+연월차 계산 (Qt 비의존)
+"""
+
+from datetime import datetime, timedelta
+
+from .leave_calendar import entitlement_calendar, to_date
+
+
+class LeaveCalculator:
+    """연월차 계산 클래스"""
+    
+    # 1년 이상 재직인원 리스트 (TODAY 기준)
+    ONE_YEAR_OR_MORE_EMPLOYEES = [
+        '전금희', '박진성', '김미라', '김아름벌', '맹기열', 
+        '강지승', '신동인', '두보라', '오세원', '황혜선', '김현경'
+    ]
+    
+    def __init__(self, db_manager):
+        self.db = db_manager
+    
+    def is_one_year_or_more(self, name, hire_date, target_date=None):
+        """TODAY 기준으로 1년 이상 재직인원인지 확인"""
+        # 명시적으로 1년 이상 재직인원 리스트에 있으면 1년 이상자로 처리
+        if name in self.ONE_YEAR_OR_MORE_EMPLOYEES:
+            return True
+        
+        if target_date is None:
+            target_date = datetime.now().date()
+        
+        # TODAY 기준으로 입사일로부터 365일 경과 여부
+        return to_date(target_date) >= entitlement_calendar(hire_date).one_year_date
+    
+    def calculate_monthly_leave(self, hire_date, target_date):
+        """입사 1년 미만 직원의 월차 계산
+        입사일을 기준으로 1개월 만근 시 연차 1개 발생 (최대 11개)
+        """
+        return entitlement_calendar(hire_date).monthly_leave(target_date)
+    
+    def calculate_annual_leave(self, hire_date, target_date):
+        """연차 계산
+        - 입사 1년 경과 시: 입사일 기준으로 연차 15개 부여
+        - 근속연수 증가 시 연차 추가:
+          * 만3년차: 16일 (예: 2023년 5월 30일 입사 → 2026년 5월 30일에 16일 발생)
+          * 만5년차: 17일
+          * 만7년차: 18일
+          * 만25년차: 25일 (최대)
+        근속 연수별 발생 수는 입사일별 달력(leave_calendar)에 미리 계산되어 있습니다.
+        """
+        return entitlement_calendar(hire_date).annual_leave(target_date)
+    
+    def check_monthly_leave_expiration(self, employee_id, hire_date, target_date):
+        """월차 소멸 확인 및 처리 - 1년 미만자만 처리
+        입사기념일 기준으로 1년 되는 날 소멸 (1년 이상자는 월차 없음)
+        """
+        calendar = entitlement_calendar(hire_date)
+        hire_date = calendar.hire_date
+        target_date = to_date(target_date)
+        
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        
+        # 직원 정보 조회
+        cursor.execute("SELECT name FROM employees WHERE id = ?", (employee_id,))
+        result = cursor.fetchone()
+        if not result:
+            conn.close()
+            return 0
+        
+        name = result[0]
+        
+        # 1년 이상자는 월차 소멸 없음
+        if self.is_one_year_or_more(name, hire_date, target_date):
+            conn.close()
+            return 0
+        
+        # 1년 미만자: 입사기념일 기준으로 1년 되는 날 소멸 (2월 29일 입사자는 2월 28일)
+        one_year_date = calendar.anniversaries[1]
+        
+        # 정확히 1년 되는 날에 소멸 처리
+        if target_date >= one_year_date:
+            # 기존 소멸 기록이 있는지 확인 (중복 방지)
+            cursor.execute("""
+                SELECT id FROM leave_expirations
+                WHERE employee_id = ? AND leave_type = '월차' AND expiration_date = ?
+            """, (employee_id, one_year_date))
+            existing = cursor.fetchone()
+            
+            if not existing:
+                cursor.execute("""
+                    SELECT SUM(leave_amount) as total_used
+                    FROM leave_records
+                    WHERE employee_id = ? AND leave_type = '월차'
+                    AND leave_date < ?
+                """, (employee_id, one_year_date))
+                result = cursor.fetchone()
+                total_used = result[0] if result[0] else 0
+                
+                # 입사기념일 기준으로 1년 전까지 생성된 월차 수 (최대 11개)
+                max_monthly_leave = min(11, self.calculate_monthly_leave(hire_date, one_year_date - timedelta(days=1)))
+                expired_amount = max_monthly_leave - total_used
+                
+                if expired_amount > 0:
+                    cursor.execute("""
+                        INSERT INTO leave_expirations 
+                        (employee_id, leave_type, expired_amount, expiration_date, year)
+                        VALUES (?, ?, ?, ?, ?)
+                    """, (employee_id, '월차', expired_amount, one_year_date, target_date.year))
+                    conn.commit()
+                    conn.close()
+                    return expired_amount
+            
+            conn.close()
+        return 0
+    
+    def check_annual_leave_expiration(self, employee_id, target_date):
+        """연차 소멸 확인 및 처리
+        1년 이상자: 입사기념일 기준으로 연차 생성, 다음년도 입사기념일까지 사용 안하면 소멸
+        1년 미만자: 소멸 없음 (1년 경과 후 1년 이상자 로직으로 전환)
+        """
+        target_date = to_date(target_date)
+        
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        
+        # 직원 정보 조회
+        cursor.execute("SELECT name, hire_date FROM employees WHERE id = ?", (employee_id,))
+        result = cursor.fetchone()
+        if not result:
+            conn.close()
+            return 0
+        
+        name, hire_date_str = result
+        calendar = entitlement_calendar(hire_date_str)
+        hire_date = calendar.hire_date
+        
+        # 1년 이상자 여부 확인
+        if not self.is_one_year_or_more(name, hire_date, target_date):
+            # 1년 미만자는 소멸 없음
+            conn.close()
+            return 0
+        
+        # 1년 이상자: 입사기념일 기준으로 연차 생성, 다음년도 입사기념일까지 사용 안하면 소멸
+        expired_total = 0
+        
+        # 입사일 이후의 모든 입사기념일 확인
+        for year_offset in range(1, 50):  # 최대 50년까지 확인
+            # 입사기념일과 다음년도 입사기념일 (소멸일)
+            anniversary_date = calendar.anniversaries[year_offset]
+            next_anniversary_date = calendar.anniversaries[year_offset + 1]
+            
+            # 소멸일이 지났는지 확인
+            if target_date >= next_anniversary_date:
+                # 기존 소멸 기록 확인
+                cursor.execute("""
+                    SELECT id FROM leave_expirations
+                    WHERE employee_id = ? AND leave_type = '연차' AND expiration_date = ?
+                    """, (employee_id, next_anniversary_date))
+                existing = cursor.fetchone()
+                
+                if not existing:
+                    # 입사기념일 기준으로 생성된 연차 계산
+                    annual_leave_generated = self.calculate_annual_leave(hire_date, anniversary_date)
+                    
+                    # 입사기념일부터 다음년도 입사기념일 직전까지 사용한 연차 계산
+                    cursor.execute("""
+                        SELECT SUM(leave_amount) as total_used
+                        FROM leave_records
+                        WHERE employee_id = ? AND leave_type = '연차'
+                        AND leave_date >= ? AND leave_date < ?
+                        """, (employee_id, anniversary_date, next_anniversary_date))
+                    result = cursor.fetchone()
+                    total_used = result[0] if result[0] else 0
+                    
+                    expired_amount = annual_leave_generated - total_used
+                    
+                    if expired_amount > 0:
+                        cursor.execute("""
+                            INSERT INTO leave_expirations 
+                            (employee_id, leave_type, expired_amount, expiration_date, year)
+                            VALUES (?, ?, ?, ?, ?)
+                            """, (employee_id, '연차', expired_amount, next_anniversary_date, target_date.year))
+                        expired_total += expired_amount
+            else:
+                # 아직 소멸일이 지나지 않았으면 중단
+                break
+        
+        conn.commit()
+        conn.close()
+        return expired_total
@@ -0,0 +1,141 @@
+"""
+입사일 기준 연월차 발생 달력 (Qt 비의존)
+
+입사기념일(2월 29일 입사자는 평년 2월 28일), 근속 연수별 연차 발생 수,
+월차 발생일을 입사일마다 한 번만 계산해 둡니다. 화면 새로고침/소멸 처리에서
+직원마다 입사일 문자열을 다시 파싱하고 기념일을 다시 계산하지 않습니다.
+
+달력은 입사일 값으로 캐시하므로 입사일이 바뀌면 자동으로 새 달력이 사용됩니다.
+
+    calendar = entitlement_calendar("2020-05-30")
+    calendar.anniversary(2025)          # 2025-05-30
+    calendar.annual_leave("2025-06-01") # 15
+"""
+
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+
+# 미리 계산해 두는 근속 연수 (이후는 요청 시 계산)
+MAX_SERVICE_YEARS = 50
+MAX_MONTHLY_LEAVE = 11
+MAX_ANNUAL_LEAVE = 25
+
+_parsed_dates = {}
+_calendars = {}
+
+
+def to_date(value):
+    """'YYYY-MM-DD' 문자열/datetime을 date로 (문자열 파싱 결과는 캐시)"""
+    if isinstance(value, str):
+        parsed = _parsed_dates.get(value)
+        if parsed is None:
+            parsed = _parsed_dates[value] = datetime.strptime(value, "%Y-%m-%d").date()
+        return parsed
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def anniversary_in_year(hire_date, year):
+    """해당 년도의 입사기념일 (2월 29일 입사자는 평년에 2월 28일)"""
+    try:
+        return date(year, hire_date.month, hire_date.day)
+    except ValueError:
+        return date(year, hire_date.month, hire_date.day - 1)
+
+
+def annual_leave_for_service_years(years):
+    """만 근속 연수별 연차 발생 수 (1년 15일, 만3년부터 2년마다 1일 추가, 최대 25일)"""
+    if years < 1:
+        return 0
+    annual_leave = 15
+    if years >= 3:
+        annual_leave += (years - 3) // 2 + 1
+    return min(annual_leave, MAX_ANNUAL_LEAVE)
+
+
+class EntitlementCalendar:
+    """입사일 하나에 대한 연월차 발생 달력
+
+    anniversaries[n]: n번째 입사기념일 (0번째는 입사일)
+    entitlements[n]: 만 n년 근속 시 연차 발생 수
+    accrual_dates[k]: k+1번째 월차가 발생하는 날 (입사 후 매월 같은 날, 없는 날이면 다음 달 1일)
+    """
+
+    __slots__ = ("hire_date", "one_year_date", "anniversaries", "entitlements", "accrual_dates")
+
+    def __init__(self, hire_date):
+        hire_date = to_date(hire_date)
+        self.hire_date = hire_date
+        # 1년 이상 재직 판정일 (입사일 + 365일)
+        self.one_year_date = hire_date + timedelta(days=365)
+        self.anniversaries = tuple(anniversary_in_year(hire_date, hire_date.year + n)
+                                   for n in range(MAX_SERVICE_YEARS + 1))
+        self.entitlements = tuple(annual_leave_for_service_years(n) for n in range(MAX_SERVICE_YEARS + 1))
+        accrual_dates = []
+        for months in range(1, MAX_MONTHLY_LEAVE + 1):
+            index = hire_date.year * 12 + hire_date.month - 1 + months
+            try:
+                accrual_dates.append(date(index // 12, index % 12 + 1, hire_date.day))
+            except ValueError:
+                # 입사일과 같은 날이 없는 달은 다음 달 1일에 발생
+                accrual_dates.append(date((index + 1) // 12, (index + 1) % 12 + 1, 1))
+        self.accrual_dates = tuple(accrual_dates)
+
+    def anniversary(self, year):
+        """해당 년도의 입사기념일"""
+        offset = year - self.hire_date.year
+        if 0 <= offset <= MAX_SERVICE_YEARS:
+            return self.anniversaries[offset]
+        return anniversary_in_year(self.hire_date, year)
+
+    def service_years(self, target_date):
+        """target_date 기준 만 근속 연수 (입사일 월/일 기준)"""
+        target_date = to_date(target_date)
+        hire_date = self.hire_date
+        years = target_date.year - hire_date.year
+        if (target_date.month, target_date.day) < (hire_date.month, hire_date.day):
+            years -= 1
+        return years
+
+    def annual_leave(self, target_date):
+        """target_date 기준 연차 발생 수"""
+        years = self.service_years(target_date)
+        if years < 1:
+            return 0
+        if years <= MAX_SERVICE_YEARS:
+            return self.entitlements[years]
+        return MAX_ANNUAL_LEAVE
+
+    def months_accrued(self, target_date):
+        """target_date까지 발생한 월차 수 (0~11, 1년 경과 여부와 무관)"""
+        return bisect_right(self.accrual_dates, to_date(target_date))
+
+    def monthly_leave(self, target_date):
+        """입사 1년 미만 직원의 target_date 기준 월차 수 (1년 이상이면 0)
+
+        입사일 이전 날짜는 기존 계산과 같이 경과 개월 수(음수)를 그대로 돌려줍니다.
+        """
+        target_date = to_date(target_date)
+        if target_date >= self.one_year_date:
+            return 0
+        hire_date = self.hire_date
+        if target_date < hire_date:
+            months = (target_date.year - hire_date.year) * 12 + (target_date.month - hire_date.month)
+            return months - 1 if target_date.day < hire_date.day else months
+        return self.months_accrued(target_date)
+
+
+def entitlement_calendar(hire_date):
+    """입사일의 연월차 발생 달력 (입사일 값별로 캐시)"""
+    hire_date = to_date(hire_date)
+    calendar = _calendars.get(hire_date)
+    if calendar is None:
+        calendar = _calendars[hire_date] = EntitlementCalendar(hire_date)
+    return calendar
+
+
+def clear_calendar_cache():
+    """캐시한 달력과 날짜 파싱 결과 비우기"""
+    _calendars.clear()
+    _parsed_dates.clear()
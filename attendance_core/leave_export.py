@@ -0,0 +1,134 @@
+"""
+연월차 관리대장 엑셀 시트 작성 (Qt 비의존)
+
+화면 표에서 읽은 행을 openpyxl write-only 워크북에 한 번에 기록합니다.
+부서 병합, 테두리, 강조 색상, 열 너비를 셀을 쓰는 시점에 함께 지정하므로
+작성 후 다시 훑으며 스타일을 덧입히지 않습니다.
+
+    workbook = openpyxl.Workbook(write_only=True)
+    write_leave_sheet(workbook, "2025년", rows, 2025)
+    workbook.save(path)
+"""
+
+from copy import copy
+
+from .leave_ledger import MONTH_COLUMNS
+
+
+# 행 값 배치: 부서, 직급, 이름, 입사일, 전년도 남은연차, 1~12월, 선택년도 사용연차, 연차발생수, 잔여수, 소멸내역
+TEXT_COLUMNS = 4
+SELECTED_YEAR_COL = 18
+REMAINING_COL = 20
+COLUMN_COUNT = 21
+
+
+def leave_sheet_headers(selected_year):
+    """엑셀 헤더 (전년도/선택년도 열은 줄바꿈 표기)"""
+    return (["부서", "직급", "이름", "입사일", f"{selected_year - 1}년\n남은연차"]
+            + [f"{month}월" for month in MONTH_COLUMNS]
+            + [f"{selected_year}년\n사용연차", "연차발생수", "잔여수", "소멸내역"])
+
+
+def _column_widths():
+    return [12, 8, 10, 12, 12] + [6] * len(MONTH_COLUMNS) + [12, 10, 10, 38]
+
+
+def _has_value(value):
+    return value is not None and (not isinstance(value, str) or value.strip() != "")
+
+
+def write_leave_sheet(workbook, title, rows, selected_year, outline=False):
+    """연월차 관리대장 시트 추가
+
+    Args:
+        workbook: write-only 워크북
+        rows: [[부서, 직급, 이름, 입사일, 전년도, 1월 ... 12월, 선택년도, 발생, 잔여, 소멸내역], ...]
+        outline: True면 표 전체에 격자 테두리와 굵은 외곽선 (통합 파일),
+                 False면 값이 있는 셀에만 얇은 테두리 (단독 파일)
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.cell_range import CellRange
+
+    worksheet = workbook.create_sheet(title=title[:31])
+    worksheet.sheet_view.showGridLines = False
+    worksheet.row_dimensions[1].height = 28
+    for col, width in enumerate(_column_widths(), 1):
+        worksheet.column_dimensions[get_column_letter(col)].width = width
+
+    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    # Excel에서 글자색은 ARGB(8자리)가 안전합니다.
+    header_font = Font(bold=True, color="FF000000")
+    red_font = Font(color="FFFF0000")
+    blue_font = Font(color="FF0000FF")
+    green_fill = PatternFill(start_color="FFE2F0D9", end_color="FFE2F0D9", fill_type="solid")
+    align_center = Alignment(horizontal="center", vertical="center", wrap_text=False)
+    align_center_wrap = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+    last_row = len(rows) + 1
+    if outline:
+        thin = Side(style="thin", color="FF000000")
+        thick = Side(style="thick", color="FF000000")
+        borders = {}
+
+        def border_of(row, col, has_value):
+            key = (col == 1, col == COLUMN_COUNT, row == 1, row == last_row)
+            if key not in borders:
+                borders[key] = Border(left=thick if key[0] else thin, right=thick if key[1] else thin,
+                                      top=thick if key[2] else thin, bottom=thick if key[3] else thin)
+            return borders[key]
+    else:
+        thin_side = Side(style="thin")
+        thin_border = Border(left=thin_side, right=thin_side, top=thin_side, bottom=thin_side)
+
+        def border_of(row, col, has_value):
+            return thin_border if has_value else None
+
+    styles = {}
+
+    def cell(value, font=None, fill=None, alignment=None, border=None):
+        key = (id(font), id(fill), id(alignment), id(border))
+        style = styles.get(key)
+        if style is None:
+            template = WriteOnlyCell(worksheet)
+            for name, attr in (("font", font), ("fill", fill), ("alignment", alignment), ("border", border)):
+                if attr is not None:
+                    setattr(template, name, attr)
+            style = styles[key] = template._style
+        result = WriteOnlyCell(worksheet, value)
+        result._style = copy(style)
+        return result
+
+    worksheet.append([cell(text, header_font, header_fill, align_center_wrap, border_of(1, col, True))
+                      for col, text in enumerate(leave_sheet_headers(selected_year), 1)])
+
+    # 부서(1열)가 같은 연속 행은 세로 병합
+    dept_masters = set()
+    start = 0
+    while start < len(rows):
+        end = start
+        while end + 1 < len(rows) and rows[end + 1][0] == rows[start][0]:
+            end += 1
+        if rows[start][0]:
+            dept_masters.add(start)
+            if end > start:
+                worksheet.merged_cells.add(CellRange(min_col=1, min_row=start + 2, max_col=1, max_row=end + 2))
+        start = end + 1
+    merged_rows = {row for row in range(len(rows))
+                   if row not in dept_masters and row > 0 and rows[row][0] and rows[row][0] == rows[row - 1][0]}
+
+    for row_idx, values in enumerate(rows):
+        excel_row = row_idx + 2
+        cells = []
+        for col, value in enumerate(values, 1):
+            if col == 1 and row_idx in merged_rows:
+                value = None
+            has_value = _has_value(value)
+            wrap = (has_value and col <= TEXT_COLUMNS) or (col == 1 and row_idx in dept_masters)
+            font = red_font if col == SELECTED_YEAR_COL else blue_font if col == REMAINING_COL else None
+            cells.append(cell(value, font, green_fill if col == REMAINING_COL else None,
+                              align_center_wrap if wrap else align_center,
+                              border_of(excel_row, col, has_value)))
+        worksheet.append(cells)
+    return worksheet
@@ -0,0 +1,416 @@
+"""
+연월차 관리대장 원장(ledger) 계산 엔진
+
+연월차 탭 새로고침 시 직원별로 반복하던 attendance_records / leave_records /
+leave_expirations / leave_remaining_by_year / leave_manual_values 조회를
+테이블별 한 번의 조회로 묶고, 사용량 집계(월별 사용량, 전년도 잔여,
+반차 중복 제거, 합계)를 pandas groupby로 한 번에 계산합니다.
+
+쓰기(소멸 기록, 잔여수 저장 등)는 하지 않습니다. 결과 DataFrame을
+화면/엑셀에서 그대로 사용할 수 있도록 반환합니다.
+"""
+
+from datetime import datetime, timedelta
+
+from .leave_calendar import entitlement_calendar
+
+MONTH_COLUMNS = list(range(1, 13))
+
+
+class LeaveLedger:
+    """연월차 관리대장 계산 엔진
+
+    사용 예:
+        ledger = LeaveLedger(leave_calculator)
+        frame = ledger.build(conn, [(emp_id, name, hire_date), ...], 2025)
+    """
+
+    def __init__(self, leave_calculator):
+        self.calculator = leave_calculator
+
+    # ------------------------------------------------------------------
+    # 데이터 로드 (테이블별 1회 조회)
+    # ------------------------------------------------------------------
+    def _load_leave_rows(self, conn, hire_dates, start_date, end_date):
+        """기간 내 연차 사용량을 월별 집계(leave_balance_monthly)로 조회하여 DataFrame으로 반환
+
+        입사월은 일 단위, 나머지 월은 그 달 1일자 합계 행 (leave_balance.load_usage_rows)
+        amount: 연차/휴가 1.0, 반차(leave_type 또는 remarks) 0.5
+        strict_amount: leave_type 기준만 (remarks 반차는 제외) - 전전년도 계산용
+        """
+        import pandas as pd
+
+        from .leave_balance import load_usage_rows
+
+        rows = load_usage_rows(conn, hire_dates, start_date, end_date)
+        df = pd.DataFrame(rows, columns=['employee_id', 'work_date', 'amount', 'strict_amount'])
+        df['work_date'] = pd.to_datetime(df['work_date'], format="%Y-%m-%d", errors='coerce')
+        df['amount'] = df['amount'].astype(float)
+        df['strict_amount'] = df['strict_amount'].astype(float)
+        return df.dropna(subset=['work_date'])
+
+    def _load_annual_leave_records(self, conn, start_date, end_date):
+        """leave_records의 연차 사용량 (2026년 이상 이월 소멸 계산용)"""
+        import pandas as pd
+
+        rows = conn.execute("""
+            SELECT employee_id, leave_date, leave_amount
+            FROM leave_records
+            WHERE leave_type = '연차' AND leave_date >= ? AND leave_date < ?
+        """, (str(start_date), str(end_date))).fetchall()
+        df = pd.DataFrame(rows, columns=['employee_id', 'work_date', 'amount'])
+        df['work_date'] = pd.to_datetime(df['work_date'], format="%Y-%m-%d", errors='coerce')
+        df['amount'] = pd.to_numeric(df['amount'], errors='coerce').fillna(0.0)
+        return df.dropna(subset=['work_date'])
+
+    @staticmethod
+    def _window_sum(df, index, starts, ends, column='amount'):
+        """직원별 [start, end) 구간 합계를 한 번에 계산
+
+        starts/ends: 직원 ID 인덱스를 가진 datetime64 Series
+        """
+        import pandas as pd
+
+        if df.empty:
+            return pd.Series(0.0, index=index)
+        start = df['employee_id'].map(starts)
+        end = df['employee_id'].map(ends)
+        mask = (df['work_date'] >= start) & (df['work_date'] < end)
+        sums = df.loc[mask.to_numpy()].groupby('employee_id')[column].sum()
+        return sums.reindex(index, fill_value=0.0).astype(float)
+
+    @staticmethod
+    def _service_period_usage(df, hire_dates):
+        """근속 기간(입사기념일 사이)별 사용량 {(emp_id, n): amount}
+
+        n번째 기간 = [n-1번째 입사기념일, n번째 입사기념일), 0번째 기념일은 입사일
+        """
+        import numpy as np
+        import pandas as pd
+
+        if df.empty:
+            return {}
+        hire = pd.to_datetime(df['employee_id'].map(hire_dates))
+        valid = hire.notna().to_numpy()
+        df = df.loc[valid]
+        hire = hire.loc[valid]
+
+        year = df['work_date'].dt.year.to_numpy()
+        month_day = df['work_date'].dt.month.to_numpy() * 100 + df['work_date'].dt.day.to_numpy()
+        hire_year = hire.dt.year.to_numpy()
+        hire_month = hire.dt.month.to_numpy()
+        hire_day = hire.dt.day.to_numpy()
+        is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        hire_day = np.where((hire_month == 2) & (hire_day == 29) & ~is_leap, 28, hire_day)
+
+        period = (year - hire_year) + (month_day >= hire_month * 100 + hire_day)
+        sums = df.assign(period=period).groupby(['employee_id', 'period'])['amount'].sum()
+        return sums.to_dict()
+
+    # ------------------------------------------------------------------
+    # 직원별 규칙 계산 (쿼리 없음)
+    # ------------------------------------------------------------------
+    def _leave_generated(self, name, hire_date, anniversary, year, calc_date, today):
+        """연차 발생 수와 1년 이상 재직 여부"""
+        is_one_year = self.calculator.is_one_year_or_more(name, hire_date, calc_date)
+        if not is_one_year:
+            generated = entitlement_calendar(hire_date).months_accrued(calc_date)
+        elif year <= 2025:
+            # 2025년 이하 조회 시: 입사기념일 기준으로 연차 생성
+            generated = self.calculator.calculate_annual_leave(hire_date, anniversary)
+        elif anniversary <= today:
+            # 2026년 이상 조회 시: TODAY 기준으로 입사기념일이 지났을 때만 연차 생성
+            generated = self.calculator.calculate_annual_leave(hire_date, anniversary)
+        else:
+            generated = 0
+        return generated, is_one_year
+
+    def _prev_year_generated(self, hire_date, prev_year):
+        """이전 년도 연말 시점의 연차 발생 수"""
+        calendar = entitlement_calendar(hire_date)
+        prev_year_end = datetime(prev_year, 12, 31).date()
+        prev_year_anniversary = calendar.anniversary(prev_year)
+        if prev_year_anniversary <= hire_date:
+            prev_year_anniversary = calendar.anniversary(prev_year + 1)
+
+        days = (prev_year_end - hire_date).days
+        if days < 0:
+            generated = 0
+        elif days < 365:
+            generated = calendar.months_accrued(prev_year_end)
+        elif prev_year_anniversary <= prev_year_end:
+            generated = calendar.annual_leave(prev_year_anniversary)
+        else:
+            generated = calendar.annual_leave(prev_year_end)
+        return generated, prev_year_anniversary
+
+    def _prev_prev_year_generated(self, hire_date, prev_prev_year):
+        """전전년도 연말 시점의 연차 발생 수"""
+        calendar = entitlement_calendar(hire_date)
+        prev_prev_year_end = datetime(prev_prev_year, 12, 31).date()
+        days = (prev_prev_year_end - hire_date).days
+        if days < 0:
+            return 0
+        if days < 365:
+            return calendar.months_accrued(prev_prev_year_end)
+        return calendar.annual_leave(prev_prev_year_end)
+
+    def _expiration_text(self, hire_date, year, today, period_usage, emp_id):
+        """입사기념일별 소멸 내역 문자열 (2025년 이상 조회용)"""
+        calendar = entitlement_calendar(hire_date)
+        expiration_list = []
+        generated_by_period = {}
+        for year_offset in range(1, 50):  # 최대 50년까지 확인
+            check_anniversary = calendar.anniversaries[year_offset]
+            if check_anniversary > today:
+                break
+            if check_anniversary.year > year:
+                continue
+
+            generated = calendar.annual_leave(check_anniversary - timedelta(days=1))
+            if year_offset > 1:
+                prev_anniversary = calendar.anniversaries[year_offset - 1]
+                generated -= calendar.annual_leave(prev_anniversary - timedelta(days=1))
+            generated_by_period[year_offset] = generated
+
+            remaining_before_period = 0.0
+            if year_offset > 1:
+                remaining_before_period = (generated_by_period[year_offset - 1]
+                                           - period_usage.get((emp_id, year_offset - 1), 0.0))
+
+            used_period = period_usage.get((emp_id, year_offset), 0.0)
+            expired_amount = max(0, (generated - used_period) + remaining_before_period)
+            if expired_amount > 0:
+                expired_amount = float(expired_amount)
+                if expired_amount.is_integer():
+                    expired_amount_str = str(int(expired_amount))
+                else:
+                    expired_amount_str = f"{expired_amount:.1f}"
+                expiration_list.append(f"연차 {expired_amount_str}개 ({check_anniversary})")
+        return ", ".join(expiration_list)
+
+    # ------------------------------------------------------------------
+    # 원장 생성
+    # ------------------------------------------------------------------
+    def build(self, conn, employees, year, today=None):
+        """선택 년도의 연월차 관리대장 원장 계산
+
+        Args:
+            conn: sqlite3 연결
+            employees: [(emp_id, name, hire_date), ...] (표시 순서)
+            year: 조회 년도
+            today: 기준일 (None이면 오늘)
+
+        Returns:
+            pandas.DataFrame (index: employee_id, 표시 순서 유지)
+                remaining_prev_year: 이전 년도 남은연차
+                1~12: 월별 사용량
+                used: 사용연차 (수동 입력 월별 값 포함)
+                generated: 연차발생수
+                remaining: 잔여수
+                expiration_text: 소멸내역
+                is_one_year_or_more: 1년 이상 재직 여부 (잔여수 저장 대상)
+                carryover_expired / carryover_expiration_date:
+                    2026년 이상 조회 시 입사기념일 경과로 소멸되는 이월 연차
+                manual_values: {column_index: 값} 수동 입력 값 (17/18/19 제외)
+        """
+        import pandas as pd
+
+        if today is None:
+            today = datetime.now().date()
+        prev_year = year - 1
+        prev_prev_year = year - 2
+        year_start = datetime(year, 1, 1).date()
+        year_end = datetime(year, 12, 31).date()
+        next_year_start = datetime(year + 1, 1, 1).date()
+        prev_year_start = datetime(prev_year, 1, 1).date()
+        prev_year_end = datetime(prev_year, 12, 31).date()
+        prev_prev_year_start = datetime(prev_prev_year, 1, 1).date()
+
+        if year > today.year or year < today.year:
+            calc_date = year_end
+        else:
+            calc_date = today
+
+        # --- 직원별 기준일 계획 (쿼리 없음) ---
+        plan = []
+        for emp_id, name, hire_date in employees:
+            calendar = entitlement_calendar(hire_date)
+            hire_date = calendar.hire_date
+            anniversary = calendar.anniversary(year)
+            usage_start = hire_date if hire_date.year == year else anniversary
+
+            prev_year_generated, prev_year_anniversary = self._prev_year_generated(hire_date, prev_year)
+            if hire_date.year == prev_year:
+                usage_start_prev = hire_date
+            elif prev_year_anniversary <= prev_year_end:
+                usage_start_prev = prev_year_anniversary
+            else:
+                usage_start_prev = prev_year_start
+
+            plan.append({
+                'employee_id': emp_id,
+                'name': name,
+                'hire_date': hire_date,
+                'anniversary': anniversary,
+                'prev_anniversary': calendar.anniversary(prev_year),
+                'usage_start': usage_start,
+                'usage_start_prev': usage_start_prev,
+                'prev_year_generated': prev_year_generated,
+            })
+
+        columns = (['remaining_prev_year'] + MONTH_COLUMNS +
+                   ['used', 'generated', 'remaining', 'expiration_text', 'is_one_year_or_more',
+                    'carryover_expired', 'carryover_expiration_date', 'manual_values'])
+        if not plan:
+            return pd.DataFrame(columns=columns)
+
+        plan_df = pd.DataFrame(plan).set_index('employee_id')
+        index = plan_df.index
+
+        # --- 테이블별 1회 조회 ---
+        history_start = prev_prev_year_start
+        if year >= 2025:
+            history_start = min(history_start, min(plan_df['hire_date']))
+        leave_rows = self._load_leave_rows(conn, plan_df['hire_date'].to_dict(), history_start, next_year_start)
+        annual_records = self._load_annual_leave_records(conn, prev_year_start, next_year_start)
+
+        expirations = conn.execute("""
+            SELECT employee_id, leave_type, expired_amount, expiration_date
+            FROM leave_expirations
+            ORDER BY expiration_date DESC
+        """).fetchall()
+
+        stored_remaining = dict(conn.execute("""
+            SELECT employee_id, remaining_amount FROM leave_remaining_by_year
+            WHERE year = ?
+        """, (prev_year,)).fetchall())
+
+        manual_values = {}
+        for emp_id, col_idx, manual_val in conn.execute("""
+            SELECT employee_id, column_index, manual_value
+            FROM leave_manual_values
+            WHERE year = ?
+        """, (year,)).fetchall():
+            manual_values.setdefault(emp_id, {})[col_idx] = manual_val
+
+        # --- 사용량 집계 (벡터화) ---
+        def _dates(column):
+            return pd.to_datetime(plan_df[column])
+
+        def _const(value):
+            return pd.Series(pd.Timestamp(value), index=index)
+
+        used_attendance = self._window_sum(leave_rows, index, _dates('usage_start'), _const(next_year_start))
+        used_prev_year = self._window_sum(leave_rows, index, _dates('usage_start_prev'), _const(year_start))
+        used_prev_prev_year = self._window_sum(leave_rows, index, _const(prev_prev_year_start),
+                                               _const(prev_year_start), column='strict_amount')
+        used_between_anniversaries = self._window_sum(annual_records, index,
+                                                      _dates('prev_anniversary'), _dates('anniversary'))
+
+        # 월별 사용량: 입사기념일이 속한 월은 입사기념일 이후만 계산
+        monthly = pd.DataFrame(0.0, index=index, columns=MONTH_COLUMNS)
+        if not leave_rows.empty:
+            in_year = leave_rows.loc[(leave_rows['work_date'].dt.year == year).to_numpy()]
+            anniversary = pd.to_datetime(in_year['employee_id'].map(plan_df['anniversary']))
+            month = in_year['work_date'].dt.month
+            before_anniversary = (month == anniversary.dt.month) & (in_year['work_date'] < anniversary)
+            in_year = in_year.loc[(~before_anniversary).to_numpy()]
+            if not in_year.empty:
+                grouped = (in_year.assign(month=in_year['work_date'].dt.month)
+                           .groupby(['employee_id', 'month'])['amount'].sum()
+                           .unstack(fill_value=0.0))
+                monthly = grouped.reindex(index=index, columns=MONTH_COLUMNS, fill_value=0.0).astype(float)
+
+        period_usage = {}
+        if year >= 2025:
+            period_usage = self._service_period_usage(leave_rows, pd.to_datetime(plan_df['hire_date']))
+
+        expired_until = {}
+        expiration_lists = {}
+        for emp_id, leave_type, amount, exp_date in expirations:
+            if leave_type == '연차' and amount:
+                expired_until.setdefault(emp_id, []).append((str(exp_date), float(amount)))
+            if amount and float(amount) > 0:
+                expiration_lists.setdefault(emp_id, []).append(f"{leave_type} {amount}개 ({exp_date})")
+
+        def _expired_sum(emp_id, until):
+            until = str(until)
+            return sum(amount for exp_date, amount in expired_until.get(emp_id, []) if exp_date <= until)
+
+        # --- 직원별 결과 조립 ---
+        records = []
+        for emp_id, info in plan_df.iterrows():
+            name = info['name']
+            hire_date = info['hire_date']
+            anniversary = info['anniversary']
+
+            # 이전 년도 남은 연차
+            # (2026년 이상은 저장된 전년도 잔여수(연말 마감 등)를 그대로 사용하고 이력을 다시 계산하지 않음)
+            if hire_date.year >= year:
+                remaining_prev_year = 0.0
+            elif (year >= 2026 and emp_id in stored_remaining
+                    and self.calculator.is_one_year_or_more(name, hire_date)):
+                remaining_prev_year = float(stored_remaining[emp_id])
+            else:
+                if prev_prev_year >= hire_date.year:
+                    remaining_prev_prev_year = (self._prev_prev_year_generated(hire_date, prev_prev_year)
+                                                - used_prev_prev_year[emp_id])
+                else:
+                    remaining_prev_prev_year = 0.0
+                remaining_prev_prev_year_final = max(
+                    0.0, float(remaining_prev_prev_year) - _expired_sum(emp_id, prev_year_end))
+                remaining_prev_year = float(
+                    (info['prev_year_generated'] - used_prev_year[emp_id]) + remaining_prev_prev_year_final)
+
+            # 사용연차: 출퇴근 관리대장 기록 + 입사기념일이 속한 월 다음 월부터의 수동 입력 월별 값
+            used = float(used_attendance[emp_id])
+            emp_manual = manual_values.get(emp_id, {})
+            for col_idx, manual_val in emp_manual.items():
+                if 5 <= col_idx <= 16 and manual_val:
+                    try:
+                        month_value = float(manual_val)
+                    except (ValueError, TypeError):
+                        continue
+                    if datetime(year, col_idx - 4, 1).date() > anniversary:
+                        used += month_value
+
+            generated, is_one_year = self._leave_generated(name, hire_date, anniversary, year, calc_date, today)
+
+            # 이전 년도 최종 남은 연차 (소멸 차감)
+            carryover_expired = 0.0
+            carryover_expiration_date = None
+            if year >= 2026:
+                if today >= anniversary:
+                    # 입사기념일이 지났으면 이전 년도 잔여 연차 중 사용하지 않은 부분 소멸
+                    carryover_expired = max(0.0, remaining_prev_year - float(used_between_anniversaries[emp_id]))
+                    if carryover_expired > 0:
+                        carryover_expiration_date = anniversary
+                    remaining_prev_year_final = max(0.0, remaining_prev_year - carryover_expired)
+                else:
+                    remaining_prev_year_final = remaining_prev_year
+            else:
+                remaining_prev_year_final = max(0.0, remaining_prev_year - _expired_sum(emp_id, today))
+
+            remaining = (float(generated) - used) + remaining_prev_year_final
+
+            if year >= 2025:
+                expiration_text = self._expiration_text(hire_date, year, today, period_usage, emp_id)
+            else:
+                expiration_text = ", ".join(expiration_lists.get(emp_id, []))
+
+            record = {'employee_id': emp_id, 'remaining_prev_year': remaining_prev_year}
+            record.update({m: float(monthly.at[emp_id, m]) for m in MONTH_COLUMNS})
+            record.update({
+                'used': used,
+                'generated': float(generated),
+                'remaining': float(remaining),
+                'expiration_text': expiration_text,
+                'is_one_year_or_more': is_one_year,
+                'carryover_expired': carryover_expired,
+                'carryover_expiration_date': carryover_expiration_date,
+                'manual_values': {c: v for c, v in emp_manual.items() if c not in (17, 18, 19)},
+            })
+            records.append(record)
+
+        return pd.DataFrame(records, columns=['employee_id'] + columns).set_index('employee_id')
@@ -0,0 +1,223 @@
+"""
+근태 구분 등록부 - 연차/반차/공휴 등 구분 텍스트의 분류 (Qt 비의존)
+
+leave_types 테이블(구분마다 정수 코드, 병합 방식, 배경색, 엑셀 표시 이름,
+시간 대신 입력 가능 여부)을 한 번 읽어 바꿀 수 없는 조회 구조(frozenset, 읽기 전용 dict,
+코드로 인덱싱하는 배열)로 만듭니다. 화면 그리드, 편집 저장, 월 요약, 엑셀 가져오기/내보내기,
+연차 동기화가 모두 같은 분류를 쓰며, 구분을 추가하거나 바꿀 때 코드를 고치지 않습니다.
+
+연차 차감량은 등록부 항목이 아닙니다. 연차 사용 월별 집계(leave_balance_monthly) 트리거,
+부분 인덱스, 연월차 관리대장이 SQL에 고정된 값(migrations.BALANCE_DEDUCTIONS: 연차/휴가 1,
+반차 0.5, 그 외 0)을 쓰므로 월 요약의 연차사용과 leave_records 기록도 같은 값을 씁니다.
+구분을 바꾸면 DB의 변경 번호(leave_types_version)가 올라가 실행 중인 다른 프로세스도
+다음 사용 시 다시 읽습니다.
+
+    python -m attendance_core.leave_types leave_attendance.db                    # 구분 목록
+    python -m attendance_core.leave_types leave_attendance.db --set 워크숍 \\
+        --merge rows --color "#F8CBAD" --keyword                                # 추가/변경
+    python -m attendance_core.leave_types leave_attendance.db --delete 워크숍
+"""
+
+import argparse
+import sqlite3
+from collections import namedtuple
+from types import MappingProxyType
+
+from .migrations import BALANCE_DEDUCTIONS, LEAVE_TYPE_SEED, _sql_literal
+
+# 휴가성 구분 기본 배경색 (화면)
+LEAVE_COLOR = "#F8CBAD"
+
+# 병합 방식 (leave_types.merge_mode)
+MERGE_NONE = 0   # 입력한 행(출근/퇴근)에만 표시 (비고 '{구분}_출근' / '{구분}_퇴근')
+MERGE_ROWS = 1   # 출근/퇴근 두 행 모두 표시
+MERGE_CELL = 2   # 두 행 모두 표시하고 한 칸으로 병합
+MERGE_NAMES = {'none': MERGE_NONE, 'rows': MERGE_ROWS, 'cell': MERGE_CELL}
+
+LeaveType = namedtuple("LeaveType", "code name merge color export_label keyword")
+
+_COLUMNS = "code, name, merge_mode, color, export_label, input_keyword"
+
+def leave_types_version(conn):
+    """DB의 구분 변경 번호 (leave_types를 바꾸면 트리거가 증가, AttendanceCalculator가 다시 읽는 기준)"""
+    try:
+        row = conn.execute("SELECT version FROM leave_types_version WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+
+class LeaveTypeRegistry:
+    """근태 구분 분류 (읽기 전용)
+
+    both_rows: 출근/퇴근 두 행에 표시하는 구분, merged_cell: 그중 한 칸으로 병합하는 구분
+    colored: 배경색을 칠하는 구분, keywords: 시간 대신 입력할 수 있는 구분
+    deductions: {구분: 연차 차감량} (BALANCE_DEDUCTIONS - 등록부와 관계없이 고정)
+    code(구분) -> 정수 코드 (등록되지 않은 구분/빈 값 0), codes(구분 목록) -> 코드 배열
+    """
+
+    def __init__(self, types=LEAVE_TYPE_SEED):
+        """types: (코드, 구분, 병합, 배경색, 엑셀 표시 이름, 시간 대신 입력 가능) 행 목록"""
+        self.types = tuple(LeaveType(int(code), name, int(merge), color or None, export_label or None, bool(keyword))
+                           for code, name, merge, color, export_label, keyword in sorted(types))
+        self.by_name = MappingProxyType({t.name: t for t in self.types})
+        self.both_rows = frozenset(t.name for t in self.types if t.merge >= MERGE_ROWS)
+        self.merged_cell = frozenset(t.name for t in self.types if t.merge == MERGE_CELL)
+        self.colored = frozenset(t.name for t in self.types if t.color)
+        self.keywords = frozenset(t.name for t in self.types if t.keyword)
+        self.deductions = MappingProxyType(dict(BALANCE_DEDUCTIONS))
+        self._codes = MappingProxyType({t.name: t.code for t in self.types})
+        self._tables = {}
+
+    @classmethod
+    def load(cls, conn):
+        """leave_types 테이블에서 읽음 (테이블이 없는 DB는 기본 구분)"""
+        try:
+            rows = conn.execute(f"SELECT {_COLUMNS} FROM leave_types ORDER BY code").fetchall()
+        except sqlite3.OperationalError:
+            return DEFAULT_LEAVE_TYPES
+        return cls(rows)
+
+    def code(self, name):
+        return self._codes.get(name, 0)
+
+    def deduction(self, name):
+        """연차 차감량 (차감하지 않는 구분 0.0)"""
+        return self.deductions.get(name, 0.0)
+
+    def export_label(self, name):
+        """엑셀에 표시할 이름 (지정하지 않았거나 등록되지 않은 구분은 그대로)"""
+        leave_type = self.by_name.get(name)
+        return leave_type.export_label or name if leave_type else name
+
+    def deduction_condition(self, column="leave_type"):
+        """연차 차감 구분 SQL 조건 (스키마 부분 인덱스 조건과 같은 리터럴)"""
+        return f"{column} IN ({', '.join(_sql_literal(name) for name in self.deductions)})"
+
+    def codes(self, names):
+        """구분 목록 -> 코드 int 배열"""
+        import numpy as np
+        names = list(names)
+        return np.fromiter((self._codes.get(name, 0) for name in names), dtype=np.int64, count=len(names))
+
+    def table(self, field):
+        """코드로 인덱싱하는 필드 배열 (0번은 등록되지 않은 구분)
+
+        field: 'both_rows', 'merged_cell', 'colored', 'keyword'(bool) 또는 'deduction'(float)
+        """
+        table = self._tables.get(field)
+        if table is None:
+            import numpy as np
+            size = max((t.code for t in self.types), default=0) + 1
+            if field == 'deduction':
+                table = np.zeros(size)
+                for t in self.types:
+                    table[t.code] = self.deduction(t.name)
+            else:
+                names = self.keywords if field == 'keyword' else getattr(self, field)
+                table = np.zeros(size, dtype=bool)
+                for t in self.types:
+                    table[t.code] = t.name in names
+            table.setflags(write=False)
+            table = self._tables[field] = table
+        return table
+
+
+DEFAULT_LEAVE_TYPES = LeaveTypeRegistry()
+
+
+def set_leave_type(conn, name, merge=None, color=None, export_label=None, keyword=None):
+    """구분 추가 또는 변경 (None인 항목은 기존 값, 새 구분이면 기본값 유지)
+
+    Raises:
+        ValueError: 구분 이름이 비어 있거나 병합 방식이 잘못된 경우
+    """
+    name = (name or "").strip()
+    if not name:
+        raise ValueError("구분 이름을 지정해야 합니다.")
+    if merge is not None and merge not in MERGE_NAMES.values():
+        raise ValueError(f"잘못된 병합 방식입니다: {merge}")
+    row = conn.execute(f"SELECT {_COLUMNS} FROM leave_types WHERE name = ?", (name,)).fetchone()
+    _code, _name, old_merge, old_color, old_label, old_keyword = row or (None, name, MERGE_NONE, None, None, 0)
+    conn.execute("""
+        INSERT INTO leave_types (name, merge_mode, color, export_label, input_keyword)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (name) DO UPDATE SET
+            merge_mode = excluded.merge_mode, color = excluded.color,
+            export_label = excluded.export_label, input_keyword = excluded.input_keyword
+    """, (name,
+          old_merge if merge is None else merge,
+          old_color if color is None else (color or None),
+          old_label if export_label is None else (export_label or None),
+          old_keyword if keyword is None else int(keyword)))
+
+
+def delete_leave_type(conn, name):
+    """구분 삭제 (기존 기록의 텍스트는 그대로 두며 일반 텍스트로 표시). 없는 구분이면 False
+
+    Raises:
+        ValueError: 연차 사용 집계에 쓰이는 구분(연차/반차/휴가)인 경우
+    """
+    if name in BALANCE_DEDUCTIONS:
+        raise ValueError(f"'{name}'은(는) 연차 사용 집계에 쓰이는 구분이라 삭제할 수 없습니다.")
+    return conn.execute("DELETE FROM leave_types WHERE name = ?", (name,)).rowcount > 0
+
+
+def main(argv=None):
+    from .database import DatabaseManager
+
+    parser = argparse.ArgumentParser(description="근태 구분 (병합 방식, 배경색, 엑셀 표시 이름, 입력 가능 여부)")
+    parser.add_argument("db_path", help="DB 파일 경로")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--set", metavar="구분", help="구분 추가/변경")
+    action.add_argument("--delete", metavar="구분", help="구분 삭제")
+    parser.add_argument("--merge", choices=sorted(MERGE_NAMES),
+                        help="none: 입력한 행에만, rows: 출근/퇴근 두 행, cell: 두 행을 한 칸으로 병합")
+    parser.add_argument("--color", help="배경색 (예: #F8CBAD, 빈 문자열이면 없음)")
+    parser.add_argument("--label", help="엑셀 표시 이름 (빈 문자열이면 구분 이름)")
+    keyword = parser.add_mutually_exclusive_group()
+    keyword.add_argument("--keyword", dest="keyword", action="store_true", default=None,
+                         help="다이얼로그/엑셀 가져오기에서 시간 대신 입력 가능")
+    keyword.add_argument("--no-keyword", dest="keyword", action="store_false")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(args.db_path)
+    try:
+        if args.set:
+            try:
+                with db.transaction() as conn:
+                    set_leave_type(conn, args.set, MERGE_NAMES.get(args.merge), color=args.color,
+                                   export_label=args.label, keyword=args.keyword)
+            except ValueError as e:
+                print(str(e))
+                return 1
+            print(f"구분 '{args.set}' 저장")
+            return 0
+        if args.delete:
+            try:
+                with db.transaction() as conn:
+                    deleted = delete_leave_type(conn, args.delete)
+            except ValueError as e:
+                print(str(e))
+                return 1
+            if not deleted:
+                print(f"구분 '{args.delete}'이(가) 없습니다.")
+                return 1
+            print(f"구분 '{args.delete}' 삭제")
+            return 0
+
+        merge_labels = {value: key for key, value in MERGE_NAMES.items()}
+        with db.connection() as conn:
+            registry = LeaveTypeRegistry.load(conn)
+        print(f"{'코드':>4}  {'구분':<8}{'병합':<6}{'차감':>5}  {'배경색':<9}{'엑셀 표시':<10}입력")
+        for t in registry.types:
+            print(f"{t.code:>4}  {t.name:<8}{merge_labels.get(t.merge, t.merge)!s:<6}"
+                  f"{registry.deduction(t.name):>5g}  {t.color or '-':<9}"
+                  f"{t.export_label or '-':<10}{'O' if t.keyword else '-'}")
+        return 0
+    finally:
+        db.close_all()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
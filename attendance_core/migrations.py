@@ -0,0 +1,363 @@
+"""
+스키마 마이그레이션 (PRAGMA user_version 기반)
+
+MIGRATIONS에 (버전, 설명, SQL 목록)을 순서대로 추가합니다.
+DB에 저장된 user_version보다 높은 버전만 하나의 트랜잭션으로 적용하고,
+적용한 것이 있으면 ANALYZE로 통계를 갱신하여 새 인덱스가 사용되도록 합니다.
+"""
+
+import sqlite3
+
+
+
+# 연차성 근태 기록 조건 (쿼리의 WHERE 절에 같은 조건이 있어야 부분 인덱스가 사용됨)
+LEAVE_ROW_CONDITION = ("(leave_type IN ('연차', '반차', '휴가') "
+                       "OR remarks IN ('반차_출근', '반차_퇴근'))")
+
+# 연차 사용 월별 집계(트리거)가 세는 구분과 차감량 (연차/휴가 1일, 반차 0.5일, 그 외 구분 0)
+# - 부분 인덱스와 트리거 SQL에 들어가므로 근태 구분 등록부(leave_types)에서 바꿀 수 없음
+BALANCE_DEDUCTIONS = {'연차': 1.0, '반차': 0.5, '휴가': 1.0}
+
+# 월별 집계 대상 날짜 형식 ('YYYY-MM-DD')
+_DATE_GLOB = "'[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'"
+
+
+def _balance_row_condition(row):
+    """행(NEW/OLD)이 연차 사용 월별 집계 대상인지 (연차성 기록 + 'YYYY-MM-DD' 날짜)"""
+    return (f"(({row}.leave_type IN ('연차', '반차', '휴가') "
+            f"OR {row}.remarks IN ('반차_출근', '반차_퇴근')) "
+            f"AND {row}.work_date GLOB {_DATE_GLOB})")
+
+
+def _balance_terms(row):
+    """행 하나가 더하는 (년, 월, 연차/휴가 일수, 반차 일수, 구분이 '반차'인 일수) SQL 식
+
+    반차는 비고(반차_출근/반차_퇴근)로만 표시된 날도 포함하고 연차/휴가인 날은 제외합니다.
+    (employee_id, work_date)가 UNIQUE이므로 같은 날의 반차가 두 번 집계되지 않습니다.
+    """
+    return (f"CAST(substr({row}.work_date, 1, 4) AS INTEGER)",
+            f"CAST(substr({row}.work_date, 6, 2) AS INTEGER)",
+            f"(CASE WHEN {row}.leave_type IN ('연차', '휴가') THEN 1 ELSE 0 END)",
+            f"(CASE WHEN {row}.leave_type IN ('연차', '휴가') THEN 0 "
+            f"WHEN {row}.leave_type = '반차' OR {row}.remarks IN ('반차_출근', '반차_퇴근') THEN 1 "
+            f"ELSE 0 END)",
+            f"(CASE WHEN {row}.leave_type = '반차' THEN 1 ELSE 0 END)")
+
+
+def _balance_add(row):
+    year, month, full, half, typed_half = _balance_terms(row)
+    return f"""INSERT INTO leave_balance_monthly
+                   (employee_id, year, month, full_days, half_days, typed_half_days)
+               VALUES ({row}.employee_id, {year}, {month}, {full}, {half}, {typed_half})
+               ON CONFLICT (employee_id, year, month) DO UPDATE SET
+                   full_days = full_days + excluded.full_days,
+                   half_days = half_days + excluded.half_days,
+                   typed_half_days = typed_half_days + excluded.typed_half_days;"""
+
+
+def _balance_remove(row):
+    year, month, full, half, typed_half = _balance_terms(row)
+    key = f"employee_id = {row}.employee_id AND year = {year} AND month = {month}"
+    return f"""UPDATE leave_balance_monthly SET
+                   full_days = full_days - {full},
+                   half_days = half_days - {half},
+                   typed_half_days = typed_half_days - {typed_half}
+               WHERE {key};
+               DELETE FROM leave_balance_monthly
+               WHERE {key} AND full_days = 0 AND half_days = 0 AND typed_half_days = 0;"""
+
+
+# 근태 기록 전체에서 월별 집계를 다시 계산 (초기 채우기, 재구성, 일치 검사)
+_terms = _balance_terms("attendance_records")
+LEAVE_BALANCE_SELECT = f"""
+    SELECT employee_id, {_terms[0]}, {_terms[1]},
+           SUM({_terms[2]}), SUM({_terms[3]}), SUM({_terms[4]})
+    FROM attendance_records
+    WHERE {LEAVE_ROW_CONDITION}
+    AND work_date GLOB {_DATE_GLOB}
+    GROUP BY 1, 2, 3
+"""
+LEAVE_BALANCE_BACKFILL = f"""
+    INSERT INTO leave_balance_monthly
+        (employee_id, year, month, full_days, half_days, typed_half_days)
+    {LEAVE_BALANCE_SELECT}
+"""
+
+
+def minute_of_day_sql(value):
+    """'HH:MM[:SS]' 시각 텍스트 -> 분 단위 정수 SQL 식
+
+    month_grid.parse_minutes와 같은 규칙입니다 (앞 5글자가 H:M ~ HH:MM).
+    비어 있으면 NULL, 해석할 수 없으면 -1 입니다. (TIME 컬럼은 NUMERIC 친화성이라
+    '0' 같은 값은 숫자 0으로 저장되며, 화면과 같이 빈 값으로 취급)
+    """
+    head = f"substr({value}, 1, 5)"
+    colon = f"instr({head}, ':')"
+    hour = f"CAST(substr({head}, 1, {colon} - 1) AS INTEGER)"
+    minute = f"CAST(substr({head}, {colon} + 1) AS INTEGER)"
+    return (f"(CASE WHEN {value} IS NULL OR {value} = '' OR {value} = 0 THEN NULL "
+            f"WHEN ({head} GLOB '[0-9][0-9]:[0-9][0-9]' OR {head} GLOB '[0-9]:[0-9][0-9]' "
+            f"OR {head} GLOB '[0-9][0-9]:[0-9]' OR {head} GLOB '[0-9]:[0-9]') "
+            f"AND {hour} <= 23 AND {minute} <= 59 THEN {hour} * 60 + {minute} "
+            f"ELSE -1 END)")
+
+
+def _sql_literal(value):
+    if value is None:
+        return "NULL"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return repr(int(value) if isinstance(value, bool) else value)
+
+
+# 기본 근태 구분 (버전 6에서 leave_types 테이블에 넣는 값, 테이블이 없을 때의 분류)
+# (코드, 구분, 병합(0: 입력한 행, 1: 두 행, 2: 한 칸으로 병합),
+#  배경색, 엑셀 표시 이름(None이면 구분), 시간 대신 입력 가능)
+LEAVE_TYPE_SEED = (
+    (1, '연차', 2, '#F8CBAD', None, True),
+    (2, '반차', 0, '#F8CBAD', None, True),
+    (3, '반반차', 0, None, None, True),
+    (4, '휴가', 0, None, None, False),
+    (5, '경조사', 2, '#F8CBAD', None, False),
+    (6, '예비군', 2, '#F8CBAD', None, False),
+    (7, '설날', 2, '#F8CBAD', None, True),
+    (8, '추석', 2, '#F8CBAD', None, True),
+    (9, '박람회', 2, '#F8CBAD', None, True),
+    (10, '출장', 1, '#F8CBAD', None, True),
+    (11, '공휴', 0, '#F8CBAD', None, True),
+    (12, '민방위', 0, '#F8CBAD', None, True),
+    (13, '교육', 0, '#F8CBAD', None, True),
+)
+
+
+def _leave_type_seed_sql():
+    """기본 근태 구분 (LEAVE_TYPE_SEED) 입력 - 이미 있는 구분은 그대로 둠"""
+    values = ",\n".join(f"({', '.join(_sql_literal(value) for value in row)})" for row in LEAVE_TYPE_SEED)
+    return f"""INSERT OR IGNORE INTO leave_types
+               (code, name, merge_mode, color, export_label, input_keyword)
+               VALUES {values}"""
+
+
+def _minutes_stale(row):
+    """행(NEW)의 분 단위 컬럼이 시각 텍스트와 다른지 (직접 기록하지 않은 쓰기 보정용)"""
+    return (f"({row}.arrival_minute IS NOT {minute_of_day_sql(f'{row}.arrival_time')} "
+            f"OR {row}.departure_minute IS NOT {minute_of_day_sql(f'{row}.departure_time')})")
+
+
+_SET_MINUTES = f"""UPDATE attendance_records SET
+                       arrival_minute = {minute_of_day_sql('NEW.arrival_time')},
+                       departure_minute = {minute_of_day_sql('NEW.departure_time')}
+                   WHERE id = NEW.id;"""
+
+MIGRATIONS = [
+    (1, "조회 패턴별 인덱스 추가", [
+        # 월별 근태 조회 (work_date 범위)
+        """CREATE INDEX IF NOT EXISTS idx_attendance_work_date
+           ON attendance_records(work_date)""",
+        # 연월차 관리대장 - 기간 내 연차/반차/휴가 기록 (부분 + 커버링)
+        f"""CREATE INDEX IF NOT EXISTS idx_attendance_leave_rows
+            ON attendance_records(work_date, employee_id, leave_type, remarks)
+            WHERE {LEAVE_ROW_CONDITION}""",
+        # 연월차 동기화 - leave_type 기준 연차성 기록 (부분 + 커버링)
+        """CREATE INDEX IF NOT EXISTS idx_attendance_leave_types
+           ON attendance_records(work_date, employee_id, leave_type, remarks)
+           WHERE leave_type IN ('연차', '반차', '휴가')""",
+        # 소멸 중복 확인 (직원 + 종류 + 소멸일)
+        """CREATE INDEX IF NOT EXISTS idx_leave_expirations_emp_type_date
+           ON leave_expirations(employee_id, leave_type, expiration_date)""",
+        # 직원별 종류별 기간 사용량 합계 (커버링)
+        """CREATE INDEX IF NOT EXISTS idx_leave_records_emp_type_date
+           ON leave_records(employee_id, leave_type, leave_date, leave_amount)""",
+        # 전 직원 연차 사용량 기간 조회 (커버링)
+        """CREATE INDEX IF NOT EXISTS idx_leave_records_type_date
+           ON leave_records(leave_type, leave_date, employee_id, leave_amount)""",
+    ]),
+    (2, "연차 사용 월별 집계 테이블 (트리거로 갱신)", [
+        """CREATE TABLE IF NOT EXISTS leave_balance_monthly (
+               year INTEGER NOT NULL,
+               month INTEGER NOT NULL,
+               employee_id INTEGER NOT NULL,
+               full_days INTEGER NOT NULL DEFAULT 0,
+               half_days INTEGER NOT NULL DEFAULT 0,
+               typed_half_days INTEGER NOT NULL DEFAULT 0,
+               PRIMARY KEY (employee_id, year, month)
+           ) WITHOUT ROWID""",
+        # 기존 기록 변경은 UPDATE(ON CONFLICT DO UPDATE)로 해야 이전 값이 빠짐
+        # (INSERT OR REPLACE가 지우는 행은 recursive_triggers 없이는 DELETE 트리거가 실행되지 않음)
+        f"""CREATE TRIGGER IF NOT EXISTS trg_leave_balance_insert
+            AFTER INSERT ON attendance_records
+            WHEN {_balance_row_condition("NEW")}
+            BEGIN
+                {_balance_add("NEW")}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_leave_balance_delete
+            AFTER DELETE ON attendance_records
+            WHEN {_balance_row_condition("OLD")}
+            BEGIN
+                {_balance_remove("OLD")}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_leave_balance_update_old
+            AFTER UPDATE OF employee_id, work_date, leave_type, remarks ON attendance_records
+            WHEN {_balance_row_condition("OLD")}
+            BEGIN
+                {_balance_remove("OLD")}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_leave_balance_update_new
+            AFTER UPDATE OF employee_id, work_date, leave_type, remarks ON attendance_records
+            WHEN {_balance_row_condition("NEW")}
+            BEGIN
+                {_balance_add("NEW")}
+            END""",
+        "DELETE FROM leave_balance_monthly",
+        LEAVE_BALANCE_BACKFILL,
+    ]),
+    (3, "연말 마감 기록 (마감한 년도의 잔여수는 화면 조회로 덮어쓰지 않음)", [
+        """CREATE TABLE IF NOT EXISTS leave_year_closes (
+               year INTEGER PRIMARY KEY,
+               reference_date TEXT NOT NULL,
+               employee_count INTEGER NOT NULL,
+               closed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+           )""",
+    ]),
+    # 출퇴근 시각을 분 단위 정수로도 저장 (색상/평균/플래그 계산은 정수 비교, 텍스트는 호환용으로 유지)
+    # UPSERT_ATTENDANCE_SQL이 함께 기록하며, 분 컬럼 없이 기록한 행은 트리거가 채움
+    (4, "출퇴근 시각 분 단위 정수 컬럼", [
+        "ALTER TABLE attendance_records ADD COLUMN arrival_minute INTEGER",
+        "ALTER TABLE attendance_records ADD COLUMN departure_minute INTEGER",
+        f"""UPDATE attendance_records SET
+                arrival_minute = {minute_of_day_sql('arrival_time')},
+                departure_minute = {minute_of_day_sql('departure_time')}""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_attendance_minutes_insert
+            AFTER INSERT ON attendance_records
+            WHEN {_minutes_stale("NEW")}
+            BEGIN
+                {_SET_MINUTES}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_attendance_minutes_update
+            AFTER UPDATE OF arrival_time, departure_time, arrival_minute, departure_minute ON attendance_records
+            WHEN {_minutes_stale("NEW")}
+            BEGIN
+                {_SET_MINUTES}
+            END""",
+    ]),
+    # 조기출근/지각/야근 기준 시각 (부서별, 기간별 예외) - work_rules.WorkRules로 컴파일
+    (5, "근무 규칙 테이블", [
+        """CREATE TABLE IF NOT EXISTS work_rules (
+               id INTEGER PRIMARY KEY AUTOINCREMENT,
+               name TEXT,
+               department TEXT,
+               start_date DATE,
+               end_date DATE,
+               early_arrival_before TEXT,
+               late_arrival_after TEXT,
+               late_departure_from TEXT,
+               created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+           )""",
+    ]),
+    # 구분 텍스트(연차, 반차, 공휴 등)의 병합 방식/배경색/엑셀 표시 이름
+    # - leave_types.LeaveTypeRegistry로 읽음
+    (6, "근태 구분 등록부", [
+        """CREATE TABLE IF NOT EXISTS leave_types (
+               code INTEGER PRIMARY KEY,
+               name TEXT NOT NULL UNIQUE,
+               merge_mode INTEGER NOT NULL DEFAULT 0,
+               color TEXT,
+               export_label TEXT,
+               input_keyword INTEGER NOT NULL DEFAULT 0
+           )""",
+        _leave_type_seed_sql(),
+    ]),
+    # 다른 프로세스(CLI 등)의 구분 변경을 실행 중인 프로그램이 알 수 있도록 변경 번호를 DB에 기록하고,
+    # 연차 사용 월별 집계(BALANCE_DEDUCTIONS)가 세는 구분은 등록부에서 삭제하지 못하게 함
+    (7, "근태 구분 변경 번호", [
+        """CREATE TABLE IF NOT EXISTS leave_types_version (
+               id INTEGER PRIMARY KEY CHECK (id = 1),
+               version INTEGER NOT NULL
+           )""",
+        "INSERT OR IGNORE INTO leave_types_version (id, version) VALUES (1, 0)",
+        _leave_type_seed_sql(),
+        *(f"""CREATE TRIGGER IF NOT EXISTS trg_leave_types_version_{event.lower()}
+              AFTER {event} ON leave_types
+              BEGIN
+                  UPDATE leave_types_version SET version = version + 1 WHERE id = 1;
+              END""" for event in ("INSERT", "UPDATE", "DELETE")),
+        f"""CREATE TRIGGER IF NOT EXISTS trg_leave_types_balance_delete
+            BEFORE DELETE ON leave_types
+            WHEN OLD.name IN ({', '.join(_sql_literal(name) for name in BALANCE_DEDUCTIONS)})
+            BEGIN
+                SELECT RAISE(ABORT, '연차 사용 집계에 쓰이는 구분은 삭제할 수 없습니다');
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_leave_types_balance_rename
+            BEFORE UPDATE OF name ON leave_types
+            WHEN OLD.name IN ({', '.join(_sql_literal(name) for name in BALANCE_DEDUCTIONS)})
+             AND NEW.name IS NOT OLD.name
+            BEGIN
+                SELECT RAISE(ABORT, '연차 사용 집계에 쓰이는 구분은 이름을 바꿀 수 없습니다');
+            END""",
+    ]),
+    # 다른 프로세스(CLI 등)의 근무 규칙 변경을 실행 중인 프로그램이 알 수 있도록 변경 번호를 DB에 기록
+    # (부서 규칙 대상이 바뀌므로 직원 추가/삭제와 부서 변경도 포함)
+    (8, "근무 규칙 변경 번호", [
+        """CREATE TABLE IF NOT EXISTS work_rules_version (
+               id INTEGER PRIMARY KEY CHECK (id = 1),
+               version INTEGER NOT NULL
+           )""",
+        "INSERT OR IGNORE INTO work_rules_version (id, version) VALUES (1, 0)",
+        *(f"""CREATE TRIGGER IF NOT EXISTS trg_{table}_rules_version_{suffix}
+              AFTER {event} ON {table}
+              BEGIN
+                  UPDATE work_rules_version SET version = version + 1 WHERE id = 1;
+              END"""
+          for table, suffix, event in (("work_rules", "insert", "INSERT"),
+                                       ("work_rules", "update", "UPDATE"),
+                                       ("work_rules", "delete", "DELETE"),
+                                       ("employees", "insert", "INSERT"),
+                                       ("employees", "department", "UPDATE OF department"),
+                                       ("employees", "delete", "DELETE"))),
+    ]),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn):
+    """DB에 저장된 스키마 버전 (PRAGMA user_version)"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(conn):
+    """저장된 버전 이후의 마이그레이션 적용
+
+    Returns:
+        적용한 마이그레이션 버전 목록
+    """
+    current = get_schema_version(conn)
+    pending = [m for m in MIGRATIONS if m[0] > current]
+    if not pending:
+        return []
+
+    if conn.in_transaction:
+        conn.commit()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        # 다른 프로세스가 먼저 적용했을 수 있으므로 잠금 확보 후 다시 확인
+        current = get_schema_version(conn)
+        applied = []
+        for version, _description, statements in pending:
+            if version <= current:
+                continue
+            for sql in statements:
+                conn.execute(sql)
+            # user_version은 DB 헤더에 저장되며 트랜잭션과 함께 커밋/롤백됨
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+            applied.append(version)
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+
+    if applied:
+        # 새 인덱스를 플래너가 선택하도록 통계 갱신
+        conn.execute("ANALYZE")
+        conn.commit()
+    return applied
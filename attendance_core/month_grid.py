@@ -0,0 +1,249 @@
+"""
+월간 출퇴근 그리드 (Qt 비의존)
+
+한 달치 기록을 직원 x 일자(31) NumPy 배열로 보관하고, 화면에 표시할 셀 텍스트/스타일,
+병합·사선 여부, 요약(month_summary.MonthSummary)을 한 번에 계산합니다.
+화면은 이 결과를 그대로 옮겨 그리기만 하면 되므로 셀마다 시간 파싱이나
+다른 셀 조회를 반복하지 않습니다.
+"""
+
+import re
+from calendar import monthrange
+from datetime import date, datetime
+from functools import lru_cache
+
+from .month_loader import fetch_month_rows
+from .month_summary import MonthSummary
+
+
+# 셀 스타일 코드
+STYLE_EMPTY = 0      # 빈 셀 (음영)
+STYLE_PLAIN = 1      # 일반 텍스트/시간
+STYLE_LEAVE = 2      # 휴가성 텍스트 (기본 배경색 LEAVE_COLOR)
+STYLE_EARLY = 3      # 08시 이전 출근 (초록)
+STYLE_LATE = 4       # 09시 이후 출근 (빨강)
+STYLE_NIGHT = 5      # 20시 이후 퇴근 (파랑)
+STYLE_LEAVE_COLORS = 16  # 기본과 다른 구분 배경색 (색마다 16, 17, ...)
+
+# 기록 플래그 비트
+FLAG_RECORD = 1
+FLAG_EARLY = 2
+FLAG_LATE_ARRIVAL = 4
+FLAG_LATE_DEPARTURE = 8
+
+_HHMM = re.compile(r"(\d{1,2}):(\d{1,2})")
+
+
+def parse_minutes(value):
+    """'HH:MM[:SS]' 앞 5글자를 분 단위 정수로 변환 (화면 표시와 같은 규칙, 실패 시 -1)"""
+    match = _HHMM.fullmatch(str(value)[:5])
+    if not match:
+        return -1
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if hour > 23 or minute > 59:
+        return -1
+    return hour * 60 + minute
+
+
+@lru_cache(maxsize=8)
+def leave_color_styles(leave_registry):
+    """구분 코드로 인덱싱하는 배경 스타일 배열(배경색 없음 0)과 {스타일 코드: 배경색}"""
+    import numpy as np
+    from .leave_types import LEAVE_COLOR
+
+    styles = {LEAVE_COLOR: STYLE_LEAVE}
+    style_by_code = np.zeros(len(leave_registry.table('colored')), dtype=np.int8)
+    for leave_type in leave_registry.types:
+        if leave_type.color:
+            color = leave_type.color.upper()
+            if color not in styles:
+                styles[color] = STYLE_LEAVE_COLORS + len(styles) - 1
+            style_by_code[leave_type.code] = styles[color]
+    style_by_code.setflags(write=False)
+    return style_by_code, {style: color for color, style in styles.items()}
+
+
+def _to_date(value):
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+class MonthGrid:
+    """직원 x 일자 월간 출퇴근 배열
+
+    주요 속성 (n = 직원 수, 열 = 일자 1~31):
+        arrival_minutes, departure_minutes: int16 (n, 31), 시간 없음/해석 불가 -1
+        leave_codes: int16 (n, 31), leave_types 튜플의 인덱스 (0 = 없음)
+        flags: uint8 (n, 31), FLAG_* 비트
+        arrival_text, departure_text: 셀 표시 텍스트 (object 배열)
+        arrival_style, departure_style: STYLE_* 코드 (구분 배경은 leave_styles의 코드)
+        leave_styles: {배경 스타일 코드: 배경색} - 근태 구분 등록부의 배경색
+        merged: 출근/퇴근 행 병합 여부
+        shaded: 입사 전/퇴사 후 (회색 배경)
+        diagonal: 사선 표시 여부
+        summary: 직원별 요약 (MonthSummary)
+        early_count, late_arrival_count, late_departure_count, leave_amount: summary의 직원별 요약
+        avg_arrival, avg_departure: 직원별 평균 시간 텍스트 ('HH:MM' 또는 '')
+    """
+
+    def __init__(self, year, month, employees, rows, rules=None, leave_registry=None):
+        """
+        Args:
+            employees: [(emp_id, hire_date, resignation_date), ...] 화면 표시 순서
+            rows: fetch_month_rows() 결과
+            rules: 색상 기준 근무 규칙 (work_rules.WorkRules, None이면 기본 기준)
+            leave_registry: 구분 병합/배경색 기준 (leave_types.LeaveTypeRegistry, None이면 기본 구분)
+        """
+        import numpy as np
+        from .work_rules import DEFAULT_THRESHOLDS, evaluate_flags
+
+        self.year = year
+        self.month = month
+        self.days_in_month = monthrange(year, month)[1]
+        self.emp_ids = [emp[0] for emp in employees]
+        self.index = {emp_id: i for i, emp_id in enumerate(self.emp_ids)}
+        n = len(self.emp_ids)
+        shape = (n, 31)
+
+        days = np.arange(1, 32)
+
+        # --- 기록을 평탄한 배열로 ---
+        rows = [row for row in rows if row[0] in self.index]
+        emp_idx = np.fromiter((self.index[row[0]] for row in rows), dtype=np.int64, count=len(rows))
+        day_idx = np.fromiter((row[1] - 1 for row in rows), dtype=np.int64, count=len(rows))
+        arrivals = [row[2] for row in rows]
+        departures = [row[3] for row in rows]
+        leave_types = [row[7] or '' for row in rows]
+        remarks = [row[8] or '' for row in rows]
+
+        # 분 단위 정수 컬럼 사용 (시각 텍스트를 다시 해석하지 않음, None = 시간 없음)
+        arr_min = np.fromiter((-1 if row[9] is None else row[9] for row in rows), dtype=np.int16, count=len(rows))
+        dep_min = np.fromiter((-1 if row[10] is None else row[10] for row in rows), dtype=np.int16, count=len(rows))
+        has_arr = np.fromiter((row[9] is not None for row in rows), dtype=bool, count=len(rows))
+        has_dep = np.fromiter((row[10] is not None for row in rows), dtype=bool, count=len(rows))
+        early = np.fromiter((bool(row[4]) for row in rows), dtype=bool, count=len(rows))
+        late_arr = np.fromiter((bool(row[5]) for row in rows), dtype=bool, count=len(rows))
+        late_dep = np.fromiter((bool(row[6]) for row in rows), dtype=bool, count=len(rows))
+
+        # remarks가 '{구분}_출근' / '{구분}_퇴근'이면 해당 행에만 텍스트 표시
+        remark_in = np.fromiter((bool(lt) and rm == f'{lt}_출근' for lt, rm in zip(leave_types, remarks)),
+                                dtype=bool, count=len(rows))
+        remark_out = np.fromiter((bool(lt) and rm == f'{lt}_퇴근' for lt, rm in zip(leave_types, remarks)),
+                                 dtype=bool, count=len(rows))
+        no_remark = np.fromiter((bool(lt) and not rm for lt, rm in zip(leave_types, remarks)),
+                                dtype=bool, count=len(rows))
+        type_array = np.array(leave_types, dtype=object)
+        if leave_registry is None:
+            from .leave_types import DEFAULT_LEAVE_TYPES
+            leave_registry = DEFAULT_LEAVE_TYPES
+        type_codes = leave_registry.codes(leave_types)
+        both_rows = no_remark & leave_registry.table('both_rows')[type_codes]
+        # 출근/퇴근 행 텍스트가 같고 병합 대상이면 한 칸으로 병합
+        merge_day = both_rows & leave_registry.table('merged_cell')[type_codes]
+        # 출근하지 않은 날로 칠하는 배경 (두 행 표시 구분은 배경색이 없어도 기본 배경색)
+        style_by_code, self.leave_styles = leave_color_styles(leave_registry)
+        leave_bg_style = style_by_code[type_codes]
+        leave_fill = np.where(leave_bg_style > 0, leave_bg_style, STYLE_LEAVE)
+        leave_bg = leave_bg_style > 0
+
+        # 구분 코드 (0 = 없음)
+        self.leave_types = ('',) + tuple(sorted({lt for lt in leave_types if lt}))
+        code_of = {lt: i for i, lt in enumerate(self.leave_types)}
+        leave_code = np.fromiter((code_of[lt] for lt in leave_types), dtype=np.int16, count=len(rows))
+
+        # 기록별 조기출근/지각/야근 색상 (직원 x 일자 기준 배열에서 기록 위치 값을 골라 한 번에 비교)
+        thresholds = DEFAULT_THRESHOLDS if rules is None else rules.month_thresholds(year, month, self.emp_ids)
+        thresholds = [t[emp_idx, day_idx] if np.ndim(t) else t for t in thresholds]
+        is_early, is_late, is_night = evaluate_flags(thresholds, arr_min, dep_min)
+
+        # --- 출근 행 셀 ---
+        a_is_text = remark_in | both_rows
+        a_time_ok = ~a_is_text & has_arr & (arr_min >= 0)
+        a_style = np.select(
+            [a_is_text & (leave_bg | both_rows), a_is_text,
+             a_time_ok & is_early, a_time_ok & is_late,
+             ~a_is_text & has_arr],
+            [leave_fill, STYLE_PLAIN, STYLE_EARLY, STYLE_LATE, STYLE_PLAIN],
+            default=STYLE_EMPTY)
+        a_text = [lt if is_text else (str(v)[:5] if v else '')
+                  for lt, is_text, v in zip(leave_types, a_is_text, arrivals)]
+
+        # --- 퇴근 행 셀 ---
+        d_is_text = remark_out | both_rows
+        d_time_ok = ~d_is_text & has_dep & (dep_min >= 0)
+        d_style = np.select(
+            [d_is_text & (leave_bg | both_rows), d_is_text,
+             d_time_ok & is_night,
+             ~d_is_text & has_dep],
+            [leave_fill, STYLE_PLAIN, STYLE_NIGHT, STYLE_PLAIN],
+            default=STYLE_EMPTY)
+        d_text = [lt if is_text else (str(v)[:5] if v else '')
+                  for lt, is_text, v in zip(leave_types, d_is_text, departures)]
+
+        # --- 2차원 배열로 배치 ---
+        self.arrival_minutes = np.full(shape, -1, dtype=np.int16)
+        self.departure_minutes = np.full(shape, -1, dtype=np.int16)
+        self.leave_codes = np.zeros(shape, dtype=np.int16)
+        self.flags = np.zeros(shape, dtype=np.uint8)
+        self.arrival_style = np.full(shape, STYLE_EMPTY, dtype=np.int8)
+        self.departure_style = np.full(shape, STYLE_EMPTY, dtype=np.int8)
+        self.arrival_text = np.full(shape, '', dtype=object)
+        self.departure_text = np.full(shape, '', dtype=object)
+        merged_by_text = np.zeros(shape, dtype=bool)
+
+        cells = (emp_idx, day_idx)
+        self.arrival_minutes[cells] = np.where(has_arr, arr_min, -1)
+        self.departure_minutes[cells] = np.where(has_dep, dep_min, -1)
+        self.leave_codes[cells] = leave_code
+        self.flags[cells] = (FLAG_RECORD | np.where(early, FLAG_EARLY, 0)
+                             | np.where(late_arr, FLAG_LATE_ARRIVAL, 0)
+                             | np.where(late_dep, FLAG_LATE_DEPARTURE, 0))
+        self.arrival_style[cells] = a_style
+        self.departure_style[cells] = d_style
+        self.arrival_text[cells] = np.array(a_text, dtype=object)
+        self.departure_text[cells] = np.array(d_text, dtype=object)
+        merged_by_text[cells] = merge_day
+
+        # --- 입사 전 / 퇴사 후 (병합 + 회색 + 사선) ---
+        ordinals = np.array([date(year, month, min(day, self.days_in_month)).toordinal() for day in days])
+        valid_day = days <= self.days_in_month
+        hire = np.array([(_to_date(emp[1]) or date.min).toordinal() for emp in employees], dtype=np.int64)
+        resign = np.array([(_to_date(emp[2]) or date.max).toordinal() for emp in employees], dtype=np.int64)
+        before_hire = (ordinals[None, :] < hire[:, None]) & valid_day
+        after_resign = (ordinals[None, :] > resign[:, None]) & valid_day
+
+        self.shaded = before_hire | after_resign
+        # 병합된 날짜는 입사 전이어도 사선 없이 회색만, 퇴사 후는 항상 사선
+        self.diagonal = (before_hire & ~merged_by_text) | after_resign
+        self.merged = merged_by_text | self.shaded
+
+        # --- 직원별 요약 (구분 텍스트로 표시한 칸은 평균 제외) ---
+        self.summary = MonthSummary.compute(year, month, n, emp_idx, day_idx, early, late_arr, late_dep, type_array,
+                                            np.where(a_time_ok, arr_min, -1), np.where(d_time_ok, dep_min, -1),
+                                            leave_registry)
+        self.early_count = self.summary.early_count
+        self.late_arrival_count = self.summary.late_arrival_count
+        self.late_departure_count = self.summary.late_departure_count
+        self.leave_amount = self.summary.leave_amount
+        self.avg_arrival = self.summary.avg_arrival
+        self.avg_departure = self.summary.avg_departure
+
+    @classmethod
+    def load(cls, cursor, year, month, employees, only_listed=False, rules=None, leave_registry=None):
+        """한 번의 범위 조회로 월간 그리드 생성 (employees: [(emp_id, hire_date, resignation_date)])
+
+        only_listed=True이면 employees에 해당하는 기록만 조회합니다 (일부 직원 행 갱신용).
+        """
+        employee_ids = [emp[0] for emp in employees] if only_listed else None
+        return cls(year, month, employees, fetch_month_rows(cursor, year, month, employee_ids), rules,
+                   leave_registry)
+
+    def row_of(self, emp_id):
+        """직원 ID의 배열 행 번호 (없으면 None)"""
+        return self.index.get(emp_id)
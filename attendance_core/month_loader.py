@@ -0,0 +1,101 @@
+"""
+월간 출퇴근 일괄 로더 (Qt 비의존)
+
+직원별로 월 데이터를 반복 조회하지 않고, 한 번의 범위 조회로
+해당 월 전체 직원의 기록을 {emp_id: {day: record}} 형태로 반환합니다.
+"""
+
+from calendar import monthrange
+
+
+def month_date_range(year, month):
+    """해당 월의 [시작일, 다음 달 1일) 문자열 범위 반환
+
+    work_date는 'YYYY-MM-DD' 텍스트로 저장되므로 문자열 비교로 범위 조회가 가능합니다.
+    strftime()으로 감싸지 않아야 (employee_id, work_date) 인덱스를 탈 수 있습니다.
+    """
+    start = f"{year:04d}-{month:02d}-01"
+    if month == 12:
+        end = f"{year + 1:04d}-01-01"
+    else:
+        end = f"{year:04d}-{month + 1:02d}-01"
+    return start, end
+
+
+# 이 수 이하의 직원만 조회할 때는 employee_id IN (...) 조건 사용 (SQLite 바인딩 변수 제한 이내)
+MAX_EMPLOYEE_FILTER = 500
+
+
+def fetch_month_rows(cursor, year, month, employee_ids=None):
+    """특정 월의 전체 직원 출퇴근 기록 행 목록 (work_date 대신 일(day) 정수)
+
+    Args:
+        employee_ids: 지정하면 해당 직원의 기록만 조회 (일부 행 갱신용)
+
+    Returns:
+        [(emp_id, day, arrival, departure, early, late_arr, late_dep, leave_type, remarks,
+          arrival_minute, departure_minute), ...]
+        arrival_minute/departure_minute: 분 단위 정수 (시간 없음 None, 해석 불가 -1)
+    """
+    start, end = month_date_range(year, month)
+    if employee_ids is not None and len(employee_ids) <= MAX_EMPLOYEE_FILTER:
+        employee_ids = list(employee_ids)
+        if not employee_ids:
+            return []
+        placeholders = ", ".join("?" * len(employee_ids))
+        rows = cursor.execute(f"""
+            SELECT employee_id, work_date, arrival_time, departure_time,
+                   early_arrival, late_arrival, late_departure, leave_type, remarks,
+                   arrival_minute, departure_minute
+            FROM attendance_records
+            WHERE employee_id IN ({placeholders}) AND work_date >= ? AND work_date < ?
+            ORDER BY employee_id, work_date
+        """, (*employee_ids, start, end)).fetchall()
+    else:
+        rows = cursor.execute("""
+            SELECT employee_id, work_date, arrival_time, departure_time,
+                   early_arrival, late_arrival, late_departure, leave_type, remarks,
+                   arrival_minute, departure_minute
+            FROM attendance_records
+            WHERE work_date >= ? AND work_date < ?
+            ORDER BY employee_id, work_date
+        """, (start, end)).fetchall()
+
+    days_in_month = monthrange(year, month)[1]
+    result = []
+    for emp_id, work_date, *values in rows:
+        try:
+            day = int(str(work_date)[8:10])
+        except ValueError:
+            continue
+        if not 1 <= day <= days_in_month:
+            continue
+        result.append((emp_id, day, *values))
+    return result
+
+
+def load_month_records(cursor, year, month):
+    """특정 월의 전체 직원 출퇴근 기록을 한 번에 조회
+
+    Args:
+        cursor: sqlite3 커서 또는 연결 (execute 지원 객체)
+        year: 년도
+        month: 월
+
+    Returns:
+        {emp_id: {day: {'arrival', 'departure', 'early', 'late_arr',
+                        'late_dep', 'leave_type', 'remarks'}}}
+    """
+    month_records = {}
+    for (emp_id, day, arrival, departure, early, late_arr, late_dep, leave_type, remarks,
+         _arrival_minute, _departure_minute) in fetch_month_rows(cursor, year, month):
+        month_records.setdefault(emp_id, {})[day] = {
+            'arrival': arrival,
+            'departure': departure,
+            'early': early,
+            'late_arr': late_arr,
+            'late_dep': late_dep,
+            'leave_type': leave_type,
+            'remarks': remarks
+        }
+    return month_records
@@ -0,0 +1,130 @@
+"""
+월간 출퇴근 요약 (Qt 비의존)
+
+조기출근/지각/야근/연차사용/평균 출근시간/평균 퇴근시간 6개 요약을 해당 월 전체 직원의
+기록 배열에서 한 번에 계산합니다. 화면(MonthGrid), 엑셀 내보내기, 보고서가 같은 계산을 씁니다.
+
+요일은 월 1일의 요일에서 산술로 구하므로 날짜 객체를 일자마다 만들지 않습니다.
+
+    summary = MonthSummary.load(conn.cursor(), 2025, 3, employee_ids)
+    summary.to_frame(employee_ids)   # 보고서용 DataFrame (SUMMARY_COLUMNS)
+"""
+
+from calendar import monthrange
+from datetime import date
+
+SUMMARY_COLUMNS = ("조기출근", "지각", "야근", "연차사용", "평균 출근시간", "평균 퇴근시간")
+
+# 셋째 주 수요일(15~21일) 이 시각 퇴근은 평균 퇴근시간에서 제외 (조기 퇴근일)
+THIRD_WEDNESDAY_DEPARTURE = 17 * 60
+
+
+def format_average(total_minutes, count):
+    """평균 시각 'HH:MM' (분 합계 / 건수, 초 단위에서 버림)"""
+    avg_seconds = (total_minutes * 60) // count
+    return f"{avg_seconds // 3600:02d}:{(avg_seconds % 3600) // 60:02d}"
+
+
+def month_days(year, month):
+    """일자(1~31) 열별 (평일 여부, 셋째 주 수요일 여부) bool 배열 - 없는 날짜는 모두 False"""
+    import numpy as np
+
+    days = np.arange(1, 32)
+    weekday = (date(year, month, 1).weekday() + days - 1) % 7
+    valid = days <= monthrange(year, month)[1]
+    return (weekday < 5) & valid, (weekday == 2) & (days >= 15) & (days <= 21) & valid
+
+
+class MonthSummary:
+    """직원별 월 요약 (길이 n 배열)
+
+    early_count, late_arrival_count, late_departure_count: int
+    leave_amount: float (구분별 연차 차감량 합계 - 기본 연차/휴가 1.0, 반차 0.5)
+    avg_arrival, avg_departure: 'HH:MM' 또는 '' 목록
+    """
+
+    def __init__(self, early_count, late_arrival_count, late_departure_count, leave_amount,
+                 avg_arrival, avg_departure):
+        self.early_count = early_count
+        self.late_arrival_count = late_arrival_count
+        self.late_departure_count = late_departure_count
+        self.leave_amount = leave_amount
+        self.avg_arrival = avg_arrival
+        self.avg_departure = avg_departure
+
+    @classmethod
+    def compute(cls, year, month, n, emp_idx, day_idx, early, late_arrival, late_departure, leave_types,
+                arrival_minutes, departure_minutes, leave_registry=None):
+        """기록 배열에서 직원별 요약 계산
+
+        Args:
+            n: 직원 수
+            emp_idx, day_idx: 기록별 직원 위치(0~n-1), 일자-1
+            early, late_arrival, late_departure: 기록별 저장된 플래그
+            leave_types: 기록별 구분 (object 배열, 없으면 '')
+            arrival_minutes, departure_minutes: 기록별 평균에 넣을 시각(분).
+                음수는 제외 (시간 없음, 해석 불가, 구분 텍스트로 표시한 칸)
+            leave_registry: 연차사용 차감량 기준 (leave_types.LeaveTypeRegistry, None이면 기본 구분)
+
+        평균 출근은 주말 제외, 평균 퇴근은 주말과 셋째 주 수요일 17:00 퇴근 제외입니다.
+        """
+        import numpy as np
+
+        emp_idx = np.asarray(emp_idx, dtype=np.int64)
+        day_idx = np.asarray(day_idx, dtype=np.int64)
+        arrival_minutes = np.asarray(arrival_minutes, dtype=np.int64)
+        departure_minutes = np.asarray(departure_minutes, dtype=np.int64)
+        leave_types = np.asarray(leave_types, dtype=object)
+
+        def count(values):
+            return np.bincount(emp_idx, weights=np.asarray(values, dtype=bool), minlength=n).astype(int)
+
+        if leave_registry is None:
+            from .leave_types import DEFAULT_LEAVE_TYPES
+            leave_registry = DEFAULT_LEAVE_TYPES
+        amount = leave_registry.table('deduction')[leave_registry.codes(leave_types)]
+
+        is_weekday, is_third_wednesday = month_days(year, month)
+        in_month = (day_idx >= 0) & (day_idx < 31)
+        day = np.where(in_month, day_idx, 0)
+        weekday = in_month & is_weekday[day]
+        arrival_mask = (arrival_minutes >= 0) & weekday
+        departure_mask = ((departure_minutes >= 0) & weekday
+                          & ~(is_third_wednesday[day] & (departure_minutes == THIRD_WEDNESDAY_DEPARTURE)))
+
+        return cls(count(early), count(late_arrival), count(late_departure),
+                   np.bincount(emp_idx, weights=amount, minlength=n),
+                   cls._averages(emp_idx, arrival_minutes, arrival_mask, n),
+                   cls._averages(emp_idx, departure_minutes, departure_mask, n))
+
+    @staticmethod
+    def _averages(emp_idx, minutes, mask, n):
+        import numpy as np
+        totals = np.bincount(emp_idx[mask], weights=minutes[mask], minlength=n).astype(np.int64)
+        counts = np.bincount(emp_idx[mask], minlength=n)
+        return [format_average(int(t), int(c)) if c else '' for t, c in zip(totals, counts)]
+
+    @classmethod
+    def load(cls, cursor, year, month, employee_ids, rules=None, leave_registry=None):
+        """해당 월 직원 목록의 요약 (화면과 같은 규칙 - 구분 텍스트로 표시하는 칸은 평균 제외)"""
+        from .month_grid import MonthGrid
+        grid = MonthGrid.load(cursor, year, month, [(emp_id, None, None) for emp_id in employee_ids],
+                              only_listed=True, rules=rules, leave_registry=leave_registry)
+        return grid.summary
+
+    def values(self, i):
+        """i번째 직원의 요약 6개 (SUMMARY_COLUMNS 순서)"""
+        return (int(self.early_count[i]), int(self.late_arrival_count[i]), int(self.late_departure_count[i]),
+                float(self.leave_amount[i]), self.avg_arrival[i], self.avg_departure[i])
+
+    def to_frame(self, index=None):
+        """보고서용 DataFrame (열: SUMMARY_COLUMNS, index: 직원 ID 등)"""
+        import pandas as pd
+        return pd.DataFrame({
+            SUMMARY_COLUMNS[0]: self.early_count,
+            SUMMARY_COLUMNS[1]: self.late_arrival_count,
+            SUMMARY_COLUMNS[2]: self.late_departure_count,
+            SUMMARY_COLUMNS[3]: self.leave_amount,
+            SUMMARY_COLUMNS[4]: self.avg_arrival,
+            SUMMARY_COLUMNS[5]: self.avg_departure,
+        }, index=index)
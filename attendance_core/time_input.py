@@ -0,0 +1,117 @@
+"""
+출퇴근 시간 입력 정규화 (Qt 비의존)
+
+화면 셀 편집, 시간 수정 다이얼로그, 여러 셀 일괄 수정, 엑셀 가져오기가 같은 규칙으로
+시간을 해석합니다. 허용 형식은 TIME_INPUT_FORMATS 표 하나로 관리하며 한 번 컴파일한
+정규식으로 검사하고, 같은 입력은 LRU 캐시로 다시 해석하지 않습니다.
+
+    normalize_time_input("830")              # ('08:30', 510)
+    normalize_time_input("연차")             # ('연차', None)
+    format_minutes(510)                      # '08:30'
+    input_time(0.375)                        # time(9, 0) - 엑셀 시간 소수
+    input_time("09:00:30")                   # time(9, 0, 30) - 초 유지
+    time_input_minutes(["830", "연차", None])  # array([510, -1, -1]) - 열 전체를 한 번에
+"""
+
+import re
+from datetime import datetime, time
+from functools import lru_cache
+
+# 허용하는 시간 입력 형식 (정규식, 예) - 시/분(/초) 그룹
+TIME_INPUT_FORMATS = (
+    (r"(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?", "8:30, 08:30, 08:30:00"),
+    (r"(\d{1,2})(\d{2})", "830, 0830"),
+)
+
+_TIME_INPUT = re.compile("|".join(f"(?:{pattern})" for pattern, _ in TIME_INPUT_FORMATS))
+
+# 서로 다른 입력 값을 기억하는 개수
+CACHE_SIZE = 4096
+
+# 엑셀 시간 셀의 하루(1.0) 초 수
+_DAY_SECONDS = 86400
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_time_seconds(text):
+    """시간 입력 문자열 -> 자정부터의 초 (초가 없으면 0초, 시간 형식이 아니면 None)"""
+    match = _TIME_INPUT.fullmatch(text.strip())
+    if not match:
+        return None
+    hour, minute, second = ([int(group) for group in match.groups() if group is not None] + [0])[:3]
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    return hour * 3600 + minute * 60 + second
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_time_input(text):
+    """시간 입력 문자열 -> 자정부터의 분 (초는 버림, 시간 형식이 아니면 None)"""
+    seconds = parse_time_seconds(text)
+    return None if seconds is None else seconds // 60
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_time_input(text):
+    """셀/다이얼로그 입력 -> (표시 텍스트, 분 또는 None)
+
+    시간이면 'HH:MM'과 분, 아니면(연차 등 구분 텍스트) 앞뒤 공백을 뺀 입력과 None입니다.
+    """
+    minutes = parse_time_input(text)
+    if minutes is None:
+        return text.strip(), None
+    return format_minutes(minutes), minutes
+
+
+def format_minutes(minutes):
+    """분 -> 'HH:MM'"""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def value_seconds(value):
+    """문자열/time/datetime/엑셀 시간 소수 -> 자정부터의 초 (해석할 수 없거나 비어 있으면 None)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.time()
+    if isinstance(value, time):
+        return value.hour * 3600 + value.minute * 60 + value.second
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # 엑셀 시간 셀은 하루를 1.0으로 하는 소수 (부동소수 오차는 초 단위로 반올림)
+        if 0.0 <= value < 1.0:
+            return min(round(value * _DAY_SECONDS), _DAY_SECONDS - 1)
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return parse_time_seconds(str(value))
+    if isinstance(value, str):
+        return parse_time_seconds(value)
+    return None
+
+
+def value_minutes(value):
+    """value_seconds의 분 버전 (분 열 계산용, 초는 버림)"""
+    seconds = value_seconds(value)
+    return None if seconds is None else seconds // 60
+
+
+def input_time(value):
+    """value_seconds의 time 버전 - 초가 있으면 유지 (해석할 수 없으면 None)"""
+    seconds = value_seconds(value)
+    if seconds is None:
+        return None
+    return time(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+
+
+def time_input_minutes(values):
+    """값 목록(열 전체) -> 분 int32 배열 (시간 없음/해석 불가 -1)
+
+    서로 다른 값을 pandas.factorize로 한 번씩만 해석해 배열로 펼칩니다.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    # 마지막 칸(-1)은 빈 값(factorize 코드 -1) 자리
+    unique_minutes = [value_minutes(value) for value in uniques]
+    lookup = np.array([-1 if minutes is None else minutes for minutes in unique_minutes] + [-1], dtype=np.int32)
+    return lookup[codes]
@@ -0,0 +1,359 @@
+"""
+근무 규칙 - 조기출근/지각/야근 기준 시각 (Qt 비의존)
+
+work_rules 테이블의 규칙(부서별, 기간별 예외)을 한 번 읽어 분 단위 정수 기준으로
+컴파일합니다. 기록 한 건의 플래그 계산(AttendanceCalculator), 한 달치 배열 계산
+(MonthGrid), 기존 기록 일괄 재계산(SQL 한 문장)이 모두 같은 기준을 씁니다.
+
+규칙 적용 순서: 기본값(08:00 / 09:00 / 20:00) -> 전체 부서 규칙 -> 부서 규칙.
+같은 단계에서는 나중에 등록한 규칙이 우선하며, 비워 둔(NULL) 기준은 앞 단계 값을 따릅니다.
+규칙을 추가/삭제하면 해당 기간(부서 규칙은 해당 부서 직원)의 기존 기록 플래그를 다시 계산합니다.
+규칙이나 직원 부서를 바꾸면 DB의 변경 번호(work_rules_version)가 올라가 CLI 등 다른 프로세스의
+변경도 실행 중인 프로그램이 다음 사용 시 다시 읽습니다.
+
+    python -m attendance_core.work_rules leave_attendance.db                       # 규칙 목록
+    python -m attendance_core.work_rules leave_attendance.db --add --department 영업팀 \\
+        --start 2025-07-01 --end 2025-08-31 --late 09:30                           # 하계 출근 09:30
+    python -m attendance_core.work_rules leave_attendance.db --delete 3
+"""
+
+import argparse
+import logging
+import sqlite3
+from datetime import date, datetime
+
+from .attendance_calculator import (EARLY_ARRIVAL_BEFORE_MINUTE, LATE_ARRIVAL_AFTER_MINUTE,
+                                    LATE_DEPARTURE_FROM_MINUTE)
+from .month_grid import parse_minutes
+
+logger = logging.getLogger(__name__)
+
+# (조기출근 기준, 지각 기준, 야근 기준) 분 단위 - 규칙이 없을 때
+DEFAULT_THRESHOLDS = (EARLY_ARRIVAL_BEFORE_MINUTE, LATE_ARRIVAL_AFTER_MINUTE, LATE_DEPARTURE_FROM_MINUTE)
+
+# 기준 종류별 work_rules 컬럼 (DEFAULT_THRESHOLDS 순서)
+THRESHOLD_COLUMNS = ("early_arrival_before", "late_arrival_after", "late_departure_from")
+
+# 부서 규칙 대상 직원을 employee_id IN (...)으로 거를 최대 수 (SQLite 바인딩 변수 제한 이내)
+MAX_EMPLOYEE_FILTER = 500
+
+
+def rules_version(conn):
+    """DB의 규칙 변경 번호 (work_rules나 직원 부서를 바꾸면 트리거가 증가, AttendanceCalculator가 다시 읽는 기준)"""
+    try:
+        row = conn.execute("SELECT version FROM work_rules_version WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+
+def _day_text(value):
+    """date/datetime/'YYYY-MM-DD...' -> 'YYYY-MM-DD' (기간 비교는 문자열로)"""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)[:10]
+
+
+def _threshold_minutes(value):
+    """규칙에 저장된 'HH:MM' -> 분 (비어 있으면 None)"""
+    if value is None or value == '':
+        return None
+    minutes = parse_minutes(value)
+    if minutes < 0:
+        raise ValueError(f"잘못된 기준 시각입니다: {value}")
+    return minutes
+
+
+class WorkRules:
+    """컴파일된 근무 규칙
+
+    thresholds(직원, 날짜) -> (조기출근 기준, 지각 기준, 야근 기준) 분
+    month_thresholds(년, 월, 직원 목록) -> 직원 x 일자(31) 기준 배열
+    flag_sql() -> 기존 기록 플래그 재계산용 SQL 식
+    """
+
+    def __init__(self, rules=(), department_members=None):
+        """
+        Args:
+            rules: [(rule_id, department, start_date, end_date, early, late, night), ...]
+                   기준은 분 단위 정수 또는 None(앞 단계 값 사용)
+            department_members: {부서: [직원 ID, ...]} (부서 규칙 대상)
+        """
+        # 적용 순서: 전체 부서 규칙 -> 부서 규칙, 같은 단계는 등록 순
+        self.rules = sorted(rules, key=lambda rule: (rule[1] is not None, rule[0]))
+        self.department_members = {dept: tuple(ids) for dept, ids in (department_members or {}).items()}
+        self._department_of = {emp_id: dept for dept, ids in self.department_members.items() for emp_id in ids}
+        self._cache = {}
+
+    @classmethod
+    def load(cls, conn):
+        rules = []
+        for rule_id, department, start_date, end_date, *values in conn.execute(f"""
+            SELECT id, department, start_date, end_date, {', '.join(THRESHOLD_COLUMNS)}
+            FROM work_rules ORDER BY id
+        """).fetchall():
+            try:
+                minutes = [_threshold_minutes(value) for value in values]
+            except ValueError as e:
+                logger.warning("근무 규칙 %s 무시: %s", rule_id, e)
+                continue
+            rules.append((rule_id, department or None,
+                          _day_text(start_date) if start_date else None,
+                          _day_text(end_date) if end_date else None, *minutes))
+        departments = sorted({rule[1] for rule in rules if rule[1] is not None})
+        members = {dept: [] for dept in departments}
+        if departments:
+            placeholders = ", ".join("?" * len(departments))
+            for emp_id, dept in conn.execute(f"""
+                SELECT id, department FROM employees WHERE department IN ({placeholders})
+            """, departments):
+                members[dept].append(emp_id)
+        return cls(rules, members)
+
+    @property
+    def is_default(self):
+        return not self.rules
+
+    def _resolve(self, department, day):
+        thresholds = list(DEFAULT_THRESHOLDS)
+        for _rule_id, rule_dept, start, end, *values in self.rules:
+            if rule_dept is not None and rule_dept != department:
+                continue
+            if (start is not None and day < start) or (end is not None and day > end):
+                continue
+            for kind, value in enumerate(values):
+                if value is not None:
+                    thresholds[kind] = value
+        return tuple(thresholds)
+
+    def thresholds(self, employee_id, work_date):
+        """해당 직원/날짜의 (조기출근 기준, 지각 기준, 야근 기준) 분"""
+        if not self.rules:
+            return DEFAULT_THRESHOLDS
+        key = (self._department_of.get(employee_id), _day_text(work_date))
+        thresholds = self._cache.get(key)
+        if thresholds is None:
+            thresholds = self._cache[key] = self._resolve(*key)
+        return thresholds
+
+    def month_thresholds(self, year, month, employee_ids):
+        """직원 x 일자(31) 기준 배열 3개 (조기출근, 지각, 야근) - 규칙이 없으면 정수 3개"""
+        if not self.rules:
+            return DEFAULT_THRESHOLDS
+        import numpy as np
+        from calendar import monthrange
+
+        days = [f"{year:04d}-{month:02d}-{day:02d}" for day in range(1, monthrange(year, month)[1] + 1)]
+        by_department = {}
+        for dept in {self._department_of.get(emp_id) for emp_id in employee_ids}:
+            table = np.array([self._resolve(dept, day) for day in days], dtype=np.int16).T
+            # 없는 날짜(29~31일)는 마지막 날 기준으로 채움 (셀 없음)
+            by_department[dept] = np.pad(table, ((0, 0), (0, 31 - len(days))), mode='edge')
+        stacked = np.stack([by_department[self._department_of.get(emp_id)] for emp_id in employee_ids], axis=1) \
+            if employee_ids else np.zeros((3, 0, 31), dtype=np.int16)
+        return stacked[0], stacked[1], stacked[2]
+
+    def _threshold_sql(self, kind):
+        """기준 하나의 SQL CASE 식과 바인딩 값 (attendance_records 행 기준)"""
+        branches = []
+        params = []
+        # 나중에 적용되는 규칙이 우선이므로 역순으로 먼저 검사
+        for _rule_id, department, start, end, *values in reversed(self.rules):
+            if values[kind] is None:
+                continue
+            conditions = []
+            if department is not None:
+                members = self.department_members.get(department, ())
+                if not members:
+                    continue
+                conditions.append(f"employee_id IN ({', '.join(str(int(emp_id)) for emp_id in members)})")
+            if start is not None:
+                conditions.append("work_date >= ?")
+                params.append(start)
+            if end is not None:
+                conditions.append("work_date <= ?")
+                params.append(end)
+            branches.append(f"WHEN {' AND '.join(conditions) or '1'} THEN {int(values[kind])}")
+        if not branches:
+            return str(DEFAULT_THRESHOLDS[kind]), []
+        return f"(CASE {' '.join(branches)} ELSE {DEFAULT_THRESHOLDS[kind]} END)", params
+
+    def flag_sql(self):
+        """(조기출근, 지각, 야근) 플래그 SQL 식 목록과 바인딩 값 (AttendanceCalculator.attendance_row와 같은 규칙)"""
+        early, early_params = self._threshold_sql(0)
+        late, late_params = self._threshold_sql(1)
+        night, night_params = self._threshold_sql(2)
+        # 지각 기준 분과 같은 분이어도 초가 있으면(09:00:30) 기준 이후
+        return ([f"(CASE WHEN arrival_minute >= 0 AND arrival_minute < {early} THEN 1 ELSE 0 END)",
+                 f"(CASE WHEN arrival_minute >= 0 AND (arrival_minute > {late} OR "
+                 f"(arrival_minute = {late} AND substr(arrival_time, 7, 2) > '00')) THEN 1 ELSE 0 END)",
+                 f"(CASE WHEN departure_minute >= 0 AND departure_minute >= {night} THEN 1 ELSE 0 END)"],
+                [early_params, late_params + late_params, night_params])
+
+    def recalculate(self, conn, start=None, end=None, employee_ids=None):
+        """기존 기록의 조기출근/지각/야근 플래그를 규칙대로 한 번에 다시 계산 (바뀐 행만 기록)
+
+        Args:
+            start, end: 재계산할 work_date 범위 (포함, None이면 제한 없음)
+            employee_ids: 지정하면 해당 직원만
+
+        Returns:
+            플래그가 바뀐 행 수
+        """
+        (early, late, night), (early_params, late_params, night_params) = self.flag_sql()
+        conditions = ["1"]
+        params = []
+        if start is not None:
+            conditions.append("work_date >= ?")
+            params.append(_day_text(start))
+        if end is not None:
+            conditions.append("work_date <= ?")
+            params.append(_day_text(end))
+        if employee_ids is not None:
+            employee_ids = list(employee_ids)
+            if not employee_ids:
+                return 0
+            if len(employee_ids) <= MAX_EMPLOYEE_FILTER:
+                conditions.append(f"employee_id IN ({', '.join('?' * len(employee_ids))})")
+                params.extend(employee_ids)
+        cursor = conn.execute(f"""
+            UPDATE attendance_records SET
+                early_arrival = {early},
+                late_arrival = {late},
+                late_departure = {night}
+            WHERE {' AND '.join(conditions)}
+            AND (early_arrival IS NOT {early} OR late_arrival IS NOT {late} OR late_departure IS NOT {night})
+        """, [*early_params, *late_params, *night_params, *params,
+              *early_params, *late_params, *night_params])
+        return cursor.rowcount
+
+
+def evaluate_flags(thresholds, arrival_minutes, departure_minutes):
+    """분 단위 배열 전체의 (조기출근, 지각, 야근) bool 배열 (시간 없음/해석 불가는 음수)
+
+    thresholds: month_thresholds() 결과 또는 같은 모양으로 고른 기준 배열 3개
+    (초 단위 정보가 없으므로 지각은 기준 분 이후만 - 화면 색상 규칙)
+    """
+    import numpy as np
+    early, late, night = thresholds
+    arrival_minutes = np.asarray(arrival_minutes)
+    departure_minutes = np.asarray(departure_minutes)
+    has_arrival = arrival_minutes >= 0
+    return (has_arrival & (arrival_minutes < early),
+            has_arrival & (arrival_minutes > late),
+            (departure_minutes >= 0) & (departure_minutes >= night))
+
+
+def add_rule(conn, early=None, late=None, night=None, department=None, start_date=None, end_date=None,
+             name=None):
+    """규칙 추가 후 해당 기간/부서의 기존 기록 플래그 재계산 (conn의 트랜잭션 안에서 실행)
+
+    Args:
+        early, late, night: 조기출근/지각/야근 기준 'HH:MM' (None이면 앞 단계 값)
+
+    Returns:
+        (규칙 ID, 플래그가 바뀐 행 수)
+
+    Raises:
+        ValueError: 기준이 하나도 없거나 시각/날짜 형식이 잘못된 경우
+    """
+    values = [_threshold_minutes(value) for value in (early, late, night)]
+    if all(value is None for value in values):
+        raise ValueError("조기출근/지각/야근 기준 중 하나 이상을 지정해야 합니다.")
+    for value in (start_date, end_date):
+        if value is not None:
+            datetime.strptime(_day_text(value), "%Y-%m-%d")
+    start_date = _day_text(start_date) if start_date else None
+    end_date = _day_text(end_date) if end_date else None
+    if start_date and end_date and start_date > end_date:
+        raise ValueError("시작일이 종료일보다 늦습니다.")
+
+    rule_id = conn.execute(f"""
+        INSERT INTO work_rules (name, department, start_date, end_date, {', '.join(THRESHOLD_COLUMNS)})
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (name, department or None, start_date, end_date,
+          *(f"{v // 60:02d}:{v % 60:02d}" if v is not None else None for v in values))).lastrowid
+    rules = WorkRules.load(conn)
+    employee_ids = rules.department_members.get(department, ()) if department else None
+    return rule_id, rules.recalculate(conn, start_date, end_date, employee_ids)
+
+
+def delete_rule(conn, rule_id):
+    """규칙 삭제 후 해당 기간/부서의 기존 기록 플래그 재계산. 없는 규칙이면 None"""
+    row = conn.execute("SELECT department, start_date, end_date FROM work_rules WHERE id = ?",
+                       (rule_id,)).fetchone()
+    if row is None:
+        return None
+    department, start_date, end_date = row
+    # 부서 규칙이면 삭제 전 대상 직원 (삭제 후에는 members에 남지 않음)
+    employee_ids = None
+    if department:
+        employee_ids = [emp_id for (emp_id,) in conn.execute(
+            "SELECT id FROM employees WHERE department = ?", (department,))]
+    conn.execute("DELETE FROM work_rules WHERE id = ?", (rule_id,))
+    return WorkRules.load(conn).recalculate(conn, start_date, end_date, employee_ids)
+
+
+def main(argv=None):
+    from .database import DatabaseManager
+
+    parser = argparse.ArgumentParser(description="근무 규칙 (조기출근/지각/야근 기준 시각)")
+    parser.add_argument("db_path", help="DB 파일 경로")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--add", action="store_true", help="규칙 추가")
+    action.add_argument("--delete", type=int, metavar="ID", help="규칙 삭제")
+    action.add_argument("--recalculate", action="store_true", help="전체 기록 플래그 재계산")
+    parser.add_argument("--name", help="규칙 이름")
+    parser.add_argument("--department", help="부서 (생략 시 전체 부서)")
+    parser.add_argument("--start", help="시작일 YYYY-MM-DD (생략 시 처음부터)")
+    parser.add_argument("--end", help="종료일 YYYY-MM-DD (생략 시 계속)")
+    parser.add_argument("--early", help="이 시각 이전 출근은 조기출근 (HH:MM)")
+    parser.add_argument("--late", help="이 시각 이후 출근은 지각 (HH:MM)")
+    parser.add_argument("--night", help="이 시각 이후 퇴근은 야근 (HH:MM)")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(args.db_path)
+    try:
+        try:
+            if args.add:
+                with db.transaction() as conn:
+                    rule_id, changed = add_rule(conn, args.early, args.late, args.night, args.department,
+                                                args.start, args.end, args.name)
+                print(f"규칙 {rule_id} 추가, 플래그 변경 {changed:,}행")
+                return 0
+            if args.delete is not None:
+                with db.transaction() as conn:
+                    changed = delete_rule(conn, args.delete)
+                if changed is None:
+                    print(f"규칙 {args.delete}이(가) 없습니다.")
+                    return 1
+                print(f"규칙 {args.delete} 삭제, 플래그 변경 {changed:,}행")
+                return 0
+            if args.recalculate:
+                with db.transaction() as conn:
+                    changed = WorkRules.load(conn).recalculate(conn)
+                print(f"플래그 변경 {changed:,}행")
+                return 0
+        except ValueError as e:
+            print(str(e))
+            return 1
+
+        with db.connection() as conn:
+            rows = conn.execute(f"""
+                SELECT id, name, department, start_date, end_date, {', '.join(THRESHOLD_COLUMNS)}
+                FROM work_rules ORDER BY id
+            """).fetchall()
+        early, late, night = (f"{v // 60:02d}:{v % 60:02d}" for v in DEFAULT_THRESHOLDS)
+        print(f"기본: 조기출근 {early} 이전, 지각 {late} 이후, 야근 {night} 이후")
+        for rule_id, name, department, start_date, end_date, early, late, night in rows:
+            print(f"[{rule_id}] {name or ''} 부서={department or '전체'} 기간={start_date or '-'}~{end_date or '-'} "
+                  f"조기출근={early or '-'} 지각={late or '-'} 야근={night or '-'}")
+        return 0
+    finally:
+        db.close_all()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
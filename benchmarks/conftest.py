@@ -0,0 +1,241 @@
+"""
+벤치마크 공용 fixture
+
+합성 DB는 (직원 수, 기간, seed, 스키마 버전)별로 한 번만 생성하여 캐시하고,
+세션마다 복사본을 사용합니다. 규모는 환경 변수로 조정할 수 있습니다.
+
+    ATTENDANCE_BENCH_EMPLOYEES  직원 수 (기본 1000)
+    ATTENDANCE_BENCH_YEARS      기간 (년, 기본 10)
+    ATTENDANCE_BENCH_CACHE      캐시 디렉터리 (기본: 임시 폴더/attendance_bench)
+    ATTENDANCE_BENCH_GUI        1이면 None 참조가 새는 PySide6 빌드에서도 화면 경로 측정
+"""
+
+import importlib.util
+import os
+import re
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+if BENCH_DIR not in sys.path:
+    sys.path.insert(0, BENCH_DIR)
+
+from attendance_core import DatabaseManager, LeaveCalculator, AttendanceCalculator, ChangeBus  # noqa: E402
+from attendance_core.migrations import SCHEMA_VERSION  # noqa: E402
+import synthetic_data  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "Attendance and Leave Management Program.py")
+
+BENCH_EMPLOYEES = int(os.environ.get("ATTENDANCE_BENCH_EMPLOYEES", 1000))
+BENCH_YEARS = int(os.environ.get("ATTENDANCE_BENCH_YEARS", 10))
+BENCH_END_YEAR = 2025
+BENCH_SEED = 20250101
+BENCH_CACHE = os.environ.get("ATTENDANCE_BENCH_CACHE",
+                             os.path.join(tempfile.gettempdir(), "attendance_bench"))
+
+# 전체 스캔이 허용되지 않는 대용량 테이블
+LARGE_TABLES = {"attendance_records", "leave_records"}
+# 전체 스캔이어도 연차성 행만 담고 있어 허용하는 부분 인덱스
+PARTIAL_INDEXES = {"idx_attendance_leave_rows", "idx_attendance_leave_types"}
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "export: 엑셀 내보내기 (대용량 DB에서 수 분 소요)")
+
+
+@pytest.fixture(scope="session")
+def synthetic_db_path(tmp_path_factory):
+    """세션용 합성 DB 복사본 경로"""
+    os.makedirs(BENCH_CACHE, exist_ok=True)
+    cached = os.path.join(
+        BENCH_CACHE,
+        f"synthetic_{BENCH_EMPLOYEES}x{BENCH_YEARS}_{BENCH_END_YEAR}_{BENCH_SEED}_v{SCHEMA_VERSION}.db")
+    if not os.path.exists(cached):
+        synthetic_data.generate(cached + ".tmp", employees=BENCH_EMPLOYEES, years=BENCH_YEARS,
+                                end_year=BENCH_END_YEAR, seed=BENCH_SEED)
+        os.replace(cached + ".tmp", cached)
+    path = str(tmp_path_factory.mktemp("bench") / "leave_attendance.db")
+    shutil.copyfile(cached, path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def db_manager(synthetic_db_path):
+    db = DatabaseManager(synthetic_db_path)
+    yield db
+    db.close_all()
+
+
+@pytest.fixture(scope="session")
+def leave_calculator(db_manager):
+    return LeaveCalculator(db_manager)
+
+
+@pytest.fixture(scope="session")
+def attendance_calculator(db_manager):
+    return AttendanceCalculator(db_manager)
+
+
+@pytest.fixture(scope="session")
+def employees(db_manager):
+    """(id, name, hire_date) 목록 - 연월차 관리대장 조회 대상"""
+    with db_manager.connection() as conn:
+        return conn.execute("SELECT id, name, hire_date FROM employees ORDER BY id").fetchall()
+
+
+# --- GUI 경로 (PySide6 필요) ---
+
+@pytest.fixture(scope="session")
+def app_module():
+    """메인 프로그램 모듈 (파일명에 공백이 있어 경로로 로드)"""
+    pytest.importorskip("PySide6")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    spec = importlib.util.spec_from_file_location("attendance_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def qt_app(app_module):
+    from PySide6.QtWidgets import QApplication
+    if _leaks_none_refs() and os.environ.get("ATTENDANCE_BENCH_GUI") != "1":
+        pytest.skip("이 PySide6 빌드는 Python 3.12 미만에서 Qt 호출마다 None 참조를 잃어 "
+                    "대용량 측정 후 인터프리터가 중단됩니다 (none_dealloc)")
+    return QApplication.instance() or QApplication([])
+
+
+def _leaks_none_refs(calls=64):
+    """반환값 없는 Qt 호출마다 None 참조 수가 줄어드는 PySide6 빌드인지
+
+    Python 3.12부터 None은 불멸 객체라 영향이 없고, 그 전 버전에서는 화면 경로를 반복 측정하면
+    None 참조 수가 0이 되어 'Fatal Python error: none_dealloc'으로 세션 전체가 중단됩니다.
+    """
+    if sys.version_info >= (3, 12):
+        return False
+    from PySide6.QtCore import QObject
+
+    probe = QObject()
+    before = sys.getrefcount(None)
+    for _ in range(calls):
+        probe.setObjectName("probe")
+    return before - sys.getrefcount(None) >= calls // 2
+
+
+@pytest.fixture(scope="session")
+def guis(app_module, qt_app, db_manager, leave_calculator, attendance_calculator):
+    """(연월차 GUI, 출퇴근 GUI) - MainApplication과 같은 방식으로 연결
+
+    세션이 끝나면 MainApplication.closeEvent와 같은 순서로 정리합니다
+    (백그라운드 조회 중단, 작업 스레드 대기, 위젯 삭제, 연결 풀 정리).
+    """
+    from PySide6.QtCore import QCoreApplication, QEvent, QThreadPool
+
+    change_bus = ChangeBus()
+    leave_gui = app_module.LeaveManagementGUI(None, db_manager, leave_calculator, change_bus=change_bus)
+    attendance_gui = app_module.AttendanceManagementGUI(None, db_manager, attendance_calculator, leave_gui,
+                                                        change_bus=change_bus)
+    leave_gui.attendance_gui = attendance_gui
+    select_year(leave_gui.year_combo, BENCH_END_YEAR)
+    select_year(attendance_gui.year_combo, BENCH_END_YEAR)
+    select_month(attendance_gui.month_combo, 3)
+    yield leave_gui, attendance_gui
+
+    for gui in (leave_gui, attendance_gui):
+        gui.cancel_background_refresh()
+    QThreadPool.globalInstance().waitForDone(5000)
+    qt_app.processEvents()  # 작업 스레드가 보낸 완료 신호
+    for gui in (attendance_gui, leave_gui):
+        gui.close()
+        gui.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    qt_app.processEvents()
+    db_manager.close_all()
+
+
+@pytest.fixture
+def quiet_dialogs(app_module, monkeypatch):
+    """메시지 박스/파일 열기 등 사용자 상호작용 차단"""
+    for name in ("information", "warning", "critical"):
+        monkeypatch.setattr(app_module.QMessageBox, name, staticmethod(lambda *args, **kwargs: None))
+    monkeypatch.setattr(app_module.QMessageBox, "question",
+                        staticmethod(lambda *args, **kwargs: app_module.QMessageBox.Yes))
+    # 통합 다운로드는 완료 후 파일을 엽니다 (Windows)
+    monkeypatch.setattr(os, "startfile", lambda *args, **kwargs: None, raising=False)
+
+
+def select_year(combo, year):
+    """콤보박스에서 항목 데이터가 year인 항목 선택 (자동 새로고침 신호는 보내지 않음)"""
+    index = combo.findData(year)
+    if index >= 0:
+        combo.blockSignals(True)
+        combo.setCurrentIndex(index)
+        combo.blockSignals(False)
+
+
+select_month = select_year
+
+
+# --- 쿼리 계획 검사 ---
+
+@contextmanager
+def capture_sql(db):
+    """db에서 꺼낸 연결이 실행하는 SQL 문을 기록"""
+    statements = []
+    connections = []
+    original = db.get_connection
+
+    def get_connection():
+        conn = original()
+        conn.set_trace_callback(statements.append)
+        connections.append(conn)
+        return conn
+
+    db.get_connection = get_connection
+    try:
+        yield statements
+    finally:
+        del db.get_connection
+        for conn in connections:
+            conn.set_trace_callback(None)
+
+
+_TABLE_ALIAS = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(?!WHERE\b|JOIN\b|ON\b|ORDER\b|GROUP\b|LEFT\b|INNER\b|LIMIT\b)(\w+))?",
+                          re.IGNORECASE)
+_SCAN = re.compile(r"^SCAN (\w+)(?: USING (?:COVERING )?INDEX (\w+))?")
+
+
+def query_plan(conn, sql):
+    """EXPLAIN QUERY PLAN 상세 문자열 목록"""
+    return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql)]
+
+
+def full_scans(conn, statements, tables=LARGE_TABLES):
+    """statements 중 대용량 테이블을 전체 스캔하는 (테이블, 계획, SQL) 목록"""
+    problems = []
+    seen = set()
+    for sql in statements:
+        text = sql.strip()
+        if not text.upper().startswith(("SELECT", "WITH")) or text in seen:
+            continue
+        seen.add(text)
+        aliases = {}
+        for table, alias in _TABLE_ALIAS.findall(text):
+            aliases[table] = table
+            if alias:
+                aliases[alias] = table
+        for detail in query_plan(conn, text):
+            match = _SCAN.match(detail)
+            if not match:
+                continue
+            table = aliases.get(match.group(1), match.group(1))
+            if table in tables and match.group(2) not in PARTIAL_INDEXES:
+                problems.append((table, detail, " ".join(text.split())))
+    return problems
@@ -0,0 +1,278 @@
+"""
+벤치마크용 합성 데이터베이스 생성기
+
+기본값: 직원 1,000명 x 10년치 평일 출퇴근 기록 (약 250만 행)
+같은 seed와 인자로 생성하면 항상 같은 데이터가 만들어집니다.
+
+사용 예:
+    python benchmarks/synthetic_data.py bench.db --employees 1000 --years 10
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from attendance_core import DatabaseManager, LeaveCalculator, ExpirationScheduler  # noqa: E402
+
+
+DEPARTMENTS = [('경영지원팀', 0.35), ('영업팀', 0.35), ('글로벌비즈니스팀', 0.30)]
+POSITIONS = [('이사', 0.02), ('팀장', 0.05), ('파트장', 0.08), ('과장', 0.15), ('대리', 0.25), ('프로', 0.45)]
+
+# 고정 공휴일 (월, 일) - 해당 날짜는 전 직원 '공휴'로 기록
+FIXED_HOLIDAYS = {(1, 1), (3, 1), (5, 5), (6, 6), (8, 15), (10, 3), (10, 9), (12, 25)}
+
+# 평일 근태 구분 비율 (나머지는 정상 출퇴근)
+LEAVE_MIX = [
+    ('연차', None, 0.055),
+    ('반차', '반차_퇴근', 0.015),
+    ('반차', '반차_출근', 0.004),
+    ('휴가', None, 0.015),
+    ('병가', None, 0.004),
+    ('출장', None, 0.003),
+    ('교육', None, 0.002),
+]
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = "민서도윤하준지우예은수현시우주원건유진태"
+
+
+def _fmt_minutes(minutes):
+    """분 단위 정수 -> 'HH:MM:SS'"""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}:00"
+
+
+def _business_days(start, end):
+    """[start, end] 구간의 평일 목록"""
+    days = []
+    current = start
+    while current <= end:
+        if current.weekday() < 5:
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+def _make_employees(rng, count, start, end):
+    departments = rng.choice(len(DEPARTMENTS), size=count, p=[p for _, p in DEPARTMENTS])
+    positions = rng.choice(len(POSITIONS), size=count, p=[p for _, p in POSITIONS])
+    # 85%는 데이터 기간 이전 입사, 15%는 기간 중 입사
+    span_before = (start - date(start.year - 15, 1, 1)).days
+    span_inside = (end - start).days
+    hired_inside = rng.random(count) < 0.15
+    offsets = rng.integers(0, span_before, size=count)
+    inside_offsets = rng.integers(0, span_inside, size=count)
+    resigned = rng.random(count) < 0.10
+
+    employees = []
+    for i in range(count):
+        if hired_inside[i]:
+            hire_date = start + timedelta(days=int(inside_offsets[i]))
+        else:
+            hire_date = start - timedelta(days=int(offsets[i]) + 1)
+        resignation_date = None
+        if resigned[i]:
+            first = max(hire_date, start) + timedelta(days=30)
+            if first < end:
+                resignation_date = first + timedelta(days=int(rng.integers(0, (end - first).days + 1)))
+        name = (SURNAMES[i % len(SURNAMES)]
+                + GIVEN[(i // len(SURNAMES)) % len(GIVEN)]
+                + GIVEN[(i * 7) % len(GIVEN)]
+                + f"{i:04d}")
+        employees.append((
+            DEPARTMENTS[departments[i]][0], POSITIONS[positions[i]][0], name,
+            hire_date.strftime("%Y-%m-%d"), i,
+            0 if resignation_date else 1,
+            resignation_date.strftime("%Y-%m-%d") if resignation_date else None,
+        ))
+    return employees
+
+
+def _attendance_rows(rng, emp_id, days, day_index):
+    """직원 한 명의 출퇴근 기록 행 목록"""
+    n = len(days)
+    arrivals = rng.normal(8 * 60 + 45, 15, size=n).round().astype(int).clip(7 * 60, 11 * 60)
+    departures = rng.normal(18 * 60 + 30, 55, size=n).round().astype(int).clip(17 * 60, 23 * 60 + 30)
+    kinds = rng.choice(len(LEAVE_MIX) + 1, size=n,
+                       p=[p for _, _, p in LEAVE_MIX] + [1.0 - sum(p for _, _, p in LEAVE_MIX)])
+
+    rows = []
+    for i in range(n):
+        work_date = days[i]
+        if (work_date.month, work_date.day) in FIXED_HOLIDAYS:
+            rows.append((emp_id, day_index[work_date], None, None, 0, 0, 0, '공휴', None, None, None))
+            continue
+        arrival = int(arrivals[i])
+        departure = int(departures[i])
+        kind = kinds[i]
+        if kind < len(LEAVE_MIX):
+            leave_type, remarks, _ = LEAVE_MIX[kind]
+            if remarks == '반차_퇴근':
+                rows.append((emp_id, day_index[work_date], _fmt_minutes(arrival), None,
+                             int(arrival < 480), int(arrival > 540), 0, leave_type, remarks, arrival, None))
+            elif remarks == '반차_출근':
+                rows.append((emp_id, day_index[work_date], None, _fmt_minutes(departure),
+                             0, 0, int(departure >= 1200), leave_type, remarks, None, departure))
+            else:
+                rows.append((emp_id, day_index[work_date], None, None, 0, 0, 0, leave_type, None, None, None))
+            continue
+        rows.append((emp_id, day_index[work_date], _fmt_minutes(arrival), _fmt_minutes(departure),
+                     int(arrival < 480), int(arrival > 540), int(departure >= 1200), None, None,
+                     arrival, departure))
+    return rows
+
+
+def generate(db_path, employees=1000, years=10, end_year=2025, seed=20250101,
+             with_expirations=True, verbose=False):
+    """합성 데이터베이스 생성 (기존 파일은 덮어씀)
+
+    Args:
+        db_path: 생성할 DB 파일 경로
+        employees: 직원 수
+        years: 출퇴근 기록 기간 (end_year 12월 31일까지 years년)
+        end_year: 마지막 연도
+        seed: 난수 seed (같으면 같은 데이터)
+        with_expirations: ExpirationScheduler로 소멸 내역까지 생성
+
+    Returns:
+        {'employees': 직원 수, 'attendance_records': 행 수, 'leave_records': 행 수,
+         'leave_expirations': 행 수}
+    """
+    import numpy as np
+
+    started = time.time()
+    db_path = os.path.abspath(db_path)
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+    rng = np.random.default_rng(seed)
+    start = date(end_year - years + 1, 1, 1)
+    end = date(end_year, 12, 31)
+    all_days = _business_days(start, end)
+    day_index = {d: d.strftime("%Y-%m-%d") for d in all_days}
+
+    db = DatabaseManager(db_path)
+    try:
+        with db.transaction() as conn:
+            employee_rows = _make_employees(rng, employees, start, end)
+            conn.executemany("""
+                INSERT INTO employees
+                (department, position, name, hire_date, display_order, is_active, resignation_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, employee_rows)
+
+            emp_list = conn.execute("SELECT id, hire_date, resignation_date FROM employees ORDER BY id").fetchall()
+            attendance_count = 0
+            for emp_id, hire_date, resignation_date in emp_list:
+                first = max(start, date.fromisoformat(hire_date))
+                last = date.fromisoformat(resignation_date) if resignation_date else end
+                days = [d for d in all_days if first <= d <= last]
+                rows = _attendance_rows(rng, emp_id, days, day_index)
+                conn.executemany("""
+                    INSERT INTO attendance_records
+                    (employee_id, work_date, arrival_time, departure_time,
+                     early_arrival, late_arrival, late_departure, leave_type, remarks,
+                     arrival_minute, departure_minute)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                attendance_count += len(rows)
+                if verbose and emp_id % 100 == 0:
+                    print(f"  직원 {emp_id}/{employees} ({attendance_count:,}행, {time.time() - started:.1f}초)")
+
+            # sync_leave_records와 같은 규칙으로 leave_records 채우기
+            conn.execute("""
+                INSERT OR IGNORE INTO leave_records
+                (employee_id, leave_type, leave_date, leave_amount, year, month)
+                SELECT employee_id, leave_type, work_date,
+                       CASE WHEN leave_type = '반차' THEN 0.5 ELSE 1.0 END,
+                       CAST(strftime('%Y', work_date) AS INTEGER),
+                       CAST(strftime('%m', work_date) AS INTEGER)
+                FROM attendance_records
+                WHERE leave_type IN ('연차', '반차', '휴가')
+            """)
+        with db.connection() as conn:
+            conn.execute("ANALYZE")
+            conn.commit()
+
+        if with_expirations:
+            ExpirationScheduler(db, LeaveCalculator(db)).run(end)
+
+        with db.connection() as conn:
+            counts = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                      for table in ('employees', 'attendance_records', 'leave_records', 'leave_expirations')}
+    finally:
+        db.close_all()
+
+    if verbose:
+        print(f"생성 완료: {db_path} ({time.time() - started:.1f}초) {counts}")
+    return counts
+
+
+def write_fingerprint_workbook(db_path, xlsx_path, year):
+    """DB의 한 해 출퇴근 기록을 지문 인식기 내보내기 형식의 엑셀로 저장
+
+    '1월'~'12월' 시트마다 헤더(직급/이름/구분/1~31) 아래 직원별 출근·퇴근 두 행이 있으며,
+    출근 행에는 시간 대신 근태 구분(연차 등 업로드가 인식하는 값)이 들어갈 수 있습니다. 엑셀 업로드 측정용입니다.
+
+    Returns:
+        기록된 (직원, 날짜) 셀 수
+    """
+    import openpyxl
+    from attendance_core.leave_types import DEFAULT_LEAVE_TYPES
+    from attendance_core.month_loader import month_date_range
+
+    db = DatabaseManager(db_path)
+    workbook = openpyxl.Workbook(write_only=True)
+    cells = 0
+    try:
+        with db.connection() as conn:
+            employees = conn.execute("SELECT id, position, name FROM employees ORDER BY id").fetchall()
+            for month in range(1, 13):
+                sheet = workbook.create_sheet(f"{month}월")
+                sheet.append(["직급", "이름", "구분"] + list(range(1, 32)))
+                by_employee = {}
+                for emp_id, work_date, arrival, departure, leave_type in conn.execute("""
+                    SELECT employee_id, work_date, arrival_time, departure_time, leave_type
+                    FROM attendance_records
+                    WHERE work_date >= ? AND work_date < ?
+                """, month_date_range(year, month)):
+                    by_employee.setdefault(emp_id, {})[int(work_date[8:10])] = (arrival, departure, leave_type)
+                for emp_id, position, name in employees:
+                    days = by_employee.get(emp_id, {})
+                    arrivals = [None] * 31
+                    departures = [None] * 31
+                    for day, (arrival, departure, leave_type) in days.items():
+                        if not arrival and not departure and leave_type not in DEFAULT_LEAVE_TYPES.keywords:
+                            continue  # 업로드 형식에 없는 구분 (휴가, 병가 등)
+                        arrivals[day - 1] = arrival[:5] if arrival else leave_type
+                        departures[day - 1] = departure[:5] if departure else None
+                        cells += 1
+                    sheet.append([position, name, "출근"] + arrivals)
+                    sheet.append([None, None, "퇴근"] + departures)
+        workbook.save(xlsx_path)
+    finally:
+        db.close_all()
+    return cells
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 근태 데이터베이스 생성")
+    parser.add_argument("db_path", help="생성할 DB 파일 경로")
+    parser.add_argument("--employees", type=int, default=1000, help="직원 수 (기본 1000)")
+    parser.add_argument("--years", type=int, default=10, help="기간 (년, 기본 10)")
+    parser.add_argument("--end-year", type=int, default=2025, help="마지막 연도 (기본 2025)")
+    parser.add_argument("--seed", type=int, default=20250101, help="난수 seed")
+    parser.add_argument("--no-expirations", action="store_true", help="소멸 내역 생성 생략")
+    args = parser.parse_args(argv)
+    generate(args.db_path, employees=args.employees, years=args.years, end_year=args.end_year,
+             seed=args.seed, with_expirations=not args.no_expirations, verbose=True)
+
+
+if __name__ == "__main__":
+    main()
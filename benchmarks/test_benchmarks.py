@@ -0,0 +1,316 @@
+"""
+주요 경로 실행 시간 벤치마크 (pytest-benchmark)
+
+    python -m pytest benchmarks                      # 전체
+    python -m pytest benchmarks -m "not export"      # 엑셀 내보내기 제외
+    python -m pytest benchmarks --benchmark-save=base # 결과 저장 후 --benchmark-compare로 비교
+
+데이터 계층만 측정하는 항목은 PySide6 없이도 실행됩니다.
+"""
+
+import shutil
+from datetime import date, time
+
+import pytest
+
+import synthetic_data
+from attendance_core import (AttendanceCalculator, AttendanceImporter, AttendanceWorkbookWriter,
+                             DatabaseManager, LeaveLedger, load_month_records)
+from attendance_core.annual_close import AnnualClose
+from attendance_core.attendance_edits import commit_pending_changes
+from attendance_core.leave_balance import find_leave_balance_mismatches
+from attendance_core.leave_types import LeaveTypeRegistry
+from attendance_core.month_summary import SUMMARY_COLUMNS, MonthSummary
+from attendance_core.time_input import normalize_time_input, time_input_minutes
+from attendance_core.work_rules import add_rule, delete_rule
+from conftest import BENCH_END_YEAR, select_year
+
+
+# --- 출퇴근 관리대장 월 조회 (_refresh_month_data) ---
+
+def test_load_month_records(benchmark, db_manager):
+    def run():
+        with db_manager.connection() as conn:
+            return load_month_records(conn.cursor(), BENCH_END_YEAR, 3)
+
+    records = benchmark(run)
+    assert records
+
+
+def test_month_refresh(benchmark, guis):
+    _leave_gui, attendance_gui = guis
+    benchmark.pedantic(attendance_gui.refresh_data, rounds=3, iterations=1)
+    assert attendance_gui.table.rowCount() > 0
+
+
+def test_paste_month(benchmark, guis, monkeypatch):
+    """엑셀에서 복사한 블록(최대 60행 x 30일) 붙여넣기 (한 번에 변경 사항에 반영 - 셀마다 DB 조회 없음)
+
+    DB 연결은 붙여넣기마다 근무 규칙 변경 번호를 확인하는 한 번뿐입니다.
+    """
+    from PySide6.QtWidgets import QApplication, QTableWidgetSelectionRange
+
+    _leave_gui, attendance_gui = guis
+    table = attendance_gui.table
+    rows = min(table.rowCount(), 60)
+    cells = ["08:30", "18:00", "0750", "2010", "반차", "09:05", "", "연차"]
+    blocks = ["\n".join("\t".join(cells[(row + col + shift) % len(cells)] for col in range(30))
+                        for row in range(rows)) for shift in (0, 1)]
+    ticks = iter(range(1_000_000))
+
+    def setup():
+        # 매 회 다른 블록을 붙여넣어 모든 셀 값이 바뀌도록 함
+        QApplication.clipboard().setText(blocks[next(ticks) % 2])
+        attendance_gui.pending_changes = {}
+        table.clearSelection()
+        table.setRangeSelected(QTableWidgetSelectionRange(0, 3, rows - 1, 32), True)
+
+    connections = []
+    monkeypatch.setattr(attendance_gui.db, "get_connection",
+                        lambda original=attendance_gui.db.get_connection: connections.append(1) or original())
+    benchmark.pedantic(table.paste_to_selected_cells, setup=setup, rounds=3, iterations=1)
+    assert attendance_gui.pending_changes
+    assert len(connections) <= 3
+    attendance_gui.pending_changes = {}
+
+
+def test_month_summary(benchmark, db_manager):
+    """보고서용 월 요약 (전 직원 6개 요약을 한 번에 계산)"""
+    with db_manager.connection() as conn:
+        employee_ids = [emp_id for (emp_id,) in conn.execute("SELECT id FROM employees ORDER BY id")]
+
+    def run():
+        with db_manager.connection() as conn:
+            return MonthSummary.load(conn.cursor(), BENCH_END_YEAR, 3, employee_ids).to_frame(employee_ids)
+
+    frame = benchmark(run)
+    assert list(frame.columns) == list(SUMMARY_COLUMNS)
+    assert frame[SUMMARY_COLUMNS[4]].ne('').any()
+
+
+def test_work_rule_recalculate(benchmark, db_manager):
+    """근무 규칙 변경 시 기존 기록 플래그 일괄 재계산 (추가한 규칙을 삭제해 원래 플래그로 복구)"""
+    def run():
+        with db_manager.transaction() as conn:
+            rule_id, changed = add_rule(conn, late="09:30", start_date=f"{BENCH_END_YEAR}-01-01")
+            restored = delete_rule(conn, rule_id)
+        return changed, restored
+
+    changed, restored = benchmark.pedantic(run, rounds=2, iterations=1)
+    assert changed == restored > 0
+
+
+def test_save_pending_changes(benchmark, synthetic_db_path, employees, tmp_path):
+    """한 달치 붙여넣기 편집 저장 (전 직원 x 일자 출근/퇴근 시간 + 일부 반차/연차)"""
+    target_path = str(tmp_path / "edits.db")
+    pending = {}
+    for emp_id, _name, _hire_date in employees:
+        for day in range(1, 32):
+            work_date = date(BENCH_END_YEAR, 3, day)
+            if day % 10 == 0:
+                pending[(emp_id, work_date, '출근')] = {'new_value': '반차', 'formatted_time': '반차', 'is_time': False}
+            elif day % 10 == 5:
+                pending[(emp_id, work_date, '출근')] = {'new_value': '연차', 'formatted_time': '연차', 'is_time': False}
+                continue
+            else:
+                pending[(emp_id, work_date, '출근')] = {'new_value': '08:50', 'formatted_time': '08:50', 'is_time': True}
+            pending[(emp_id, work_date, '퇴근')] = {'new_value': '18:10', 'formatted_time': '18:10', 'is_time': True}
+    databases = []
+
+    def setup():
+        shutil.copyfile(synthetic_db_path, target_path)
+        db = DatabaseManager(target_path)
+        databases.append(db)
+        return (db,), {}
+
+    def run(db):
+        with db.transaction() as conn:
+            return commit_pending_changes(conn, AttendanceCalculator(db), pending, BENCH_END_YEAR, 3)
+
+    try:
+        saved = benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
+        with databases[-1].connection() as conn:
+            half_days = conn.execute("""
+                SELECT COUNT(*) FROM leave_records WHERE leave_type = '반차' AND leave_date >= ? AND leave_date < ?
+            """, (f"{BENCH_END_YEAR}-03-01", f"{BENCH_END_YEAR}-04-01")).fetchone()[0]
+    finally:
+        for db in databases:
+            db.close_all()
+    assert saved == len(pending)
+    assert half_days >= 3 * len(employees)
+
+
+# --- 시간 입력 정규화 (셀 편집/다이얼로그/엑셀 가져오기 공통) ---
+
+TIME_INPUTS = ["830", "8:30", "08:30:00", "1805", 0.375, time(9, 5), "연차", "", None, "25:00"]
+TIME_INPUT_MINUTES = [510, 510, 510, 1085, 540, 545, -1, -1, -1, -1]
+
+
+def test_time_input_scalar(benchmark):
+    """셀 하나씩 정규화 (LRU 캐시 - 같은 입력은 다시 해석하지 않음)"""
+    texts = [value for value in TIME_INPUTS if isinstance(value, str)] * 1000
+
+    def run():
+        return [normalize_time_input(text) for text in texts]
+
+    result = benchmark(run)
+    assert result[0] == ("08:30", 510)
+    assert result[2] == ("08:30", 510)
+    assert result[4] == ("연차", None)
+
+
+def test_time_input_column(benchmark):
+    """열 전체 정규화 (서로 다른 값마다 한 번 해석 후 배열로 펼침)"""
+    values = TIME_INPUTS * 10_000
+    minutes = benchmark(time_input_minutes, values)
+    assert minutes[:len(TIME_INPUTS)].tolist() == TIME_INPUT_MINUTES
+    assert len(minutes) == len(values)
+
+
+def test_leave_type_lookup(benchmark, db_manager):
+    """구분 텍스트 열 전체 분류 (등록부 코드 -> 병합/차감량 배열 인덱싱)"""
+    with db_manager.connection() as conn:
+        registry = LeaveTypeRegistry.load(conn)
+    leave_types = ["연차", "반차", "출장", "공휴", "미팅", ""] * 10_000
+
+    def run():
+        codes = registry.codes(leave_types)
+        return registry.table('both_rows')[codes], registry.table('deduction')[codes]
+
+    both_rows, deduction = benchmark(run)
+    assert both_rows[:6].tolist() == [True, False, True, False, False, False]
+    assert deduction[:6].tolist() == [1.0, 0.5, 0.0, 0.0, 0.0, 0.0]
+
+
+# --- 연월차 관리대장 (LeaveManagementGUI.refresh_data) ---
+
+def test_leave_ledger_build(benchmark, db_manager, leave_calculator, employees):
+    ledger = LeaveLedger(leave_calculator)
+
+    def run():
+        with db_manager.connection() as conn:
+            return ledger.build(conn, employees, BENCH_END_YEAR)
+
+    result = benchmark(run)
+    assert len(result) == len(employees)
+
+
+def test_leave_balance_check(benchmark, db_manager):
+    """월별 집계(트리거 갱신)와 원본 기록 일치 검사 (leave_balance --rebuild 전 확인용)"""
+    def run():
+        with db_manager.connection() as conn:
+            return find_leave_balance_mismatches(conn)
+
+    assert benchmark(run) == []
+
+
+def test_annual_close(benchmark, db_manager, leave_calculator, employees):
+    """연말 마감 (전 직원 잔여수 확정) - 다음 년도 원장은 확정 값을 그대로 사용"""
+    closer = AnnualClose(db_manager, leave_calculator)
+    today = date(BENCH_END_YEAR + 1, 1, 2)
+    count = benchmark.pedantic(closer.close_year, args=(BENCH_END_YEAR,), kwargs={'today': today},
+                               rounds=2, iterations=1)
+    assert count > 0
+
+    with db_manager.connection() as conn:
+        stored = dict(conn.execute("""
+            SELECT employee_id, remaining_amount FROM leave_remaining_by_year WHERE year = ?
+        """, (BENCH_END_YEAR,)).fetchall())
+        ledger = LeaveLedger(leave_calculator).build(conn, employees, BENCH_END_YEAR + 1, today=today)
+    frozen = ledger.loc[ledger.index.isin(list(stored)) & ledger['is_one_year_or_more'].astype(bool)]
+    assert len(frozen) > 0
+    assert all(frozen['remaining_prev_year'][emp_id] == stored[emp_id] for emp_id in frozen.index)
+
+
+def test_leave_refresh(benchmark, guis):
+    leave_gui, _attendance_gui = guis
+    benchmark.pedantic(leave_gui.refresh_data, rounds=3, iterations=1)
+    assert leave_gui.table.rowCount() > 0
+
+
+# --- 연월차 동기화 (sync_leave_records) ---
+
+def test_sync_leave_records(benchmark, db_manager, guis, quiet_dialogs):
+    _leave_gui, attendance_gui = guis
+    # 두 번째 실행부터는 모든 행이 UPDATE 경로를 탐 (실사용과 동일)
+    benchmark.pedantic(attendance_gui.sync_leave_records, rounds=2, iterations=1)
+    with db_manager.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM leave_records").fetchone()[0] > 0
+
+
+# --- 엑셀 업로드 (upload_excel) ---
+
+def test_attendance_excel_import(benchmark, synthetic_db_path, tmp_path):
+    """연간(12개 시트) 전 직원 지문 엑셀을 해당 연도 기록이 빈 DB에 가져오기"""
+    xlsx_path = str(tmp_path / "fingerprint.xlsx")
+    cells = synthetic_data.write_fingerprint_workbook(synthetic_db_path, xlsx_path, BENCH_END_YEAR)
+    target_path = str(tmp_path / "import.db")
+    databases = []
+
+    def setup():
+        shutil.copyfile(synthetic_db_path, target_path)
+        db = DatabaseManager(target_path)
+        with db.transaction() as conn:
+            conn.execute("DELETE FROM attendance_records WHERE work_date >= ? AND work_date < ?",
+                         (f"{BENCH_END_YEAR}-01-01", f"{BENCH_END_YEAR + 1}-01-01"))
+        databases.append(db)
+        return (AttendanceImporter(db, AttendanceCalculator(db)), xlsx_path, BENCH_END_YEAR, 1), {}
+
+    try:
+        result = benchmark.pedantic(lambda importer, *args: importer.import_file(*args),
+                                    setup=setup, rounds=1, iterations=1)
+    finally:
+        for db in databases:
+            db.close_all()
+    assert result.written == cells
+    assert not result.errors
+
+
+# --- 엑셀 내보내기 ---
+
+@pytest.mark.export
+def test_attendance_excel_export(benchmark, guis, quiet_dialogs, tmp_path):
+    _leave_gui, attendance_gui = guis
+    path = tmp_path / "attendance.xlsx"
+    benchmark.pedantic(attendance_gui._download_attendance_excel,
+                       kwargs={"file_path_override": str(path), "silent": True, "open_after": False},
+                       rounds=1, iterations=1)
+    assert path.exists()
+
+
+@pytest.mark.export
+@pytest.mark.parametrize("processes", [1, 4])
+def test_attendance_workbook_writer(benchmark, db_manager, tmp_path, processes):
+    """연간 12개 월 시트 (processes=1: 현재 프로세스만, 4: 월별 계산을 프로세스 풀에서)"""
+    path = tmp_path / f"attendance_{processes}.xlsx"
+    year_months = [(BENCH_END_YEAR, month) for month in range(1, 13)]
+    with db_manager.connection() as conn:
+        employees = conn.execute("SELECT id, position, name, hire_date FROM employees ORDER BY id").fetchall()
+
+    def run():
+        with db_manager.connection() as conn:
+            return AttendanceWorkbookWriter(conn).write(str(path), year_months, employees, processes=processes)
+
+    assert benchmark.pedantic(run, rounds=1, iterations=1) == 12
+
+
+@pytest.mark.export
+def test_leave_excel_export(benchmark, guis, quiet_dialogs, tmp_path):
+    leave_gui, _attendance_gui = guis
+    select_year(leave_gui.year_combo, BENCH_END_YEAR)
+    leave_gui.refresh_data()
+    path = tmp_path / "leave.xlsx"
+    benchmark.pedantic(leave_gui.download_excel,
+                       kwargs={"file_path_override": str(path), "silent": True, "open_after": False},
+                       rounds=1, iterations=1)
+    assert path.exists()
+
+
+@pytest.mark.export
+def test_combined_excel_export(benchmark, app_module, guis, quiet_dialogs, tmp_path, monkeypatch):
+    leave_gui, _attendance_gui = guis
+    path = tmp_path / "combined.xlsx"
+    monkeypatch.setattr(app_module.QFileDialog, "getSaveFileName",
+                        staticmethod(lambda *args, **kwargs: (str(path), "")))
+    benchmark.pedantic(leave_gui.download_combined_excel, rounds=1, iterations=1)
+    assert path.exists()
@@ -0,0 +1,109 @@
+"""
+쿼리 계획 회귀 검사
+
+화면/동기화/내보내기 경로가 실제로 실행하는 SQL을 기록한 뒤 EXPLAIN QUERY PLAN으로
+대용량 테이블(attendance_records, leave_records) 전체 스캔이 없는지 확인합니다.
+인덱스가 빠지거나 WHERE 절이 인덱스를 못 타게 바뀌면 실패합니다.
+"""
+
+import pytest
+
+from attendance_core import ExpirationScheduler, LeaveLedger, load_month_records
+from attendance_core.leave_balance import usage_between
+from conftest import BENCH_END_YEAR, capture_sql, full_scans, query_plan
+
+
+def _assert_no_full_scans(db_manager, statements):
+    assert statements, "기록된 SQL이 없습니다"
+    with db_manager.connection() as conn:
+        problems = full_scans(conn, statements)
+    assert not problems, "\n".join(f"{table}: {detail}\n    {sql}" for table, detail, sql in problems)
+
+
+def _plan_uses(db_manager, statements, needle, index_name):
+    """needle을 포함하는 SQL의 계획이 index_name을 사용하는지"""
+    matched = [sql for sql in statements if needle in sql]
+    assert matched, f"'{needle}' 조회가 실행되지 않았습니다"
+    with db_manager.connection() as conn:
+        for sql in matched:
+            plan = " | ".join(query_plan(conn, sql))
+            assert index_name in plan, f"{index_name} 미사용: {plan}\n    {' '.join(sql.split())}"
+
+
+# --- 데이터 계층 ---
+
+def test_month_records_plan(db_manager):
+    with capture_sql(db_manager) as statements:
+        with db_manager.connection() as conn:
+            load_month_records(conn.cursor(), BENCH_END_YEAR, 3)
+    # work_date 인덱스 또는 (employee_id, work_date) 인덱스 skip-scan 중 플래너가 선택
+    _assert_no_full_scans(db_manager, statements)
+
+
+def test_leave_ledger_plan(db_manager, leave_calculator, employees):
+    with capture_sql(db_manager) as statements:
+        with db_manager.connection() as conn:
+            LeaveLedger(leave_calculator).build(conn, employees, BENCH_END_YEAR)
+    _assert_no_full_scans(db_manager, statements)
+    # 사용량은 월별 집계에서, 입사월만 원본 기록(부분 인덱스 또는 직원+날짜 인덱스)에서 조회
+    _plan_uses(db_manager, statements, "FROM leave_balance_monthly", "leave_balance_monthly")
+    _plan_uses(db_manager, statements, "FROM leave_records", "idx_leave_records_type_date")
+
+
+def test_leave_balance_plan(db_manager, employees):
+    """직원 한 명의 사용량은 월별 집계의 (employee_id, year, month) 키로 조회"""
+    emp_id, _name, hire_date = employees[0]
+    with capture_sql(db_manager) as statements:
+        with db_manager.connection() as conn:
+            usage_between(conn, emp_id, hire_date, f"{BENCH_END_YEAR}-01-01", f"{BENCH_END_YEAR + 1}-01-01")
+    _assert_no_full_scans(db_manager, statements)
+    _plan_uses(db_manager, statements, "FROM leave_balance_monthly", "PRIMARY KEY")
+
+
+def test_expiration_lookup_plan(db_manager):
+    with db_manager.connection() as conn:
+        plan = " | ".join(query_plan(conn, """
+            SELECT id FROM leave_expirations
+            WHERE employee_id = 1 AND leave_type = '월차' AND expiration_date = '2025-01-01'
+        """))
+    assert "idx_leave_expirations_emp_type_date" in plan, plan
+
+
+def test_expiration_scheduler_plan(db_manager, leave_calculator):
+    with capture_sql(db_manager) as statements:
+        # 이미 처리된 날짜이므로 watermark 확인 위주로 실행됨 (DB 변경 없음)
+        ExpirationScheduler(db_manager, leave_calculator).run(f"{BENCH_END_YEAR}-12-31")
+    _assert_no_full_scans(db_manager, statements)
+
+
+# --- 화면 경로 (PySide6 필요) ---
+
+def test_month_refresh_plan(db_manager, guis):
+    _leave_gui, attendance_gui = guis
+    with capture_sql(db_manager) as statements:
+        attendance_gui.refresh_data()
+    _assert_no_full_scans(db_manager, statements)
+
+
+def test_leave_refresh_plan(db_manager, guis):
+    leave_gui, _attendance_gui = guis
+    with capture_sql(db_manager) as statements:
+        leave_gui.refresh_data()
+    _assert_no_full_scans(db_manager, statements)
+
+
+def test_sync_leave_records_plan(db_manager, guis, quiet_dialogs):
+    _leave_gui, attendance_gui = guis
+    with capture_sql(db_manager) as statements:
+        attendance_gui.sync_leave_records()
+    _assert_no_full_scans(db_manager, statements)
+    _plan_uses(db_manager, statements, "FROM attendance_records ar", "idx_attendance_leave_types")
+
+
+@pytest.mark.export
+def test_attendance_export_plan(db_manager, guis, quiet_dialogs, tmp_path):
+    _leave_gui, attendance_gui = guis
+    with capture_sql(db_manager) as statements:
+        attendance_gui._download_attendance_excel(
+            file_path_override=str(tmp_path / "attendance.xlsx"), silent=True, open_after=False)
+    _assert_no_full_scans(db_manager, statements)
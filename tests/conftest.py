@@ -0,0 +1,47 @@
+"""
+단위/회귀 테스트 공용 fixture
+
+각 테스트는 빈 DB(스키마 최신 버전)를 새로 만들어 사용합니다.
+성능 측정은 benchmarks/에 있습니다.
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from attendance_core import DatabaseManager, AttendanceCalculator  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "leave_attendance.db")
+
+
+@pytest.fixture
+def db_manager(db_path):
+    db = DatabaseManager(db_path)
+    yield db
+    db.close_all()
+
+
+@pytest.fixture
+def attendance_calculator(db_manager):
+    return AttendanceCalculator(db_manager)
+
+
+@pytest.fixture
+def add_employee(db_manager):
+    """add_employee(이름, 부서, 입사일) -> 직원 ID"""
+    def add(name, department="개발팀", hire_date="2020-01-01"):
+        with db_manager.transaction() as conn:
+            return conn.execute("""
+                INSERT INTO employees (department, position, name, hire_date) VALUES (?, '사원', ?, ?)
+            """, (department, name, hire_date)).lastrowid
+    return add
@@ -0,0 +1,140 @@
+"""출퇴근 관리대장 편집 일괄 저장 (commit_pending_changes)
+
+기대값은 한 칸씩 저장하던 기존 save_changes의 결과입니다.
+"""
+
+from datetime import date
+
+import pytest
+
+from attendance_core.attendance_edits import commit_pending_changes
+from attendance_core.time_input import normalize_time_input
+
+
+def _change(text):
+    """화면 셀 편집과 같은 pending_changes 값 (빈 값은 삭제)"""
+    if not text:
+        return {'new_value': '', 'formatted_time': '', 'is_time': False, 'is_delete': True}
+    formatted_time, minutes = normalize_time_input(text)
+    return {'new_value': text, 'formatted_time': formatted_time, 'is_time': minutes is not None}
+
+
+def _save(db_manager, calculator, emp_id, existing, leaves, edits):
+    with db_manager.transaction() as conn:
+        for day, (arrival, departure, leave_type, remarks) in existing.items():
+            conn.execute("""
+                INSERT INTO attendance_records (employee_id, work_date, arrival_time, departure_time, leave_type, remarks)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (emp_id, f"2025-03-{day:02d}", arrival, departure, leave_type, remarks))
+        for day, leave_type, amount in leaves:
+            conn.execute("""
+                INSERT INTO leave_records (employee_id, leave_type, leave_date, leave_amount, year, month)
+                VALUES (?, ?, ?, ?, 2025, 3)
+            """, (emp_id, leave_type, f"2025-03-{day:02d}", amount))
+    pending = {(emp_id, date(2025, 3, day), category): _change(text) for day, category, text in edits}
+    with db_manager.transaction() as conn:
+        assert commit_pending_changes(conn, calculator, pending, 2025, 3) == len(pending)
+        attendance = conn.execute("""
+            SELECT work_date, arrival_time, departure_time, early_arrival, late_arrival, late_departure,
+                   leave_type, remarks
+            FROM attendance_records ORDER BY work_date
+        """).fetchall()
+        leave = conn.execute("""
+            SELECT leave_date, leave_type, leave_amount FROM leave_records ORDER BY leave_date, leave_type
+        """).fetchall()
+    return [tuple(row) for row in attendance], [tuple(row) for row in leave]
+
+
+# (기존 기록 {일: (출근, 퇴근, 구분, 비고)}, 기존 leave_records [(일, 구분, 차감)], 편집 [(일, 행, 입력)],
+#  저장 후 attendance_records, 저장 후 leave_records)
+CASES = {
+    "출근 시간": (
+        {}, [], [(3, '출근', '0830')],
+        [('2025-03-03', '08:30:00', None, 0, 0, 0, None, '')], []),
+    "같은 날 출퇴근 시간": (
+        {}, [], [(3, '출근', '07:55'), (3, '퇴근', '2005')],
+        [('2025-03-03', '07:55:00', '20:05:00', 1, 0, 1, None, '')], []),
+    "플래그 경계": (
+        {}, [], [(4, '출근', '0800'), (4, '퇴근', '2000'), (5, '출근', '0759'), (5, '퇴근', '1959'),
+                 (6, '출근', '0901')],
+        [('2025-03-04', '08:00:00', '20:00:00', 0, 0, 1, None, ''),
+         ('2025-03-05', '07:59:00', '19:59:00', 1, 0, 0, None, ''),
+         ('2025-03-06', '09:01:00', None, 0, 1, 0, None, '')], []),
+    "연차 날짜에 출근 시간": (
+        {3: (None, None, '연차', '')}, [(3, '연차', 1.0)], [(3, '출근', '09:10')],
+        [('2025-03-03', '09:10:00', None, 0, 1, 0, '연차', '')], [('2025-03-03', '연차', 1.0)]),
+    "반차_퇴근 날짜에 출근 시간": (
+        {3: (None, '18:00:00', '반차', '반차_퇴근')}, [], [(3, '출근', '09:00')],
+        [('2025-03-03', '09:00:00', '18:00:00', 0, 0, 0, '반차', '반차_퇴근')], []),
+    "반차_출근 자리에 출근 시간": (
+        {3: (None, '18:00:00', '반차', '반차_출근')}, [(3, '반차', 0.5)], [(3, '출근', '09:00')],
+        [('2025-03-03', '09:00:00', '18:00:00', 0, 0, 0, None, '')], [('2025-03-03', '반차', 0.5)]),
+    "출근 행 반차는 퇴근 시간 유지": (
+        {3: ('09:00:00', '18:00:00', None, None)}, [], [(3, '출근', '반차')],
+        [('2025-03-03', None, '18:00:00', 0, 0, 0, '반차', '반차_출근')], [('2025-03-03', '반차', 0.5)]),
+    "반차 입력 후 퇴근 시간": (
+        {}, [], [(3, '출근', '반차'), (3, '퇴근', '1800')],
+        [('2025-03-03', None, '18:00:00', 0, 0, 0, '반차', '반차_출근')], [('2025-03-03', '반차', 0.5)]),
+    "퇴근 시간 입력 후 반차": (
+        {}, [], [(3, '퇴근', '1800'), (3, '출근', '반차')],
+        [('2025-03-03', None, '18:00:00', 0, 0, 0, '반차', '반차_출근')], [('2025-03-03', '반차', 0.5)]),
+    "연차는 두 행 표시": (
+        {3: ('09:00:00', '18:00:00', None, None)}, [], [(3, '출근', '연차')],
+        [('2025-03-03', None, None, 0, 0, 0, '연차', '')], [('2025-03-03', '연차', 1.0)]),
+    "출장은 차감 없음": (
+        {3: ('09:00:00', None, None, None)}, [], [(3, '퇴근', '출장')],
+        [('2025-03-03', None, None, 0, 0, 0, '출장', '')], []),
+    "퇴근 행 휴가": (
+        {3: ('09:00:00', None, None, None)}, [], [(3, '퇴근', '휴가')],
+        [('2025-03-03', '09:00:00', None, 0, 0, 0, '휴가', '휴가_퇴근')], []),
+    "출근 행 휴가": (
+        {}, [], [(3, '출근', '휴가')],
+        [('2025-03-03', None, None, 0, 0, 0, '휴가', '휴가_출근')], []),
+    "출근 행 공휴 (반차_퇴근 덮어쓰기)": (
+        {3: (None, None, '반차', '반차_퇴근')}, [], [(3, '출근', '공휴')],
+        [('2025-03-03', None, None, 0, 0, 0, '공휴', '공휴_출근')], []),
+    "연차 날짜 퇴근 행 반차": (
+        {3: (None, None, '연차', '')}, [(3, '연차', 1.0)], [(3, '퇴근', '반차')],
+        [('2025-03-03', None, None, 0, 0, 0, '반차', '반차_퇴근')],
+        [('2025-03-03', '반차', 0.5), ('2025-03-03', '연차', 1.0)]),
+    "반차_출근 날짜 퇴근 행 반차": (
+        {3: (None, None, '반차', '반차_출근')}, [], [(3, '퇴근', '반차')],
+        [('2025-03-03', None, None, 0, 0, 0, '반차', '반차_퇴근')], [('2025-03-03', '반차', 0.5)]),
+    "미팅 (등록되지 않은 텍스트)": (
+        {3: ('09:00:00', '18:00:00', None, None)}, [], [(3, '퇴근', '미팅')],
+        [('2025-03-03', '09:00:00', None, 0, 0, 0, '미팅', '미팅_퇴근')], []),
+    "연차 삭제": (
+        {3: (None, None, '연차', '')}, [(3, '연차', 1.0)], [(3, '출근', '')],
+        [], []),
+    "반차_출근 날짜 퇴근 삭제": (
+        {3: (None, '18:00:00', '반차', '반차_출근')}, [(3, '반차', 0.5)], [(3, '퇴근', '')],
+        [('2025-03-03', None, None, 0, 0, 0, '반차', '반차_출근')], [('2025-03-03', '반차', 0.5)]),
+    "반차_퇴근 삭제": (
+        {3: ('09:00:00', None, '반차', '반차_퇴근')}, [(3, '반차', 0.5)], [(3, '퇴근', '')],
+        [('2025-03-03', '09:00:00', None, 0, 0, 0, None, None)], []),
+    "퇴근 삭제는 출근 초 유지": (
+        {3: ('09:00:30', '18:00:00', None, None)}, [], [(3, '퇴근', '')],
+        [('2025-03-03', '09:00:30', None, 0, 1, 0, None, None)], []),
+    "두 행 모두 삭제": (
+        {3: ('09:00:00', '18:00:00', None, None)}, [], [(3, '출근', ''), (3, '퇴근', '')],
+        [], []),
+    "없는 기록 삭제": (
+        {}, [], [(3, '출근', '')],
+        [], []),
+}
+
+
+@pytest.mark.parametrize("existing, leaves, edits, expected_attendance, expected_leave",
+                         list(CASES.values()), ids=list(CASES))
+def test_commit_pending_changes_matches_cell_by_cell_save(db_manager, attendance_calculator, add_employee,
+                                                          existing, leaves, edits, expected_attendance,
+                                                          expected_leave):
+    emp_id = add_employee("홍길동")
+    attendance, leave = _save(db_manager, attendance_calculator, emp_id, existing, leaves, edits)
+    assert attendance == expected_attendance
+    assert leave == expected_leave
+
+
+def test_commit_pending_changes_without_edits(db_manager, attendance_calculator):
+    with db_manager.transaction() as conn:
+        assert commit_pending_changes(conn, attendance_calculator, {}, 2025, 3) == 0
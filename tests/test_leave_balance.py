@@ -0,0 +1,26 @@
+"""연차 사용 월별 집계 (leave_balance_monthly 트리거)"""
+
+import sqlite3
+
+from attendance_core.attendance_calculator import UPSERT_ATTENDANCE_SQL
+from attendance_core.leave_balance import find_leave_balance_mismatches
+
+
+def test_leave_balance_upsert_without_recursive_triggers(db_path, db_manager, attendance_calculator,
+                                                          add_employee):
+    """같은 날 기록 덮어쓰기는 연결 설정과 관계없이 월별 집계에서 이전 값이 빠짐"""
+    emp_id = add_employee("홍길동", hire_date="2025-01-01")
+    attendance_calculator.process_attendance_record(emp_id, "2025-03-03", None, None, '연차', "")
+    attendance_calculator.process_attendance_record(emp_id, "2025-03-03", None, None, '연차', "")
+    db_manager.close_all()
+
+    # 풀 밖의 연결 (recursive_triggers 기본값 OFF)
+    raw = sqlite3.connect(db_path)
+    try:
+        with raw:
+            raw.execute(UPSERT_ATTENDANCE_SQL, (emp_id, "2025-03-03", None, None, 0, 0, 0, '반차', "", None, None))
+            raw.execute(UPSERT_ATTENDANCE_SQL, (emp_id, "2025-03-03", None, None, 0, 0, 0, '반차', "", None, None))
+        assert find_leave_balance_mismatches(raw) == []
+        assert raw.execute("SELECT full_days, half_days FROM leave_balance_monthly").fetchall() == [(0, 1)]
+    finally:
+        raw.close()
@@ -0,0 +1,93 @@
+"""입사일 기준 연월차 발생 달력 - 기대값은 달력 도입 전 LeaveCalculator 계산 결과"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from attendance_core import LeaveCalculator
+from attendance_core.leave_calendar import entitlement_calendar
+
+
+@pytest.fixture
+def leave_calculator():
+    return LeaveCalculator(None)
+
+
+def _monthly_leave(hire_date, target_date):
+    """달력 도입 전 월차 계산 (입사일 이전은 음수)"""
+    if (target_date - hire_date).days >= 365:
+        return 0
+    months = (target_date.year - hire_date.year) * 12 + (target_date.month - hire_date.month)
+    if target_date.day < hire_date.day:
+        months -= 1
+    return min(months, 11)
+
+
+def _annual_leave(hire_date, target_date):
+    """달력 도입 전 연차 계산 (입사일 월/일 기준 만 근속 연수, 2월 29일 보정 없음)"""
+    years = target_date.year - hire_date.year
+    if (target_date.month, target_date.day) < (hire_date.month, hire_date.day):
+        years -= 1
+    if years < 1:
+        return 0
+    annual_leave = 15
+    if years >= 3:
+        annual_leave += (years - 3) // 2 + 1
+    return min(annual_leave, 25)
+
+
+# (입사일, 기준일, 월차, 연차, 1년 이상)
+CASES = [
+    ("2024-02-29", "2024-01-15", -2, 0, False),    # 입사 전 (기존 계산과 같이 음수)
+    ("2023-12-31", "2023-12-01", -1, 0, False),
+    ("2023-05-30", "2022-05-31", -12, 0, False),
+    ("2024-02-29", "2025-02-27", 11, 0, False),    # 364일
+    ("2024-02-29", "2025-02-28", 0, 0, True),      # 365일
+    ("2024-02-29", "2025-03-01", 0, 15, True),
+    ("2023-01-31", "2023-02-28", 0, 0, False),     # 31일이 없는 달
+    ("2023-01-31", "2023-03-01", 1, 0, False),
+    ("2023-01-31", "2023-04-30", 2, 0, False),
+    ("2023-12-31", "2024-12-29", 11, 0, False),    # 윤년을 지나는 364일
+    ("2023-12-31", "2024-12-30", 0, 0, True),
+    ("2020-02-29", "2021-02-28", 0, 0, True),
+    ("2020-02-29", "2023-02-28", 0, 15, True),
+    ("2020-02-29", "2045-03-01", 0, 25, True),
+    ("2023-05-30", "2026-05-29", 0, 15, True),
+    ("2023-05-30", "2026-05-30", 0, 16, True),     # 만3년
+]
+
+
+@pytest.mark.parametrize("hire_date, target_date, monthly, annual, one_year", CASES)
+def test_leave_calculator_edge_dates(leave_calculator, hire_date, target_date, monthly, annual, one_year):
+    assert leave_calculator.calculate_monthly_leave(hire_date, target_date) == monthly
+    assert leave_calculator.calculate_annual_leave(hire_date, target_date) == annual
+    assert leave_calculator.is_one_year_or_more("", hire_date, target_date) is one_year
+
+
+@pytest.mark.parametrize("hire_date", [date(2020, 2, 29), date(2024, 2, 29), date(2023, 1, 31),
+                                       date(2023, 3, 31), date(2023, 12, 31), date(2024, 8, 30),
+                                       date(2022, 1, 1)])
+def test_leave_calculator_matches_previous_calculation(leave_calculator, hire_date):
+    for offset in range(-400, 3000):
+        target_date = hire_date + timedelta(days=offset)
+        assert leave_calculator.calculate_monthly_leave(hire_date, target_date) == \
+            _monthly_leave(hire_date, target_date), target_date
+        assert leave_calculator.calculate_annual_leave(hire_date, target_date) == \
+            _annual_leave(hire_date, target_date), target_date
+        assert leave_calculator.is_one_year_or_more("", hire_date, target_date) == \
+            ((target_date - hire_date).days >= 365), target_date
+
+
+def test_leap_day_anniversaries():
+    calendar = entitlement_calendar("2020-02-29")
+    assert calendar.anniversary(2021) == date(2021, 2, 28)
+    assert calendar.anniversary(2024) == date(2024, 2, 29)
+    assert calendar.anniversaries[1] == date(2021, 2, 28)
+    assert calendar.accrual_dates[0] == date(2020, 3, 29)
+    assert entitlement_calendar("2023-01-31").accrual_dates[:3] == (date(2023, 3, 1), date(2023, 3, 31),
+                                                                    date(2023, 5, 1))
+
+
+def test_listed_employee_is_one_year_or_more(leave_calculator):
+    name = LeaveCalculator.ONE_YEAR_OR_MORE_EMPLOYEES[0]
+    assert leave_calculator.is_one_year_or_more(name, "2025-03-01", "2025-03-02")
@@ -0,0 +1,25 @@
+"""근태 구분 등록부 (leave_types)"""
+
+import sqlite3
+
+import pytest
+
+
+def test_leave_type_changes_from_other_connection(db_path, attendance_calculator):
+    """다른 연결(CLI 등)의 구분 변경은 다시 읽고, 연차 사용 집계 구분의 삭제/이름 변경은 DB에서 거부"""
+    raw = sqlite3.connect(db_path)
+    try:
+        assert '워크숍' not in attendance_calculator.leave_registry.keywords
+        with raw:
+            raw.execute("INSERT INTO leave_types (name, merge_mode, input_keyword) VALUES ('워크숍', 1, 1)")
+        assert '워크숍' in attendance_calculator.leave_registry.keywords
+        with pytest.raises(sqlite3.IntegrityError):
+            with raw:
+                raw.execute("DELETE FROM leave_types WHERE name = '반차'")
+        with pytest.raises(sqlite3.IntegrityError):
+            with raw:
+                raw.execute("UPDATE leave_types SET name = '오전반차' WHERE name = '반차'")
+        assert attendance_calculator.leave_registry.deduction('반차') == 0.5
+        assert '반차' in attendance_calculator.leave_registry.by_name
+    finally:
+        raw.close()
@@ -0,0 +1,92 @@
+"""출퇴근 관리대장 월간 표 모델 (MonthGridModel) - PySide6 필요"""
+
+import importlib.util
+import os
+from datetime import time
+
+import pytest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "Attendance and Leave Management Program.py")
+
+
+@pytest.fixture(scope="module")
+def app_module():
+    """메인 프로그램 모듈 (파일명에 공백이 있어 경로로 로드)"""
+    pytest.importorskip("PySide6")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    spec = importlib.util.spec_from_file_location("attendance_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def attendance_gui(app_module, db_manager, attendance_calculator):
+    from PySide6.QtCore import QCoreApplication, QEvent, QThreadPool
+    from PySide6.QtWidgets import QApplication
+    from attendance_core import ChangeBus, LeaveCalculator
+
+    app = QApplication.instance() or QApplication([])
+    change_bus = ChangeBus()
+    leave_gui = app_module.LeaveManagementGUI(None, db_manager, LeaveCalculator(db_manager), change_bus=change_bus)
+    gui = app_module.AttendanceManagementGUI(None, db_manager, attendance_calculator, leave_gui,
+                                             change_bus=change_bus)
+    leave_gui.attendance_gui = gui
+    yield gui
+
+    for widget in (leave_gui, gui):
+        widget.cancel_background_refresh()
+    QThreadPool.globalInstance().waitForDone(5000)
+    app.processEvents()
+    for widget in (gui, leave_gui):
+        widget.close()
+        widget.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    app.processEvents()
+
+
+def _select(combo, value):
+    index = combo.findData(value)
+    assert index >= 0
+    combo.blockSignals(True)
+    combo.setCurrentIndex(index)
+    combo.blockSignals(False)
+
+
+def test_month_model_reads_grid(app_module, attendance_gui, attendance_calculator, add_employee):
+    """월간 표 모델은 셀마다 아이템 없이 MonthGrid 값을 그대로 표시 (병합 날짜는 퇴근 행 셀 없음)"""
+    from PySide6.QtCore import Qt
+
+    veteran = add_employee("홍길동")
+    newcomer = add_employee("김신입", hire_date="2025-03-10")  # 입사 전 날짜는 사선
+    attendance_calculator.process_attendance_record(veteran, "2025-03-03", None, None, '연차', "")
+    attendance_calculator.process_attendance_record(veteran, "2025-03-04", time(7, 50), time(20, 10))
+    attendance_calculator.process_attendance_record(veteran, "2025-03-05", None, time(18, 0), '반차', "반차_출근")
+    attendance_calculator.process_attendance_record(newcomer, "2025-03-11", time(9, 5), time(18, 0))
+    _select(attendance_gui.year_combo, 2025)
+    _select(attendance_gui.month_combo, 3)
+
+    attendance_gui.refresh_data()
+    with attendance_gui.db.connection() as conn:
+        _employees, grid = attendance_gui._load_month_data(conn.cursor(), *attendance_gui._selected_period())
+    table, model = attendance_gui.table, attendance_gui.month_model
+    assert set(attendance_gui._month_rows) == {veteran, newcomer}
+    for emp_id, (arrival_row, _emp, hidden) in attendance_gui._month_rows.items():
+        i = grid.row_of(emp_id)
+        for d in range(grid.days_in_month):
+            arrival = model.index(arrival_row, 3 + d)
+            assert arrival.data(Qt.DisplayRole) == grid.arrival_text[i, d]
+            assert arrival.data(Qt.UserRole) == {'emp_id': emp_id, 'day': d + 1, 'category': '출근'}
+            assert bool(arrival.data(app_module.DIAGONAL_ROLE)) == bool(grid.diagonal[i, d])
+            assert (table.item(arrival_row + 1, 3 + d) is None) == bool(grid.merged[i, d])
+            if not hidden:
+                assert table.rowSpan(arrival_row, 3 + d) == (2 if grid.merged[i, d] else 1)
+
+    veteran_row = attendance_gui._month_rows[veteran][0]
+    assert model.index(veteran_row, 3 + 2).data(Qt.DisplayRole) == '연차'
+    assert table.rowSpan(veteran_row, 3 + 2) == 2
+    assert model.index(veteran_row, 3 + 4).data(Qt.DisplayRole) == '반차'
+    newcomer_row = attendance_gui._month_rows[newcomer][0]
+    assert model.index(newcomer_row, 3).data(app_module.DIAGONAL_ROLE)
+    assert not model.index(newcomer_row, 3 + 10).data(app_module.DIAGONAL_ROLE)
@@ -0,0 +1,12 @@
+"""시간 입력 해석과 저장 (초 단위 유지)"""
+
+
+def test_attendance_time_keeps_seconds(db_manager, attendance_calculator, add_employee):
+    """'HH:MM:SS' 문자열 저장 시 초 유지 (09:00:30 출근은 09:00 이후이므로 지각)"""
+    emp_id = add_employee("홍길동", hire_date="2025-01-01")
+    attendance_calculator.process_attendance_record(emp_id, "2025-03-03", "09:00:30", "18:00:00")
+    with db_manager.connection() as conn:
+        row = conn.execute("""
+            SELECT arrival_time, late_arrival FROM attendance_records WHERE employee_id = ?
+        """, (emp_id,)).fetchone()
+    assert tuple(row) == ("09:00:30", 1)
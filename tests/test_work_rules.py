@@ -0,0 +1,129 @@
+"""근무 규칙 (work_rules) - 기본 기준은 기존 고정 기준(08:00 / 09:00 / 20:00)과 같아야 함"""
+
+import sqlite3
+from datetime import date, time
+
+import numpy as np
+import pytest
+
+from attendance_core import MonthSummary
+from attendance_core.work_rules import (DEFAULT_THRESHOLDS, WorkRules, add_rule, delete_rule, evaluate_flags,
+                                        rules_version)
+
+
+def _flags(calculator, employee_id, work_date, arrival, departure):
+    row = calculator.attendance_row(employee_id, work_date, arrival, departure)
+    return row[4:7]
+
+
+def _stored_flags(db_manager, employee_id, work_date):
+    with db_manager.connection() as conn:
+        return conn.execute("""
+            SELECT early_arrival, late_arrival, late_departure FROM attendance_records
+            WHERE employee_id = ? AND work_date = ?
+        """, (employee_id, work_date)).fetchone()
+
+
+def test_default_thresholds_match_fixed_times():
+    assert DEFAULT_THRESHOLDS == (8 * 60, 9 * 60, 20 * 60)
+    assert WorkRules().thresholds(1, date(2025, 3, 3)) == DEFAULT_THRESHOLDS
+
+
+@pytest.mark.parametrize("arrival, departure, expected", [
+    (time(7, 59), time(19, 59), (1, 0, 0)),
+    (time(8, 0), time(20, 0), (0, 0, 1)),
+    (time(9, 0), time(18, 0), (0, 0, 0)),
+    (time(9, 0, 30), None, (0, 1, 0)),   # 초가 있으면 09:00 이후
+    (time(9, 1), time(23, 59), (0, 1, 1)),
+    (None, None, (0, 0, 0)),
+])
+def test_attendance_row_flags_without_rules(attendance_calculator, arrival, departure, expected):
+    assert _flags(attendance_calculator, 1, "2025-03-03", arrival, departure) == expected
+
+
+def test_evaluate_flags_boundaries():
+    arrival = np.array([479, 480, 540, 541, -1])
+    departure = np.array([1199, 1200, -1, 1380, 1200])
+    early, late, night = evaluate_flags(DEFAULT_THRESHOLDS, arrival, departure)
+    assert early.tolist() == [True, False, False, False, False]
+    assert late.tolist() == [False, False, False, True, False]
+    assert night.tolist() == [False, True, False, True, True]
+
+
+def test_rule_precedence():
+    """기본값 -> 전체 부서 규칙 -> 부서 규칙, 같은 단계는 나중 규칙 우선, 비워 둔 기준은 앞 단계 값"""
+    rules = WorkRules([
+        (3, "영업팀", "2025-07-01", "2025-08-31", None, 570, None),
+        (1, None, None, None, None, 550, 1260),
+        (2, None, "2025-07-01", None, 450, 560, None),
+        (4, "영업팀", "2025-08-01", None, None, 600, None),
+    ], {"영업팀": [7]})
+    assert rules.thresholds(8, date(2025, 6, 30)) == (480, 550, 1260)
+    assert rules.thresholds(8, date(2025, 7, 1)) == (450, 560, 1260)
+    assert rules.thresholds(7, date(2025, 6, 30)) == (480, 550, 1260)
+    assert rules.thresholds(7, date(2025, 7, 15)) == (450, 570, 1260)
+    assert rules.thresholds(7, "2025-08-15") == (450, 600, 1260)
+    assert rules.thresholds(7, date(2025, 9, 1)) == (450, 600, 1260)
+
+
+def test_month_thresholds_match_thresholds():
+    rules = WorkRules([(1, "영업팀", "2025-03-10", "2025-03-20", None, 570, None)], {"영업팀": [7]})
+    early, late, night = rules.month_thresholds(2025, 3, [7, 8])
+    for i, emp_id in enumerate([7, 8]):
+        for day in range(1, 32):
+            expected = rules.thresholds(emp_id, date(2025, 3, day))
+            assert (early[i, day - 1], late[i, day - 1], night[i, day - 1]) == expected
+
+
+def test_third_wednesday_17_00_excluded_from_average_departure():
+    """셋째 주 수요일(15~21일) 17:00 퇴근만 평균 퇴근에서 제외 (2025-03-19가 셋째 주 수요일)"""
+    days = [12, 19, 19, 20]   # 둘째 주 수요일, 셋째 주 수요일 x 2명, 목요일
+    summary = MonthSummary.compute(
+        2025, 3, 2, emp_idx=[0, 0, 1, 0], day_idx=[d - 1 for d in days],
+        early=[0] * 4, late_arrival=[0] * 4, late_departure=[0] * 4, leave_types=[""] * 4,
+        arrival_minutes=[-1] * 4, departure_minutes=[17 * 60, 17 * 60, 18 * 60, 19 * 60])
+    # 직원 0: 12일 17:00 + 20일 19:00 (19일 17:00 제외), 직원 1: 19일 18:00은 포함
+    assert summary.avg_departure == ["18:00", "18:00"]
+
+
+def test_add_and_delete_rule_rewrite_flags(db_manager, attendance_calculator, add_employee):
+    sales = add_employee("영업", department="영업팀")
+    dev = add_employee("개발", department="개발팀")
+    for emp_id in (sales, dev):
+        for work_date in ("2025-06-30", "2025-07-01"):
+            attendance_calculator.process_attendance_record(emp_id, work_date, time(9, 20), time(18, 0))
+    assert _stored_flags(db_manager, sales, "2025-07-01") == (0, 1, 0)
+
+    with db_manager.transaction() as conn:
+        rule_id, changed = add_rule(conn, late="09:30", department="영업팀", start_date="2025-07-01")
+    assert changed == 1
+    assert _stored_flags(db_manager, sales, "2025-07-01") == (0, 0, 0)
+    assert _stored_flags(db_manager, sales, "2025-06-30") == (0, 1, 0)
+    assert _stored_flags(db_manager, dev, "2025-07-01") == (0, 1, 0)
+    # 새로 저장하는 기록도 같은 기준
+    assert _flags(attendance_calculator, sales, "2025-07-02", time(9, 20), None) == (0, 0, 0)
+
+    with db_manager.transaction() as conn:
+        assert delete_rule(conn, rule_id) == 1
+        assert delete_rule(conn, rule_id) is None
+    assert _stored_flags(db_manager, sales, "2025-07-01") == (0, 1, 0)
+    assert _flags(attendance_calculator, sales, "2025-07-02", time(9, 20), None) == (0, 1, 0)
+
+
+def test_rule_changes_from_other_connection(db_path, db_manager, attendance_calculator, add_employee):
+    """다른 연결(CLI 등)의 규칙 추가와 직원 부서 변경은 변경 번호로 알고 다시 읽음"""
+    emp_id = add_employee("영업", department="영업팀")
+    assert attendance_calculator.rules.thresholds(emp_id, date(2025, 7, 1)) == DEFAULT_THRESHOLDS
+
+    raw = sqlite3.connect(db_path)
+    try:
+        before = rules_version(raw)
+        with raw:
+            raw.execute("INSERT INTO work_rules (department, late_arrival_after) VALUES ('영업팀', '09:30')")
+        assert rules_version(raw) > before
+        assert attendance_calculator.rules.thresholds(emp_id, date(2025, 7, 1)) == (480, 570, 1200)
+        with raw:
+            raw.execute("UPDATE employees SET department = '개발팀' WHERE id = ?", (emp_id,))
+        assert attendance_calculator.rules.thresholds(emp_id, date(2025, 7, 1)) == DEFAULT_THRESHOLDS
+    finally:
+        raw.close()